@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+"""A deterministic in-process chat model used by the benchmarks, so that the
+agent hot path can be measured without any network round-trip."""
+from copy import deepcopy
+from typing import Any, AsyncGenerator
+
+from agentscope.message import TextBlock, ToolUseBlock
+from agentscope.model import ChatModelBase, ChatResponse
+from agentscope.model._model_usage import ChatUsage
+
+
+class MockChatModel(ChatModelBase):
+    """A mock chat model that replays a fixed script of responses in a loop.
+
+    In the streaming mode, the text blocks are split into chunks of
+    `chunk_size` characters, and the accumulated content is yielded like the
+    real model APIs, while the tool use blocks are emitted in the last chunk.
+    """
+
+    def __init__(
+        self,
+        script: list[list[TextBlock | ToolUseBlock]],
+        stream: bool = True,
+        chunk_size: int = 8,
+    ) -> None:
+        """Initialize the mock chat model.
+
+        Args:
+            script (`list[list[TextBlock | ToolUseBlock]]`):
+                The content blocks of the responses, which are replayed in
+                order and in a loop. The ids of the tool use blocks are
+                renewed for each call.
+            stream (`bool`, defaults to `True`):
+                Whether to stream the responses.
+            chunk_size (`int`, defaults to `8`):
+                The number of characters of each text chunk in the streaming
+                mode.
+        """
+        super().__init__("mock_model", stream)
+        self.script = script
+        self.chunk_size = chunk_size
+        self.n_calls = 0
+
+    async def __call__(
+        self,
+        messages: list[dict],
+        tools: list[dict] | None = None,
+        **kwargs: Any,
+    ) -> ChatResponse | AsyncGenerator[ChatResponse, None]:
+        """Return the next response in the script."""
+        content = deepcopy(self.script[self.n_calls % len(self.script)])
+        for block in content:
+            if block["type"] == "tool_use":
+                block["id"] = f"call_{self.n_calls}_{block['name']}"
+        self.n_calls += 1
+
+        usage = ChatUsage(
+            input_tokens=len(messages),
+            output_tokens=sum(len(str(_)) for _ in content),
+            time=0.0,
+        )
+
+        if self.stream:
+            return self._stream(content, usage)
+        return ChatResponse(content=content, usage=usage)
+
+    async def _stream(
+        self,
+        content: list[TextBlock | ToolUseBlock],
+        usage: ChatUsage,
+    ) -> AsyncGenerator[ChatResponse, None]:
+        """Yield the accumulated chunks of the response."""
+        text = "".join(_["text"] for _ in content if _["type"] == "text")
+        tool_uses = [_ for _ in content if _["type"] == "tool_use"]
+
+        for end in range(self.chunk_size, len(text), self.chunk_size):
+            yield ChatResponse(
+                content=[TextBlock(type="text", text=text[:end])],
+            )
+
+        yield ChatResponse(
+            content=[
+                *([TextBlock(type="text", text=text)] if text else []),
+                *tool_uses,
+            ],
+            usage=usage,
+        )
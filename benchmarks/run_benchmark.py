@@ -0,0 +1,590 @@
+# -*- coding: utf-8 -*-
+"""The benchmark suite of the agent hot path in AgentScope.
+
+The benchmarks run fully in-process with a deterministic mock chat model, so
+that the results reflect the overhead of the framework itself, i.e. the
+formatting, memory, tool calling, session and broadcasting.
+
+Example:
+
+.. code-block:: bash
+
+    # Run all the benchmarks and compare against the stored baseline
+    python benchmarks/run_benchmark.py
+
+    # Record a new baseline on the current machine
+    python benchmarks/run_benchmark.py --update-baseline
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from functools import partial
+from typing import Any, Awaitable, Callable
+
+from mock_model import MockChatModel
+
+from agentscope.agent import ReActAgent
+from agentscope.formatter import OpenAIChatFormatter
+from agentscope.memory import InMemoryMemory
+from agentscope.message import (
+    Msg,
+    TextBlock,
+    ToolResultBlock,
+    ToolUseBlock,
+)
+from agentscope.pipeline import MsgHub
+from agentscope.session import JSONSession
+from agentscope.token import LocalTokenEstimator, TokenCounterBase
+from agentscope.tool import Toolkit, ToolResponse
+
+_DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+_TEXT = (
+    "AgentScope is a multi-agent framework, and this sentence is repeated to "
+    "simulate a realistic message length in the benchmarks. "
+) * 2
+
+
+@dataclass
+class BenchmarkResult:
+    """The result of a benchmark case."""
+
+    name: str
+    """The name of the benchmark case."""
+
+    iterations: int
+    """The number of the timed iterations."""
+
+    throughput: float
+    """The number of iterations per second."""
+
+    p50_ms: float
+    """The median latency in milliseconds."""
+
+    p90_ms: float
+    """The 90th percentile latency in milliseconds."""
+
+    p99_ms: float
+    """The 99th percentile latency in milliseconds."""
+
+    peak_memory_kb: float
+    """The peak memory allocated by a single iteration in KB."""
+
+
+@dataclass
+class BenchmarkCase:
+    """A benchmark case, where `setup` runs before each iteration and is not
+    timed."""
+
+    name: str
+    func: Callable[[], Awaitable[Any]]
+    setup: Callable[[], Awaitable[Any]] | None = None
+
+
+class _EstimatorTokenCounter(TokenCounterBase):
+    """A token counter that estimates the tokens locally, so that the
+    truncation loop runs without any network round-trip."""
+
+    def __init__(self) -> None:
+        """Initialize the token counter."""
+        self.estimator = LocalTokenEstimator()
+
+    async def count(self, messages: list[dict], **kwargs: Any) -> int:
+        """Estimate the tokens of the messages."""
+        return self.estimator.count(messages, kwargs.get("tools"))
+
+    async def count_many(self, texts: list[str], **kwargs: Any) -> list[int]:
+        """Estimate the tokens of the texts."""
+        return self.estimator.count_many(texts)
+
+
+def _percentile(sorted_values: list[float], percent: float) -> float:
+    """The nearest-rank percentile of the sorted values."""
+    index = max(0, math.ceil(percent / 100 * len(sorted_values)) - 1)
+    return sorted_values[index]
+
+
+async def run_case(
+    case: BenchmarkCase,
+    iterations: int,
+    warmup: int = 3,
+) -> BenchmarkResult:
+    """Run a benchmark case, and measure the latencies and the peak memory.
+
+    The peak memory is measured in separate iterations, since tracing the
+    allocations slows down the timed ones.
+    """
+    for _ in range(warmup):
+        if case.setup:
+            await case.setup()
+        await case.func()
+
+    latencies = []
+    for _ in range(iterations):
+        if case.setup:
+            await case.setup()
+        start = time.perf_counter()
+        await case.func()
+        latencies.append(time.perf_counter() - start)
+
+    peak = 0
+    for _ in range(min(iterations, 3)):
+        if case.setup:
+            await case.setup()
+        tracemalloc.start()
+        try:
+            await case.func()
+            peak = max(peak, tracemalloc.get_traced_memory()[1])
+        finally:
+            tracemalloc.stop()
+
+    latencies.sort()
+    return BenchmarkResult(
+        name=case.name,
+        iterations=iterations,
+        throughput=len(latencies) / sum(latencies),
+        p50_ms=_percentile(latencies, 50) * 1000,
+        p90_ms=_percentile(latencies, 90) * 1000,
+        p99_ms=_percentile(latencies, 99) * 1000,
+        peak_memory_kb=peak / 1024,
+    )
+
+
+def make_history(n_msgs: int) -> list[Msg]:
+    """Make a dialogue history with user messages and tool call/result
+    pairs."""
+    msgs = []
+    while len(msgs) < n_msgs:
+        i = len(msgs)
+        if i % 3 == 0:
+            msgs.append(Msg("user", f"[{i}] {_TEXT}", "user"))
+        elif i % 3 == 1:
+            msgs.append(
+                Msg(
+                    "Friday",
+                    [
+                        TextBlock(type="text", text=f"[{i}] {_TEXT}"),
+                        ToolUseBlock(
+                            type="tool_use",
+                            id=f"history_{i}",
+                            name="tool_0",
+                            input={"query": _TEXT},
+                        ),
+                    ],
+                    "assistant",
+                ),
+            )
+        else:
+            msgs.append(
+                Msg(
+                    "system",
+                    [
+                        ToolResultBlock(
+                            type="tool_result",
+                            id=f"history_{i - 1}",
+                            name="tool_0",
+                            output=[TextBlock(type="text", text=_TEXT)],
+                        ),
+                    ],
+                    "system",
+                ),
+            )
+
+    # Don't leave a dangling tool call at the end
+    if msgs[-1].has_content_blocks("tool_use"):
+        msgs.pop()
+    return msgs
+
+
+def make_toolkit(n_tools: int) -> Toolkit:
+    """Make a toolkit with the given number of tool functions."""
+
+    def make_tool(index: int) -> Callable[..., ToolResponse]:
+        def tool(query: str) -> ToolResponse:
+            """A mock tool function that echoes the query.
+
+            Args:
+                query (`str`):
+                    The query string.
+            """
+            return ToolResponse(
+                content=[TextBlock(type="text", text=f"{index}: {query}")],
+            )
+
+        tool.__name__ = f"tool_{index}"
+        return tool
+
+    toolkit = Toolkit()
+    for i in range(n_tools):
+        toolkit.register_tool_function(make_tool(i))
+    return toolkit
+
+
+def make_agent(
+    name: str,
+    n_tools: int = 1,
+    stream: bool = True,
+) -> ReActAgent:
+    """Make a ReAct agent with the mock model, which calls a tool and then
+    generates the response in each reply."""
+    model = MockChatModel(
+        [
+            [
+                TextBlock(type="text", text=_TEXT),
+                ToolUseBlock(
+                    type="tool_use",
+                    id="",
+                    name="tool_0",
+                    input={"query": "benchmark"},
+                ),
+            ],
+            [
+                ToolUseBlock(
+                    type="tool_use",
+                    id="",
+                    name=ReActAgent.finish_function_name,
+                    input={"response": _TEXT},
+                ),
+            ],
+        ],
+        stream=stream,
+    )
+    agent = ReActAgent(
+        name=name,
+        sys_prompt="You're a helpful assistant.",
+        model=model,
+        formatter=OpenAIChatFormatter(),
+        toolkit=make_toolkit(n_tools),
+    )
+    agent.disable_console_output()
+    return agent
+
+
+async def _reset_memory(agent: ReActAgent, history: list[Msg]) -> None:
+    """Reset the memory of the agent to the given history."""
+    agent.memory.content = list(history)
+
+
+async def _reply(agent: ReActAgent) -> None:
+    """Reply to a user message."""
+    await agent(Msg("user", "Hi!", "user"))
+
+
+def react_agent_cases(
+    histories: list[int],
+    tool_counts: list[int],
+) -> list[BenchmarkCase]:
+    """The benchmark cases of `ReActAgent.reply`."""
+    cases = []
+    for n_history in histories:
+        for n_tools in tool_counts:
+            for stream in [True, False]:
+                agent = make_agent("Friday", n_tools, stream)
+                mode = "stream" if stream else "non-stream"
+                cases.append(
+                    BenchmarkCase(
+                        f"react_agent_reply[history={n_history},"
+                        f"tools={n_tools},{mode}]",
+                        partial(_reply, agent),
+                        partial(_reset_memory, agent, make_history(n_history)),
+                    ),
+                )
+    return cases
+
+
+def formatter_cases(histories: list[int]) -> list[BenchmarkCase]:
+    """The benchmark cases of `TruncatedFormatterBase.format`, with and
+    without the truncation."""
+    cases = []
+    for n_history in histories:
+        history = make_history(n_history)
+        counter = _EstimatorTokenCounter()
+        n_tokens = counter.estimator.count(
+            [_.to_dict() for _ in history],
+        )
+        for truncate in [False, True]:
+            formatter = OpenAIChatFormatter(
+                token_counter=counter if truncate else None,
+                # Truncate about a tenth of the history
+                max_tokens=int(n_tokens * 0.9) if truncate else None,
+            )
+            cases.append(
+                BenchmarkCase(
+                    f"formatter_format[history={n_history},"
+                    f"truncate={truncate}]",
+                    partial(formatter.format, history),
+                ),
+            )
+    return cases
+
+
+async def _call_tool(toolkit: Toolkit, tool_call: ToolUseBlock) -> None:
+    """Call the tool function and consume its response."""
+    async for _ in await toolkit.call_tool_function(tool_call):
+        pass
+
+
+def toolkit_cases(tool_counts: list[int]) -> list[BenchmarkCase]:
+    """The benchmark cases of `Toolkit.call_tool_function`."""
+    cases = []
+    for n_tools in tool_counts:
+        tool_call = ToolUseBlock(
+            type="tool_use",
+            id="0",
+            name=f"tool_{n_tools - 1}",
+            input={"query": "benchmark"},
+        )
+        cases.append(
+            BenchmarkCase(
+                f"toolkit_call[tools={n_tools}]",
+                partial(_call_tool, make_toolkit(n_tools), tool_call),
+            ),
+        )
+    return cases
+
+
+async def _add_one_by_one(memory: InMemoryMemory, msgs: list[Msg]) -> None:
+    """Add the messages into the memory one by one."""
+    for msg in msgs:
+        await memory.add(msg)
+
+
+def memory_cases(histories: list[int]) -> list[BenchmarkCase]:
+    """The benchmark cases of adding the messages one by one into
+    `InMemoryMemory`."""
+    cases = []
+    for n_history in histories:
+        memory = InMemoryMemory()
+        cases.append(
+            BenchmarkCase(
+                f"memory_add[history={n_history}]",
+                partial(_add_one_by_one, memory, make_history(n_history)),
+                memory.clear,
+            ),
+        )
+    return cases
+
+
+async def _save_and_load(session: JSONSession, agent: ReActAgent) -> None:
+    """Save the agent state into the session and load it back."""
+    await session.save_session_state(agent=agent)
+    await session.load_session_state(agent=agent)
+
+
+def session_cases(
+    histories: list[int],
+    save_dir: str,
+) -> list[BenchmarkCase]:
+    """The benchmark cases of saving and loading a `JSONSession`."""
+    cases = []
+    for n_history in histories:
+        agent = make_agent("Friday")
+        agent.memory.content = make_history(n_history)
+        session = JSONSession(f"history_{n_history}", save_dir)
+        cases.append(
+            BenchmarkCase(
+                f"session_save_load[history={n_history}]",
+                partial(_save_and_load, session, agent),
+            ),
+        )
+    return cases
+
+
+async def _clear_memories(agents: list[ReActAgent]) -> None:
+    """Clear the memories of the agents."""
+    for agent in agents:
+        await agent.memory.clear()
+
+
+def msghub_cases(agent_counts: list[int]) -> list[BenchmarkCase]:
+    """The benchmark cases of `MsgHub.broadcast`."""
+    cases = []
+    for n_agents in agent_counts:
+        agents = [make_agent(f"agent_{i}") for i in range(n_agents)]
+        hub = MsgHub(agents, enable_auto_broadcast=False)
+        cases.append(
+            BenchmarkCase(
+                f"msghub_broadcast[agents={n_agents}]",
+                partial(hub.broadcast, make_history(10)),
+                partial(_clear_memories, agents),
+            ),
+        )
+    return cases
+
+
+def calibrate() -> float:
+    """Time a fixed pure-Python workload in milliseconds, which is used to
+    normalize the latencies across machines and CPU frequency changes."""
+    payload = {"role": "user", "content": [{"type": "text", "text": _TEXT}]}
+    timings = []
+    for _ in range(5):
+        start = time.perf_counter()
+        for _ in range(2000):
+            json.loads(json.dumps(payload))
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000
+
+
+def compare_with_baseline(
+    results: list[BenchmarkResult],
+    calibration_ms: float,
+    baseline: dict,
+    tolerance: float,
+) -> list[str]:
+    """Compare the median latency and the peak memory with the baseline,
+    and return the regressions. The latencies are scaled by the ratio of
+    the calibration timings before comparing."""
+    scale = baseline["calibration_ms"] / calibration_ms
+    regressions = []
+    for result in results:
+        if result.name not in baseline["results"]:
+            continue
+        previous_result = baseline["results"][result.name]
+        for key, current in [
+            ("p50_ms", result.p50_ms * scale),
+            ("peak_memory_kb", result.peak_memory_kb),
+        ]:
+            previous = previous_result[key]
+            if previous > 0 and current > previous * (1 + tolerance):
+                regressions.append(
+                    f"{result.name}: {key} {previous:.3f} -> {current:.3f} "
+                    f"(+{(current / previous - 1) * 100:.0f}%)",
+                )
+    return regressions
+
+
+def _print_results(results: list[BenchmarkResult]) -> None:
+    """Print the results as a table."""
+    width = max(len(_.name) for _ in results)
+    print(
+        f"{'case':<{width}}  {'ops/s':>10}  {'p50 ms':>9}  {'p90 ms':>9}  "
+        f"{'p99 ms':>9}  {'peak KB':>10}",
+    )
+    for result in results:
+        print(
+            f"{result.name:<{width}}  {result.throughput:>10.1f}  "
+            f"{result.p50_ms:>9.3f}  {result.p90_ms:>9.3f}  "
+            f"{result.p99_ms:>9.3f}  {result.peak_memory_kb:>10.1f}",
+        )
+
+
+async def main(args: argparse.Namespace) -> int:
+    """Run the benchmarks, and return the exit code."""
+    with tempfile.TemporaryDirectory() as save_dir:
+        suites = {
+            "react_agent": lambda: react_agent_cases(args.history, args.tools),
+            "formatter": lambda: formatter_cases(args.history),
+            "toolkit": lambda: toolkit_cases(args.tools),
+            "memory": lambda: memory_cases(args.history),
+            "session": lambda: session_cases(args.history, save_dir),
+            "msghub": lambda: msghub_cases(args.agents),
+        }
+
+        calibration_ms = calibrate()
+        results = []
+        for suite in args.suites:
+            for case in suites[suite]():
+                results.append(await run_case(case, args.iterations))
+
+    _print_results(results)
+
+    if args.update_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "calibration_ms": calibration_ms,
+                    "results": {_.name: asdict(_) for _ in results},
+                },
+                f,
+                indent=4,
+            )
+        print(f"\nThe baseline is saved to {args.baseline}.")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"\nNo baseline found at {args.baseline}, skip comparing.")
+        return 0
+
+    with open(args.baseline, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+
+    regressions = compare_with_baseline(
+        results,
+        calibration_ms,
+        baseline,
+        args.tolerance,
+    )
+    if regressions:
+        print(f"\nFound {len(regressions)} regression(s) over the baseline:")
+        for regression in regressions:
+            print(f"  {regression}")
+        return 1
+
+    print("\nNo regression over the baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description=__doc__.split("\n", maxsplit=1)[0]
+    )
+    parser.add_argument(
+        "--suites",
+        nargs="+",
+        default=["react_agent", "formatter", "toolkit", "memory", "session"]
+        + ["msghub"],
+        help="The benchmark suites to run.",
+    )
+    parser.add_argument(
+        "--history",
+        type=int,
+        nargs="+",
+        default=[10, 100, 1000],
+        help="The history lengths.",
+    )
+    parser.add_argument(
+        "--tools",
+        type=int,
+        nargs="+",
+        default=[1, 10, 50],
+        help="The numbers of the tool functions.",
+    )
+    parser.add_argument(
+        "--agents",
+        type=int,
+        nargs="+",
+        default=[2, 10, 50],
+        help="The numbers of the agents in the MsgHub.",
+    )
+    parser.add_argument(
+        "--iterations",
+        type=int,
+        default=20,
+        help="The number of the timed iterations of each case.",
+    )
+    parser.add_argument(
+        "--baseline",
+        type=str,
+        default=_DEFAULT_BASELINE,
+        help="The path of the baseline JSON file.",
+    )
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Save the results as the new baseline.",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.3,
+        help="The relative slowdown over the baseline that's regarded as a "
+        "regression.",
+    )
+    sys.exit(asyncio.run(main(parser.parse_args())))
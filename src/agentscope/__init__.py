@@ -18,6 +18,7 @@ from . import token
 from . import evaluate
 from . import pipeline
 from . import tracing
+from . import metrics
 
 from ._logging import (
     logger,
@@ -35,6 +36,7 @@ def init(
     logging_level: str = "INFO",
     studio_url: str | None = None,
     tracing_url: str | None = None,
+    metrics_url: str | None = None,
 ) -> None:
     """Initialize the agentscope library.
 
@@ -55,6 +57,11 @@ def init(
             OpenTelemetry tracing platforms like Arize-Phoenix and Langfuse.
             If not provided and `studio_url` is provided, it will send traces
             to the AgentScope Studio's tracing endpoint.
+        metrics_url (`str | None`, optional):
+            The URL of the OTLP metrics endpoint, to which the built-in
+            metrics are exported periodically. The metrics are always
+            available in the Prometheus text format by
+            `agentscope.metrics.get_registry().to_prometheus()`.
     """
 
     from . import _config
@@ -105,6 +112,11 @@ def init(
 
         setup_tracing(endpoint=endpoint)
 
+    if metrics_url:
+        from .metrics import setup_metrics
+
+        setup_metrics(endpoint=metrics_url)
+
 
 __all__ = [
     # modules
@@ -123,6 +135,7 @@ __all__ = [
     "evaluate",
     "pipeline",
     "tracing",
+    "metrics",
     # functions
     "init",
     "setup_logger",
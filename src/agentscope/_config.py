@@ -21,3 +21,7 @@ name = datetime.now().strftime("%H%M%S_") + _generate_random_suffix(4)
 run_id: str = shortuuid.uuid()
 created_at: str = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
 trace_enabled: bool = False
+trace_max_attribute_bytes: int | None = 32 * 1024
+trace_sample_errors: bool = True
+trace_slow_threshold: float | None = None
+metrics_enabled: bool = False
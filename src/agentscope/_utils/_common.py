@@ -7,10 +7,20 @@ import inspect
 import json
 import os
 import tempfile
+import threading
 import types
 import typing
+from concurrent.futures import Executor, TimeoutError as FutureTimeoutError
 from datetime import datetime
-from typing import Union, Any, Callable, Type, Dict
+from typing import (
+    Union,
+    Any,
+    AsyncGenerator,
+    Callable,
+    Iterator,
+    Type,
+    Dict,
+)
 
 import requests
 from json_repair import repair_json
@@ -103,6 +113,111 @@ async def _execute_async_or_sync_func(
     return func(*args, **kwargs)
 
 
+async def _run_sync_func_in_thread(
+    executor: Executor | None,
+    func: Callable,
+    *args: Any,
+    **kwargs: Any,
+) -> Any:
+    """Run a blocking function in a worker thread so that the event loop is
+    not frozen during its execution.
+
+    Args:
+        executor (`Executor | None`):
+            The executor to run the function in. If `None`, the default
+            executor of the running event loop is used.
+        func (`Callable`):
+            The blocking function to be executed.
+        *args (`Any`):
+            Positional arguments to be passed to the function.
+        **kwargs (`Any`):
+            Keyword arguments to be passed to the function.
+
+    Returns:
+        `Any`:
+            The result of the function execution.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        executor,
+        functools.partial(func, *args, **kwargs),
+    )
+
+
+async def _iterate_sync_generator_in_thread(
+    executor: Executor | None,
+    func: Callable[..., Iterator[Any]],
+    *args: Any,
+    queue_size: int = 32,
+    **kwargs: Any,
+) -> AsyncGenerator[Any, None]:
+    """Call a blocking function that returns a synchronous iterator, and
+    consume the iterator within a worker thread. The items are bridged back
+    to the event loop through a bounded asyncio queue, so that a slow
+    consumer applies backpressure on the worker thread.
+
+    Args:
+        executor (`Executor | None`):
+            The executor to run the function in. If `None`, the default
+            executor of the running event loop is used.
+        func (`Callable[..., Iterator[Any]]`):
+            The blocking function that returns a synchronous iterator.
+        *args (`Any`):
+            Positional arguments to be passed to the function.
+        queue_size (`int`, defaults to `32`):
+            The maximum number of items buffered between the worker thread
+            and the event loop.
+        **kwargs (`Any`):
+            Keyword arguments to be passed to the function.
+
+    Yields:
+        `Any`:
+            The items produced by the synchronous iterator, in order.
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+    stopped = threading.Event()
+    sentinel = object()
+
+    def _put(item: Any) -> None:
+        """Put an item into the queue from the worker thread, blocking the
+        thread until there is room or the consumer is gone."""
+        future = asyncio.run_coroutine_threadsafe(queue.put(item), loop)
+        while not stopped.is_set():
+            try:
+                future.result(timeout=0.1)
+                return
+            except FutureTimeoutError:
+                continue
+        future.cancel()
+
+    def _produce() -> None:
+        """Consume the synchronous iterator within the worker thread."""
+        try:
+            for item in func(*args, **kwargs):
+                if stopped.is_set():
+                    return
+                _put((item, None))
+        except BaseException as e:  # pylint: disable=broad-except
+            _put((sentinel, e))
+            return
+        _put((sentinel, None))
+
+    producer = loop.run_in_executor(executor, _produce)
+    try:
+        while True:
+            item, error = await queue.get()
+            if error is not None:
+                raise error
+            if item is sentinel:
+                break
+            yield item
+        await producer
+    finally:
+        # Release the worker thread if the consumer stops early
+        stopped.set()
+
+
 def _get_bytes_from_web_url(
     url: str,
     max_retries: int = 3,
@@ -2,6 +2,7 @@
 """The agent base class in agentscope."""
 import asyncio
 import json
+import time
 from asyncio import Task
 from collections import OrderedDict
 from typing import Callable, Any
@@ -10,6 +11,7 @@ import shortuuid
 
 from ._agent_meta import _AgentMeta
 from .._logging import logger
+from ..metrics._builtin import _check_metrics_enabled, _record_agent_reply
 from ..module import StateModule
 from ..message import Msg
 from ..types import AgentHookTypes
@@ -157,6 +159,10 @@ class AgentBase(StateModule, metaclass=_AgentMeta):
         # output of the agent, e.g., in a production environment.
         self._disable_console_output: bool = False
 
+        # The queue to receive the printed (streaming) messages of the agent,
+        # e.g. used by the streaming pipeline
+        self._msg_queue: asyncio.Queue | None = None
+
     async def observe(self, msg: Msg | list[Msg] | None) -> None:
         """Receive the given message(s) without generating a reply.
 
@@ -169,6 +175,22 @@ class AgentBase(StateModule, metaclass=_AgentMeta):
             f" {self.__class__.__name__} class.",
         )
 
+    async def observe_stream(self, msg: Msg, last: bool) -> None:
+        """Receive a streamed chunk of the message that is being generated
+        by the upstream agent in the streaming pipeline, before the
+        upstream agent finishes replying. The agents can override this
+        method to prepare for replying in advance, e.g. retrieving or
+        formatting, while the complete message is still passed to the
+        `reply` method as usual.
+
+        Args:
+            msg (`Msg`):
+                The frozen chunk of the message, which contains the content
+                accumulated so far.
+            last (`bool`):
+                Whether this is the last chunk of the message.
+        """
+
     async def reply(self, *args: Any, **kwargs: Any) -> Msg:
         """The main logic of the agent, which generates a reply based on the
         current state and input arguments."""
@@ -187,6 +209,12 @@ class AgentBase(StateModule, metaclass=_AgentMeta):
                 Whether this is the last one in streaming messages. For
                 non-streaming message, this should always be `True`.
         """
+        if self._msg_queue is not None:
+            # Put a frozen snapshot, since the streaming message is modified
+            # in place. Waiting for a full queue slows down the agent to the
+            # pace of the consumer.
+            await self._msg_queue.put((msg.freeze(), last))
+
         if self._disable_console_output:
             return
 
@@ -230,6 +258,8 @@ class AgentBase(StateModule, metaclass=_AgentMeta):
         self._reply_id = shortuuid.uuid()
 
         reply_msg: Msg | None = None
+        error: BaseException | None = None
+        start_time = time.perf_counter()
         try:
             self._reply_task = asyncio.current_task()
             reply_msg = await self.reply(*args, **kwargs)
@@ -238,7 +268,17 @@ class AgentBase(StateModule, metaclass=_AgentMeta):
         except asyncio.CancelledError:
             reply_msg = await self.handle_interrupt(*args, **kwargs)
 
+        except Exception as e:
+            error = e
+            raise
+
         finally:
+            if _check_metrics_enabled():
+                await self._record_reply_metrics(
+                    time.perf_counter() - start_time,
+                    error,
+                )
+
             # Broadcast the reply message to all subscribers
             if reply_msg:
                 await self._broadcast_to_subscribers(reply_msg)
@@ -246,6 +286,29 @@ class AgentBase(StateModule, metaclass=_AgentMeta):
 
         return reply_msg
 
+    async def _record_reply_metrics(
+        self,
+        elapsed: float,
+        error: BaseException | None,
+    ) -> None:
+        """Record the reply latency and the memory size in the built-in
+        metrics."""
+        memory_size = None
+        memory = getattr(self, "memory", None)
+        if memory is not None and hasattr(memory, "size"):
+            try:
+                memory_size = await memory.size()
+            except Exception:
+                # The memory size is optional in the metrics
+                pass
+
+        _record_agent_reply(
+            getattr(self, "name", None) or self.__class__.__name__,
+            elapsed,
+            error,
+            memory_size,
+        )
+
     async def _broadcast_to_subscribers(
         self,
         msg: Msg | list[Msg] | None,
@@ -471,6 +534,19 @@ class AgentBase(StateModule, metaclass=_AgentMeta):
         else:
             self._subscribers.pop(msghub_name)
 
+    def set_msg_queue(self, queue: asyncio.Queue | None) -> None:
+        """Set the queue to receive the printed messages of the agent as
+        tuples of the frozen message and the `last` flag, or unset it with
+        `None`.
+
+        Args:
+            queue (`asyncio.Queue | None`):
+                The queue, which is recommended to be bounded so that the
+                agent waits for the consumer rather than buffering the
+                messages without limit.
+        """
+        self._msg_queue = queue
+
     def disable_console_output(self) -> None:
         """This function will disable the console output of the agent, e.g.
         in a production environment to avoid messy logs."""
@@ -11,9 +11,15 @@ from pydantic import BaseModel, ValidationError
 from ._react_agent_base import ReActAgentBase
 from ..formatter import FormatterBase
 from ..memory import MemoryBase, LongTermMemoryBase, InMemoryMemory
-from ..message import Msg, ToolUseBlock, ToolResultBlock, TextBlock
+from ..message import (
+    Msg,
+    ToolUseBlock,
+    ToolResultBlock,
+    TextBlock,
+    BlobStore,
+)
 from ..model import ChatModelBase
-from ..tool import Toolkit, ToolResponse
+from ..tool import Toolkit, ToolResponse, ToolOutputPolicy
 from ..tracing import trace_reply
 
 
@@ -81,6 +87,10 @@ class ReActAgent(ReActAgentBase):
         enable_meta_tool: bool = False,
         parallel_tool_calls: bool = False,
         max_iters: int = 10,
+        tool_output_policy: ToolOutputPolicy
+        | dict[str, ToolOutputPolicy]
+        | None = None,
+        blob_store: BlobStore | None = None,
     ) -> None:
         """Initialize the ReAct agent
 
@@ -123,6 +133,19 @@ class ReActAgent(ReActAgentBase):
                 them in parallel.
             max_iters (`int`, defaults to `10`):
                 The maximum number of iterations of the reasoning-acting loops.
+            tool_output_policy (`ToolOutputPolicy | dict[str, \
+            ToolOutputPolicy] | None`, optional):
+                The policy to limit the size of the tool results recorded in
+                the memory. A single policy applies to all the tool
+                functions, while a dictionary specifies the policies by the
+                tool function names, and the other tool functions are not
+                limited. If provided, a tool function `view_tool_output` will
+                be added to the toolkit, which allows the agent to page
+                through the full outputs spilled to the blob store.
+            blob_store (`BlobStore | None`, optional):
+                The blob store to spill the full tool outputs. If not
+                provided and the tool output policy is given, a default
+                `BlobStore` will be created.
         """
         super().__init__()
 
@@ -172,6 +195,13 @@ class ReActAgent(ReActAgentBase):
                 self.toolkit.reset_equipped_tools,
             )
 
+        # The size limits of the tool results recorded in the memory
+        self.tool_output_policy = tool_output_policy
+        self.blob_store = blob_store
+        if tool_output_policy is not None:
+            self.blob_store = blob_store or BlobStore()
+            self.toolkit.register_tool_function(self.view_tool_output)
+
         self.parallel_tool_calls = parallel_tool_calls
         self.max_iters = max_iters
 
@@ -180,6 +210,10 @@ class ReActAgent(ReActAgentBase):
         # If required structured output model is provided
         self._required_structured_model: Type[BaseModel] | None = None
 
+        # The text and the result of the long-term memory retrieval done
+        # early by the streamed input message
+        self._prefetched_retrieval: tuple[str, str | None] | None = None
+
         # Register the status variables
         self.register_state("name")
         self.register_state("_sys_prompt")
@@ -220,7 +254,7 @@ class ReActAgent(ReActAgentBase):
         # Long-term memory retrieval
         if self._static_control:
             # Retrieve information from the long-term memory if available
-            retrieved_info = await self.long_term_memory.retrieve(msg)
+            retrieved_info = await self._retrieve_from_long_term_memory(msg)
             if retrieved_info:
                 await self.memory.add(
                     Msg(
@@ -417,9 +451,141 @@ class ReActAgent(ReActAgentBase):
             return response_msg
 
         finally:
+            # Truncate the large tool output before recording it, and spill
+            # the full one to the blob store
+            policy = self._get_tool_output_policy(tool_call["name"])
+            tool_res_block = tool_res_msg.content[0]
+            if policy is not None and isinstance(
+                tool_res_block["output"],  # type: ignore[index]
+                list,
+            ):
+                tool_res_block["output"] = policy.apply(  # type: ignore[index]
+                    tool_res_block["output"],  # type: ignore[index]
+                    self.blob_store,
+                )
+
             # Record the tool result message in the memory
             await self.memory.add(tool_res_msg)
 
+    def _get_tool_output_policy(
+        self,
+        tool_name: str,
+    ) -> ToolOutputPolicy | None:
+        """Get the output policy of the given tool function."""
+        if tool_name in [self.finish_function_name, "view_tool_output"]:
+            return None
+        if isinstance(self.tool_output_policy, dict):
+            return self.tool_output_policy.get(tool_name)
+        return self.tool_output_policy
+
+    def view_tool_output(
+        self,
+        blob_id: str,
+        offset: int = 0,
+        length: int = 8000,
+    ) -> ToolResponse:
+        """View a part of a truncated tool output, which is stored in the
+        blob store.
+
+        Args:
+            blob_id (`str`):
+                The id of the blob that stores the full tool output.
+            offset (`int`, defaults to `0`):
+                The character offset to start viewing from.
+            length (`int`, defaults to `8000`):
+                The number of characters to view.
+        """
+        try:
+            text = self.blob_store.get_text(blob_id)
+        except (KeyError, ValueError):
+            return ToolResponse(
+                content=[
+                    TextBlock(
+                        type="text",
+                        text=f"Error: Blob {blob_id} not found.",
+                    ),
+                ],
+            )
+
+        # Never return more than a single tool result can keep inline
+        policies = (
+            list(self.tool_output_policy.values())
+            if isinstance(self.tool_output_policy, dict)
+            else [self.tool_output_policy]
+        )
+        max_length = max(
+            (_.max_inline_chars for _ in policies if _ is not None),
+            default=length,
+        )
+        offset = max(0, offset)
+        end = offset + max(1, min(length, max_length))
+
+        remaining = max(0, len(text) - end)
+        note = (
+            f"\n\n[... {remaining} characters remaining, continue with "
+            f"offset={end} ...]"
+            if remaining
+            else "\n\n[End of the output.]"
+        )
+        return ToolResponse(
+            content=[
+                TextBlock(
+                    type="text",
+                    text=f"[Characters {offset} to {min(end, len(text))} of "
+                    f"{len(text)}]\n{text[offset:end]}{note}",
+                ),
+            ],
+        )
+
+    async def observe_stream(self, msg: Msg, last: bool) -> None:
+        """Retrieve from the long-term memory once a text reply of the
+        upstream agent is completely streamed, and reuse the result in
+        `reply` if the input message has the same text.
+
+        .. note:: The partial chunks are ignored, since a provisional query
+         costs an extra retrieval. So the retrieval only overlaps with the
+         rest of the upstream reply after its text is streamed, e.g. the
+         acting, the long-term memory recording and the hooks.
+
+        Args:
+            msg (`Msg`):
+                The frozen chunk of the message.
+            last (`bool`):
+                Whether this is the last chunk of the message.
+        """
+        if (
+            not last
+            or not self._static_control
+            or msg.has_content_blocks("tool_use")
+            or not msg.get_text_content()
+        ):
+            return
+
+        # Retrieve within the streaming consumer rather than a detached
+        # task, so that it's cancelled together with the pipeline
+        self._prefetched_retrieval = None
+        retrieved_info = await self.long_term_memory.retrieve(msg)
+        self._prefetched_retrieval = (msg.get_text_content(), retrieved_info)
+
+    async def _retrieve_from_long_term_memory(
+        self,
+        msg: Msg | list[Msg] | None,
+    ) -> str | None:
+        """Retrieve from the long-term memory, reusing the result of
+        `observe_stream` if the input message has the same text."""
+        prefetched, self._prefetched_retrieval = (
+            self._prefetched_retrieval,
+            None,
+        )
+        if (
+            prefetched is not None
+            and isinstance(msg, Msg)
+            and msg.get_text_content() == prefetched[0]
+        ):
+            return prefetched[1]
+
+        return await self.long_term_memory.retrieve(msg)
+
     async def observe(self, msg: Msg | list[Msg] | None) -> None:
         """Receive observing message(s) without generating a reply.
 
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 """The dashscope embedding module in agentscope."""
+import asyncio
 from datetime import datetime
 from typing import Any, List
 
@@ -12,11 +13,17 @@ from ._embedding_base import EmbeddingModelBase
 class DashScopeTextEmbedding(EmbeddingModelBase):
     """DashScope text embedding model class"""
 
+    max_batch_size: int | None = 10
+    """The maximum number of texts in a request, which is 10 for the
+    text-embedding-v3 and v4 models."""
+
     def __init__(
         self,
         api_key: str,
         model_name: str,
         embedding_cache: EmbeddingCacheBase | None = None,
+        max_concurrency: int = 4,
+        max_retries: int = 3,
     ) -> None:
         """Initialize the DashScope text embedding model class.
 
@@ -28,8 +35,13 @@ class DashScopeTextEmbedding(EmbeddingModelBase):
             embedding_cache (`EmbeddingCacheBase`):
                 The embedding cache class instance, used to cache the
                 embedding results to avoid repeated API calls.
+            max_concurrency (`int`, defaults to `4`):
+                The maximum number of the batches sent concurrently in a
+                call.
+            max_retries (`int`, defaults to `3`):
+                The maximum number of attempts for each batch.
         """
-        super().__init__(model_name)
+        super().__init__(model_name, max_concurrency, max_retries)
 
         self.api_key = api_key
         self.embedding_cache = embedding_cache
@@ -68,32 +80,39 @@ class DashScopeTextEmbedding(EmbeddingModelBase):
 
         import dashscope
 
+        async def embed_batch(
+            batch: List[str],
+        ) -> tuple[List[List[float]], int | None]:
+            """Embed a batch of texts in a thread, since the DashScope SDK
+            only provides a synchronous API."""
+            response = await asyncio.to_thread(
+                dashscope.embeddings.TextEmbedding.call,
+                api_key=self.api_key,
+                **{**kwargs, "input": batch},
+            )
+            if response.status_code != 200:
+                raise RuntimeError(
+                    f"Failed to get embedding from DashScope API: {response}",
+                )
+            return (
+                [_["embedding"] for _ in response.output["embeddings"]],
+                response.usage["total_tokens"],
+            )
+
         start_time = datetime.now()
-        response = dashscope.embeddings.TextEmbedding.call(
-            api_key=self.api_key,
-            **kwargs,
-        )
+        embeddings, tokens = await self._embed_in_batches(text, embed_batch)
         time = (datetime.now() - start_time).total_seconds()
 
-        if response.status_code != 200:
-            raise RuntimeError(
-                f"Failed to get embedding from DashScope API: {response}",
-            )
-
         if self.embedding_cache:
             await self.embedding_cache.store(
                 identifier=kwargs,
-                embeddings=[
-                    _["embedding"] for _ in response.output["embeddings"]
-                ],
+                embeddings=embeddings,
             )
 
-        embedding_response = EmbeddingResponse(
-            embeddings=[_["embedding"] for _ in response.output["embeddings"]],
+        return EmbeddingResponse(
+            embeddings=embeddings,
             usage=EmbeddingUsage(
-                tokens=response.usage["total_tokens"],
+                tokens=tokens,
                 time=time,
             ),
         )
-
-        return embedding_response
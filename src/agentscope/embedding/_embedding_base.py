@@ -1,8 +1,10 @@
 # -*- coding: utf-8 -*-
 """The embedding model base class."""
-from typing import Any, List, TYPE_CHECKING
+import asyncio
+from typing import Any, Awaitable, Callable, List, TYPE_CHECKING
 
 from ._embedding_response import EmbeddingResponse
+from .._logging import logger
 
 if TYPE_CHECKING:
     from ..model import ChatResponse
@@ -11,22 +13,55 @@ else:
 
 
 class EmbeddingModelBase:
-    """Base class for embedding models."""
+    """Base class for embedding models.
+
+    The subclasses can send the inputs by `_embed_in_batches`, which splits
+    them into the batches accepted by the provider according to
+    `max_batch_size` and `max_batch_tokens`, runs the batches with a bounded
+    concurrency and retries, and merges the results in order.
+    """
 
     model_name: str
     """The embedding model name"""
 
+    max_batch_size: int | None = None
+    """The maximum number of texts in a single API request, `None` means
+    no limit."""
+
+    max_batch_tokens: int | None = None
+    """The maximum number of tokens in a single API request, `None` means
+    no limit. The tokens are estimated by `_count_tokens`."""
+
     def __init__(
         self,
         model_name: str,
+        max_concurrency: int = 4,
+        max_retries: int = 3,
     ) -> None:
         """Initialize the embedding model base class.
 
         Args:
             model_name (`str`):
                 The name of the embedding model.
+            max_concurrency (`int`, defaults to `4`):
+                The maximum number of the batches sent concurrently in a
+                call.
+            max_retries (`int`, defaults to `3`):
+                The maximum number of attempts for each batch.
         """
+        if max_concurrency < 1:
+            raise ValueError(
+                f"`max_concurrency` must be at least 1, got "
+                f"{max_concurrency}.",
+            )
+        if max_retries < 1:
+            raise ValueError(
+                f"`max_retries` must be at least 1, got {max_retries}.",
+            )
+
         self.model_name = model_name
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
 
     async def __call__(
         self,
@@ -38,3 +73,101 @@ class EmbeddingModelBase:
             f"The {self.__class__.__name__} class does not implement "
             f"the __call__ method.",
         )
+
+    def _count_tokens(self, text: str) -> int:
+        """Estimate the number of tokens of the given text. The number of
+        characters is used by default, which is an upper bound for most
+        tokenizers."""
+        return len(text)
+
+    def _split_batches(self, text: List[str]) -> list[List[str]]:
+        """Split the texts into consecutive batches under the batch size and
+        token limits. A text exceeding the token limit alone is sent in its
+        own batch."""
+        batches: list[List[str]] = []
+        batch: List[str] = []
+        n_tokens = 0
+        for _ in text:
+            tokens = self._count_tokens(_) if self.max_batch_tokens else 0
+            if batch and (
+                (self.max_batch_size and len(batch) >= self.max_batch_size)
+                or (
+                    self.max_batch_tokens
+                    and n_tokens + tokens > self.max_batch_tokens
+                )
+            ):
+                batches.append(batch)
+                batch, n_tokens = [], 0
+            batch.append(_)
+            n_tokens += tokens
+
+        if batch:
+            batches.append(batch)
+        return batches
+
+    async def _embed_in_batches(
+        self,
+        text: List[str],
+        embed_batch: Callable[
+            [List[str]],
+            Awaitable[tuple[List[List[float]], int | None]],
+        ],
+    ) -> tuple[List[List[float]], int | None]:
+        """Embed the texts batch by batch with a bounded concurrency, and
+        merge the results in the input order.
+
+        Args:
+            text (`List[str]`):
+                The input texts.
+            embed_batch (`Callable[[List[str]], Awaitable[tuple[List[List\
+            [float]], int | None]]]`):
+                The async function that sends a single API request for a
+                batch, and returns the embeddings together with the number
+                of used tokens (`None` if not available).
+
+        Returns:
+            `tuple[List[List[float]], int | None]`:
+                The embeddings of all the texts, and the total number of
+                used tokens, which is `None` if not available for any batch.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def run_batch(
+            batch: List[str],
+        ) -> tuple[List[List[float]], int | None]:
+            async with semaphore:
+                for attempt in range(self.max_retries):
+                    try:
+                        embeddings, tokens = await embed_batch(batch)
+                        if len(embeddings) != len(batch):
+                            raise RuntimeError(
+                                f"Expected {len(batch)} embeddings, got "
+                                f"{len(embeddings)}.",
+                            )
+                        return embeddings, tokens
+
+                    except Exception as e:
+                        if attempt == self.max_retries - 1:
+                            raise
+                        logger.info(
+                            "Failed to embed a batch of %d texts with %s. "
+                            "Error %s. Retrying...",
+                            len(batch),
+                            self.model_name,
+                            str(e),
+                        )
+                        await asyncio.sleep(2**attempt)
+
+            raise RuntimeError(
+                f"Failed to embed a batch of {len(batch)} texts.",
+            )
+
+        results = await asyncio.gather(
+            *[run_batch(_) for _ in self._split_batches(text)],
+        )
+
+        embeddings = [_ for batch, _tokens in results for _ in batch]
+        tokens = [_tokens for _batch, _tokens in results]
+        if None in tokens:
+            return embeddings, None
+        return embeddings, sum(tokens)
@@ -12,11 +12,16 @@ from ._embedding_base import EmbeddingModelBase
 class GeminiTextEmbedding(EmbeddingModelBase):
     """The Gemini text embedding model."""
 
+    max_batch_size: int | None = 100
+    """The maximum number of texts in a request."""
+
     def __init__(
         self,
         api_key: str,
         model_name: str,
         embedding_cache: EmbeddingCacheBase | None = None,
+        max_concurrency: int = 4,
+        max_retries: int = 3,
         **kwargs: Any,
     ) -> None:
         """Initialize the Gemini text embedding model class.
@@ -29,10 +34,17 @@ class GeminiTextEmbedding(EmbeddingModelBase):
             embedding_cache (`EmbeddingCacheBase | None`, defaults to `None`):
                 The embedding cache class instance, used to cache the
                 embedding results to avoid repeated API calls.
+            max_concurrency (`int`, defaults to `4`):
+                The maximum number of the batches sent concurrently in a
+                call.
+            max_retries (`int`, defaults to `3`):
+                The maximum number of attempts for each batch.
+            **kwargs (`Any`):
+                The keyword arguments used to initialize the Gemini client.
         """
         from google import genai
 
-        super().__init__(model_name)
+        super().__init__(model_name, max_concurrency, max_retries)
 
         self.client = genai.Client(api_key=api_key, **kwargs)
         self.embedding_cache = embedding_cache
@@ -68,18 +80,27 @@ class GeminiTextEmbedding(EmbeddingModelBase):
                     source="cache",
                 )
 
+        async def embed_batch(
+            batch: List[str],
+        ) -> tuple[List[List[float]], int | None]:
+            """Embed a batch of texts with the async client."""
+            response = await self.client.aio.models.embed_content(
+                **{**kwargs, "contents": batch},
+            )
+            return [_.values for _ in response.embeddings], None
+
         start_time = datetime.now()
-        response = self.client.models.embed_content(**kwargs)
+        embeddings, _ = await self._embed_in_batches(text, embed_batch)
         time = (datetime.now() - start_time).total_seconds()
 
         if self.embedding_cache:
             await self.embedding_cache.store(
                 identifier=kwargs,
-                embeddings=[_.values for _ in response.embeddings],
+                embeddings=embeddings,
             )
 
         return EmbeddingResponse(
-            embeddings=[_.values for _ in response.embeddings],
+            embeddings=embeddings,
             usage=EmbeddingUsage(
                 time=time,
             ),
@@ -1,6 +1,5 @@
 # -*- coding: utf-8 -*-
 """The ollama text embedding model class."""
-import asyncio
 from datetime import datetime
 from typing import List, Any
 
@@ -13,11 +12,16 @@ from ..embedding import EmbeddingModelBase
 class OllamaTextEmbedding(EmbeddingModelBase):
     """The Ollama embedding model."""
 
+    max_batch_size: int | None = 1
+    """The embeddings API of Ollama accepts a single text in a request."""
+
     def __init__(
         self,
         model_name: str,
         host: str | None = None,
         embedding_cache: EmbeddingCacheBase | None = None,
+        max_concurrency: int = 4,
+        max_retries: int = 3,
         **kwargs: Any,
     ) -> None:
         """Initialize the Ollama text embedding model class.
@@ -30,10 +34,17 @@ class OllamaTextEmbedding(EmbeddingModelBase):
             embedding_cache (`EmbeddingCacheBase | None`, defaults to `None`):
                 The embedding cache class instance, used to cache the
                 embedding results to avoid repeated API calls.
+            max_concurrency (`int`, defaults to `4`):
+                The maximum number of the requests sent concurrently in a
+                call.
+            max_retries (`int`, defaults to `3`):
+                The maximum number of attempts for each request.
+            **kwargs (`Any`):
+                The keyword arguments used to initialize the Ollama client.
         """
         import ollama
 
-        super().__init__(model_name)
+        super().__init__(model_name, max_concurrency, max_retries)
 
         self.client = ollama.AsyncClient(host=host, **kwargs)
         self.embedding_cache = embedding_cache
@@ -50,9 +61,15 @@ class OllamaTextEmbedding(EmbeddingModelBase):
                 The input text to be embedded. It can be a list of strings.
         """
 
+        identifier = {
+            "input": text,
+            "model": self.model_name,
+            **kwargs,
+        }
+
         if self.embedding_cache:
             cached_embeddings = await self.embedding_cache.retrieve(
-                identifier=kwargs,
+                identifier=identifier,
             )
             if cached_embeddings:
                 return EmbeddingResponse(
@@ -64,23 +81,29 @@ class OllamaTextEmbedding(EmbeddingModelBase):
                     source="cache",
                 )
 
+        async def embed_batch(
+            batch: List[str],
+        ) -> tuple[List[List[float]], int | None]:
+            """Embed a single text."""
+            response = await self.client.embeddings(
+                self.model_name,
+                batch[0],
+                **kwargs,
+            )
+            return [response.embedding], None
+
         start_time = datetime.now()
-        response = await asyncio.gather(
-            *[
-                self.client.embeddings(self.model_name, _, **kwargs)
-                for _ in text
-            ],
-        )
+        embeddings, _ = await self._embed_in_batches(text, embed_batch)
         time = (datetime.now() - start_time).total_seconds()
 
         if self.embedding_cache:
             await self.embedding_cache.store(
-                identifier=kwargs,
-                embeddings=[_.embedding for _ in response],
+                identifier=identifier,
+                embeddings=embeddings,
             )
 
         return EmbeddingResponse(
-            embeddings=[_.embedding for _ in response],
+            embeddings=embeddings,
             usage=EmbeddingUsage(
                 time=time,
             ),
@@ -12,11 +12,19 @@ from ._embedding_base import EmbeddingModelBase
 class OpenAITextEmbedding(EmbeddingModelBase):
     """OpenAI text embedding model class."""
 
+    max_batch_size: int | None = 2048
+    """The maximum number of texts in a request."""
+
+    max_batch_tokens: int | None = 300_000
+    """The maximum number of tokens summed over the texts in a request."""
+
     def __init__(
         self,
         api_key: str,
         model_name: str,
         embedding_cache: EmbeddingCacheBase | None = None,
+        max_concurrency: int = 4,
+        max_retries: int = 3,
         **kwargs: Any,
     ) -> None:
         """Initialize the OpenAI text embedding model class.
@@ -29,10 +37,17 @@ class OpenAITextEmbedding(EmbeddingModelBase):
             embedding_cache (`EmbeddingCacheBase | None`, defaults to `None`):
                 The embedding cache class instance, used to cache the
                 embedding results to avoid repeated API calls.
+            max_concurrency (`int`, defaults to `4`):
+                The maximum number of the batches sent concurrently in a
+                call.
+            max_retries (`int`, defaults to `3`):
+                The maximum number of attempts for each batch.
+            **kwargs (`Any`):
+                The keyword arguments used to initialize the OpenAI client.
         """
         import openai
 
-        super().__init__(model_name)
+        super().__init__(model_name, max_concurrency, max_retries)
 
         self.client = openai.AsyncClient(api_key=api_key, **kwargs)
         self.embedding_cache = embedding_cache
@@ -70,20 +85,32 @@ class OpenAITextEmbedding(EmbeddingModelBase):
                     source="cache",
                 )
 
+        async def embed_batch(
+            batch: List[str],
+        ) -> tuple[List[List[float]], int | None]:
+            """Embed a batch of texts."""
+            response = await self.client.embeddings.create(
+                **{**kwargs, "input": batch},
+            )
+            return (
+                [_.embedding for _ in response.data],
+                response.usage.total_tokens,
+            )
+
         start_time = datetime.now()
-        response = await self.client.embeddings.create(**kwargs)
+        embeddings, tokens = await self._embed_in_batches(text, embed_batch)
         time = (datetime.now() - start_time).total_seconds()
 
         if self.embedding_cache:
             await self.embedding_cache.store(
                 identifier=kwargs,
-                embeddings=[_.embedding for _ in response.data],
+                embeddings=embeddings,
             )
 
         return EmbeddingResponse(
-            embeddings=[_.embedding for _ in response.data],
+            embeddings=embeddings,
             usage=EmbeddingUsage(
-                tokens=response.usage.total_tokens,
+                tokens=tokens,
                 time=time,
             ),
         )
@@ -5,6 +5,7 @@ from ._evaluator import (
     EvaluatorBase,
     RayEvaluator,
     GeneralEvaluator,
+    ProcessPoolEvaluator,
 )
 from ._metric_base import (
     MetricBase,
@@ -30,6 +31,7 @@ __all__ = [
     "EvaluatorBase",
     "RayEvaluator",
     "GeneralEvaluator",
+    "ProcessPoolEvaluator",
     "MetricBase",
     "MetricResult",
     "MetricType",
@@ -2,8 +2,12 @@
 """The ACE benchmark class in agentscope. The code is implemented with
 reference to the `ACEBench <https://github.com/ACEBench/ACEBench>`_
 under the MIT license."""
+import copy
+import glob
+import hashlib
 import json
 import os
+import pickle
 from typing import Generator
 
 import json5
@@ -55,15 +59,32 @@ class ACEBenchmark(BenchmarkBase):
     ]
     """The data filenames"""
 
+    cache_dir: str = ".cache"
+    """The subdirectory of the data dir to store the compiled dataset"""
+
     def __init__(
         self,
         data_dir: str,
+        languages: list[str] | None = None,
+        categories: list[str] | None = None,
+        use_cache: bool = True,
     ) -> None:
         """Initialize the ACEBenchmark
 
         Args:
             data_dir (`str`):
                 The directory where the dataset is downloaded and saved.
+            languages (`list[str] | None`, optional):
+                Only load the tasks in the given languages, e.g. `["zh"]`.
+                If not provided, all the languages are loaded.
+            categories (`list[str] | None`, optional):
+                Only load the tasks in the given categories, e.g.
+                `["agent_multi_step"]`. If not provided, all the categories
+                are loaded.
+            use_cache (`bool`, defaults to `True`):
+                Whether to compile the parsed data files into a pickle cache
+                under the data dir, keyed by the hash of the files, so that
+                the slow JSON5 parsing only happens once.
         """
         super().__init__(
             name="ACEBench",
@@ -82,51 +103,161 @@ class ACEBenchmark(BenchmarkBase):
         if not self._verify_data():
             self._download_data()
 
-        self.dataset = self._load_data()
+        self.use_cache = use_cache
+        self.dataset = self._load_data(languages, categories)
+
+    @staticmethod
+    def _get_language(subdir: str) -> str:
+        """Get the language from the data subdir, e.g. `"zh"`."""
+        return subdir.rsplit("_", maxsplit=1)[-1]
+
+    @staticmethod
+    def _get_category(filename: str) -> str:
+        """Get the category from the data filename, e.g.
+        `"agent_multi_step"`."""
+        return filename.split(".", maxsplit=1)[0].removeprefix("data_")
+
+    def _load_data(
+        self,
+        languages: list[str] | None = None,
+        categories: list[str] | None = None,
+    ) -> list[dict]:
+        """Load the dataset of the given languages and categories from the
+        data directory, where the other data files are not parsed."""
+        all_languages = [self._get_language(_) for _ in self.data_subdir]
+        all_categories = [self._get_category(_) for _ in self.data_files]
+        for name, values, supported in [
+            ("languages", languages, all_languages),
+            ("categories", categories, all_categories),
+        ]:
+            unknown = set(values or []) - set(supported)
+            if unknown:
+                raise ValueError(
+                    f"Unknown {name} {sorted(unknown)}, expected ones in "
+                    f"{supported}.",
+                )
 
-    def _load_data(self) -> list[dict]:
-        """Load the dataset from the data directory."""
         dataset = []
         for subdir in self.data_subdir:
+            if languages and self._get_language(subdir) not in languages:
+                continue
             for filename in self.data_files:
-                file_path = os.path.join(self.data_dir, subdir, filename)
+                if categories and self._get_category(filename) not in (
+                    categories
+                ):
+                    continue
+                dataset.extend(self._load_file(subdir, filename))
 
-                gt_path = os.path.join(
-                    self.data_dir,
-                    subdir,
-                    self.ground_truth_dir,
-                    filename,
-                )
-                gt_dataset = {}
-                with open(gt_path, "r", encoding="utf-8") as gt_file:
-                    for line in gt_file:
-                        gt_data = json5.loads(line)
-                        gt_dataset[gt_data["id"]] = gt_data
-
-                with open(file_path, "r", encoding="utf-8") as f:
-                    for line in f:
-                        data = json5.loads(line)
-                        gt = gt_dataset[data["id"]]
-                        gt.pop("id", None)
-                        data["ground_truth"] = gt["ground_truth"]
-                        data["mile_stone"] = gt["mile_stone"]
-                        data["language"] = subdir.rsplit(
-                            "_",
-                            maxsplit=1,
-                        )[-1]
-                        data["tags"] = {
-                            "language": data["language"],
-                            "category": filename.split(
-                                ".",
-                                maxsplit=1,
-                            )[0].removeprefix(
-                                "data_",
-                            ),
-                        }
-                        dataset.append(data)
+        return dataset
+
+    def _load_file(self, subdir: str, filename: str) -> list[dict]:
+        """Load a data file and its ground truth from the compiled cache, or
+        parse and compile them if the cache doesn't exist or is outdated."""
+        file_path = os.path.join(self.data_dir, subdir, filename)
+        gt_path = os.path.join(
+            self.data_dir,
+            subdir,
+            self.ground_truth_dir,
+            filename,
+        )
+        if not self.use_cache:
+            return self._parse_file(subdir, filename, file_path, gt_path)
+
+        hasher = hashlib.sha256()
+        for path in [file_path, gt_path]:
+            with open(path, "rb") as f:
+                hasher.update(f.read())
+
+        cache_prefix = os.path.join(
+            self.data_dir,
+            self.cache_dir,
+            f"{subdir}_{filename}",
+        )
+        cache_path = f"{cache_prefix}.{hasher.hexdigest()[:16]}.pkl"
+        if os.path.exists(cache_path):
+            with open(cache_path, "rb") as f:
+                return pickle.load(f)
+
+        dataset = self._parse_file(subdir, filename, file_path, gt_path)
+
+        # Remove the outdated caches, and write the new one atomically
+        for outdated_path in glob.glob(f"{glob.escape(cache_prefix)}.*.pkl"):
+            os.remove(outdated_path)
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(f"{cache_path}.tmp", "wb") as f:
+            pickle.dump(dataset, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(f"{cache_path}.tmp", cache_path)
 
         return dataset
 
+    def _parse_file(
+        self,
+        subdir: str,
+        filename: str,
+        file_path: str,
+        gt_path: str,
+    ) -> list[dict]:
+        """Parse a data file and its ground truth."""
+        gt_dataset = {}
+        with open(gt_path, "r", encoding="utf-8") as gt_file:
+            for line in gt_file:
+                gt_data = json5.loads(line)
+                gt_dataset[gt_data["id"]] = gt_data
+
+        dataset = []
+        with open(file_path, "r", encoding="utf-8") as f:
+            for line in f:
+                data = json5.loads(line)
+                gt = gt_dataset[data["id"]]
+                gt.pop("id", None)
+                data["ground_truth"] = gt["ground_truth"]
+                data["mile_stone"] = gt["mile_stone"]
+                data["language"] = self._get_language(subdir)
+                data["tags"] = {
+                    "language": data["language"],
+                    "category": self._get_category(filename),
+                }
+                # Handle the schema differences once when compiling
+                data["function"] = [
+                    json.loads(
+                        json.dumps(function_schema).replace(
+                            '"type": "dict"',
+                            '"type": "object"',
+                        ),
+                    )
+                    for function_schema in data["function"]
+                ]
+                dataset.append(data)
+
+        return dataset
+
+    def filter(
+        self,
+        languages: list[str] | None = None,
+        categories: list[str] | None = None,
+    ) -> "ACEBenchmark":
+        """Get a view of the benchmark with only the tasks in the given
+        languages and categories, sharing the loaded data with this one.
+
+        Args:
+            languages (`list[str] | None`, optional):
+                The languages to keep, e.g. `["zh"]`.
+            categories (`list[str] | None`, optional):
+                The categories to keep, e.g. `["agent_multi_turn"]`.
+
+        Returns:
+            `ACEBenchmark`:
+                The filtered benchmark.
+        """
+        benchmark = copy.copy(self)
+        benchmark.dataset = [
+            item
+            for item in self.dataset
+            if (not languages or item["tags"]["language"] in languages)
+            and (not categories or item["tags"]["category"] in categories)
+        ]
+        return benchmark
+
     def _verify_data(self) -> bool:
         """Verify the data completeness and integrity."""
         for subdir in self.data_subdir:
@@ -179,28 +310,18 @@ class ACEBenchmark(BenchmarkBase):
         ace_phone = ACEPhone()
         ace_phone.load_initial_config(item["initial_config"])
 
-        # Obtain tool functions
+        # Obtain tool functions, whose schemas are formatted when loading
         tools: list[tuple] = []
         for function_schema in item["function"]:
-            name = function_schema["name"]
-
-            # Handle the schema differences
-            formatted_schema = json.loads(
-                json.dumps(
-                    function_schema,
-                ).replace(
-                    '"type": "dict"',
-                    '"type": "object"',
-                ),
+            tool_function = ace_phone.get_tool_function(
+                function_schema["name"],
             )
-
-            tool_function = ace_phone.get_tool_function(name)
             tools.append(
                 (
                     tool_function,
                     {
                         "type": "function",
-                        "function": formatted_schema,
+                        "function": copy.deepcopy(function_schema),
                     },
                 ),
             )
@@ -0,0 +1,322 @@
+# -*- coding: utf-8 -*-
+"""The multiprocess evaluator in agentscope, which uses multiple cores on a
+single node without a Ray cluster."""
+import asyncio
+import inspect
+import multiprocessing
+import queue
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Awaitable, Callable
+
+from ._evaluator_base import EvaluatorBase
+from .._benchmark_base import BenchmarkBase
+from .._evaluator_storage import EvaluatorStorageBase
+from .._solution import SolutionOutput
+from .._task import Task
+from ..._logging import logger
+
+
+async def _run_worker_loop(
+    storage: EvaluatorStorageBase,
+    solution: Callable[
+        [Task, Callable],
+        Awaitable[SolutionOutput] | SolutionOutput,
+    ],
+    task_queue: Any,
+    result_queue: Any,
+    n_tasks_per_worker: int,
+) -> None:
+    """Take the tasks from the task queue whenever there is a free slot, and
+    put the results into the result queue."""
+    semaphore = asyncio.Semaphore(n_tasks_per_worker)
+    running = set()
+
+    async def run_task(
+        repeat_id: str,
+        task: Task,
+        solution_result: SolutionOutput | None,
+    ) -> None:
+        """Run the solution if it's not finished, and evaluate it."""
+        try:
+            is_new = solution_result is None
+            if is_new:
+                solution_result = solution(
+                    task,
+                    storage.get_agent_pre_print_hook(task.id, repeat_id),
+                )
+                if inspect.isawaitable(solution_result):
+                    solution_result = await solution_result
+
+            # Evaluate in a thread to keep the other tasks running
+            evaluations = await asyncio.to_thread(
+                task.evaluate,
+                solution_result,
+            )
+            result_queue.put(
+                (
+                    repeat_id,
+                    task.id,
+                    solution_result if is_new else None,
+                    evaluations,
+                    None,
+                ),
+            )
+
+        except Exception as e:
+            result_queue.put((repeat_id, task.id, None, [], repr(e)))
+
+    while True:
+        await semaphore.acquire()
+        item = await asyncio.to_thread(task_queue.get)
+        if item is None:
+            semaphore.release()
+            break
+
+        running_task = asyncio.create_task(run_task(*item))
+        running.add(running_task)
+        running_task.add_done_callback(running.discard)
+        running_task.add_done_callback(lambda _: semaphore.release())
+
+    await asyncio.gather(*running)
+
+
+def _run_worker(*args: Any) -> None:
+    """The entry of the worker processes, which runs a long-lived event loop
+    until the task queue is exhausted."""
+    asyncio.run(_run_worker_loop(*args))
+
+
+class ProcessPoolEvaluator(EvaluatorBase):
+    """The multiprocess evaluator, which runs the tasks in `n_workers`
+    processes on a single node without a Ray cluster. Each process runs up
+    to `n_tasks_per_worker` tasks concurrently on its own event loop, and
+    takes the next task whenever one of its tasks finishes.
+
+    The storage is only written by the main process (single writer): the
+    workers send the solution outputs and the evaluation results back, and
+    the main process saves them, so the storages that are not process-safe
+    can also be used. The agent printing hooks are still called in the
+    workers, and only write to the files of their own tasks.
+
+    As in the other evaluators, the finished solutions and evaluations in
+    the storage are skipped, so that an interrupted evaluation can be
+    resumed.
+
+    .. note:: The worker processes are started by `spawn`, so the solution
+     and the storage must be picklable, e.g. the solution should be a
+     module-level function, and the evaluation script should be guarded by
+     `if __name__ == "__main__":`.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        benchmark: BenchmarkBase,
+        n_repeat: int,
+        storage: EvaluatorStorageBase,
+        n_workers: int,
+        n_tasks_per_worker: int = 8,
+    ) -> None:
+        """Initialize the evaluator.
+
+        Args:
+            name (`str`):
+                The name of this evaluator.
+            benchmark: (`BenchmarkBase`):
+                A benchmark instance inheriting from `BenchmarkBase` that
+                defines the evaluation dataset.
+            n_repeat (`int`):
+                How many times to repeat the evaluation for each task.
+            storage (`EvaluatorStorageBase`):
+                A instance inheriting from the child class of
+                `EvaluatorStorageBase` that supports storing and loading
+                solution output and evaluation results.
+            n_workers (`int`):
+                The number of the worker processes.
+            n_tasks_per_worker (`int`, defaults to `8`):
+                The maximum number of the tasks running concurrently in each
+                worker process.
+        """
+        super().__init__(
+            name=name,
+            benchmark=benchmark,
+            n_repeat=n_repeat,
+            storage=storage,
+        )
+
+        assert isinstance(benchmark, BenchmarkBase)
+
+        assert n_repeat >= 1, "n_repeat must be at least 1"
+
+        assert n_workers >= 1, "n_workers must be at least 1"
+
+        assert n_tasks_per_worker >= 1, "n_tasks_per_worker must be at least 1"
+
+        self.n_workers = n_workers
+        self.n_tasks_per_worker = n_tasks_per_worker
+
+    def _get_pending_items(
+        self,
+    ) -> list[tuple[str, Task, SolutionOutput | None]]:
+        """Get the unfinished tasks, together with their finished solution
+        outputs if exist."""
+        items = []
+        for repeat_id in range(self.n_repeat):
+            repeat_id = str(repeat_id)
+            for task in self.benchmark:
+                if not self.storage.solution_result_exists(
+                    task.id,
+                    repeat_id,
+                ):
+                    items.append((repeat_id, task, None))
+                    continue
+
+                if all(
+                    self.storage.evaluation_result_exists(
+                        task.id,
+                        repeat_id,
+                        metric.name,
+                    )
+                    for metric in task.metrics
+                ):
+                    continue
+
+                items.append(
+                    (
+                        repeat_id,
+                        task,
+                        self.storage.get_solution_result(task.id, repeat_id),
+                    ),
+                )
+        return items
+
+    async def run(
+        self,
+        solution: Callable[
+            [Task, Callable],
+            Awaitable[SolutionOutput] | SolutionOutput,
+        ],
+    ) -> None:
+        """Run the multiprocess evaluation, and aggregate the results.
+
+        Args:
+            solution (`Callable[[Task, Callable], Awaitable[SolutionOutput] \
+            | SolutionOutput]`):
+                A picklable sync or async function that takes a `Task`
+                instance and a pre-print hook function as input, returns a
+                `SolutionOutput` instance.
+        """
+        await self._save_evaluation_meta()
+
+        items = self._get_pending_items()
+        if items:
+            await self._run_workers(solution, items)
+
+        await self.aggregate()
+
+    async def _run_workers(
+        self,
+        solution: Callable[
+            [Task, Callable],
+            Awaitable[SolutionOutput] | SolutionOutput,
+        ],
+        items: list[tuple[str, Task, SolutionOutput | None]],
+    ) -> None:
+        """Run the pending tasks in the worker processes, and save the
+        results as they finish."""
+        context = multiprocessing.get_context("spawn")
+        n_workers = min(self.n_workers, len(items))
+
+        with context.Manager() as manager, ProcessPoolExecutor(
+            max_workers=n_workers,
+            mp_context=context,
+        ) as executor:
+            task_queue, result_queue = manager.Queue(), manager.Queue()
+            for item in items:
+                task_queue.put(item)
+            # One stop signal for each worker
+            for _ in range(n_workers):
+                task_queue.put(None)
+
+            workers = [
+                executor.submit(
+                    _run_worker,
+                    self.storage,
+                    solution,
+                    task_queue,
+                    result_queue,
+                    self.n_tasks_per_worker,
+                )
+                for _ in range(n_workers)
+            ]
+
+            failures = []
+            for n_finished in range(1, len(items) + 1):
+                result = await self._get_result(result_queue, workers)
+                (
+                    repeat_id,
+                    task_id,
+                    solution_result,
+                    evaluations,
+                    error,
+                ) = result
+                if error is not None:
+                    failures.append((task_id, repeat_id, error))
+                    logger.error(
+                        "Failed task %s (repeat %s): %s",
+                        task_id,
+                        repeat_id,
+                        error,
+                    )
+                    continue
+
+                if solution_result is not None:
+                    self.storage.save_solution_result(
+                        task_id,
+                        repeat_id,
+                        solution_result,
+                    )
+                for evaluation in evaluations:
+                    self.storage.save_evaluation_result(
+                        task_id=task_id,
+                        repeat_id=repeat_id,
+                        evaluation=evaluation,
+                    )
+                logger.info(
+                    "Finished task %s (repeat %s), %d/%d done.",
+                    task_id,
+                    repeat_id,
+                    n_finished,
+                    len(items),
+                )
+
+            for worker in workers:
+                worker.result()
+
+        if failures:
+            raise RuntimeError(
+                f"{len(failures)}/{len(items)} tasks failed in the "
+                f"evaluation, e.g. task {failures[0][0]} (repeat "
+                f"{failures[0][1]}): {failures[0][2]}",
+            )
+
+    @staticmethod
+    async def _get_result(result_queue: Any, workers: list) -> tuple:
+        """Wait for the next result, and raise the error if a worker process
+        exits unexpectedly, e.g. killed by the OOM killer, or if all the
+        workers exit without sending the result."""
+        while True:
+            try:
+                return await asyncio.to_thread(result_queue.get, timeout=1.0)
+            except queue.Empty as e:
+                for worker in workers:
+                    if worker.done() and worker.exception() is not None:
+                        raise worker.exception() from e
+
+                # The workers put their results before exiting, so no more
+                # result will come
+                if all(_.done() for _ in workers) and result_queue.empty():
+                    raise RuntimeError(
+                        "All the worker processes exited before the results "
+                        "of all the tasks are received.",
+                    ) from e
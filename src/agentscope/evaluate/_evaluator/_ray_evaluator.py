@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 """The evaluator base class in agentscope."""
 import asyncio
+import inspect
+from collections import deque
 from typing import Callable, Awaitable, Coroutine, Any
 
 try:
@@ -13,6 +15,7 @@ from .._evaluator._evaluator_base import EvaluatorBase
 from .._solution import SolutionOutput
 from .._task import Task
 from .._evaluator_storage import EvaluatorStorageBase
+from ..._logging import logger
 
 
 def _lazy_ray_remote(func: Callable) -> Callable:
@@ -26,9 +29,82 @@ def _lazy_ray_remote(func: Callable) -> Callable:
         return func
 
 
+class _EvaluationActor:
+    """The Ray actor that holds a long-lived event loop, and runs multiple
+    tasks concurrently on it. The storage and the solution are deserialized
+    only once per actor, so the clients cached by the solution (e.g. the
+    model clients, toolkits or MCP connections created on first use) are
+    reused across the tasks."""
+
+    def __init__(
+        self,
+        storage: EvaluatorStorageBase,
+        solution: Callable[
+            [Task, Callable],
+            Awaitable[SolutionOutput] | SolutionOutput,
+        ],
+    ) -> None:
+        """Initialize the actor with the storage and the solution."""
+        self.storage = storage
+        self.solution = solution
+
+    async def run_task(self, repeat_id: str, task: Task) -> str:
+        """Generate a solution to a task and evaluate it, returning the task
+        id once finished."""
+        if self.storage.solution_result_exists(task.id, repeat_id):
+            solution_result = self.storage.get_solution_result(
+                task.id,
+                repeat_id,
+            )
+
+        else:
+            solution_result = self.solution(
+                task,
+                self.storage.get_agent_pre_print_hook(task.id, repeat_id),
+            )
+            if inspect.isawaitable(solution_result):
+                solution_result = await solution_result
+            self.storage.save_solution_result(
+                task.id,
+                repeat_id,
+                solution_result,
+            )
+
+        if any(
+            not self.storage.evaluation_result_exists(
+                task.id,
+                repeat_id,
+                metric.name,
+            )
+            for metric in task.metrics
+        ):
+            # Evaluate in a thread to keep the other tasks running
+            evaluation_results = await asyncio.to_thread(
+                task.evaluate,
+                solution_result,
+            )
+            for result in evaluation_results:
+                self.storage.save_evaluation_result(
+                    task_id=task.id,
+                    repeat_id=repeat_id,
+                    evaluation=result,
+                )
+
+        return task.id
+
+
 class RayEvaluator(EvaluatorBase):
     """The ray-based evaluator that supports distributed and parallel
-    evaluation."""
+    evaluation.
+
+    By default, each task runs in a stateless Ray remote function. With
+    `use_actor_pool=True`, the tasks are run by a pool of `n_workers` Ray
+    actors instead, each of which runs up to `n_tasks_per_actor` tasks
+    concurrently on its own event loop, so that the workers are not idle
+    while the agents wait for the LLM APIs. The tasks are dispatched to the
+    actors as soon as they have free slots, and the results are reported
+    as they finish.
+    """
 
     def __init__(
         self,
@@ -37,8 +113,32 @@ class RayEvaluator(EvaluatorBase):
         n_repeat: int,
         storage: EvaluatorStorageBase,
         n_workers: int,
+        use_actor_pool: bool = False,
+        n_tasks_per_actor: int = 8,
     ) -> None:
-        """Initialize the evaluator."""
+        """Initialize the evaluator.
+
+        Args:
+            name (`str`):
+                The name of this evaluator.
+            benchmark: (`BenchmarkBase`):
+                A benchmark instance inheriting from `BenchmarkBase` that
+                defines the evaluation dataset.
+            n_repeat (`int`):
+                How many times to repeat the evaluation for each task.
+            storage (`EvaluatorStorageBase`):
+                A instance inheriting from the child class of
+                `EvaluatorStorageBase` that supports storing and loading
+                solution output and evaluation results.
+            n_workers (`int`):
+                The number of the Ray actors in the actor pool mode.
+            use_actor_pool (`bool`, defaults to `False`):
+                Whether to run the tasks by a pool of long-lived Ray actors
+                rather than one remote function per task.
+            n_tasks_per_actor (`int`, defaults to `8`):
+                The maximum number of the tasks running concurrently in each
+                actor in the actor pool mode.
+        """
         super().__init__(
             name=name,
             benchmark=benchmark,
@@ -52,9 +152,13 @@ class RayEvaluator(EvaluatorBase):
 
         assert n_workers >= 1, "n_workers must be at least 1"
 
+        assert n_tasks_per_actor >= 1, "n_tasks_per_actor must be at least 1"
+
         self.benchmark = benchmark
         self.n_repeat = n_repeat
         self.n_workers = n_workers
+        self.use_actor_pool = use_actor_pool
+        self.n_tasks_per_actor = n_tasks_per_actor
 
     @staticmethod
     @_lazy_ray_remote
@@ -146,6 +250,11 @@ class RayEvaluator(EvaluatorBase):
 
         await self._save_evaluation_meta()
 
+        if self.use_actor_pool:
+            await self._run_actor_pool(solution)
+            await self.aggregate()
+            return
+
         futures = []
         for repeat_id in range(self.n_repeat):
             for task in self.benchmark:
@@ -160,3 +269,94 @@ class RayEvaluator(EvaluatorBase):
         ray.get(futures)
 
         await self.aggregate()
+
+    async def _run_actor_pool(
+        self,
+        solution: Callable[
+            [Task, Callable],
+            Awaitable[SolutionOutput] | SolutionOutput,
+        ],
+    ) -> None:
+        """Run the tasks by the actor pool, where an actor takes the next
+        pending task whenever one of its tasks finishes."""
+        if ray is None:
+            raise ImportError(
+                "The actor pool mode of RayEvaluator requires ray, please "
+                "install it by `pip install ray`.",
+            )
+
+        actor_cls = ray.remote(_EvaluationActor).options(
+            max_concurrency=self.n_tasks_per_actor,
+        )
+        # Serialize the storage and the solution only once for all actors
+        storage_ref, solution_ref = ray.put(self.storage), ray.put(solution)
+        actors = [
+            actor_cls.remote(storage_ref, solution_ref)
+            for _ in range(self.n_workers)
+        ]
+
+        pending = deque(
+            (str(repeat_id), task)
+            for repeat_id in range(self.n_repeat)
+            for task in self.benchmark
+        )
+        n_total = len(pending)
+        running: dict[asyncio.Future, tuple[Any, str, str]] = {}
+
+        def submit(actor: Any) -> None:
+            """Submit the next pending task to the actor."""
+            repeat_id, task = pending.popleft()
+            ref = actor.run_task.remote(repeat_id, task)
+            running[asyncio.wrap_future(ref.future())] = (
+                actor,
+                task.id,
+                repeat_id,
+            )
+
+        n_finished, failures = 0, []
+        try:
+            # Fill the slots of the actors in turn
+            for _ in range(self.n_tasks_per_actor):
+                for actor in actors:
+                    if pending:
+                        submit(actor)
+
+            while running:
+                done, _ = await asyncio.wait(
+                    running,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                for future in done:
+                    actor, task_id, repeat_id = running.pop(future)
+                    n_finished += 1
+                    try:
+                        future.result()
+                        logger.info(
+                            "Finished task %s (repeat %s), %d/%d done.",
+                            task_id,
+                            repeat_id,
+                            n_finished,
+                            n_total,
+                        )
+                    except Exception as e:
+                        failures.append((task_id, repeat_id, e))
+                        logger.error(
+                            "Failed task %s (repeat %s): %s",
+                            task_id,
+                            repeat_id,
+                            str(e),
+                        )
+
+                    if pending:
+                        submit(actor)
+
+        finally:
+            for actor in actors:
+                ray.kill(actor)
+
+        if failures:
+            raise RuntimeError(
+                f"{len(failures)}/{n_total} tasks failed in the evaluation, "
+                f"e.g. task {failures[0][0]} (repeat {failures[0][1]}): "
+                f"{failures[0][2]}",
+            )
@@ -27,6 +27,7 @@ from ._deepseek_formatter import (
     DeepSeekChatFormatter,
     DeepSeekMultiAgentFormatter,
 )
+from ._hedged_formatter import HedgedFormatter
 
 __all__ = [
     "FormatterBase",
@@ -43,4 +44,5 @@ __all__ = [
     "OllamaMultiAgentFormatter",
     "DeepSeekChatFormatter",
     "DeepSeekMultiAgentFormatter",
+    "HedgedFormatter",
 ]
@@ -6,7 +6,14 @@ from typing import Any
 
 from ._truncated_formatter_base import TruncatedFormatterBase
 from .._logging import logger
-from ..message import Msg, TextBlock, ImageBlock, ToolUseBlock, ToolResultBlock
+from ..message import (
+    BlobStore,
+    Msg,
+    TextBlock,
+    ImageBlock,
+    ToolUseBlock,
+    ToolResultBlock,
+)
 from ..token import TokenCounterBase
 
 
@@ -60,9 +67,19 @@ class AnthropicChatFormatter(TruncatedFormatterBase):
 
             for block in msg.get_content_blocks():
                 typ = block.get("type")
-                if typ in ["thinking", "text", "image"]:
+                if typ in ["thinking", "text"]:
                     content_blocks.append({**block})
 
+                elif typ == "image":
+                    content_blocks.append(
+                        {
+                            **block,
+                            "source": BlobStore.resolve_source(
+                                block["source"],
+                            ),
+                        },
+                    )
+
                 elif typ == "tool_use":
                     content_blocks.append(
                         {
@@ -78,7 +95,17 @@ class AnthropicChatFormatter(TruncatedFormatterBase):
                     if output is None:
                         content_value = [{"type": "text", "text": None}]
                     elif isinstance(output, list):
-                        content_value = output
+                        content_value = [
+                            {
+                                **_,
+                                "source": BlobStore.resolve_source(
+                                    _["source"],
+                                ),
+                            }
+                            if _.get("type") == "image"
+                            else _
+                            for _ in output
+                        ]
                     else:
                         content_value = [{"type": "text", "text": str(output)}]
                     messages.append(
@@ -204,7 +231,14 @@ class AnthropicMultiAgentFormatter(TruncatedFormatterBase):
                         )
                         accumulated_text.clear()
 
-                    conversation_blocks.append({**block})
+                    conversation_blocks.append(
+                        {
+                            **block,
+                            "source": BlobStore.resolve_source(
+                                block["source"],
+                            ),
+                        },
+                    )
 
         if accumulated_text:
             conversation_blocks.append(
@@ -10,6 +10,7 @@ from ._truncated_formatter_base import TruncatedFormatterBase
 from .._logging import logger
 from .._utils._common import _is_accessible_local_file
 from ..message import (
+    BlobStore,
     Msg,
     TextBlock,
     ImageBlock,
@@ -151,7 +152,7 @@ class DashScopeChatFormatter(TruncatedFormatterBase):
                     )
 
                 elif typ in ["image", "audio"]:
-                    source = block["source"]
+                    source = BlobStore.resolve_source(block["source"])
                     if source["type"] == "url":
                         url = source["url"]
                         if _is_accessible_local_file(url):
@@ -351,8 +352,9 @@ class DashScopeMultiAgentFormatter(TruncatedFormatterBase):
                         )
                         accumulated_text.clear()
 
-                    if block["source"]["type"] == "url":
-                        url = block["source"]["url"]
+                    source = BlobStore.resolve_source(block["source"])
+                    if source["type"] == "url":
+                        url = source["url"]
                         if _is_accessible_local_file(url):
                             conversation_blocks.append(
                                 {
@@ -363,9 +365,9 @@ class DashScopeMultiAgentFormatter(TruncatedFormatterBase):
                         else:
                             conversation_blocks.append({block["type"]: url})
 
-                    elif block["source"]["type"] == "base64":
-                        media_type = block["source"]["media_type"]
-                        base64_data = block["source"]["data"]
+                    elif source["type"] == "base64":
+                        media_type = source["media_type"]
+                        base64_data = source["data"]
                         conversation_blocks.append(
                             {
                                 block[
@@ -5,7 +5,7 @@ from abc import abstractmethod
 from typing import Any, List
 
 from .._utils._common import _save_base64_data
-from ..message import Msg, AudioBlock, ImageBlock, TextBlock
+from ..message import BlobStore, Msg, AudioBlock, ImageBlock, TextBlock
 
 
 class FormatterBase:
@@ -69,7 +69,7 @@ class FormatterBase:
                     f"Invalid {block['type']} block: {block}, 'source' key "
                     "is required."
                 )
-                source = block["source"]
+                source = BlobStore.resolve_source(block["source"])
                 # Save the image locally and return the file path
                 if source["type"] == "url":
                     textual_output.append(
@@ -9,6 +9,7 @@ from urllib.parse import urlparse
 from ._truncated_formatter_base import TruncatedFormatterBase
 from .._utils._common import _get_bytes_from_web_url
 from ..message import (
+    BlobStore,
     Msg,
     TextBlock,
     ImageBlock,
@@ -153,9 +154,10 @@ class GeminiChatFormatter(TruncatedFormatterBase):
                     )
 
                 elif typ in ["image", "audio", "video"]:
-                    if block["source"]["type"] == "base64":
-                        media_type = block["source"]["media_type"]
-                        base64_data = block["source"]["data"]
+                    source = BlobStore.resolve_source(block["source"])
+                    if source["type"] == "base64":
+                        media_type = source["media_type"]
+                        base64_data = source["data"]
 
                         parts.append(
                             {
@@ -166,11 +168,11 @@ class GeminiChatFormatter(TruncatedFormatterBase):
                             },
                         )
 
-                    elif block["source"]["type"] == "url":
+                    elif source["type"] == "url":
                         parts.append(
                             {
                                 "inline_data": _to_gemini_inline_data(
-                                    block["source"]["url"],
+                                    source["url"],
                                 ),
                             },
                         )
@@ -336,18 +338,19 @@ class GeminiMultiAgentFormatter(TruncatedFormatterBase):
                         accumulated_text.clear()
 
                     # handle the multimodal data
-                    if block["source"]["type"] == "url":
+                    source = BlobStore.resolve_source(block["source"])
+                    if source["type"] == "url":
                         conversation_parts.append(
                             {
                                 "inline_data": _to_gemini_inline_data(
-                                    block["source"]["url"],
+                                    source["url"],
                                 ),
                             },
                         )
 
-                    elif block["source"]["type"] == "base64":
-                        media_type = block["source"]["media_type"]
-                        base64_data = block["source"]["data"]
+                    elif source["type"] == "base64":
+                        media_type = source["media_type"]
+                        base64_data = source["data"]
                         conversation_parts.append(
                             {
                                 "inline_data": {
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+"""The hedged formatter, which formats the messages for multiple chat model
+backends at once."""
+import asyncio
+from typing import Any
+
+from ._formatter_base import FormatterBase
+from ..message import Msg
+
+
+class MultiFormatPrompt(list):
+    """The formatted prompt for multiple backends. It behaves as the prompt
+    of the first (primary) backend, and carries the prompts of all the
+    backends in the `variants` attribute."""
+
+    def __init__(self, variants: list[list[dict[str, Any]]]) -> None:
+        """Initialize the multi-format prompt.
+
+        Args:
+            variants (`list[list[dict[str, Any]]]`):
+                The formatted prompts, one for each backend.
+        """
+        super().__init__(variants[0])
+        self.variants = variants
+
+
+class HedgedFormatter(FormatterBase):
+    """The formatter used together with `HedgedChatModel`, which formats the
+    messages with the matching formatter of each backend, so that the
+    backends from different providers receive the prompts in their required
+    formats.
+
+    .. code-block:: python
+        :caption: Example usage
+
+        agent = ReActAgent(
+            name="Friday",
+            sys_prompt="You're a helpful assistant named Friday.",
+            model=HedgedChatModel(
+                [OpenAIChatModel(...), DashScopeChatModel(...)],
+            ),
+            formatter=HedgedFormatter(
+                [OpenAIChatFormatter(), DashScopeChatFormatter()],
+            ),
+        )
+    """
+
+    def __init__(self, formatters: list[FormatterBase]) -> None:
+        """Initialize the hedged formatter.
+
+        Args:
+            formatters (`list[FormatterBase]`):
+                The formatters, in the same order as the models in the
+                `HedgedChatModel`.
+        """
+        if not formatters:
+            raise ValueError("At least one formatter is required.")
+        self.formatters = formatters
+
+    async def format(
+        self,
+        msgs: list[Msg],
+        **kwargs: Any,
+    ) -> MultiFormatPrompt:
+        """Format the messages with all the formatters.
+
+        Args:
+            msgs (`list[Msg]`):
+                The input messages to be formatted.
+
+        Returns:
+            `MultiFormatPrompt`:
+                The formatted prompt, which is the prompt of the first
+                formatter and carries the prompts of all the formatters.
+        """
+        variants = await asyncio.gather(
+            *[_.format(msgs, **kwargs) for _ in self.formatters],
+        )
+        return MultiFormatPrompt(list(variants))
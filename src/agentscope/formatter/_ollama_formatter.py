@@ -9,7 +9,14 @@ from urllib.parse import urlparse
 from ._truncated_formatter_base import TruncatedFormatterBase
 from .._logging import logger
 from .._utils._common import _get_bytes_from_web_url
-from ..message import Msg, TextBlock, ImageBlock, ToolUseBlock, ToolResultBlock
+from ..message import (
+    BlobStore,
+    Msg,
+    TextBlock,
+    ImageBlock,
+    ToolUseBlock,
+    ToolResultBlock,
+)
 from ..token import TokenCounterBase
 
 
@@ -107,15 +114,15 @@ class OllamaChatFormatter(TruncatedFormatterBase):
                     )
 
                 elif typ == "image":
-                    source_type = block["source"]["type"]
-                    if source_type == "url":
+                    source = BlobStore.resolve_source(block["source"])
+                    if source["type"] == "url":
                         images.append(
                             _convert_ollama_image_url_to_base64_data(
-                                block["source"]["url"],
+                                source["url"],
                             ),
                         )
-                    elif source_type == "base64":
-                        images.append(block["source"]["data"])
+                    elif source["type"] == "base64":
+                        images.append(source["data"])
 
                 else:
                     logger.warning(
@@ -257,7 +264,7 @@ class OllamaMultiAgentFormatter(TruncatedFormatterBase):
 
                 elif block["type"] == "image":
                     # Handle the accumulated text as a single block
-                    source = block["source"]
+                    source = BlobStore.resolve_source(block["source"])
                     if accumulated_text:
                         conversation_blocks.append(
                             {"text": "\n".join(accumulated_text)},
@@ -18,6 +18,8 @@ from ..message import (
     ImageBlock,
     AudioBlock,
     Base64Source,
+    BlobSource,
+    BlobStore,
     ToolUseBlock,
     ToolResultBlock,
 )
@@ -66,8 +68,11 @@ def _to_openai_image_url(url: str) -> str:
     raise TypeError(f'"{url}" should end with {support_image_extensions}.')
 
 
-def _to_openai_audio_data(source: URLSource | Base64Source) -> dict:
+def _to_openai_audio_data(
+    source: URLSource | Base64Source | BlobSource,
+) -> dict:
     """Covert an audio source to OpenAI format."""
+    source = BlobStore.resolve_source(source)
     if source["type"] == "url":
         extension = source["url"].split(".")[-1].lower()
         if extension not in ["wav", "mp3"]:
@@ -194,13 +199,14 @@ class OpenAIChatFormatter(TruncatedFormatterBase):
                     )
 
                 elif typ == "image":
-                    source_type = block["source"]["type"]
+                    source = BlobStore.resolve_source(block["source"])
+                    source_type = source["type"]
                     if source_type == "url":
-                        url = _to_openai_image_url(block["source"]["url"])
+                        url = _to_openai_image_url(source["url"])
 
                     elif source_type == "base64":
-                        data = block["source"]["data"]
-                        media_type = block["source"]["media_type"]
+                        data = source["data"]
+                        media_type = source["media_type"]
                         url = f"data:{media_type};base64,{data}"
 
                     else:
@@ -328,13 +334,14 @@ class OpenAIMultiAgentFormatter(TruncatedFormatterBase):
                     accumulated_text.append(f"{msg.name}: {block['text']}")
 
                 elif block["type"] == "image":
-                    source_type = block["source"]["type"]
+                    source = BlobStore.resolve_source(block["source"])
+                    source_type = source["type"]
                     if source_type == "url":
-                        url = _to_openai_image_url(block["source"]["url"])
+                        url = _to_openai_image_url(source["url"])
 
                     elif source_type == "base64":
-                        data = block["source"]["data"]
-                        media_type = block["source"]["media_type"]
+                        data = source["data"]
+                        media_type = source["media_type"]
                         url = f"data:{media_type};base64,{data}"
 
                     else:
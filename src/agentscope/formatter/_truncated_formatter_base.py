@@ -12,6 +12,7 @@ from typing import (
 
 from ._formatter_base import FormatterBase
 from ..message import Msg
+from ..metrics._builtin import _check_metrics_enabled, _record_truncation
 from ..token import TokenCounterBase
 from ..tracing import trace_format
 
@@ -68,6 +69,7 @@ class TruncatedFormatterBase(FormatterBase, ABC):
 
         msgs = deepcopy(msgs)
 
+        n_rounds = 0
         while True:
             formatted_msgs = await self._format(msgs)
             n_tokens = await self._count(formatted_msgs)
@@ -77,10 +79,19 @@ class TruncatedFormatterBase(FormatterBase, ABC):
                 or self.max_tokens is None
                 or n_tokens <= self.max_tokens
             ):
-                return formatted_msgs
+                # Confirm the final count if the counter only estimates
+                n_tokens = await self._confirm(formatted_msgs)
+                if n_tokens is None or n_tokens <= self.max_tokens:
+                    if (
+                        self.max_tokens is not None
+                        and _check_metrics_enabled()
+                    ):
+                        _record_truncation(self.__class__.__name__, n_rounds)
+                    return formatted_msgs
 
             # truncate the input messages
             msgs = await self._truncate(msgs)
+            n_rounds += 1
 
     async def _format(self, msgs: list[Msg]) -> list[dict[str, Any]]:
         """Format the input messages into the required format. This method
@@ -227,6 +238,25 @@ class TruncatedFormatterBase(FormatterBase, ABC):
 
         return await self.token_counter.count(msgs)
 
+    async def _confirm(self, msgs: list[dict[str, Any]]) -> int | None:
+        """Confirm the token number of the final formatted messages, if the
+        token counter only returns estimations in `count`. Return `None` if
+        no confirmation is needed.
+
+        Args:
+            msgs (`list[dict[str, Any]]`):
+                The formatted messages to be confirmed.
+        """
+        # The custom token counters may not implement the confirmation
+        if (
+            self.token_counter is None
+            or self.max_tokens is None
+            or not hasattr(self.token_counter, "confirm")
+        ):
+            return None
+
+        return await self.token_counter.confirm(msgs)
+
     @staticmethod
     async def _group_messages(
         msgs: list[Msg],
@@ -4,6 +4,8 @@ the MCP servers."""
 
 from ._client_base import MCPClientBase
 from ._mcp_function import MCPToolFunction
+from ._session_pool import MCPSessionPool
+from ._tool_cache import MCPToolCache
 from ._stateful_client_base import StatefulClientBase
 from ._stdio_stateful_client import StdIOStatefulClient
 from ._http_stateless_client import HttpStatelessClient
@@ -12,6 +14,8 @@ from ._http_stateful_client import HttpStatefulClient
 
 __all__ = [
     "MCPToolFunction",
+    "MCPSessionPool",
+    "MCPToolCache",
     "MCPClientBase",
     "StatefulClientBase",
     "StdIOStatefulClient",
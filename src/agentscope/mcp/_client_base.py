@@ -22,6 +22,14 @@ class MCPClientBase:
         """
         self.name = name
 
+        self.server_id: str | None = None
+        """The identity of the MCP server, e.g. its URL or command, used as
+        the key to cache its tools."""
+
+        self.server_info: mcp.types.Implementation | None = None
+        """The server name and version reported in the `initialize`
+        handshake, available once a session is initialized."""
+
     @abstractmethod
     async def get_callable_function(
         self,
@@ -30,6 +38,35 @@ class MCPClientBase:
     ) -> Callable:
         """Get a tool function by its name."""
 
+    async def get_callable_functions(
+        self,
+        tools: list[mcp.types.Tool],
+        wrap_tool_result: bool = True,
+    ) -> list[Callable]:
+        """Get the tool functions of the given tools, which are already
+        listed from the MCP server, e.g. by `list_tools`.
+
+        Args:
+            tools (`list[mcp.types.Tool]`):
+                The listed MCP tools.
+            wrap_tool_result (`bool`, defaults to `True`):
+                Whether to wrap the tool result into agentscope's
+                `ToolResponse` object.
+
+        Returns:
+            `list[Callable]`:
+                The async tool functions in the same order as the tools.
+        """
+        return [
+            await self.get_callable_function(_.name, wrap_tool_result)
+            for _ in tools
+        ]
+
+    async def get_server_info(self) -> mcp.types.Implementation | None:
+        """Get the server name and version reported in the `initialize`
+        handshake, or `None` if unknown."""
+        return self.server_info
+
     @staticmethod
     def _convert_mcp_content_to_as_blocks(
         mcp_content_blocks: list,
@@ -65,6 +65,7 @@ class HttpStatefulClient(StatefulClientBase):
 
         assert transport in ["streamable_http", "sse"]
         self.transport = transport
+        self.server_id = f"{transport}:{url}"
 
         if self.transport == "streamable_http":
             self.client = streamablehttp_client(
@@ -10,6 +10,7 @@ from mcp.client.streamable_http import streamablehttp_client
 
 from . import MCPToolFunction
 from ._client_base import MCPClientBase
+from ._session_pool import MCPSessionPool
 from ..tool import ToolResponse
 
 
@@ -20,6 +21,12 @@ class HttpStatelessClient(MCPClientBase):
      session state across multiple tool calls. Each tool call will start a
      new session and close it after the call is done.
 
+     For the stateless MCP servers, set `pool_sessions=True` to reuse the
+     initialized sessions across the tool calls instead, which saves the
+     transport setup and the `initialize` handshake of each call. Call
+     `close` to release the pooled sessions when the client is no longer
+     used.
+
     """
 
     stateful: bool = False
@@ -35,6 +42,9 @@ class HttpStatelessClient(MCPClientBase):
         headers: dict[str, str] | None = None,
         timeout: float = 30,
         sse_read_timeout: float = 60 * 5,
+        pool_sessions: bool = False,
+        max_pool_size: int = 4,
+        pool_idle_timeout: float = 60 * 5,
         **client_kwargs: Any,
     ) -> None:
         """Initialize the streamable HTTP MCP server.
@@ -56,6 +66,16 @@ class HttpStatelessClient(MCPClientBase):
             sse_read_timeout (`float`, optional):
                 The timeout for reading Server-Sent Events (SSE) in seconds.
                 Defaults to 300 (5 minutes).
+            pool_sessions (`bool`, defaults to `False`):
+                Whether to keep the initialized sessions in a pool and reuse
+                them across the tool calls. Only use it for the MCP servers
+                that don't keep per-session state.
+            max_pool_size (`int`, defaults to `4`):
+                The maximum number of pooled sessions, i.e. the maximum
+                number of concurrent tool calls to the MCP server.
+            pool_idle_timeout (`float`, defaults to `300`):
+                The idle time in seconds after which a pooled session is
+                closed.
             **client_kwargs (`Any`):
                 The additional keyword arguments to pass to the streamable
                 HTTP client.
@@ -65,6 +85,7 @@ class HttpStatelessClient(MCPClientBase):
         assert transport in ["streamable_http", "sse"]
 
         self.transport = transport
+        self.server_id = f"{transport}:{url}"
 
         self.client_config = {
             "url": url,
@@ -76,6 +97,14 @@ class HttpStatelessClient(MCPClientBase):
 
         self._tools = None
 
+        self.session_pool = None
+        if pool_sessions:
+            self.session_pool = MCPSessionPool(
+                self.get_client,
+                max_size=max_pool_size,
+                idle_timeout=pool_idle_timeout,
+            )
+
     def get_client(self) -> _AsyncGeneratorContextManager[Any]:
         """The disposable MCP client object, which is a context manager."""
         if self.transport == "sse":
@@ -129,7 +158,8 @@ class HttpStatelessClient(MCPClientBase):
             mcp_name=self.name,
             tool=target_tool,
             wrap_tool_result=wrap_tool_result,
-            client_gen=self.get_client,
+            client_gen=None if self.session_pool else self.get_client,
+            session_pool=self.session_pool,
         )
 
     async def list_tools(self) -> List[mcp.types.Tool]:
@@ -139,10 +169,71 @@ class HttpStatelessClient(MCPClientBase):
             `mcp.types.ListToolsResult`:
                 The result containing the list of tools.
         """
+        if self.session_pool:
+            self._tools = await self.session_pool.list_tools()
+            self.server_info = self.session_pool.server_info
+            return self._tools
+
         async with self.get_client() as cli:
             read_stream, write_stream = cli[0], cli[1]
             async with ClientSession(read_stream, write_stream) as session:
-                await session.initialize()
+                init_res = await session.initialize()
+                self.server_info = init_res.serverInfo
                 res = await session.list_tools()
                 self._tools = res.tools
                 return res.tools
+
+    async def get_callable_functions(
+        self,
+        tools: list[mcp.types.Tool],
+        wrap_tool_result: bool = True,
+    ) -> list[MCPToolFunction]:
+        """Get the tool functions of the given tools, which are already
+        listed from the MCP server, without listing the tools again.
+
+        Args:
+            tools (`list[mcp.types.Tool]`):
+                The listed MCP tools.
+            wrap_tool_result (`bool`, defaults to `True`):
+                Whether to wrap the tool result into agentscope's
+                `ToolResponse` object.
+
+        Returns:
+            `list[MCPToolFunction]`:
+                The async tool functions in the same order as the tools.
+        """
+        return [
+            MCPToolFunction(
+                mcp_name=self.name,
+                tool=tool,
+                wrap_tool_result=wrap_tool_result,
+                client_gen=None if self.session_pool else self.get_client,
+                session_pool=self.session_pool,
+            )
+            for tool in tools
+        ]
+
+    async def get_server_info(self) -> mcp.types.Implementation | None:
+        """Get the server name and version reported in the `initialize`
+        handshake. If no session has been initialized yet, a session is
+        initialized to get it, which is kept in the pool if the sessions
+        are pooled."""
+        if self.server_info is not None:
+            return self.server_info
+
+        if self.session_pool:
+            await self.session_pool.run(lambda session: session.send_ping())
+            self.server_info = self.session_pool.server_info
+            return self.server_info
+
+        async with self.get_client() as cli:
+            read_stream, write_stream = cli[0], cli[1]
+            async with ClientSession(read_stream, write_stream) as session:
+                res = await session.initialize()
+                self.server_info = res.serverInfo
+                return self.server_info
+
+    async def close(self) -> None:
+        """Close the pooled sessions, if any."""
+        if self.session_pool:
+            await self.session_pool.close()
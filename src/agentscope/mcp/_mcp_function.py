@@ -7,6 +7,7 @@ import mcp
 from mcp import ClientSession
 
 from ._client_base import MCPClientBase
+from ._session_pool import MCPSessionPool
 from .._utils._common import _extract_json_schema_from_mcp_tool
 from ..tool import ToolResponse
 
@@ -31,6 +32,7 @@ class MCPToolFunction:
         client_gen: Callable[..., _AsyncGeneratorContextManager[Any]]
         | None = None,
         session: ClientSession | None = None,
+        session_pool: MCPSessionPool | None = None,
     ) -> None:
         """Initialize the MCP function."""
         self.mcp_name = mcp_name
@@ -39,18 +41,16 @@ class MCPToolFunction:
         self.json_schema = _extract_json_schema_from_mcp_tool(tool)
         self.wrap_tool_result = wrap_tool_result
 
-        # Cannot be None at the same time
-        if (
-            client_gen is None
-            and session is None
-            or (client_gen is not None and session is not None)
-        ):
+        # Exactly one of them should be provided
+        if [client_gen, session, session_pool].count(None) != 2:
             raise ValueError(
-                "Either client or session must be provided, but not both.",
+                "Exactly one of client_gen, session and session_pool must be "
+                "provided.",
             )
 
         self.client_gen = client_gen
         self.session = session
+        self.session_pool = session_pool
 
     async def __call__(
         self,
@@ -58,7 +58,13 @@ class MCPToolFunction:
     ) -> mcp.types.CallToolResult | ToolResponse:
         """Call the MCP tool function with the given arguments, and return
         the result."""
-        if self.client_gen:
+        if self.session_pool:
+            res = await self.session_pool.call_tool(
+                self.name,
+                arguments=kwargs,
+            )
+
+        elif self.client_gen:
             async with self.client_gen() as cli:
                 read_stream, write_stream = cli[0], cli[1]
                 async with ClientSession(read_stream, write_stream) as session:
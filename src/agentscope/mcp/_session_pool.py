@@ -0,0 +1,291 @@
+# -*- coding: utf-8 -*-
+"""The session pool that keeps the initialized MCP sessions alive across
+the tool calls of the stateless MCP clients."""
+import asyncio
+import time
+from contextlib import _AsyncGeneratorContextManager, suppress
+from typing import Any, Awaitable, Callable, TypeVar
+
+import anyio
+import mcp.types
+from mcp import ClientSession
+from mcp.shared.exceptions import McpError
+
+from .._logging import logger
+
+T = TypeVar("T")
+
+_RECONNECT_ERRORS = (
+    anyio.ClosedResourceError,
+    anyio.BrokenResourceError,
+    anyio.EndOfStream,
+    ConnectionError,
+)
+"""The errors indicating the pooled session is broken, after which the call
+is retried once with a fresh session."""
+
+
+class _PooledSession:
+    """An initialized MCP session owned by a background task.
+
+    The transport and the session are entered and exited within the same
+    background task, since the anyio cancel scopes of the MCP transports
+    cannot be exited from a different task than the one that entered them.
+    """
+
+    def __init__(
+        self,
+        client_gen: Callable[..., _AsyncGeneratorContextManager[Any]],
+    ) -> None:
+        """Initialize the pooled session.
+
+        Args:
+            client_gen (`Callable[..., _AsyncGeneratorContextManager[Any]]`):
+                The function that creates the disposable MCP transport.
+        """
+        self.client_gen = client_gen
+        self.session: ClientSession | None = None
+        self.server_info: mcp.types.Implementation | None = None
+        self.last_used = time.monotonic()
+
+        self._ready = asyncio.Event()
+        self._closing = asyncio.Event()
+        self._error: BaseException | None = None
+        self._task: asyncio.Task | None = None
+
+    async def open(self) -> None:
+        """Start the background task and wait until the session is
+        initialized."""
+        self._task = asyncio.create_task(self._run())
+        await self._ready.wait()
+        if self._error is not None:
+            raise self._error
+
+    async def _run(self) -> None:
+        """Enter the transport and the session, and hold them until the
+        session is closed."""
+        try:
+            async with self.client_gen() as cli:
+                read_stream, write_stream = cli[0], cli[1]
+                async with ClientSession(read_stream, write_stream) as session:
+                    res = await session.initialize()
+                    self.server_info = res.serverInfo
+                    self.session = session
+                    self._ready.set()
+                    await self._closing.wait()
+        except Exception as e:
+            if not self._ready.is_set():
+                self._error = e
+            else:
+                logger.debug("Pooled MCP session exited with error: %s", e)
+        finally:
+            self.session = None
+            self._ready.set()
+
+    @property
+    def is_alive(self) -> bool:
+        """If the session is initialized and not closed."""
+        return self.session is not None and not self._closing.is_set()
+
+    async def close(self) -> None:
+        """Close the session and the transport."""
+        self._closing.set()
+        if self._task is not None:
+            with suppress(Exception, asyncio.CancelledError):
+                await self._task
+
+
+class MCPSessionPool:
+    """A bounded pool of initialized MCP sessions for the stateless MCP
+    servers, which saves the transport setup and the `initialize` handshake
+    of each tool call.
+
+    Each session serves one call at a time. The idle sessions are closed
+    after `idle_timeout` seconds, and pinged before reuse if they have been
+    idle longer than `health_check_interval` seconds. A session that breaks
+    during a call is discarded, and the call is retried once with a freshly
+    initialized session.
+    """
+
+    def __init__(
+        self,
+        client_gen: Callable[..., _AsyncGeneratorContextManager[Any]],
+        max_size: int = 4,
+        idle_timeout: float = 300,
+        health_check_interval: float = 30,
+        health_check_timeout: float = 5,
+    ) -> None:
+        """Initialize the session pool.
+
+        Args:
+            client_gen (`Callable[..., _AsyncGeneratorContextManager[Any]]`):
+                The function that creates the disposable MCP transport,
+                e.g. `HttpStatelessClient.get_client`.
+            max_size (`int`, defaults to `4`):
+                The maximum number of sessions, i.e. the maximum number of
+                concurrent tool calls to the MCP server.
+            idle_timeout (`float`, defaults to `300`):
+                The idle time in seconds after which a session is closed.
+            health_check_interval (`float`, defaults to `30`):
+                The idle time in seconds after which a session is pinged
+                before reuse.
+            health_check_timeout (`float`, defaults to `5`):
+                The timeout in seconds of the ping.
+        """
+        if max_size < 1:
+            raise ValueError(f"`max_size` must be positive, got {max_size}.")
+
+        self.client_gen = client_gen
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.health_check_interval = health_check_interval
+        self.health_check_timeout = health_check_timeout
+
+        self.server_info: mcp.types.Implementation | None = None
+        """The server name and version reported by the latest initialized
+        session."""
+
+        self._idle: list[_PooledSession] = []
+        self._semaphore: asyncio.Semaphore | None = None
+
+    @property
+    def size(self) -> int:
+        """The number of idle sessions in the pool."""
+        return len(self._idle)
+
+    async def call_tool(
+        self,
+        name: str,
+        arguments: dict[str, Any] | None = None,
+    ) -> mcp.types.CallToolResult:
+        """Call the tool with a pooled session.
+
+        Args:
+            name (`str`):
+                The name of the tool.
+            arguments (`dict[str, Any] | None`, optional):
+                The arguments of the tool.
+
+        Returns:
+            `mcp.types.CallToolResult`:
+                The raw result of the tool call.
+        """
+        return await self.run(
+            lambda session: session.call_tool(name, arguments=arguments),
+        )
+
+    async def list_tools(self) -> list[mcp.types.Tool]:
+        """List the tools with a pooled session."""
+        res = await self.run(lambda session: session.list_tools())
+        return res.tools
+
+    async def run(
+        self,
+        func: Callable[[ClientSession], Awaitable[T]],
+    ) -> T:
+        """Run the given function with a pooled session.
+
+        Args:
+            func (`Callable[[ClientSession], Awaitable[T]]`):
+                The async function that takes an initialized session.
+
+        Returns:
+            `T`:
+                The result of the function.
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_size)
+
+        async with self._semaphore:
+            pooled, reused = await self._acquire()
+            try:
+                res = await func(pooled.session)
+            except _RECONNECT_ERRORS as e:
+                await pooled.close()
+                if not reused:
+                    raise
+                logger.info(
+                    "Pooled MCP session is broken (%s), retrying with a new "
+                    "session.",
+                    repr(e),
+                )
+                pooled = await self._open()
+                try:
+                    res = await func(pooled.session)
+                except BaseException:
+                    await pooled.close()
+                    raise
+            except McpError:
+                # The error response from the server, and the session is
+                # still usable
+                self._release(pooled)
+                raise
+            except BaseException:
+                # The session state is unknown after a failed or cancelled
+                # call, so it's not returned to the pool
+                await pooled.close()
+                raise
+
+            self._release(pooled)
+            return res
+
+    async def close(self) -> None:
+        """Close all the idle sessions in the pool."""
+        idle, self._idle = self._idle, []
+        await asyncio.gather(*[_.close() for _ in idle])
+
+    async def _acquire(self) -> tuple[_PooledSession, bool]:
+        """Get a healthy idle session, or open a new one. Return the session
+        and whether it's reused from the pool."""
+        await self._evict_expired()
+
+        while self._idle:
+            # Reuse the most recently used session first, so that the
+            # others can expire when the load decreases
+            pooled = self._idle.pop()
+            if await self._is_healthy(pooled):
+                return pooled, True
+            await pooled.close()
+
+        return await self._open(), False
+
+    def _release(self, pooled: _PooledSession) -> None:
+        """Return the session to the pool."""
+        pooled.last_used = time.monotonic()
+        self._idle.append(pooled)
+
+    async def _open(self) -> _PooledSession:
+        """Open and initialize a new session."""
+        pooled = _PooledSession(self.client_gen)
+        await pooled.open()
+        self.server_info = pooled.server_info
+        return pooled
+
+    async def _is_healthy(self, pooled: _PooledSession) -> bool:
+        """Check the session, and ping it if it has been idle for long."""
+        if not pooled.is_alive:
+            return False
+
+        if time.monotonic() - pooled.last_used < self.health_check_interval:
+            return True
+
+        try:
+            await asyncio.wait_for(
+                pooled.session.send_ping(),
+                self.health_check_timeout,
+            )
+        except Exception as e:
+            logger.debug("Pooled MCP session failed the ping: %s", e)
+            return False
+        return True
+
+    async def _evict_expired(self) -> None:
+        """Close the sessions that have been idle longer than the idle
+        timeout."""
+        now = time.monotonic()
+        expired = [
+            _ for _ in self._idle if now - _.last_used >= self.idle_timeout
+        ]
+        if expired:
+            self._idle = [_ for _ in self._idle if _ not in expired]
+            await asyncio.gather(*[_.close() for _ in expired])
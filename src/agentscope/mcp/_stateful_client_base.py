@@ -60,7 +60,8 @@ class StatefulClientBase(MCPClientBase, ABC):
             read_stream, write_stream = context[0], context[1]
             self.session = ClientSession(read_stream, write_stream)
             await self.stack.enter_async_context(self.session)
-            await self.session.initialize()
+            res = await self.session.initialize()
+            self.server_info = res.serverInfo
 
             self.is_connected = True
             logger.info("MCP client connected.")
@@ -151,6 +152,37 @@ class StatefulClientBase(MCPClientBase, ABC):
             session=self.session,
         )
 
+    async def get_callable_functions(
+        self,
+        tools: list[mcp.types.Tool],
+        wrap_tool_result: bool = True,
+    ) -> list[MCPToolFunction]:
+        """Get the tool functions of the given tools, which are already
+        listed from the MCP server, without looking them up again.
+
+        Args:
+            tools (`list[mcp.types.Tool]`):
+                The listed MCP tools.
+            wrap_tool_result (`bool`, defaults to `True`):
+                Whether to wrap the tool result into agentscope's
+                `ToolResponse` object.
+
+        Returns:
+            `list[MCPToolFunction]`:
+                The async tool functions in the same order as the tools.
+        """
+        self._validate_connection()
+
+        return [
+            MCPToolFunction(
+                mcp_name=self.name,
+                tool=tool,
+                wrap_tool_result=wrap_tool_result,
+                session=self.session,
+            )
+            for tool in tools
+        ]
+
     def _validate_connection(self) -> None:
         """Validate the connection to the MCP server."""
         if not self.is_connected:
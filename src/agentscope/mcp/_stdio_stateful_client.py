@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 """The StdIO MCP server implementation in AgentScope, which provides
 function-level fine-grained control over the MCP servers using standard IO."""
+import shlex
 from typing import Literal
 
 from mcp import stdio_client, StdioServerParameters
@@ -65,6 +66,8 @@ class StdIOStatefulClient(StatefulClientBase):
         """
         super().__init__(name=name)
 
+        self.server_id = "stdio:" + shlex.join([command, *(args or [])])
+
         self.client = stdio_client(
             StdioServerParameters(
                 command=command,
@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+"""The disk cache of the MCP tool schemas, keyed by the server identity and
+version."""
+import hashlib
+import json
+import os
+import time
+
+import mcp.types
+
+from ._client_base import MCPClientBase
+from .._logging import logger
+
+
+class MCPToolCache:
+    """The disk cache of the tools listed from MCP servers, so that the tool
+    discovery can be skipped on warm starts.
+
+    Each server has a JSON file keyed by its identity (the URL or the
+    command) together with the server name and version reported in the
+    `initialize` handshake, so a server upgrade invalidates its cached tools
+    automatically. If the server version is unknown, the tools are listed
+    from the server directly.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str = "./.cache/mcp_tools",
+        ttl: float | None = None,
+    ) -> None:
+        """Initialize the MCP tool cache.
+
+        Args:
+            cache_dir (`str`, defaults to `"./.cache/mcp_tools"`):
+                The directory to store the cached tool files.
+            ttl (`float | None`, defaults to `None`):
+                The time-to-live of the cached tools in seconds. If `None`,
+                the cached tools only expire when the server version changes.
+        """
+        self._cache_dir = os.path.abspath(cache_dir)
+        self.ttl = ttl
+
+    @property
+    def cache_dir(self) -> str:
+        """The cache directory where the tool files are stored."""
+        if not os.path.exists(self._cache_dir):
+            os.makedirs(self._cache_dir, exist_ok=True)
+        return self._cache_dir
+
+    async def list_tools(
+        self,
+        mcp_client: MCPClientBase,
+    ) -> list[mcp.types.Tool]:
+        """List the tools of the MCP client, from the cache if the server
+        version matches, otherwise from the server.
+
+        Args:
+            mcp_client (`MCPClientBase`):
+                The MCP client, which should be connected if it's stateful.
+
+        Returns:
+            `list[mcp.types.Tool]`:
+                The tools of the MCP server.
+        """
+        server_info = None
+        if mcp_client.server_id is not None:
+            server_info = await mcp_client.get_server_info()
+
+        if server_info is None:
+            return await mcp_client.list_tools()
+
+        path_file = self._get_path(mcp_client.server_id, server_info)
+        tools = self._load(path_file)
+        if tools is not None:
+            logger.debug(
+                "Load %d tools of MCP %s from cache.",
+                len(tools),
+                mcp_client.name,
+            )
+            return tools
+
+        tools = await mcp_client.list_tools()
+
+        # Write into a temporary file first to avoid partial files
+        path_tmp = f"{path_file}.{os.getpid()}.tmp"
+        with open(path_tmp, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "server_id": mcp_client.server_id,
+                    "server_info": server_info.model_dump(mode="json"),
+                    "tools": [_.model_dump(mode="json") for _ in tools],
+                },
+                f,
+                ensure_ascii=False,
+            )
+        os.replace(path_tmp, path_file)
+        return tools
+
+    def clear(self) -> None:
+        """Remove all the cached tool files."""
+        for filename in os.listdir(self.cache_dir):
+            if filename.endswith(".json"):
+                os.remove(os.path.join(self.cache_dir, filename))
+
+    def _load(self, path_file: str) -> list[mcp.types.Tool] | None:
+        """Load the tools from the cached file, or return `None` if not found,
+        expired or corrupted."""
+        if not os.path.isfile(path_file):
+            return None
+
+        if (
+            self.ttl is not None
+            and time.time() - os.path.getmtime(path_file) > self.ttl
+        ):
+            os.remove(path_file)
+            return None
+
+        try:
+            with open(path_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return [mcp.types.Tool.model_validate(_) for _ in data["tools"]]
+        except (json.JSONDecodeError, KeyError, ValueError):
+            logger.warning(
+                "Remove the corrupted cached MCP tool file %s.",
+                path_file,
+            )
+            os.remove(path_file)
+            return None
+
+    def _get_path(
+        self,
+        server_id: str,
+        server_info: mcp.types.Implementation,
+    ) -> str:
+        """Get the file path for the given server."""
+        key = json.dumps([server_id, server_info.name, server_info.version])
+        filename = hashlib.sha256(key.encode("utf-8")).hexdigest() + ".json"
+        return os.path.join(self.cache_dir, filename)
@@ -3,13 +3,17 @@
 
 from ._memory_base import MemoryBase
 from ._in_memory_memory import InMemoryMemory
+from ._compacting_memory import CompactingMemory
 from ._long_term_memory_base import LongTermMemoryBase
 from ._mem0_long_term_memory import Mem0LongTermMemory
+from ._local_long_term_memory import LocalLongTermMemory
 
 
 __all__ = [
     "MemoryBase",
     "InMemoryMemory",
+    "CompactingMemory",
     "LongTermMemoryBase",
     "Mem0LongTermMemory",
+    "LocalLongTermMemory",
 ]
@@ -0,0 +1,316 @@
+# -*- coding: utf-8 -*-
+"""The compacting memory, which summarizes the older messages when the
+prompt grows beyond a token budget."""
+import asyncio
+from typing import Any, AsyncGenerator
+
+from ._in_memory_memory import InMemoryMemory
+from ._memory_base import MemoryBase
+from .._logging import logger
+from ..formatter import FormatterBase
+from ..message import Msg, TextBlock
+from ..model import ChatModelBase
+from ..token import TokenCounterBase
+
+_DEFAULT_SUMMARY_PROMPT = (
+    "Summarize the conversation above, including the tool calls and their "
+    "results, so that the task can be continued with the summary only. "
+    "Your summary should include:\n"
+    "1. The task and the requirements from the user.\n"
+    "2. What has been completed so far.\n"
+    "3. The key information that has been found, e.g. the important tool "
+    "results, facts and intermediate conclusions.\n"
+    "4. What remains to be done.\n"
+    "Be concise, and don't omit any information needed in the next steps."
+)
+
+# The ratio of the high water mark, above which the sum of the cached
+# message token numbers is confirmed by counting the whole formatted memory
+_RECOUNT_RATIO = 0.8
+
+
+class CompactingMemory(MemoryBase):
+    """A memory wrapper that keeps the prompt within a token budget by
+    compacting the older messages into a summary.
+
+    Once the formatted memory exceeds the high water mark after adding new
+    messages, the oldest messages are summarized by the chat model into a
+    single message, until the remaining messages fit into the low water mark.
+    The compaction runs in the background by default, so that the agent is
+    not blocked, and the summary replaces the compacted messages once it's
+    ready. A tool call message is always compacted together with its tool
+    result, and the most recent messages are kept as they are.
+
+    .. code-block:: python
+        :caption: Example usage
+
+        agent = ReActAgent(
+            name="Friday",
+            sys_prompt="You're a helpful assistant named Friday.",
+            model=model,
+            formatter=formatter,
+            memory=CompactingMemory(
+                model=model,
+                formatter=OpenAIChatFormatter(),
+                token_counter=OpenAITokenCounter("gpt-4o"),
+                high_water_mark=60000,
+                low_water_mark=20000,
+            ),
+        )
+    """
+
+    def __init__(
+        self,
+        model: ChatModelBase,
+        formatter: FormatterBase,
+        token_counter: TokenCounterBase,
+        high_water_mark: int,
+        low_water_mark: int | None = None,
+        memory: MemoryBase | None = None,
+        keep_recent: int = 4,
+        summary_prompt: str = _DEFAULT_SUMMARY_PROMPT,
+        background: bool = True,
+    ) -> None:
+        """Initialize the compacting memory.
+
+        Args:
+            model (`ChatModelBase`):
+                The chat model used to summarize the messages.
+            formatter (`FormatterBase`):
+                The formatter used to format the messages, both for counting
+                the tokens and for the summarization. It should not truncate
+                the messages itself.
+            token_counter (`TokenCounterBase`):
+                The token counter to count the tokens of the formatted
+                messages.
+            high_water_mark (`int`):
+                The token number of the formatted memory that triggers the
+                compaction.
+            low_water_mark (`int | None`, optional):
+                The target token number of the remaining messages after the
+                compaction, excluding the summary. Defaults to half of the
+                high water mark.
+            memory (`MemoryBase | None`, optional):
+                The wrapped memory to store the messages. Defaults to an
+                `InMemoryMemory`.
+            keep_recent (`int`, defaults to `4`):
+                The number of the most recent messages that are never
+                compacted.
+            summary_prompt (`str`, optional):
+                The instruction to summarize the compacted messages.
+            background (`bool`, defaults to `True`):
+                Whether to run the compaction in the background. If `False`,
+                the `add` method waits until the compaction finishes.
+        """
+        super().__init__()
+
+        low_water_mark = low_water_mark or high_water_mark // 2
+        if not 0 < low_water_mark < high_water_mark:
+            raise ValueError(
+                "The low water mark should be positive and less than the "
+                f"high water mark, but got {low_water_mark} and "
+                f"{high_water_mark}.",
+            )
+
+        self.memory = memory or InMemoryMemory()
+        self.model = model
+        self.formatter = formatter
+        self.token_counter = token_counter
+        self.high_water_mark = high_water_mark
+        self.low_water_mark = low_water_mark
+        self.keep_recent = keep_recent
+        self.summary_prompt = summary_prompt
+        self.background = background
+
+        self._compaction_task: asyncio.Task | None = None
+        self._msg_tokens: dict[str, int] = {}
+
+    async def add(self, *args: Any, **kwargs: Any) -> None:
+        """Add messages into the wrapped memory, and start the compaction if
+        the formatted memory exceeds the high water mark.
+
+        The token numbers of the messages are counted and cached one by one,
+        and the whole memory is only formatted and counted exactly when
+        their sum gets near the high water mark."""
+        await self.memory.add(*args, **kwargs)
+
+        if self._compaction_task is not None:
+            # A compaction is already running
+            return
+
+        msgs = await self.memory.get_memory()
+        n_tokens = sum(await self._count_each(msgs))
+        if n_tokens < self.high_water_mark * _RECOUNT_RATIO:
+            return
+
+        n_tokens = await self._count(msgs)
+        if n_tokens <= self.high_water_mark:
+            return
+
+        logger.debug(
+            "The memory has %d tokens over the high water mark %d, start "
+            "compacting.",
+            n_tokens,
+            self.high_water_mark,
+        )
+        self._compaction_task = asyncio.create_task(self.compact())
+        self._compaction_task.add_done_callback(self._on_compaction_done)
+
+        if not self.background:
+            await self.wait_compaction()
+
+    async def compact(self) -> None:
+        """Summarize the oldest messages into a single message, so that the
+        remaining messages fit into the low water mark."""
+        msgs = list(await self.memory.get_memory())
+        n_compacted = await self._select_compacted(msgs)
+        if n_compacted < 2:
+            return
+
+        compacted = msgs[:n_compacted]
+        summary = await self._summarize(compacted)
+
+        # Apply the summary to the latest memory, since new messages may be
+        # added during the summarization
+        compacted_ids = {_.id for _ in compacted}
+        latest = list(await self.memory.get_memory())
+        indices = [i for i, _ in enumerate(latest) if _.id in compacted_ids]
+        if not indices:
+            return
+
+        await self.memory.clear()
+        await self.memory.add(
+            [
+                *latest[: indices[0]],
+                summary,
+                *[
+                    _
+                    for _ in latest[indices[0] :]
+                    if _.id not in compacted_ids
+                ],
+            ],
+        )
+        logger.info("Compacted %d messages into a summary.", len(indices))
+
+    async def wait_compaction(self) -> None:
+        """Wait for the running compaction, if any."""
+        if self._compaction_task is not None:
+            await asyncio.shield(self._compaction_task)
+
+    async def delete(self, *args: Any, **kwargs: Any) -> None:
+        """Delete items from the wrapped memory."""
+        await self.memory.delete(*args, **kwargs)
+
+    async def retrieve(self, *args: Any, **kwargs: Any) -> Any:
+        """Retrieve items from the wrapped memory."""
+        return await self.memory.retrieve(*args, **kwargs)
+
+    async def size(self) -> int:
+        """The size of the wrapped memory."""
+        return await self.memory.size()
+
+    async def clear(self) -> None:
+        """Clear the wrapped memory and cancel the running compaction."""
+        if self._compaction_task is not None:
+            self._compaction_task.cancel()
+            self._compaction_task = None
+        self._msg_tokens.clear()
+        await self.memory.clear()
+
+    async def get_memory(self, *args: Any, **kwargs: Any) -> list[Msg]:
+        """Get the content of the wrapped memory."""
+        return await self.memory.get_memory(*args, **kwargs)
+
+    def state_dict(self) -> dict:
+        """Get the state dictionary of the wrapped memory."""
+        return self.memory.state_dict()
+
+    def load_state_dict(self, state_dict: dict, strict: bool = True) -> None:
+        """Load the state dictionary into the wrapped memory."""
+        self.memory.load_state_dict(state_dict, strict=strict)
+
+    async def _count(self, msgs: list[Msg]) -> int:
+        """Count the tokens of the formatted messages."""
+        if not msgs:
+            return 0
+        return await self.token_counter.count(
+            await self.formatter.format(msgs),
+        )
+
+    async def _count_each(self, msgs: list[Msg]) -> list[int]:
+        """Count the tokens of each message separately, where the numbers
+        are cached by the message ids and only the new messages are
+        counted, concurrently."""
+        new_msgs = [_ for _ in msgs if _.id not in self._msg_tokens]
+        n_tokens = await asyncio.gather(*[self._count([_]) for _ in new_msgs])
+
+        # Only keep the messages in the memory, so that the cache doesn't
+        # grow with the compacted and deleted ones
+        self._msg_tokens.update(zip([_.id for _ in new_msgs], n_tokens))
+        self._msg_tokens = {_.id: self._msg_tokens[_.id] for _ in msgs}
+        return [self._msg_tokens[_.id] for _ in msgs]
+
+    async def _select_compacted(self, msgs: list[Msg]) -> int:
+        """Select the number of the oldest messages to be compacted, so that
+        the remaining ones fit into the low water mark. The tool call and
+        its result are never separated."""
+        n_tokens = await self._count_each(msgs)
+        remaining = sum(n_tokens)
+
+        n_compacted = 0
+        pending_ids: set[str] = set()
+        for i, msg in enumerate(msgs[: len(msgs) - self.keep_recent]):
+            for block in msg.get_content_blocks("tool_use"):
+                pending_ids.add(block["id"])
+            for block in msg.get_content_blocks("tool_result"):
+                pending_ids.discard(block["id"])
+
+            remaining -= n_tokens[i]
+            if not pending_ids:
+                n_compacted = i + 1
+                if remaining <= self.low_water_mark:
+                    break
+
+        return n_compacted
+
+    async def _summarize(self, msgs: list[Msg]) -> Msg:
+        """Summarize the messages into a single message by the chat model."""
+        prompt = await self.formatter.format(
+            [
+                *msgs,
+                Msg("user", self.summary_prompt, "user"),
+            ],
+        )
+        res = await self.model(prompt)
+
+        if isinstance(res, AsyncGenerator):
+            # The streaming chunks are accumulated, so keep the last one
+            async for chunk in res:
+                res = chunk
+
+        summary = "\n".join(
+            _["text"] for _ in res.content if _.get("type") == "text"
+        )
+        return Msg(
+            "memory_summary",
+            [
+                TextBlock(
+                    type="text",
+                    text="<memory_summary>The content below summarizes the "
+                    "earlier conversation, which has been compacted:\n"
+                    f"{summary}</memory_summary>",
+                ),
+            ],
+            "user",
+        )
+
+    def _on_compaction_done(self, task: asyncio.Task) -> None:
+        """Reset the compaction task and log the error, if any."""
+        if self._compaction_task is task:
+            self._compaction_task = None
+
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(
+                "Failed to compact the memory: %s",
+                str(task.exception()),
+            )
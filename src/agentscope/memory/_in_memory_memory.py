@@ -1,22 +1,71 @@
 # -*- coding: utf-8 -*-
 """The dialogue memory class"""
-
+import asyncio
 from typing import Union, Iterable, Any
 
+import numpy as np
+
 from ._memory_base import MemoryBase
+from .._logging import logger
+from ..embedding import EmbeddingCacheBase, EmbeddingModelBase
 from ..message import Msg
 
 
 class InMemoryMemory(MemoryBase):
-    """The in-memory memory class for storing messages."""
+    """The in-memory memory class for storing messages.
+
+    If an embedding model is given, the text of the messages is embedded in
+    batches when they're added, and the normalized vectors are kept in a
+    contiguous matrix, so that `retrieve` can find the most relevant
+    messages by cosine similarity with a single matrix-vector product.
+
+    .. code-block:: python
+        :caption: Example usage
+
+        memory = InMemoryMemory(
+            embedding_model=OpenAITextEmbedding(
+                api_key="xxx",
+                model_name="text-embedding-3-small",
+            ),
+        )
+        await memory.add(msgs)
+        relevant_msgs = await memory.retrieve(
+            "What's the user's favorite color?",
+            limit=20,
+            recency_weight=0.2,
+        )
+    """
 
     def __init__(
         self,
+        embedding_model: EmbeddingModelBase | None = None,
+        embedding_cache: EmbeddingCacheBase | None = None,
     ) -> None:
-        """Initialize the in-memory memory object."""
+        """Initialize the in-memory memory object.
+
+        Args:
+            embedding_model (`EmbeddingModelBase | None`, optional):
+                The embedding model used to index the messages for
+                `retrieve`. If not given, the messages are not indexed and
+                `retrieve` is not available.
+            embedding_cache (`EmbeddingCacheBase | None`, optional):
+                The embedding cache to store the embedding of each message
+                text, so that the messages are not embedded again, e.g.
+                after loading the memory from a state dictionary.
+        """
         super().__init__()
         self.content: list[Msg] = []
 
+        self.embedding_model = embedding_model
+        self.embedding_cache = embedding_cache
+
+        # The normalized embeddings of the indexed messages, whose first
+        # `len(self._indexed_msgs)` rows are valid and the remaining rows are
+        # preallocated for the incoming messages.
+        self._vectors: np.ndarray | None = None
+        self._indexed_msgs: list[Msg] = []
+        self._index_lock = asyncio.Lock()
+
     def state_dict(self) -> dict:
         """Convert the current memory into JSON data format."""
         return {
@@ -47,12 +96,197 @@ class InMemoryMemory(MemoryBase):
         """The size of the memory."""
         return len(self.content)
 
-    async def retrieve(self, *args: Any, **kwargs: Any) -> None:
-        """Retrieve items from the memory."""
-        raise NotImplementedError(
-            "The retrieve method is not implemented in "
-            f"{self.__class__.__name__} class.",
+    async def retrieve(
+        self,
+        query: str | Msg,
+        limit: int = 5,
+        recency_weight: float = 0.0,
+        recency_half_life: float = 100.0,
+    ) -> list[Msg]:
+        """Retrieve the messages most relevant to the query by the cosine
+        similarity of their embeddings.
+
+        Args:
+            query (`str | Msg`):
+                The query text, or a message whose text content is used as
+                the query.
+            limit (`int`, defaults to `5`):
+                The maximum number of messages to retrieve.
+            recency_weight (`float`, defaults to `0.0`):
+                The weight of the recency in the score, between 0 and 1. The
+                score of a message is `(1 - recency_weight) * similarity +
+                recency_weight * recency`, where the recency decays from 1
+                for the latest message by half every `recency_half_life`
+                messages.
+            recency_half_life (`float`, defaults to `100.0`):
+                The number of messages after which the recency halves.
+
+        Returns:
+            `list[Msg]`:
+                The retrieved messages in descending order of the score. The
+                messages without text content are never retrieved.
+        """
+        if self.embedding_model is None:
+            raise NotImplementedError(
+                "The retrieve method requires an embedding model in "
+                f"{self.__class__.__name__} class.",
+            )
+
+        if not 0.0 <= recency_weight <= 1.0:
+            raise ValueError(
+                f"`recency_weight` must be between 0 and 1, got "
+                f"{recency_weight}.",
+            )
+
+        if isinstance(query, Msg):
+            query = query.get_text_content() or ""
+
+        await self._update_index()
+        # Keep a consistent view in case the memory changes when embedding
+        # the query
+        msgs, vectors = self._indexed_msgs, self._vectors
+        n_indexed = len(msgs)
+        if n_indexed == 0 or vectors.shape[1] == 0 or limit <= 0:
+            return []
+
+        query_vector = (await self._embed([query]))[0]
+        # The vectors are normalized, so the dot products are the cosine
+        # similarities
+        scores = vectors[:n_indexed] @ query_vector
+        if recency_weight > 0:
+            ages = np.arange(n_indexed - 1, -1, -1, dtype=np.float32)
+            recency = np.power(0.5, ages / recency_half_life)
+            scores = (1 - recency_weight) * scores + recency_weight * recency
+
+        # The messages without text content have zero vectors
+        scores[~vectors[:n_indexed].any(axis=1)] = -np.inf
+
+        limit = min(limit, int(np.isfinite(scores).sum()))
+        if limit == 0:
+            return []
+        top_k = np.argpartition(-scores, limit - 1)[:limit]
+        top_k = top_k[np.argsort(-scores[top_k], kind="stable")]
+        return [msgs[_] for _ in top_k]
+
+    async def _update_index(self) -> None:
+        """Embed the messages that are not indexed yet, and align the rows
+        of the vectors with the current messages."""
+        if self.embedding_model is None:
+            return
+
+        async with self._index_lock:
+            content = list(self.content)
+            ids = [_.id for _ in content]
+            indexed_ids = [_.id for _ in self._indexed_msgs]
+            n_indexed = len(indexed_ids)
+            if ids == indexed_ids:
+                return
+
+            if ids[:n_indexed] == indexed_ids:
+                # Only new messages are appended, which is the common case
+                vectors = await self._embed(
+                    [_.get_text_content() for _ in content[n_indexed:]],
+                )
+                self._append_vectors(vectors)
+                self._indexed_msgs = content
+                return
+
+            # The messages are deleted or reordered, reuse the existing
+            # vectors and only embed the unknown messages
+            rows = {id_: i for i, id_ in enumerate(indexed_ids)}
+            known = [i for i, id_ in enumerate(ids) if id_ in rows]
+            unknown = [i for i, id_ in enumerate(ids) if id_ not in rows]
+            vectors = await self._embed(
+                [content[i].get_text_content() for i in unknown],
+            )
+            old_vectors = self._vectors[:n_indexed]
+            self._vectors = np.zeros(
+                (len(ids), max(old_vectors.shape[1], vectors.shape[1])),
+                dtype=np.float32,
+            )
+            self._vectors[known, : old_vectors.shape[1]] = old_vectors[
+                [rows[ids[i]] for i in known]
+            ]
+            self._vectors[unknown, : vectors.shape[1]] = vectors
+            self._indexed_msgs = content
+
+    def _append_vectors(self, vectors: np.ndarray) -> None:
+        """Append the vectors to the matrix, which grows by doubling its
+        capacity to amortize the copies."""
+        n_indexed = len(self._indexed_msgs)
+        n_vectors = n_indexed + len(vectors)
+        # The dimension is unknown (zero) until a message with text content
+        # is embedded
+        dim = vectors.shape[1]
+        if self._vectors is not None:
+            dim = max(dim, self._vectors.shape[1])
+
+        if (
+            self._vectors is None
+            or n_vectors > len(self._vectors)
+            or dim > self._vectors.shape[1]
+        ):
+            capacity = n_vectors
+            if self._vectors is not None:
+                capacity = max(capacity, 2 * len(self._vectors))
+            new_vectors = np.zeros((max(capacity, 64), dim), dtype=np.float32)
+            if self._vectors is not None:
+                new_vectors[
+                    :n_indexed, : self._vectors.shape[1]
+                ] = self._vectors[:n_indexed]
+            self._vectors = new_vectors
+
+        self._vectors[n_indexed:n_vectors, : vectors.shape[1]] = vectors
+
+    async def _embed(self, texts: list[str | None]) -> np.ndarray:
+        """Embed the texts into normalized vectors, where the cached
+        embeddings are reused and the others are embedded in a single call.
+        The empty texts are mapped to zero vectors."""
+        embeddings: list[Any] = [None] * len(texts)
+        if self.embedding_cache:
+            for i, text in enumerate(texts):
+                if text:
+                    cached = await self.embedding_cache.retrieve(
+                        identifier=self._get_cache_identifier(text),
+                    )
+                    if cached:
+                        embeddings[i] = cached[0]
+
+        missing = [
+            i for i, text in enumerate(texts) if text and embeddings[i] is None
+        ]
+        if missing:
+            response = await self.embedding_model(
+                [texts[i] for i in missing],
+            )
+            for i, embedding in zip(missing, response.embeddings):
+                embeddings[i] = embedding
+                if self.embedding_cache:
+                    await self.embedding_cache.store(
+                        embeddings=[embedding],
+                        identifier=self._get_cache_identifier(texts[i]),
+                    )
+
+        dim = next(
+            (len(_) for _ in embeddings if _ is not None),
+            0 if self._vectors is None else self._vectors.shape[1],
         )
+        vectors = np.zeros((len(texts), dim), dtype=np.float32)
+        for i, embedding in enumerate(embeddings):
+            if embedding is not None:
+                vectors[i] = embedding
+
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return np.divide(
+            vectors,
+            norms,
+            out=np.zeros_like(vectors),
+            where=norms > 0,
+        )
+
+    def _get_cache_identifier(self, text: str) -> dict:
+        """Get the embedding cache identifier of a message text."""
+        return {"model": self.embedding_model.model_name, "text": text}
 
     async def delete(self, index: Union[Iterable, int]) -> None:
         """Delete the specified item by index(es).
@@ -113,6 +347,18 @@ class InMemoryMemory(MemoryBase):
             memories = [_ for _ in memories if _.id not in existing_ids]
         self.content.extend(memories)
 
+        # Embed the new messages in batches. The failure doesn't fail adding
+        # the messages, since `retrieve` embeds the missing ones again and
+        # raises the error there
+        try:
+            await self._update_index()
+        except Exception as e:
+            logger.warning(
+                "Failed to embed the messages added to the memory, which "
+                "will be retried when retrieving: %s",
+                str(e),
+            )
+
     async def get_memory(self) -> list[Msg]:
         """Get the memory content."""
         return self.content
@@ -120,3 +366,5 @@ class InMemoryMemory(MemoryBase):
     async def clear(self) -> None:
         """Clear the memory content."""
         self.content = []
+        self._vectors = None
+        self._indexed_msgs = []
@@ -0,0 +1,373 @@
+# -*- coding: utf-8 -*-
+"""The local long-term memory, which stores the memories in an embedded
+on-disk vector store without external services."""
+import asyncio
+import hashlib
+import os
+import weakref
+from typing import Any, Literal
+
+import numpy as np
+
+from ._local_vector_store import _LocalVectorStore
+from ._long_term_memory_base import LongTermMemoryBase
+from .._utils._common import _get_timestamp
+from ..embedding import EmbeddingModelBase
+from ..message import Msg, TextBlock
+from ..tool import ToolResponse
+
+_stores: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+"""The opened vector stores keyed by their directories, so that the memories
+of different agents can share the same storage directory in a process."""
+
+
+class LocalLongTermMemory(LongTermMemoryBase):
+    """A lightweight long-term memory running in process, which embeds the
+    text of the recorded messages and stores them in an on-disk vector store
+    under `storage_dir`, without any LLM inference or external services.
+
+    The vectors are memory-mapped from the disk, and searched by exact
+    cosine similarity by default. For large memories, `index_type="ivf"`
+    enables an inverted file index trained by k-means, which only scans the
+    vectors in the `n_probe` clusters nearest to the query.
+
+    The memories are recorded with the agent, user and run names of this
+    instance as metadata, and only the memories with the matching metadata
+    are retrieved. Multiple instances (e.g. for different agents) can share
+    the same storage directory within a process, while different processes
+    should use different directories.
+
+    .. code-block:: python
+        :caption: Example usage
+
+        long_term_memory = LocalLongTermMemory(
+            embedding_model=OpenAITextEmbedding(
+                api_key="xxx",
+                model_name="text-embedding-3-small",
+            ),
+            storage_dir="./long_term_memory",
+            agent_name="Friday",
+            user_name="Alice",
+        )
+        await long_term_memory.record([msg])
+        retrieved_info = await long_term_memory.retrieve(msg)
+    """
+
+    def __init__(
+        self,
+        embedding_model: EmbeddingModelBase,
+        storage_dir: str,
+        agent_name: str | None = None,
+        user_name: str | None = None,
+        run_name: str | None = None,
+        index_type: Literal["flat", "ivf"] = "flat",
+        n_probe: int = 8,
+        ivf_min_size: int = 4096,
+    ) -> None:
+        """Initialize the local long-term memory.
+
+        Args:
+            embedding_model (`EmbeddingModelBase`):
+                The embedding model to embed the memories and the queries.
+            storage_dir (`str`):
+                The directory to store the memories.
+            agent_name (`str | None`, optional):
+                The name of the agent.
+            user_name (`str | None`, optional):
+                The name of the user.
+            run_name (`str | None`, optional):
+                The name of the run/session.
+            index_type (`Literal["flat", "ivf"]`, defaults to `"flat"`):
+                The index type of the vector store, `"flat"` for exact
+                search and `"ivf"` for approximate nearest neighbour search.
+            n_probe (`int`, defaults to `8`):
+                The number of the clusters to scan in the IVF index. Larger
+                value leads to higher recall and latency.
+            ivf_min_size (`int`, defaults to `4096`):
+                The minimum number of memories to train the IVF index, below
+                which the memories are searched exactly.
+
+        .. note:: At least one of `agent_name`, `user_name`, or `run_name` is
+         required. The settings of the vector store, i.e. `index_type`,
+         `n_probe` and `ivf_min_size`, take effect when the storage
+         directory is opened for the first time in the process.
+        """
+        super().__init__()
+
+        if agent_name is None and user_name is None and run_name is None:
+            raise ValueError(
+                "at least one of agent_name, user_name, and run_name is "
+                "required",
+            )
+
+        if index_type not in ["flat", "ivf"]:
+            raise ValueError(
+                f"Unsupported index type {index_type}, expected `flat` or "
+                "`ivf`.",
+            )
+
+        self.embedding_model = embedding_model
+        self.agent_id = agent_name
+        self.user_id = user_name
+        self.run_id = run_name
+
+        storage_dir = os.path.abspath(storage_dir)
+        self._store = _stores.get(storage_dir)
+        if self._store is None:
+            self._store = _LocalVectorStore(
+                storage_dir,
+                index_type=index_type,
+                n_probe=n_probe,
+                ivf_min_size=ivf_min_size,
+            )
+            _stores[storage_dir] = self._store
+
+    @property
+    def _scope(self) -> dict:
+        """The metadata to record and filter the memories."""
+        return {
+            "agent_id": self.agent_id,
+            "user_id": self.user_id,
+            "run_id": self.run_id,
+        }
+
+    async def _embed(self, texts: list[str]) -> np.ndarray:
+        """Embed the texts into normalized vectors."""
+        response = await self.embedding_model(texts)
+        vectors = np.asarray(response.embeddings, dtype=np.float32)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return np.divide(
+            vectors,
+            norms,
+            out=np.zeros_like(vectors),
+            where=norms > 0,
+        )
+
+    async def upsert(
+        self,
+        texts: list[str],
+        ids: list[str] | None = None,
+    ) -> list[str]:
+        """Insert the memories in a batch, or update the memories with the
+        same ids.
+
+        Args:
+            texts (`list[str]`):
+                The texts to remember.
+            ids (`list[str] | None`, optional):
+                The ids of the memories. If not given, the ids are derived
+                from the texts and the metadata, so that recording the same
+                text again doesn't duplicate it.
+
+        Returns:
+            `list[str]`:
+                The ids of the memories.
+        """
+        if ids is None:
+            ids = [self._get_scoped_id(_) for _ in texts]
+
+        if len(ids) != len(texts):
+            raise ValueError(
+                f"The number of ids ({len(ids)}) doesn't match the number of "
+                f"texts ({len(texts)}).",
+            )
+
+        if not texts:
+            return []
+
+        vectors = await self._embed(texts)
+        # Write to the disk in a thread without blocking the event loop
+        await asyncio.to_thread(
+            self._store.upsert,
+            ids,
+            texts,
+            vectors,
+            {**self._scope, "timestamp": _get_timestamp()},
+        )
+        return ids
+
+    def _get_scoped_id(self, key: str) -> str:
+        """Get the memory id of the given key within the agent, user and run
+        scope of this instance."""
+        scope = (self.agent_id, self.user_id, self.run_id)
+        return hashlib.sha256(repr((key, scope)).encode("utf-8")).hexdigest()
+
+    async def search(
+        self,
+        queries: list[str],
+        limit: int = 5,
+    ) -> list[list[str]]:
+        """Search the memories most similar to each query in a batch.
+
+        Args:
+            queries (`list[str]`):
+                The queries.
+            limit (`int`, defaults to `5`):
+                The maximum number of memories to retrieve per query.
+
+        Returns:
+            `list[list[str]]`:
+                The texts of the retrieved memories for each query, in
+                descending order of the similarity.
+        """
+        if not queries or len(self._store) == 0:
+            return [[] for _ in queries]
+
+        vectors = await self._embed(queries)
+        results = await asyncio.to_thread(
+            self._store.search,
+            vectors,
+            {k: v for k, v in self._scope.items() if v is not None},
+            limit,
+        )
+        return [[record["text"] for _, record in _] for _ in results]
+
+    async def record(
+        self,
+        msgs: list[Msg | None],
+        **kwargs: Any,
+    ) -> None:
+        """Record the text content of the messages to the long-term memory,
+        where each message is stored as a memory identified by its id within
+        the agent, user and run scope of this instance.
+
+        Args:
+            msgs (`list[Msg | None]`):
+                The messages to record to memory.
+        """
+        if isinstance(msgs, Msg):
+            msgs = [msgs]
+
+        # Filter out None
+        msg_list = [_ for _ in msgs if _]
+        if not all(isinstance(_, Msg) for _ in msg_list):
+            raise TypeError(
+                "The input messages must be a list of Msg objects.",
+            )
+
+        msg_list = [_ for _ in msg_list if _.get_text_content()]
+        await self.upsert(
+            texts=[f"{_.name}: {_.get_text_content()}" for _ in msg_list],
+            # Scope the ids, so that the instances sharing the store don't
+            # overwrite each other's records of the same (broadcast) message
+            ids=[self._get_scoped_id(_.id) for _ in msg_list],
+        )
+
+    async def retrieve(
+        self,
+        msg: Msg | list[Msg] | None,
+        limit: int = 5,
+        **kwargs: Any,
+    ) -> str:
+        """Retrieve the content from the long-term memory.
+
+        Args:
+            msg (`Msg | list[Msg] | None`):
+                The message(s) to search for in the memory.
+            limit (`int`, defaults to `5`):
+                The maximum number of memories to retrieve per message.
+
+        Returns:
+            `str`:
+                The retrieved memories, one per line.
+        """
+        if msg is None:
+            return ""
+
+        if isinstance(msg, Msg):
+            msg = [msg]
+
+        if not isinstance(msg, list) or not all(
+            isinstance(_, Msg) for _ in msg
+        ):
+            raise TypeError(
+                "The input message must be a Msg or a list of Msg objects.",
+            )
+
+        queries = [_.get_text_content() for _ in msg]
+        results = await self.search([_ for _ in queries if _], limit)
+        # Remove the duplicates across the queries
+        return "\n".join(dict.fromkeys(_ for texts in results for _ in texts))
+
+    async def record_to_memory(
+        self,
+        thinking: str,
+        content: list[str],
+        **kwargs: Any,
+    ) -> ToolResponse:
+        """Use this function to record important information that you may
+        need later. The target content should be specific and concise, e.g.
+        who, when, where, do what, why, how, etc.
+
+        Args:
+            thinking (`str`):
+                Your thinking and reasoning about what to record.
+            content (`list[str]`):
+                The content to remember, which is a list of strings.
+        """
+        try:
+            await self.upsert(content)
+            return ToolResponse(
+                content=[
+                    TextBlock(
+                        type="text",
+                        text=f"Successfully recorded {len(content)} "
+                        "item(s) to memory.",
+                    ),
+                ],
+            )
+
+        except Exception as e:
+            return ToolResponse(
+                content=[
+                    TextBlock(
+                        type="text",
+                        text=f"Error recording memory: {str(e)}",
+                    ),
+                ],
+            )
+
+    async def retrieve_from_memory(
+        self,
+        keywords: list[str],
+        limit: int = 5,
+        **kwargs: Any,
+    ) -> ToolResponse:
+        """Retrieve the memory based on the given keywords.
+
+        Args:
+            keywords (`list[str]`):
+                The keywords to search for in the memory, which should be
+                specific and concise, e.g. the person's name, the date, the
+                location, etc.
+            limit (`int`, optional):
+                The maximum number of memories to retrieve per search.
+
+        Returns:
+            `ToolResponse`:
+                A ToolResponse containing the retrieved memories.
+        """
+        try:
+            results = await self.search(keywords, limit)
+            return ToolResponse(
+                content=[
+                    TextBlock(
+                        type="text",
+                        text="\n".join(
+                            dict.fromkeys(
+                                _ for texts in results for _ in texts
+                            ),
+                        ),
+                    ),
+                ],
+            )
+
+        except Exception as e:
+            return ToolResponse(
+                content=[
+                    TextBlock(
+                        type="text",
+                        text=f"Error retrieving memory: {str(e)}",
+                    ),
+                ],
+            )
@@ -0,0 +1,365 @@
+# -*- coding: utf-8 -*-
+"""The on-disk vector store of the local long-term memory, where the vectors
+are memory-mapped and optionally indexed by an inverted file (IVF) index for
+approximate nearest neighbour search."""
+import json
+import os
+import threading
+from typing import Literal
+
+import numpy as np
+
+from .._logging import logger
+
+_SCOPE_FIELDS = ("agent_id", "user_id", "run_id")
+"""The metadata fields to filter the records."""
+
+
+class _LocalVectorStore:
+    """A vector store persisted in a directory with the following files:
+
+    - `vectors.npy`: The normalized vectors, which is memory-mapped and
+      grows by doubling its rows.
+    - `records.jsonl`: The append-only log of the upserted records, where
+      the last record of the same id wins.
+    - `ivf.npz`: The centroids of the IVF index and the list assignments of
+      the vectors, if the IVF index is trained.
+
+    The methods are thread-safe, so that they can run in the threads without
+    blocking the event loop.
+    """
+
+    def __init__(
+        self,
+        storage_dir: str,
+        index_type: Literal["flat", "ivf"] = "flat",
+        n_probe: int = 8,
+        ivf_min_size: int = 4096,
+    ) -> None:
+        """Initialize the vector store, and load the existing data from the
+        storage directory.
+
+        Args:
+            storage_dir (`str`):
+                The directory to persist the vector store.
+            index_type (`Literal["flat", "ivf"]`, defaults to `"flat"`):
+                The index type. `"flat"` scans all the vectors exactly, and
+                `"ivf"` clusters the vectors into about `sqrt(n)` lists by
+                k-means, and only scans the `n_probe` lists nearest to the
+                query.
+            n_probe (`int`, defaults to `8`):
+                The number of the lists to scan in the IVF index.
+            ivf_min_size (`int`, defaults to `4096`):
+                The minimum number of the vectors to train the IVF index,
+                below which the vectors are scanned exactly. The index is
+                trained again when the vectors double.
+        """
+        self.storage_dir = os.path.abspath(storage_dir)
+        self.index_type = index_type
+        self.n_probe = n_probe
+        self.ivf_min_size = ivf_min_size
+
+        self._lock = threading.Lock()
+        self._vectors: np.memmap | None = None
+        self._records: list[dict] = []
+        self._rows: dict[str, int] = {}
+        self._vocabularies: dict[str, dict] = {_: {} for _ in _SCOPE_FIELDS}
+        self._codes: dict[str, np.ndarray] = {
+            _: np.zeros(0, dtype=np.int32) for _ in _SCOPE_FIELDS
+        }
+        self._centroids: np.ndarray | None = None
+        self._assignments = np.zeros(0, dtype=np.int32)
+        self._n_trained = 0
+
+        os.makedirs(self.storage_dir, exist_ok=True)
+        self._load()
+
+    @property
+    def _vectors_path(self) -> str:
+        """The path of the vectors file."""
+        return os.path.join(self.storage_dir, "vectors.npy")
+
+    @property
+    def _records_path(self) -> str:
+        """The path of the records file."""
+        return os.path.join(self.storage_dir, "records.jsonl")
+
+    @property
+    def _ivf_path(self) -> str:
+        """The path of the IVF index file."""
+        return os.path.join(self.storage_dir, "ivf.npz")
+
+    def __len__(self) -> int:
+        """The number of the records."""
+        return len(self._records)
+
+    def _load(self) -> None:
+        """Load the vectors, the records and the IVF index from the storage
+        directory."""
+        if not os.path.exists(self._vectors_path):
+            return
+
+        self._vectors = np.load(self._vectors_path, mmap_mode="r+")
+        self._reserve(len(self._vectors))
+
+        if os.path.exists(self._records_path):
+            with open(self._records_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        # An incomplete line written by an interrupted upsert
+                        logger.warning(
+                            "Skip a corrupted record in %s.",
+                            self._records_path,
+                        )
+                        continue
+                    self._set_record(record)
+
+        if self.index_type == "ivf" and os.path.exists(self._ivf_path):
+            with np.load(self._ivf_path) as ivf:
+                centroids = np.asarray(ivf["centroids"])
+                assignments = np.asarray(ivf["assignments"])
+            self._centroids = centroids
+            n_assigned = min(len(assignments), len(self))
+            self._assignments[:n_assigned] = assignments[:n_assigned]
+            self._n_trained = n_assigned
+            if n_assigned < len(self):
+                self._assign(np.arange(n_assigned, len(self)))
+
+    def _reserve(self, capacity: int) -> None:
+        """Grow the per-row arrays to the given capacity."""
+        for field in _SCOPE_FIELDS:
+            if len(self._codes[field]) < capacity:
+                codes = np.zeros(capacity, dtype=np.int32)
+                codes[: len(self._codes[field])] = self._codes[field]
+                self._codes[field] = codes
+        if len(self._assignments) < capacity:
+            assignments = np.zeros(capacity, dtype=np.int32)
+            assignments[: len(self._assignments)] = self._assignments
+            self._assignments = assignments
+
+    def _grow_vectors(self, n_rows: int, dim: int) -> None:
+        """Make sure the memory-mapped vectors have at least the given rows,
+        where the file is copied to a new one with doubled rows."""
+        if self._vectors is not None:
+            if self._vectors.shape[1] != dim:
+                raise ValueError(
+                    f"The embedding dimension {dim} doesn't match the "
+                    f"dimension {self._vectors.shape[1]} of the vectors in "
+                    f"{self.storage_dir}.",
+                )
+            if n_rows <= len(self._vectors):
+                return
+
+        capacity = max(n_rows, 1024)
+        if self._vectors is not None:
+            capacity = max(capacity, 2 * len(self._vectors))
+
+        tmp_path = f"{self._vectors_path}.tmp"
+        vectors = np.lib.format.open_memmap(
+            tmp_path,
+            mode="w+",
+            dtype=np.float32,
+            shape=(capacity, dim),
+        )
+        if self._vectors is not None:
+            vectors[: len(self)] = self._vectors[: len(self)]
+        vectors.flush()
+        del vectors
+        self._vectors = None
+        os.replace(tmp_path, self._vectors_path)
+
+        self._vectors = np.load(self._vectors_path, mmap_mode="r+")
+        self._reserve(capacity)
+
+    def _get_code(self, field: str, value: str | None) -> int:
+        """Get the integer code of a metadata value, where `0` means
+        `None`."""
+        if value is None:
+            return 0
+        vocabulary = self._vocabularies[field]
+        if value not in vocabulary:
+            vocabulary[value] = len(vocabulary) + 1
+        return vocabulary[value]
+
+    def _set_record(self, record: dict) -> int:
+        """Set the record in memory, and return its row."""
+        row = record["row"]
+        if row >= len(self._records):
+            self._records.extend([{}] * (row + 1 - len(self._records)))
+        self._records[row] = record
+        self._rows[record["id"]] = row
+        for field in _SCOPE_FIELDS:
+            self._codes[field][row] = self._get_code(field, record.get(field))
+        return row
+
+    def upsert(
+        self,
+        ids: list[str],
+        texts: list[str],
+        vectors: np.ndarray,
+        metadata: dict,
+    ) -> None:
+        """Insert the records, or update the records with the same ids in
+        place.
+
+        Args:
+            ids (`list[str]`):
+                The ids of the records.
+            texts (`list[str]`):
+                The texts of the records.
+            vectors (`np.ndarray`):
+                The normalized vectors of the texts.
+            metadata (`dict`):
+                The metadata shared by the records, including the agent id,
+                user id, run id and timestamp.
+        """
+        with self._lock:
+            records, n_rows = [], len(self)
+            rows: dict[str, int] = {}
+            for id_, text in zip(ids, texts):
+                row = self._rows.get(id_, rows.get(id_))
+                if row is None:
+                    row = n_rows
+                    n_rows += 1
+                rows[id_] = row
+                records.append(
+                    {"id": id_, "row": row, "text": text, **metadata}
+                )
+
+            self._grow_vectors(n_rows, vectors.shape[1])
+            for record, vector in zip(records, vectors):
+                self._vectors[record["row"]] = vector
+            # Persist the vectors before the records refer to them
+            self._vectors.flush()
+            with open(self._records_path, "a", encoding="utf-8") as f:
+                for record in records:
+                    f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+            for record in records:
+                self._set_record(record)
+
+            if self._centroids is not None:
+                self._assign(np.array(sorted(set(rows.values()))))
+
+            if self.index_type == "ivf" and len(self) >= max(
+                self.ivf_min_size,
+                2 * self._n_trained,
+            ):
+                self._train()
+
+    def _train(self) -> None:
+        """Train the IVF index by k-means on a sample of the vectors, and
+        assign all the vectors to their nearest lists."""
+        n = len(self)
+        n_lists = int(np.sqrt(n))
+        rng = np.random.default_rng(0)
+        sample = self._vectors[
+            np.sort(rng.choice(n, min(n, 32 * n_lists), replace=False))
+        ]
+
+        centroids = sample[rng.choice(len(sample), n_lists, replace=False)]
+        for _ in range(8):
+            labels = np.argmax(sample @ centroids.T, axis=1)
+            for i in range(n_lists):
+                members = sample[labels == i]
+                if len(members):
+                    centroid = members.sum(axis=0)
+                    norm = np.linalg.norm(centroid)
+                    if norm > 0:
+                        centroids[i] = centroid / norm
+
+        self._centroids = centroids
+        self._assign(np.arange(n))
+        self._n_trained = n
+
+        tmp_path = f"{self._ivf_path}.tmp.npz"
+        np.savez(
+            tmp_path,
+            centroids=self._centroids,
+            assignments=self._assignments[:n],
+        )
+        os.replace(tmp_path, self._ivf_path)
+        logger.info(
+            "Trained the IVF index with %d lists over %d vectors in %s.",
+            n_lists,
+            n,
+            self.storage_dir,
+        )
+
+    def _assign(self, rows: np.ndarray) -> None:
+        """Assign the vectors of the given rows to their nearest lists."""
+        for start in range(0, len(rows), 8192):
+            chunk = rows[start : start + 8192]
+            self._assignments[chunk] = np.argmax(
+                self._vectors[chunk] @ self._centroids.T,
+                axis=1,
+            )
+
+    def search(
+        self,
+        queries: np.ndarray,
+        filters: dict,
+        limit: int,
+    ) -> list[list[tuple[float, dict]]]:
+        """Search the most similar records for each query.
+
+        Args:
+            queries (`np.ndarray`):
+                The normalized query vectors.
+            filters (`dict`):
+                The metadata values that the records must match, e.g.
+                `{"agent_id": "Friday"}`.
+            limit (`int`):
+                The maximum number of the records for each query.
+
+        Returns:
+            `list[list[tuple[float, dict]]]`:
+                The scores and the records for each query, in descending
+                order of the score.
+        """
+        with self._lock:
+            n = len(self)
+            if n == 0 or limit <= 0:
+                return [[] for _ in queries]
+
+            mask = np.ones(n, dtype=bool)
+            for field, value in filters.items():
+                code = self._vocabularies[field].get(value)
+                if code is None:
+                    return [[] for _ in queries]
+                mask &= self._codes[field][:n] == code
+
+            results = []
+            for query in queries:
+                query_mask = mask
+                if self._centroids is not None:
+                    probes = np.argsort(-(self._centroids @ query))[
+                        : self.n_probe
+                    ]
+                    query_mask = mask & np.isin(
+                        self._assignments[:n],
+                        probes,
+                    )
+
+                rows = np.flatnonzero(query_mask)
+                if len(rows) == 0:
+                    results.append([])
+                    continue
+
+                if len(rows) == n:
+                    # Avoid copying the rows when scanning all the vectors
+                    scores = self._vectors[:n] @ query
+                else:
+                    scores = self._vectors[rows] @ query
+                k = min(limit, len(rows))
+                top_k = np.argpartition(-scores, k - 1)[:k]
+                top_k = top_k[np.argsort(-scores[top_k], kind="stable")]
+                results.append(
+                    [
+                        (float(scores[i]), self._records[rows[i]])
+                        for i in top_k
+                    ],
+                )
+            return results
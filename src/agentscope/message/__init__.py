@@ -12,8 +12,10 @@ from ._message_block import (
     VideoBlock,
     Base64Source,
     URLSource,
+    BlobSource,
 )
 from ._message_base import Msg
+from ._blob_store import BlobStore
 
 
 __all__ = [
@@ -21,6 +23,7 @@ __all__ = [
     "ThinkingBlock",
     "Base64Source",
     "URLSource",
+    "BlobSource",
     "ImageBlock",
     "AudioBlock",
     "VideoBlock",
@@ -28,4 +31,5 @@ __all__ = [
     "ToolResultBlock",
     "ContentBlock",
     "Msg",
+    "BlobStore",
 ]
@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+"""The content-addressed blob store for the large payloads that shouldn't be
+kept inline in the messages."""
+import base64
+import hashlib
+import mmap
+import os
+
+from ._message_block import Base64Source, BlobSource, URLSource
+
+
+class BlobStore:
+    """A content-addressed blob store on the local disk. Each blob is stored
+    in a file named by the SHA-256 hash of its content, so that the same
+    payload is stored only once, and the blob id can be kept in the
+    messages instead of the payload."""
+
+    def __init__(self, root_dir: str = "./.cache/blobs") -> None:
+        """Initialize the blob store.
+
+        Args:
+            root_dir (`str`, defaults to `"./.cache/blobs"`):
+                The directory to store the blob files.
+        """
+        self._root_dir = os.path.abspath(root_dir)
+
+    @property
+    def root_dir(self) -> str:
+        """The directory where the blob files are stored."""
+        if not os.path.exists(self._root_dir):
+            os.makedirs(self._root_dir, exist_ok=True)
+        return self._root_dir
+
+    def put(self, data: str | bytes) -> str:
+        """Store the data, and return its blob id.
+
+        Args:
+            data (`str | bytes`):
+                The data to store. The string is encoded in UTF-8.
+
+        Returns:
+            `str`:
+                The blob id, i.e. the SHA-256 hex digest of the data.
+        """
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+
+        blob_id = hashlib.sha256(data).hexdigest()
+        path_file = self._get_path(blob_id)
+        if not os.path.exists(path_file):
+            # Write into a temporary file first to avoid partial files
+            path_tmp = f"{path_file}.{os.getpid()}.tmp"
+            with open(path_tmp, "wb") as f:
+                f.write(data)
+            os.replace(path_tmp, path_file)
+
+        return blob_id
+
+    def get(self, blob_id: str) -> bytes:
+        """Get the data of the blob.
+
+        Args:
+            blob_id (`str`):
+                The blob id.
+
+        Raises:
+            `KeyError`:
+                If the blob doesn't exist.
+        """
+        path_file = self._get_path(blob_id)
+        if not os.path.isfile(path_file):
+            raise KeyError(f"Blob {blob_id} not found.")
+
+        with open(path_file, "rb") as f:
+            return f.read()
+
+    def put_source(self, data: str | bytes, media_type: str) -> BlobSource:
+        """Store the binary data, and return a blob source referring to it,
+        which can be used in the image, audio and video blocks instead of
+        the base64 source.
+
+        Args:
+            data (`str | bytes`):
+                The binary data, or its base64 string.
+            media_type (`str`):
+                The media type of the data, e.g. `image/png`.
+
+        Returns:
+            `BlobSource`:
+                The blob source referring to the stored data.
+        """
+        if isinstance(data, str):
+            data = base64.b64decode(data)
+
+        return BlobSource(
+            type="blob",
+            media_type=media_type,
+            blob_id=self.put(data),
+            root_dir=self.root_dir,
+        )
+
+    def get_base64(self, blob_id: str) -> str:
+        """Get the data of the blob encoded in base64, where the file is
+        memory-mapped and encoded without reading it into a bytes object.
+
+        Args:
+            blob_id (`str`):
+                The blob id.
+
+        Raises:
+            `KeyError`:
+                If the blob doesn't exist.
+        """
+        path_file = self._get_path(blob_id)
+        if not os.path.isfile(path_file):
+            raise KeyError(f"Blob {blob_id} not found.")
+
+        if os.path.getsize(path_file) == 0:
+            return ""
+
+        with open(path_file, "rb") as f, mmap.mmap(
+            f.fileno(),
+            0,
+            access=mmap.ACCESS_READ,
+        ) as buffer:
+            return base64.b64encode(buffer).decode("ascii")
+
+    @staticmethod
+    def resolve_source(
+        source: Base64Source | URLSource | BlobSource,
+    ) -> Base64Source | URLSource:
+        """Resolve a blob source into a base64 source by reading the blob,
+        and return the other sources as they are. It's used by the
+        formatters when building the API requests.
+
+        Args:
+            source (`Base64Source | URLSource | BlobSource`):
+                The source of an image, audio or video block.
+
+        Returns:
+            `Base64Source | URLSource`:
+                The resolved source.
+        """
+        if source.get("type") != "blob":
+            return source
+
+        return Base64Source(
+            type="base64",
+            media_type=source["media_type"],
+            data=BlobStore(source["root_dir"]).get_base64(source["blob_id"]),
+        )
+
+    def get_text(self, blob_id: str) -> str:
+        """Get the data of the blob as a UTF-8 string."""
+        return self.get(blob_id).decode("utf-8", errors="replace")
+
+    def exists(self, blob_id: str) -> bool:
+        """If the blob exists."""
+        return os.path.isfile(self._get_path(blob_id))
+
+    def delete(self, blob_id: str) -> None:
+        """Delete the blob if it exists."""
+        path_file = self._get_path(blob_id)
+        if os.path.isfile(path_file):
+            os.remove(path_file)
+
+    def _get_path(self, blob_id: str) -> str:
+        """Get the file path of the blob."""
+        if not blob_id.isalnum():
+            raise ValueError(f"Invalid blob id: {blob_id}")
+        return os.path.join(self.root_dir, blob_id)
@@ -1,7 +1,9 @@
 # -*- coding: utf-8 -*-
 """The message class in agentscope."""
+from copy import deepcopy
 from datetime import datetime
-from typing import Literal, List, overload, Sequence
+from functools import lru_cache
+from typing import Any, Literal, List, NoReturn, overload, Sequence
 
 import shortuuid
 
@@ -18,8 +20,93 @@ from ._message_block import (
 from ..types import JSONSerializableObject
 
 
+def _raise_read_only(*args: Any, **kwargs: Any) -> NoReturn:
+    """Raise an error for modifying the frozen message."""
+    raise TypeError(
+        "The frozen message is read-only, use `fork()` to get a modifiable "
+        "copy of it.",
+    )
+
+
+class _FrozenDict(dict):
+    """A read-only dict in the frozen message. Deep copying it returns a
+    modifiable dict."""
+
+    __setitem__ = __delitem__ = __ior__ = _raise_read_only
+    clear = pop = popitem = setdefault = update = _raise_read_only
+
+    def __copy__(self) -> dict:
+        """Get a modifiable shallow copy."""
+        return dict(self)
+
+    def __deepcopy__(self, memo: dict) -> dict:
+        """Get a modifiable deep copy."""
+        return {k: deepcopy(v, memo) for k, v in self.items()}
+
+    def __reduce__(self) -> tuple:
+        """Pickle as a plain dict."""
+        return dict, (dict(self),)
+
+
+class _FrozenList(list):
+    """A read-only list in the frozen message. Deep copying it returns a
+    modifiable list."""
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _raise_read_only
+    append = extend = insert = pop = remove = _raise_read_only
+    clear = sort = reverse = _raise_read_only
+
+    def __copy__(self) -> list:
+        """Get a modifiable shallow copy."""
+        return list(self)
+
+    def __deepcopy__(self, memo: dict) -> list:
+        """Get a modifiable deep copy."""
+        return [deepcopy(_, memo) for _ in self]
+
+    def __reduce__(self) -> tuple:
+        """Pickle as a plain list."""
+        return list, (list(self),)
+
+
+def _freeze(obj: Any) -> Any:
+    """Convert the dicts and lists in the given object into read-only ones,
+    where the frozen parts and the immutable leaves are shared rather than
+    copied."""
+    if isinstance(obj, (_FrozenDict, _FrozenList)):
+        return obj
+    if isinstance(obj, dict):
+        return _FrozenDict((k, _freeze(v)) for k, v in obj.items())
+    if isinstance(obj, list):
+        return _FrozenList(_freeze(_) for _ in obj)
+    if isinstance(obj, tuple):
+        return tuple(_freeze(_) for _ in obj)
+    return obj
+
+
 class Msg:
-    """The message class in agentscope."""
+    """The message class in agentscope.
+
+    A message can be frozen by `freeze()`, so that it can be shared safely
+    by multiple agents without copying, e.g. in the fanout pipeline. The
+    `fork()` method gets a modifiable copy of the frozen message in O(1)
+    time, which shares the content and metadata with the frozen message
+    until they're accessed through the `content` and `metadata` attributes,
+    while the read-only methods, e.g. `get_content_blocks()` and
+    `to_dict()`, never copy them.
+    """
+
+    _frozen: bool = False
+    """Whether the message is frozen, which is only overridden by the frozen
+    message class."""
+
+    _shared_fields: set[str] | None = None
+    """The fields shared with a frozen message, which are copied before being
+    exposed for modification. Only the forked messages have it."""
+
+    _unfrozen_cls: type["Msg"] | None = None
+    """The message class that the frozen message class is derived from,
+    which is only set by the frozen message classes."""
 
     def __init__(
         self,
@@ -48,14 +135,13 @@ class Msg:
                 The related API invocation id, if any. This is useful for
                 tracking the message in the context of an API call.
         """
-
         self.name = name
-        self.content = content
+        self._content = content
 
         assert role in ["user", "assistant", "system"]
         self.role = role
 
-        self.metadata = metadata
+        self._metadata = metadata
 
         self.id = shortuuid.uuid()
         self.timestamp = (
@@ -66,14 +152,120 @@ class Msg:
         )
         self.invocation_id = invocation_id
 
+    def _get_field(self, field: str) -> Any:
+        """Get the field for modification, which is copied first if it's
+        shared with a frozen message."""
+        if field in (self._shared_fields or ()):
+            self._shared_fields.discard(field)
+            self.__dict__[f"_{field}"] = deepcopy(self.__dict__[f"_{field}"])
+        return self.__dict__[f"_{field}"]
+
+    def _set_field(self, field: str, value: Any) -> None:
+        """Set the field, which is no longer shared."""
+        setattr(self, f"_{field}", value)
+        if self._shared_fields:
+            self._shared_fields.discard(field)
+
+    @property
+    def content(self) -> str | Sequence[ContentBlock]:
+        """The content of the message, which is read-only if the message is
+        frozen."""
+        return self._get_field("content")
+
+    @content.setter
+    def content(self, value: str | Sequence[ContentBlock]) -> None:
+        """Set the content of the message."""
+        self._set_field("content", value)
+
+    @property
+    def metadata(self) -> dict[str, JSONSerializableObject] | None:
+        """The metadata of the message, which is read-only if the message is
+        frozen."""
+        return self._get_field("metadata")
+
+    @metadata.setter
+    def metadata(
+        self,
+        value: dict[str, JSONSerializableObject] | None,
+    ) -> None:
+        """Set the metadata of the message."""
+        self._set_field("metadata", value)
+
+    @property
+    def is_frozen(self) -> bool:
+        """Whether the message is frozen."""
+        return self._frozen
+
+    def freeze(self) -> "Msg":
+        """Get a frozen copy of the message with the same id, whose
+        attributes, content and metadata are read-only. The frozen message
+        can be passed to multiple agents without copying, and the agents
+        can `fork()` it to modify.
+
+        Returns:
+            `Msg`:
+                The message itself if it's already frozen, otherwise a
+                frozen copy of it, where only the dicts and lists in the
+                content and metadata are copied.
+        """
+        if self._frozen:
+            return self
+
+        frozen_cls = _get_frozen_class(type(self))
+        frozen_msg = frozen_cls.__new__(frozen_cls)
+        frozen_msg.__dict__.update(
+            self.__dict__,
+            _content=_freeze(self.__dict__["_content"]),
+            _metadata=_freeze(self.__dict__["_metadata"]),
+        )
+        frozen_msg.__dict__.pop("_shared_fields", None)
+        return frozen_msg
+
+    def fork(self) -> "Msg":
+        """Get a modifiable copy of the message with the same id. The copy
+        shares the content and metadata with the frozen message, and copies
+        them on the first access through the `content` and `metadata`
+        attributes, so that forking a frozen message takes O(1) time.
+
+        Returns:
+            `Msg`:
+                The modifiable copy of the message.
+        """
+        return deepcopy(self.freeze())
+
+    def __deepcopy__(self, memo: dict) -> "Msg":
+        """Deep copy the message, where the content and metadata shared with
+        a frozen message are not copied until being modified."""
+        # The copy of a frozen message is of the class it's derived from
+        cls = self._unfrozen_cls or type(self)
+        new_msg = cls.__new__(cls)
+        memo[id(self)] = new_msg
+
+        if self._frozen:
+            shared_fields = {"content", "metadata"}
+        elif self._shared_fields:
+            shared_fields = set(self._shared_fields)
+        else:
+            # An ordinary message
+            new_msg.__dict__.update(deepcopy(self.__dict__, memo))
+            return new_msg
+
+        for key, value in self.__dict__.items():
+            if key.startswith("_") and key[1:] in shared_fields:
+                new_msg.__dict__[key] = value
+            else:
+                new_msg.__dict__[key] = deepcopy(value, memo)
+        new_msg.__dict__["_shared_fields"] = shared_fields
+        return new_msg
+
     def to_dict(self) -> dict:
         """Convert the message into JSON dict data."""
         return {
             "id": self.id,
             "name": self.name,
             "role": self.role,
-            "content": self.content,
-            "metadata": self.metadata,
+            "content": self._content,
+            "metadata": self._metadata,
             "timestamp": self.timestamp,
         }
 
@@ -116,11 +308,11 @@ class Msg:
 
     def get_text_content(self) -> str | None:
         """Get the pure text blocks from the message content."""
-        if isinstance(self.content, str):
-            return self.content
+        if isinstance(self._content, str):
+            return self._content
 
         gathered_text = None
-        for block in self.content:
+        for block in self._content:
             if block.get("type") == "text":
                 if gathered_text is None:
                     gathered_text = str(block.get("text"))
@@ -213,12 +405,12 @@ class Msg:
                 The content blocks.
         """
         blocks = []
-        if isinstance(self.content, str):
+        if isinstance(self._content, str):
             blocks.append(
-                TextBlock(type="text", text=self.content),
+                TextBlock(type="text", text=self._content),
             )
         else:
-            blocks = self.content
+            blocks = self._content
 
         if block_type is not None:
             blocks = [_ for _ in blocks if _["type"] == block_type]
@@ -230,9 +422,56 @@ class Msg:
         return (
             f"Msg(id='{self.id}', "
             f"name='{self.name}', "
-            f"content={repr(self.content)}, "
+            f"content={repr(self._content)}, "
             f"role='{self.role}', "
-            f"metadata={repr(self.metadata)}, "
+            f"metadata={repr(self._metadata)}, "
             f"timestamp='{self.timestamp}', "
             f"invocation_id='{self.invocation_id}')"
         )
+
+
+class _FrozenMsg(Msg):
+    """The frozen message, whose attributes can't be set. Its content and
+    metadata are read-only views."""
+
+    _frozen: bool = True
+
+    _unfrozen_cls: type[Msg] = Msg
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Forbid modifying the frozen message."""
+        raise AttributeError(
+            f"Cannot set `{name}` of the frozen message, use `fork()` to get "
+            "a modifiable copy of it.",
+        )
+
+    def __reduce__(self) -> tuple:
+        """Pickle the frozen message by the class it's derived from, since
+        the derived frozen classes are created dynamically."""
+        return _restore_frozen_msg, (self._unfrozen_cls, self.__dict__.copy())
+
+
+@lru_cache(maxsize=None)
+def _get_frozen_class(cls: type[Msg]) -> type[_FrozenMsg]:
+    """Get the frozen class of the given message class, so that the
+    subclasses of `Msg` are kept through `freeze()`, `fork()` and
+    `deepcopy()`."""
+    if cls is Msg:
+        return _FrozenMsg
+    return type(
+        cls.__name__,
+        (_FrozenMsg, cls),
+        {
+            "__module__": cls.__module__,
+            "__qualname__": cls.__qualname__,
+            "_unfrozen_cls": cls,
+        },
+    )
+
+
+def _restore_frozen_msg(cls: type[Msg], state: dict) -> _FrozenMsg:
+    """Restore a pickled frozen message."""
+    frozen_cls = _get_frozen_class(cls)
+    frozen_msg = frozen_cls.__new__(frozen_cls)
+    frozen_msg.__dict__.update(state)
+    return frozen_msg
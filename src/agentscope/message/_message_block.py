@@ -46,13 +46,31 @@ class URLSource(TypedDict, total=False):
     """The URL of the image or audio"""
 
 
+class BlobSource(TypedDict, total=False):
+    """The blob source, which refers to the binary data stored once in a
+    `BlobStore`, so that the messages only carry the reference and the data
+    is encoded into base64 by the formatters when building the requests."""
+
+    type: Required[Literal["blob"]]
+    """The type of the src, must be `blob`"""
+
+    media_type: Required[str]
+    """The media type of the data, e.g. `image/jpeg` or `audio/mpeg`"""
+
+    blob_id: Required[str]
+    """The id of the blob, i.e. the SHA-256 hex digest of the data"""
+
+    root_dir: Required[str]
+    """The directory of the blob store"""
+
+
 class ImageBlock(TypedDict, total=False):
     """The image block"""
 
     type: Required[Literal["image"]]
     """The type of the block"""
 
-    source: Required[Base64Source | URLSource]
+    source: Required[Base64Source | URLSource | BlobSource]
     """The src of the image"""
 
 
@@ -62,7 +80,7 @@ class AudioBlock(TypedDict, total=False):
     type: Required[Literal["audio"]]
     """The type of the block"""
 
-    source: Required[Base64Source | URLSource]
+    source: Required[Base64Source | URLSource | BlobSource]
     """The src of the audio"""
 
 
@@ -72,7 +90,7 @@ class VideoBlock(TypedDict, total=False):
     type: Required[Literal["video"]]
     """The type of the block"""
 
-    source: Required[Base64Source | URLSource]
+    source: Required[Base64Source | URLSource | BlobSource]
     """The src of the audio"""
 
 
@@ -0,0 +1,23 @@
+# -*- coding: utf-8 -*-
+"""The metrics module in agentscope, which records the latency, token and
+queue metrics of the agents, models, embedding models, tools and
+formatters."""
+
+from ._metric import (
+    MetricBase,
+    Counter,
+    Gauge,
+    Histogram,
+)
+from ._registry import MetricsRegistry, get_registry
+from ._setup import setup_metrics
+
+__all__ = [
+    "MetricBase",
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "MetricsRegistry",
+    "get_registry",
+    "setup_metrics",
+]
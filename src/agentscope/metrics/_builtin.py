@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+"""The built-in metrics of agentscope, which are recorded automatically by
+the agents, models, embedding models, toolkit and formatters."""
+from typing import Any
+
+from ._registry import get_registry
+from .. import _config
+
+_ROUND_BUCKETS = (0, 1, 2, 4, 8, 16, 32, 64)
+_SPEED_BUCKETS = (5, 10, 20, 40, 80, 160, 320)
+
+
+def _check_metrics_enabled() -> bool:
+    """Check if the built-in metrics are enabled."""
+    return _config.metrics_enabled
+
+
+def _get_status(error: BaseException | None) -> str:
+    """Get the status label by the error."""
+    return "ok" if error is None else "error"
+
+
+def _record_agent_reply(
+    agent_name: str,
+    elapsed: float,
+    error: BaseException | None,
+    memory_size: int | None = None,
+) -> None:
+    """Record the latency of an agent reply and the memory size after it."""
+    registry = get_registry()
+    registry.histogram(
+        "agentscope_agent_reply_seconds",
+        "The latency of the agent replies in seconds.",
+        ["agent"],
+    ).observe(elapsed, agent=agent_name)
+    registry.counter(
+        "agentscope_agent_replies_total",
+        "The number of the agent replies.",
+        ["agent", "status"],
+    ).inc(agent=agent_name, status=_get_status(error))
+
+    if memory_size is not None:
+        registry.gauge(
+            "agentscope_memory_size",
+            "The number of the messages in the agent memory.",
+            ["agent"],
+        ).set(memory_size, agent=agent_name)
+
+
+def _record_chat(
+    model_name: str,
+    response: Any,
+    error: BaseException | None,
+    elapsed: float,
+) -> None:
+    """Record the latency, token usage and queue time of a chat model call,
+    where the response is the (last chunk of the) `ChatResponse`."""
+    registry = get_registry()
+    registry.histogram(
+        "agentscope_model_call_seconds",
+        "The latency of the chat model calls in seconds, including the "
+        "streaming.",
+        ["model"],
+    ).observe(elapsed, model=model_name)
+    registry.counter(
+        "agentscope_model_calls_total",
+        "The number of the chat model calls.",
+        ["model", "status"],
+    ).inc(model=model_name, status=_get_status(error))
+
+    stats = getattr(response, "stream_stats", None)
+    if stats is not None and stats.time_to_first_token is not None:
+        registry.histogram(
+            "agentscope_model_time_to_first_token_seconds",
+            "The time in seconds to the first token of the streaming chat "
+            "model calls.",
+            ["model"],
+        ).observe(stats.time_to_first_token, model=model_name)
+    if stats is not None and stats.tokens_per_second is not None:
+        registry.histogram(
+            "agentscope_model_tokens_per_second",
+            "The decoding speed of the streaming chat model calls in output "
+            "tokens per second.",
+            ["model"],
+            buckets=_SPEED_BUCKETS,
+        ).observe(stats.tokens_per_second, model=model_name)
+
+    usage = getattr(response, "usage", None)
+    if usage is None:
+        return
+
+    tokens = registry.counter(
+        "agentscope_model_tokens_total",
+        "The number of the tokens consumed by the chat model calls.",
+        ["model", "type"],
+    )
+    tokens.inc(usage.input_tokens or 0, model=model_name, type="input")
+    tokens.inc(usage.output_tokens or 0, model=model_name, type="output")
+    registry.histogram(
+        "agentscope_model_queue_seconds",
+        "The time in seconds the chat model calls wait for admission, e.g. "
+        "by a rate limiter.",
+        ["model"],
+    ).observe(getattr(usage, "queue_time", 0.0), model=model_name)
+
+
+def _record_embedding(
+    model_name: str,
+    response: Any,
+    error: BaseException | None,
+    elapsed: float,
+) -> None:
+    """Record the latency and token usage of an embedding model call."""
+    registry = get_registry()
+    source = getattr(response, "source", "api")
+    registry.histogram(
+        "agentscope_embedding_call_seconds",
+        "The latency of the embedding model calls in seconds.",
+        ["model", "source"],
+    ).observe(elapsed, model=model_name, source=source)
+    registry.counter(
+        "agentscope_embedding_calls_total",
+        "The number of the embedding model calls.",
+        ["model", "source", "status"],
+    ).inc(model=model_name, source=source, status=_get_status(error))
+
+    usage = getattr(response, "usage", None)
+    if usage is not None and usage.tokens:
+        registry.counter(
+            "agentscope_embedding_tokens_total",
+            "The number of the tokens consumed by the embedding model "
+            "calls.",
+            ["model"],
+        ).inc(usage.tokens, model=model_name)
+
+
+def _record_tool_call(
+    tool_name: str,
+    response: Any,
+    error: BaseException | None,
+    elapsed: float,
+) -> None:
+    """Record the latency and status of a tool call, where the failed tool
+    responses are marked by `success=False` in their metadata."""
+    metadata = getattr(response, "metadata", None) or {}
+    failed = error is not None or metadata.get("success") is False
+
+    registry = get_registry()
+    registry.histogram(
+        "agentscope_tool_call_seconds",
+        "The latency of the tool calls in seconds, including the "
+        "streaming.",
+        ["tool"],
+    ).observe(elapsed, tool=tool_name)
+    registry.counter(
+        "agentscope_tool_calls_total",
+        "The number of the tool calls.",
+        ["tool", "status"],
+    ).inc(tool=tool_name, status="error" if failed else "ok")
+
+
+def _record_truncation(formatter_name: str, n_rounds: int) -> None:
+    """Record the number of the truncation rounds in a formatting."""
+    get_registry().histogram(
+        "agentscope_formatter_truncation_rounds",
+        "The number of the truncation rounds to fit the token limit in a "
+        "formatting.",
+        ["formatter"],
+        buckets=_ROUND_BUCKETS,
+    ).observe(n_rounds, formatter=formatter_name)
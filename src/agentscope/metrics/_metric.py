@@ -0,0 +1,379 @@
+# -*- coding: utf-8 -*-
+"""The metric classes in agentscope."""
+import bisect
+import math
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Sequence
+
+DEFAULT_LATENCY_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+"""The default histogram buckets in seconds."""
+
+
+def _escape_label_value(value: str) -> str:
+    """Escape the label value in the Prometheus text format."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    """Format the labels in the Prometheus text format."""
+    if not names:
+        return ""
+    pairs = [
+        f'{name}="{_escape_label_value(value)}"'
+        for name, value in zip(names, values)
+    ]
+    return "{" + ",".join(pairs) + "}"
+
+
+def _format_value(value: float) -> str:
+    """Format the sample value in the Prometheus text format."""
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class MetricBase(ABC):
+    """The base class of the metrics. A metric holds a series of values,
+    each of which is identified by its label values."""
+
+    type: str
+    """The metric type in the Prometheus text format."""
+
+    def __init__(
+        self,
+        name: str,
+        description: str = "",
+        label_names: Sequence[str] = (),
+    ) -> None:
+        """Initialize the metric.
+
+        Args:
+            name (`str`):
+                The metric name, e.g. `"agentscope_model_calls_total"`.
+            description (`str`, optional):
+                The description of the metric.
+            label_names (`Sequence[str]`, optional):
+                The label names, whose values must be given when recording.
+        """
+        self.name = name
+        self.description = description
+        self.label_names = tuple(label_names)
+
+        self._lock = threading.Lock()
+        self._instrument: Any = None
+
+    def _get_key(self, labels: dict[str, Any]) -> tuple[str, ...]:
+        """Get the key of the series by the label values."""
+        if len(labels) != len(self.label_names) or any(
+            _ not in labels for _ in self.label_names
+        ):
+            raise ValueError(
+                f"The metric {self.name} requires the labels "
+                f"{list(self.label_names)}, but got {list(labels)}.",
+            )
+        return tuple(str(labels[_]) for _ in self.label_names)
+
+    @abstractmethod
+    def bind(self, meter: Any) -> None:
+        """Bind the metric to an OpenTelemetry meter, so that the following
+        records are also forwarded to the OpenTelemetry instrument.
+
+        Args:
+            meter (`Meter`):
+                The OpenTelemetry meter.
+        """
+
+    @abstractmethod
+    def to_prometheus(self) -> str:
+        """Render the metric in the Prometheus text format."""
+
+    def _prometheus_header(self) -> str:
+        """The HELP and TYPE lines of the metric."""
+        return (
+            f"# HELP {self.name} {self.description}\n"
+            f"# TYPE {self.name} {self.type}\n"
+        )
+
+
+class Counter(MetricBase):
+    """A counter, whose value only increases."""
+
+    type = "counter"
+
+    def __init__(
+        self,
+        name: str,
+        description: str = "",
+        label_names: Sequence[str] = (),
+    ) -> None:
+        """Initialize the counter."""
+        super().__init__(name, description, label_names)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        """Increase the counter.
+
+        Args:
+            amount (`float`, defaults to `1.0`):
+                The non-negative amount to increase.
+            **labels (`Any`):
+                The label values.
+        """
+        if amount < 0:
+            raise ValueError("The counter can only increase.")
+
+        key = self._get_key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+        if self._instrument is not None:
+            self._instrument.add(amount, attributes=labels)
+
+    def get(self, **labels: Any) -> float:
+        """Get the counter value of the given labels."""
+        return self._values.get(self._get_key(labels), 0.0)
+
+    def bind(self, meter: Any) -> None:
+        """Bind the counter to an OpenTelemetry counter."""
+        self._instrument = meter.create_counter(
+            self.name,
+            description=self.description,
+        )
+
+    def to_prometheus(self) -> str:
+        """Render the counter in the Prometheus text format."""
+        with self._lock:
+            items = list(self._values.items())
+        lines = [
+            f"{self.name}{_format_labels(self.label_names, key)} "
+            f"{_format_value(value)}\n"
+            for key, value in items
+        ]
+        return self._prometheus_header() + "".join(lines)
+
+
+class Gauge(MetricBase):
+    """A gauge, whose value can go up and down."""
+
+    type = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        description: str = "",
+        label_names: Sequence[str] = (),
+    ) -> None:
+        """Initialize the gauge."""
+        super().__init__(name, description, label_names)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def set(self, value: float, **labels: Any) -> None:
+        """Set the gauge value.
+
+        Args:
+            value (`float`):
+                The value to set.
+            **labels (`Any`):
+                The label values.
+        """
+        key = self._get_key(labels)
+        with self._lock:
+            self._values[key] = value
+
+        if self._instrument is not None:
+            self._instrument.set(value, attributes=labels)
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        """Increase the gauge value by the given amount."""
+        key = self._get_key(labels)
+        with self._lock:
+            value = self._values.get(key, 0.0) + amount
+            self._values[key] = value
+
+        if self._instrument is not None:
+            self._instrument.set(value, attributes=labels)
+
+    def dec(self, amount: float = 1.0, **labels: Any) -> None:
+        """Decrease the gauge value by the given amount."""
+        self.inc(-amount, **labels)
+
+    def get(self, **labels: Any) -> float:
+        """Get the gauge value of the given labels."""
+        return self._values.get(self._get_key(labels), 0.0)
+
+    def bind(self, meter: Any) -> None:
+        """Bind the gauge to an OpenTelemetry gauge."""
+        self._instrument = meter.create_gauge(
+            self.name,
+            description=self.description,
+        )
+
+    def to_prometheus(self) -> str:
+        """Render the gauge in the Prometheus text format."""
+        with self._lock:
+            items = list(self._values.items())
+        lines = [
+            f"{self.name}{_format_labels(self.label_names, key)} "
+            f"{_format_value(value)}\n"
+            for key, value in items
+        ]
+        return self._prometheus_header() + "".join(lines)
+
+
+class Histogram(MetricBase):
+    """A histogram, which counts the observed values in buckets, and
+    estimates the quantiles from them."""
+
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        description: str = "",
+        label_names: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> None:
+        """Initialize the histogram.
+
+        Args:
+            name (`str`):
+                The metric name.
+            description (`str`, optional):
+                The description of the metric.
+            label_names (`Sequence[str]`, optional):
+                The label names.
+            buckets (`Sequence[float]`, optional):
+                The upper bounds of the buckets in ascending order. The
+                `+Inf` bucket is added automatically. Defaults to the
+                latency buckets from 5ms to 60s.
+        """
+        super().__init__(name, description, label_names)
+        self.buckets = tuple(sorted(buckets))
+        # The counts of the buckets (non-cumulative, with the +Inf bucket),
+        # the sum and the count of each series
+        self._series: dict[tuple[str, ...], list] = {}
+
+    def observe(self, value: float, **labels: Any) -> None:
+        """Observe a value.
+
+        Args:
+            value (`float`):
+                The observed value.
+            **labels (`Any`):
+                The label values.
+        """
+        key = self._get_key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = [[0] * (len(self.buckets) + 1), 0.0, 0]
+                self._series[key] = series
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+        if self._instrument is not None:
+            self._instrument.record(value, attributes=labels)
+
+    def get(self, **labels: Any) -> dict[str, Any]:
+        """Get the statistics of the given labels.
+
+        Returns:
+            `dict[str, Any]`:
+                A dictionary with the `count`, `sum` and the cumulative
+                `buckets` as a list of `(upper bound, count)` pairs.
+        """
+        key = self._get_key(labels)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                return {"count": 0, "sum": 0.0, "buckets": []}
+            counts, total, count = list(series[0]), series[1], series[2]
+
+        cumulative, buckets = 0, []
+        for bound, n in zip([*self.buckets, math.inf], counts):
+            cumulative += n
+            buckets.append((bound, cumulative))
+        return {"count": count, "sum": total, "buckets": buckets}
+
+    def quantile(self, q: float, **labels: Any) -> float:
+        """Estimate the quantile by linear interpolation within the bucket,
+        the same way as `histogram_quantile` in Prometheus.
+
+        Args:
+            q (`float`):
+                The quantile, ranging from 0 to 1.
+            **labels (`Any`):
+                The label values.
+
+        Returns:
+            `float`:
+                The estimated quantile, or `nan` if nothing is observed.
+        """
+        stats = self.get(**labels)
+        if stats["count"] == 0:
+            return math.nan
+
+        rank = q * stats["count"]
+        lower_bound, lower_count = 0.0, 0
+        for bound, cumulative in stats["buckets"]:
+            if cumulative >= rank:
+                if math.isinf(bound):
+                    # Fall back to the largest finite bound
+                    return lower_bound
+                n = cumulative - lower_count
+                if n == 0:
+                    return bound
+                return lower_bound + (bound - lower_bound) * (
+                    (rank - lower_count) / n
+                )
+            lower_bound, lower_count = bound, cumulative
+        return lower_bound
+
+    def bind(self, meter: Any) -> None:
+        """Bind the histogram to an OpenTelemetry histogram with the same
+        bucket boundaries."""
+        self._instrument = meter.create_histogram(
+            self.name,
+            description=self.description,
+            explicit_bucket_boundaries_advisory=list(self.buckets),
+        )
+
+    def to_prometheus(self) -> str:
+        """Render the histogram in the Prometheus text format."""
+        with self._lock:
+            keys = list(self._series)
+
+        lines = []
+        for key in keys:
+            stats = self.get(**dict(zip(self.label_names, key)))
+            for bound, cumulative in stats["buckets"]:
+                labels = _format_labels(
+                    [*self.label_names, "le"],
+                    [*key, _format_value(bound)],
+                )
+                lines.append(f"{self.name}_bucket{labels} {cumulative}\n")
+            labels = _format_labels(self.label_names, key)
+            lines.append(
+                f"{self.name}_sum{labels} {_format_value(stats['sum'])}\n",
+            )
+            lines.append(f"{self.name}_count{labels} {stats['count']}\n")
+        return self._prometheus_header() + "".join(lines)
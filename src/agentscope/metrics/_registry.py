@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+"""The metrics registry in agentscope."""
+import threading
+from typing import Any, Sequence, Type, TypeVar
+
+from ._metric import (
+    Counter,
+    DEFAULT_LATENCY_BUCKETS,
+    Gauge,
+    Histogram,
+    MetricBase,
+)
+
+MetricT = TypeVar("MetricT", bound=MetricBase)
+
+
+class MetricsRegistry:
+    """The registry of the metrics, which creates the metrics by name on
+    first use, and exports them in the Prometheus text format or via
+    OpenTelemetry.
+
+    .. code-block:: python
+        :caption: Example usage
+
+        registry = get_registry()
+        registry.counter(
+            "my_requests_total",
+            "The number of requests.",
+            ["route"],
+        ).inc(route="/chat")
+
+        # Serve it at the /metrics endpoint of your web server
+        text = registry.to_prometheus()
+    """
+
+    def __init__(self) -> None:
+        """Initialize the metrics registry."""
+        self._metrics: dict[str, MetricBase] = {}
+        self._lock = threading.Lock()
+        self._meter: Any = None
+
+    def counter(
+        self,
+        name: str,
+        description: str = "",
+        label_names: Sequence[str] = (),
+    ) -> Counter:
+        """Get or create a counter.
+
+        Args:
+            name (`str`):
+                The metric name.
+            description (`str`, optional):
+                The description of the metric.
+            label_names (`Sequence[str]`, optional):
+                The label names.
+        """
+        return self._get_or_create(Counter, name, description, label_names)
+
+    def gauge(
+        self,
+        name: str,
+        description: str = "",
+        label_names: Sequence[str] = (),
+    ) -> Gauge:
+        """Get or create a gauge.
+
+        Args:
+            name (`str`):
+                The metric name.
+            description (`str`, optional):
+                The description of the metric.
+            label_names (`Sequence[str]`, optional):
+                The label names.
+        """
+        return self._get_or_create(Gauge, name, description, label_names)
+
+    def histogram(
+        self,
+        name: str,
+        description: str = "",
+        label_names: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> Histogram:
+        """Get or create a histogram.
+
+        Args:
+            name (`str`):
+                The metric name.
+            description (`str`, optional):
+                The description of the metric.
+            label_names (`Sequence[str]`, optional):
+                The label names.
+            buckets (`Sequence[float]`, optional):
+                The upper bounds of the buckets, which are only used when
+                the histogram is created.
+        """
+        return self._get_or_create(
+            Histogram,
+            name,
+            description,
+            label_names,
+            buckets=buckets,
+        )
+
+    def get(self, name: str) -> MetricBase | None:
+        """Get the metric by name, or `None` if it doesn't exist."""
+        return self._metrics.get(name)
+
+    def list_metrics(self) -> list[MetricBase]:
+        """List all the metrics."""
+        return list(self._metrics.values())
+
+    def clear(self) -> None:
+        """Remove all the metrics."""
+        with self._lock:
+            self._metrics.clear()
+
+    def bind_meter(self, meter: Any) -> None:
+        """Forward the records of all the metrics, including the ones
+        created later, to the given OpenTelemetry meter.
+
+        .. note:: The values recorded before binding are not forwarded.
+
+        Args:
+            meter (`Meter`):
+                The OpenTelemetry meter.
+        """
+        with self._lock:
+            self._meter = meter
+            for metric in self._metrics.values():
+                metric.bind(meter)
+
+    def to_prometheus(self) -> str:
+        """Render all the metrics in the Prometheus text format."""
+        return "".join(_.to_prometheus() for _ in self.list_metrics())
+
+    def _get_or_create(
+        self,
+        cls: Type[MetricT],
+        name: str,
+        description: str,
+        label_names: Sequence[str],
+        **kwargs: Any,
+    ) -> MetricT:
+        """Get the metric by name, or create it if not exists."""
+        metric = self._metrics.get(name)
+        if metric is None:
+            with self._lock:
+                metric = self._metrics.get(name)
+                if metric is None:
+                    metric = cls(name, description, label_names, **kwargs)
+                    if self._meter is not None:
+                        metric.bind(self._meter)
+                    self._metrics[name] = metric
+
+        if not isinstance(metric, cls) or metric.label_names != tuple(
+            label_names,
+        ):
+            raise ValueError(
+                f"The metric {name} is already registered as a "
+                f"{metric.type} with labels {list(metric.label_names)}.",
+            )
+        return metric
+
+
+_registry = MetricsRegistry()
+
+
+def get_registry() -> MetricsRegistry:
+    """Get the global metrics registry, where the built-in metrics of
+    agentscope are recorded."""
+    return _registry
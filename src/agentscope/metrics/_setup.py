@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+"""The metrics exporting setup in agentscope."""
+from ._registry import get_registry
+from .. import _config
+
+
+def setup_metrics(
+    endpoint: str | None = None,
+    export_interval: float = 15.0,
+) -> None:
+    """Enable the built-in metrics, and export the metrics in the global
+    registry to an OpenTelemetry collector via OTLP over HTTP if the
+    endpoint is given.
+
+    .. note:: The built-in metrics are disabled by default to avoid the
+     overhead in the agent, model and tool calls. Without an endpoint, the
+     metrics are only recorded in the global registry, e.g. to be scraped by
+     `get_registry().to_prometheus()`.
+
+    Args:
+        endpoint (`str | None`, optional):
+            The endpoint URL for the metrics exporter, e.g.
+            `"http://localhost:4318/v1/metrics"`.
+        export_interval (`float`, defaults to `15.0`):
+            The export interval in seconds.
+    """
+    _config.metrics_enabled = True
+
+    if endpoint is None:
+        return
+
+    # Lazy import
+    from opentelemetry.sdk.metrics import MeterProvider
+    from opentelemetry.sdk.metrics.export import (
+        PeriodicExportingMetricReader,
+    )
+    from opentelemetry.exporter.otlp.proto.http.metric_exporter import (
+        OTLPMetricExporter,
+    )
+
+    reader = PeriodicExportingMetricReader(
+        OTLPMetricExporter(endpoint=endpoint),
+        export_interval_millis=export_interval * 1000,
+    )
+    meter_provider = MeterProvider(metric_readers=[reader])
+    get_registry().bind_meter(meter_provider.get_meter("agentscope"))
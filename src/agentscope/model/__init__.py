@@ -8,6 +8,12 @@ from ._openai_model import OpenAIChatModel
 from ._anthropic_model import AnthropicChatModel
 from ._ollama_model import OllamaChatModel
 from ._gemini_model import GeminiChatModel
+from ._rate_limiter import ChatRateLimiter, RateLimitedChatModel
+from ._cache_base import ChatCacheBase
+from ._in_memory_cache import InMemoryChatCache
+from ._file_cache import FileChatCache
+from ._cached_model import CachedChatModel
+from ._hedged_model import HedgedChatModel
 
 __all__ = [
     "ChatModelBase",
@@ -17,4 +23,11 @@ __all__ = [
     "AnthropicChatModel",
     "OllamaChatModel",
     "GeminiChatModel",
+    "ChatRateLimiter",
+    "RateLimitedChatModel",
+    "ChatCacheBase",
+    "InMemoryChatCache",
+    "FileChatCache",
+    "CachedChatModel",
+    "HedgedChatModel",
 ]
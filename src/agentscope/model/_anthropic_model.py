@@ -17,6 +17,7 @@ from pydantic import BaseModel
 
 from ._model_base import ChatModelBase
 from ._model_response import ChatResponse
+from ._model_stream_stats import _StreamTimer
 from ._model_usage import ChatUsage
 from .._logging import logger
 from .._utils._common import (
@@ -347,10 +348,13 @@ class AnthropicChatModel(ChatModelBase):
         tool_call_buffers = {}
         res = None
         metadata = None
+        timer = _StreamTimer(start_datetime)
+        usage_changed = False
 
         async for event in response:
             content_changed = False
             thinking_changed = False
+            timer.tick(event.type == "content_block_delta")
 
             if event.type == "message_start":
                 message = event.message
@@ -362,7 +366,7 @@ class AnthropicChatModel(ChatModelBase):
                             "output_tokens",
                             0,
                         ),
-                        time=(datetime.now() - start_datetime).total_seconds(),
+                        time=timer.elapsed(),
                     )
 
             elif event.type == "content_block_start":
@@ -402,6 +406,8 @@ class AnthropicChatModel(ChatModelBase):
             elif event.type == "message_delta":
                 if event.usage and usage:
                     usage.output_tokens = event.usage.output_tokens
+                    usage.time = timer.elapsed()
+                    usage_changed = True
 
             if (thinking_changed or content_changed) and usage:
                 contents: list = []
@@ -444,9 +450,22 @@ class AnthropicChatModel(ChatModelBase):
                         content=contents,
                         usage=usage,
                         metadata=metadata,
+                        stream_stats=timer.stats(usage.output_tokens),
                     )
+                    usage_changed = False
                     yield res
 
+        # The final output tokens come after the last content block, so
+        # yield the final response again with the complete statistics
+        if res is not None and usage_changed:
+            res = ChatResponse(
+                content=res.content,
+                usage=usage,
+                metadata=metadata,
+                stream_stats=timer.stats(usage.output_tokens),
+            )
+            yield res
+
     def _format_tools_json_schemas(
         self,
         schemas: list[dict[str, Any]],
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+"""The chat response cache base class."""
+import time
+from abc import abstractmethod
+from typing import Any
+
+from ..types import JSONSerializableObject
+
+
+class ChatCacheBase:
+    """Base class for chat response caches, which store and retrieve the
+    recorded responses by the request key."""
+
+    def __init__(self, ttl: float | None = None) -> None:
+        """Initialize the chat cache.
+
+        Args:
+            ttl (`float | None`, defaults to `None`):
+                The time-to-live of the cached responses in seconds. If
+                `None`, the cached responses never expire.
+        """
+        self.ttl = ttl
+
+    @abstractmethod
+    async def store(
+        self,
+        key: str,
+        record: JSONSerializableObject,
+        **kwargs: Any,
+    ) -> None:
+        """Store the recorded response with the given key.
+
+        Args:
+            key (`str`):
+                The key of the request, e.g. a hash of the request.
+            record (`JSONSerializableObject`):
+                The recorded response to store.
+        """
+
+    @abstractmethod
+    async def retrieve(self, key: str) -> JSONSerializableObject | None:
+        """Retrieve the recorded response with the given key. If not found
+        or expired, return `None`.
+
+        Args:
+            key (`str`):
+                The key of the request.
+        """
+
+    @abstractmethod
+    async def remove(self, key: str) -> None:
+        """Remove the recorded response with the given key.
+
+        Args:
+            key (`str`):
+                The key of the request.
+        """
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """Clear all cached responses."""
+
+    def _is_expired(self, created_at: float) -> bool:
+        """Check if a record created at the given timestamp is expired."""
+        return self.ttl is not None and time.time() - created_at > self.ttl
@@ -0,0 +1,241 @@
+# -*- coding: utf-8 -*-
+"""The cached chat model, which replays the recorded responses for the same
+requests."""
+import asyncio
+import hashlib
+import json
+import time
+from copy import deepcopy
+from typing import Any, AsyncGenerator, Type
+
+from pydantic import BaseModel
+
+from ._cache_base import ChatCacheBase
+from ._model_base import ChatModelBase
+from ._model_response import ChatResponse
+from ._model_usage import ChatUsage
+
+
+class CachedChatModel(ChatModelBase):
+    """A chat model wrapper that records the responses of the wrapped model
+    into a cache, and replays them when the same request is sent again, e.g.
+    in evaluation and regression runs.
+
+    The cache key is a canonical hash of the model name, the streaming mode,
+    the formatted messages, the tools, the structured model and the
+    generation arguments. The streaming responses are recorded as chunk
+    sequences together with the intervals between chunks, so that they can
+    be replayed with the original or compressed timing.
+
+    .. code-block:: python
+        :caption: Example usage
+
+        model = CachedChatModel(
+            OpenAIChatModel("gpt-4o", api_key="xxx"),
+            cache=FileChatCache("./.cache/chat", ttl=7 * 24 * 3600),
+            replay_speed=10.0,
+        )
+    """
+
+    def __init__(
+        self,
+        model: ChatModelBase,
+        cache: ChatCacheBase,
+        replay_speed: float | None = None,
+    ) -> None:
+        """Initialize the cached chat model.
+
+        Args:
+            model (`ChatModelBase`):
+                The chat model to be wrapped.
+            cache (`ChatCacheBase`):
+                The cache to store the recorded responses.
+            replay_speed (`float | None`, defaults to `None`):
+                The speed factor when replaying the recorded streaming
+                responses, e.g. `1.0` for the original timing and `10.0` for
+                ten times faster. If `None`, the chunks are replayed without
+                any delay.
+        """
+        if replay_speed is not None and replay_speed <= 0:
+            raise ValueError(
+                f"`replay_speed` must be positive, got {replay_speed}.",
+            )
+
+        super().__init__(model.model_name, model.stream)
+
+        self.model = model
+        self.cache = cache
+        self.replay_speed = replay_speed
+
+    async def __call__(
+        self,
+        messages: list[dict],
+        tools: list[dict] | None = None,
+        tool_choice: str | None = None,
+        structured_model: Type[BaseModel] | None = None,
+        **kwargs: Any,
+    ) -> ChatResponse | AsyncGenerator[ChatResponse, None]:
+        """Replay the cached response if found, otherwise call the wrapped
+        model and record its response.
+
+        Args:
+            messages (`list[dict]`):
+                The formatted messages.
+            tools (`list[dict] | None`, default `None`):
+                The tools JSON schemas that the model can use.
+            tool_choice (`str | None`, default `None`):
+                Controls which (if any) tool is called by the model.
+            structured_model (`Type[BaseModel] | None`, default `None`):
+                The required structured output model.
+            **kwargs (`Any`):
+                The keyword arguments for the wrapped model.
+        """
+        key = self.get_cache_key(
+            messages,
+            tools,
+            tool_choice,
+            structured_model,
+            **kwargs,
+        )
+
+        record = await self.cache.retrieve(key)
+        if record is not None:
+            chunks = [
+                (_["delay"], self._restore_response(_["response"]))
+                for _ in record["chunks"]
+            ]
+            if record["stream"]:
+                return self._replay_stream(chunks)
+            return chunks[-1][1]
+
+        start = time.perf_counter()
+        res = await self.model(
+            messages,
+            tools=tools,
+            tool_choice=tool_choice,
+            structured_model=structured_model,
+            **kwargs,
+        )
+
+        if isinstance(res, AsyncGenerator):
+            return self._record_stream(key, res, start)
+
+        await self.cache.store(
+            key,
+            {
+                "stream": False,
+                "chunks": [
+                    {
+                        "delay": time.perf_counter() - start,
+                        "response": self._dump_response(res),
+                    },
+                ],
+            },
+        )
+        return res
+
+    def get_cache_key(
+        self,
+        messages: list[dict],
+        tools: list[dict] | None = None,
+        tool_choice: str | None = None,
+        structured_model: Type[BaseModel] | None = None,
+        **kwargs: Any,
+    ) -> str:
+        """Compute the canonical hash of the request as the cache key.
+
+        Args:
+            messages (`list[dict]`):
+                The formatted messages.
+            tools (`list[dict] | None`, default `None`):
+                The tools JSON schemas that the model can use.
+            tool_choice (`str | None`, default `None`):
+                Controls which (if any) tool is called by the model.
+            structured_model (`Type[BaseModel] | None`, default `None`):
+                The required structured output model.
+            **kwargs (`Any`):
+                The keyword arguments for the wrapped model.
+
+        Returns:
+            `str`:
+                The SHA-256 hex digest of the canonical JSON representation
+                of the request.
+        """
+        request = {
+            "model_name": self.model.model_name,
+            "stream": self.model.stream,
+            "messages": messages,
+            "tools": tools,
+            "tool_choice": tool_choice,
+            "structured_model": (
+                structured_model.model_json_schema()
+                if structured_model
+                else None
+            ),
+            "generate_kwargs": getattr(self.model, "generate_kwargs", None),
+            "kwargs": kwargs,
+        }
+        canonical = json.dumps(
+            request,
+            sort_keys=True,
+            ensure_ascii=False,
+            separators=(",", ":"),
+            default=str,
+        )
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    async def _record_stream(
+        self,
+        key: str,
+        res: AsyncGenerator[ChatResponse, None],
+        start: float,
+    ) -> AsyncGenerator[ChatResponse, None]:
+        """Record the streaming response chunk by chunk, and store it into
+        the cache once the stream finishes successfully."""
+        chunks = []
+        last = start
+        async for chunk in res:
+            now = time.perf_counter()
+            chunks.append(
+                {"delay": now - last, "response": self._dump_response(chunk)},
+            )
+            last = now
+            yield chunk
+
+        if chunks:
+            await self.cache.store(key, {"stream": True, "chunks": chunks})
+
+    async def _replay_stream(
+        self,
+        chunks: list[tuple[float, ChatResponse]],
+    ) -> AsyncGenerator[ChatResponse, None]:
+        """Replay the recorded streaming response."""
+        for delay, chunk in chunks:
+            if self.replay_speed is not None:
+                await asyncio.sleep(delay / self.replay_speed)
+            yield chunk
+
+    @staticmethod
+    def _dump_response(res: ChatResponse) -> dict:
+        """Dump the chat response into a JSON serializable dictionary."""
+        # The JSON round trip detaches the record from the returned response
+        return json.loads(
+            json.dumps(
+                {
+                    "content": res.content,
+                    "usage": res.usage,
+                    "metadata": res.metadata,
+                },
+                ensure_ascii=False,
+            ),
+        )
+
+    @staticmethod
+    def _restore_response(data: dict) -> ChatResponse:
+        """Restore the chat response from the dumped dictionary."""
+        data = deepcopy(data)
+        return ChatResponse(
+            content=data["content"],
+            usage=ChatUsage(**data["usage"]) if data["usage"] else None,
+            metadata=data["metadata"],
+        )
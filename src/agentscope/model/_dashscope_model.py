@@ -1,12 +1,13 @@
 # -*- coding: utf-8 -*-
 """The dashscope API model classes."""
 import collections
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from http import HTTPStatus
 from typing import (
     Any,
     AsyncGenerator,
-    Generator,
     Union,
     TYPE_CHECKING,
     List,
@@ -18,10 +19,13 @@ from aioitertools import iter as giter
 
 from ._model_base import ChatModelBase
 from ._model_response import ChatResponse
+from ._model_stream_stats import _StreamTimer
 from ._model_usage import ChatUsage
 from .._utils._common import (
     _json_loads_with_repair,
     _create_tool_from_base_model,
+    _iterate_sync_generator_in_thread,
+    _run_sync_func_in_thread,
 )
 from ..message import TextBlock, ToolUseBlock, ThinkingBlock
 from ..tracing import trace_llm
@@ -47,6 +51,16 @@ class DashScopeChatModel(ChatModelBase):
     """The DashScope chat model class, which unifies the Generation and
     MultimodalConversation APIs into one method."""
 
+    multimodal_max_concurrency: int = 16
+    """The maximum number of in-flight MultiModalConversation requests in
+    the process. Since DashScope only provides a synchronous SDK for the
+    multimodal conversation API, these requests are driven by a worker
+    thread pool shared by all the instances. Modify it before the first
+    multimodal call to take effect."""
+
+    _multimodal_executor: ThreadPoolExecutor | None = None
+    _multimodal_executor_lock = threading.Lock()
+
     def __init__(
         self,
         model_name: str,
@@ -197,10 +211,7 @@ class DashScopeChatModel(ChatModelBase):
 
         start_datetime = datetime.now()
         if self.model_name.startswith("qvq") or "-vl" in self.model_name:
-            response = dashscope.MultiModalConversation.call(
-                api_key=self.api_key,
-                **kwargs,
-            )
+            response = await self._call_multimodal(kwargs)
 
         else:
             response = await dashscope.aigc.generation.AioGeneration.call(
@@ -223,13 +234,45 @@ class DashScopeChatModel(ChatModelBase):
 
         return parsed_response
 
+    async def _call_multimodal(self, kwargs: dict[str, Any]) -> Any:
+        """Call the multimodal conversation API, which is synchronous, in the
+        worker threads to avoid blocking the event loop."""
+        import dashscope
+
+        if self.stream:
+            return _iterate_sync_generator_in_thread(
+                self._get_multimodal_executor(),
+                dashscope.MultiModalConversation.call,
+                api_key=self.api_key,
+                **kwargs,
+            )
+
+        return await _run_sync_func_in_thread(
+            self._get_multimodal_executor(),
+            dashscope.MultiModalConversation.call,
+            api_key=self.api_key,
+            **kwargs,
+        )
+
+    @classmethod
+    def _get_multimodal_executor(cls) -> ThreadPoolExecutor:
+        """Get the process-wide thread pool executor for the multimodal
+        conversation API, which bounds the number of concurrent requests."""
+        with cls._multimodal_executor_lock:
+            if DashScopeChatModel._multimodal_executor is None:
+                DashScopeChatModel._multimodal_executor = ThreadPoolExecutor(
+                    max_workers=cls.multimodal_max_concurrency,
+                    thread_name_prefix="agentscope-dashscope",
+                )
+            return DashScopeChatModel._multimodal_executor
+
     # pylint: disable=too-many-branches
     async def _parse_dashscope_stream_response(
         self,
         start_datetime: datetime,
         response: Union[
             AsyncGenerator[GenerationResponse, None],
-            Generator[MultiModalConversationResponse, None, None],
+            AsyncGenerator[MultiModalConversationResponse, None],
         ],
         structured_model: Type[BaseModel] | None = None,
     ) -> AsyncGenerator[ChatResponse, Any]:
@@ -240,8 +283,8 @@ class DashScopeChatModel(ChatModelBase):
             start_datetime (`datetime`):
                 The start datetime of the response generation.
             response (
-                `Union[AsyncGenerator[GenerationResponse, None], Generator[ \
-                MultiModalConversationResponse, None, None]]`
+                `Union[AsyncGenerator[GenerationResponse, None], \
+                AsyncGenerator[MultiModalConversationResponse, None]]`
             ):
                 DashScope streaming response generator (GenerationResponse or
                 MultiModalConversationResponse) to parse.
@@ -262,6 +305,7 @@ class DashScopeChatModel(ChatModelBase):
         acc_content, acc_thinking_content = "", ""
         acc_tool_calls = collections.defaultdict(dict)
         metadata = None
+        timer = _StreamTimer(start_datetime)
 
         async for chunk in giter(response):
             if chunk.status_code != HTTPStatus.OK:
@@ -270,6 +314,13 @@ class DashScopeChatModel(ChatModelBase):
                 )
 
             message = chunk.output.choices[0].message
+            timer.tick(
+                bool(
+                    message.get("reasoning_content")
+                    or message.content
+                    or message.get("tool_calls"),
+                ),
+            )
 
             # Update reasoning content
             if isinstance(message.get("reasoning_content"), str):
@@ -351,13 +402,16 @@ class DashScopeChatModel(ChatModelBase):
                 usage = ChatUsage(
                     input_tokens=chunk.usage.input_tokens,
                     output_tokens=chunk.usage.output_tokens,
-                    time=(datetime.now() - start_datetime).total_seconds(),
+                    time=timer.elapsed(),
                 )
 
             parsed_chunk = ChatResponse(
                 content=content_blocks,
                 usage=usage,
                 metadata=metadata,
+                stream_stats=timer.stats(
+                    usage.output_tokens if usage else None,
+                ),
             )
             yield parsed_chunk
 
@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+"""A file chat cache implementation for storing and retrieving the recorded
+chat responses in JSON files."""
+import hashlib
+import json
+import os
+from typing import Any
+
+from ._cache_base import ChatCacheBase
+from .._logging import logger
+from ..types import JSONSerializableObject
+
+
+class FileChatCache(ChatCacheBase):
+    """The chat cache that stores each recorded response in a JSON file, so
+    that the responses can be replayed across processes and runs."""
+
+    def __init__(
+        self,
+        cache_dir: str = "./.cache/chat",
+        ttl: float | None = None,
+        max_file_number: int | None = None,
+        max_cache_size: int | None = None,
+    ) -> None:
+        """Initialize the file chat cache.
+
+        Args:
+            cache_dir (`str`, defaults to `"./.cache/chat"`):
+                The directory to store the recorded response files.
+            ttl (`float | None`, defaults to `None`):
+                The time-to-live of the cached responses in seconds. If
+                `None`, the cached responses never expire.
+            max_file_number (`int | None`, defaults to `None`):
+                The maximum number of files to keep in the cache directory. If
+                exceeded, the oldest files will be removed.
+            max_cache_size (`int | None`, defaults to `None`):
+                The maximum size of the cache directory in MB. If exceeded,
+                the oldest files will be removed until the size is within the
+                limit.
+        """
+        super().__init__(ttl)
+        self._cache_dir = os.path.abspath(cache_dir)
+        self.max_file_number = max_file_number
+        self.max_cache_size = max_cache_size
+
+    @property
+    def cache_dir(self) -> str:
+        """The cache directory where the recorded response files are
+        stored."""
+        if not os.path.exists(self._cache_dir):
+            os.makedirs(self._cache_dir, exist_ok=True)
+        return self._cache_dir
+
+    async def store(
+        self,
+        key: str,
+        record: JSONSerializableObject,
+        **kwargs: Any,
+    ) -> None:
+        """Store the recorded response with the given key.
+
+        Args:
+            key (`str`):
+                The key of the request, e.g. a hash of the request.
+            record (`JSONSerializableObject`):
+                The recorded response to store.
+        """
+        path_file = self._get_path(key)
+
+        # Write into a temporary file first to avoid partial files
+        path_tmp = f"{path_file}.{os.getpid()}.tmp"
+        with open(path_tmp, "w", encoding="utf-8") as f:
+            json.dump(record, f, ensure_ascii=False)
+        os.replace(path_tmp, path_file)
+
+        await self._maintain_cache_dir()
+
+    async def retrieve(self, key: str) -> JSONSerializableObject | None:
+        """Retrieve the recorded response with the given key. If not found
+        or expired, return `None`.
+
+        Args:
+            key (`str`):
+                The key of the request.
+        """
+        path_file = self._get_path(key)
+        if not os.path.isfile(path_file):
+            return None
+
+        if self._is_expired(os.path.getmtime(path_file)):
+            os.remove(path_file)
+            return None
+
+        try:
+            with open(path_file, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except json.JSONDecodeError:
+            logger.warning(
+                "Remove the corrupted cached chat response file %s.",
+                path_file,
+            )
+            os.remove(path_file)
+            return None
+
+    async def remove(self, key: str) -> None:
+        """Remove the recorded response with the given key.
+
+        Args:
+            key (`str`):
+                The key of the request.
+        """
+        path_file = self._get_path(key)
+        if os.path.exists(path_file):
+            os.remove(path_file)
+
+    async def clear(self) -> None:
+        """Clear the cache directory by removing all the response files."""
+        for filename in os.listdir(self.cache_dir):
+            if filename.endswith(".json"):
+                os.remove(os.path.join(self.cache_dir, filename))
+
+    def _get_path(self, key: str) -> str:
+        """Get the file path for the given key."""
+        filename = hashlib.sha256(key.encode("utf-8")).hexdigest() + ".json"
+        return os.path.join(self.cache_dir, filename)
+
+    async def _maintain_cache_dir(self) -> None:
+        """Maintain the cache directory by removing old files if the number of
+        files or the cache size exceeds the limit."""
+        if self.max_file_number is None and self.max_cache_size is None:
+            return
+
+        files = [
+            (_.name, _.stat().st_mtime, _.stat().st_size)
+            for _ in os.scandir(self.cache_dir)
+            if _.is_file() and _.name.endswith(".json")
+        ]
+        files.sort(key=lambda x: x[1])
+
+        removed_files = []
+        total_size = sum(_[2] for _ in files) / (1024.0 * 1024.0)
+        while files and (
+            (
+                self.max_file_number is not None
+                and len(files) > self.max_file_number
+            )
+            or (
+                self.max_cache_size is not None
+                and total_size > self.max_cache_size
+            )
+        ):
+            filename, _, size = files.pop(0)
+            os.remove(os.path.join(self.cache_dir, filename))
+            removed_files.append(filename)
+            total_size -= size / (1024.0 * 1024.0)
+
+        if removed_files:
+            logger.info(
+                "Remove %d cached chat response file(s) for the limited "
+                "number of files or cache size.",
+                len(removed_files),
+            )
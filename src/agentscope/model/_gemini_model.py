@@ -17,6 +17,7 @@ from pydantic import BaseModel
 from .._logging import logger
 from .._utils._common import _json_loads_with_repair
 from ..message import ToolUseBlock, TextBlock, ThinkingBlock
+from ._model_stream_stats import _StreamTimer
 from ._model_usage import ChatUsage
 from ._model_base import ChatModelBase
 from ._model_response import ChatResponse
@@ -218,8 +219,10 @@ class GeminiChatModel(ChatModelBase):
         text = ""
         thinking = ""
         metadata = None
+        timer = _StreamTimer(start_datetime)
         async for chunk in response:
             content_block: list = []
+            n_chars = len(text) + len(thinking)
 
             # Thinking parts
             if (
@@ -250,13 +253,15 @@ class GeminiChatModel(ChatModelBase):
                         ),
                     )
 
+            timer.tick(len(text) + len(thinking) > n_chars or bool(tool_calls))
+
             usage = None
             if chunk.usage_metadata:
                 usage = ChatUsage(
                     input_tokens=chunk.usage_metadata.prompt_token_count,
                     output_tokens=chunk.usage_metadata.total_token_count
                     - chunk.usage_metadata.prompt_token_count,
-                    time=(datetime.now() - start_datetime).total_seconds(),
+                    time=timer.elapsed(),
                 )
 
             if thinking:
@@ -285,6 +290,9 @@ class GeminiChatModel(ChatModelBase):
                 content=content_block,
                 usage=usage,
                 metadata=metadata,
+                stream_stats=timer.stats(
+                    usage.output_tokens if usage else None,
+                ),
             )
             yield parsed_chunk
 
@@ -0,0 +1,348 @@
+# -*- coding: utf-8 -*-
+"""The hedged chat model, which sends the requests to multiple chat model
+backends to cut the tail latency and fail over on errors."""
+import asyncio
+import bisect
+import math
+import time
+from collections import deque
+from typing import Any, AsyncGenerator
+
+from ._model_base import ChatModelBase
+from ._model_response import ChatResponse
+from .._logging import logger
+from ..formatter._hedged_formatter import MultiFormatPrompt
+
+_LATENCY_BUCKETS = [0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, math.inf]
+
+
+class _BackendStats:
+    """The latency and error statistics of a chat model backend."""
+
+    def __init__(self, window_size: int) -> None:
+        """Initialize the statistics.
+
+        Args:
+            window_size (`int`):
+                The number of recent requests used to compute the latency
+                quantiles and the error rate.
+        """
+        self.latencies: deque[float] = deque(maxlen=window_size)
+        self.outcomes: deque[bool] = deque(maxlen=window_size)
+        self.histogram = [0] * len(_LATENCY_BUCKETS)
+        self.n_requests = 0
+        self.n_errors = 0
+        self.n_cancelled = 0
+
+    def record_success(self, latency: float) -> None:
+        """Record a successful request with its latency."""
+        self.n_requests += 1
+        self.latencies.append(latency)
+        self.outcomes.append(True)
+        self.histogram[bisect.bisect_left(_LATENCY_BUCKETS, latency)] += 1
+
+    def record_cancelled(self, elapsed: float) -> None:
+        """Record a request cancelled after losing the race, whose elapsed
+        time is a lower bound of its latency. It's kept among the latency
+        samples, so that a slow backend doesn't look faster just because
+        its slow requests are always cancelled."""
+        self.n_cancelled += 1
+        self.latencies.append(elapsed)
+
+    def record_error(self) -> None:
+        """Record a failed request."""
+        self.n_requests += 1
+        self.n_errors += 1
+        self.outcomes.append(False)
+
+    @property
+    def error_rate(self) -> float:
+        """The error rate among the recent requests."""
+        if not self.outcomes:
+            return 0.0
+        return self.outcomes.count(False) / len(self.outcomes)
+
+    def quantile(self, q: float) -> float | None:
+        """The latency quantile among the recent successful requests and
+        the cancelled ones, whose elapsed times are included as the lower
+        bounds of their latencies, or `None` if there is no sample."""
+        if not self.latencies:
+            return None
+        latencies = sorted(self.latencies)
+        return latencies[min(int(q * len(latencies)), len(latencies) - 1)]
+
+    def to_dict(self) -> dict:
+        """Export the statistics into a dictionary."""
+        return {
+            "n_requests": self.n_requests,
+            "n_errors": self.n_errors,
+            "n_cancelled": self.n_cancelled,
+            "error_rate": self.error_rate,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+            "histogram": dict(
+                zip(
+                    [str(_) for _ in _LATENCY_BUCKETS],
+                    self.histogram,
+                ),
+            ),
+        }
+
+
+class HedgedChatModel(ChatModelBase):
+    """A composite chat model that wraps several chat model backends.
+
+    The request is first sent to the best backend ranked by the recent
+    latency and error statistics. If it doesn't finish within an adaptive
+    hedge delay (the latency quantile of that backend), a hedge request is
+    sent to the next backend, and the first finished response wins while the
+    others are cancelled. When a request fails, it fails over to the next
+    backend immediately. For streaming models, a request is considered
+    finished once its first chunk arrives.
+
+    If the backends require different prompt formats, use `HedgedFormatter`
+    with the matching formatters in the same order as the models.
+    """
+
+    def __init__(
+        self,
+        models: list[ChatModelBase],
+        hedge: bool = True,
+        hedge_quantile: float = 0.95,
+        default_hedge_delay: float = 2.0,
+        min_samples: int = 20,
+        window_size: int = 200,
+        error_rate_threshold: float = 0.5,
+    ) -> None:
+        """Initialize the hedged chat model.
+
+        Args:
+            models (`list[ChatModelBase]`):
+                The chat model backends, in the order of preference before
+                enough statistics are collected. They should share the same
+                streaming mode.
+            hedge (`bool`, defaults to `True`):
+                Whether to send the hedge requests. If `False`, the backends
+                are only used for failover.
+            hedge_quantile (`float`, defaults to `0.95`):
+                The latency quantile of the current backend used as the hedge
+                delay.
+            default_hedge_delay (`float`, defaults to `2.0`):
+                The hedge delay in seconds before the backend has enough
+                latency samples.
+            min_samples (`int`, defaults to `20`):
+                The minimum number of latency samples to use the adaptive
+                hedge delay.
+            window_size (`int`, defaults to `200`):
+                The number of recent requests per backend used to compute the
+                latency quantiles and the error rate.
+            error_rate_threshold (`float`, defaults to `0.5`):
+                The backends whose recent error rate reaches this threshold
+                are tried after the healthy ones.
+        """
+        if not models:
+            raise ValueError("At least one model is required.")
+
+        if len({_.stream for _ in models}) > 1:
+            raise ValueError(
+                "All the models in HedgedChatModel should share the same "
+                "streaming mode.",
+            )
+
+        super().__init__(models[0].model_name, models[0].stream)
+
+        self.models = models
+        self.hedge = hedge
+        self.hedge_quantile = hedge_quantile
+        self.default_hedge_delay = default_hedge_delay
+        self.min_samples = min_samples
+        self.error_rate_threshold = error_rate_threshold
+        self._stats = [_BackendStats(window_size) for _ in models]
+        # Keep the references of the background tasks until they finish
+        self._tasks: set[asyncio.Task] = set()
+
+    # pylint: disable=too-many-branches
+    async def __call__(
+        self,
+        messages: list[dict],
+        *args: Any,
+        **kwargs: Any,
+    ) -> ChatResponse | AsyncGenerator[ChatResponse, None]:
+        """Send the request to the backends with hedging and failover.
+
+        Args:
+            messages (`list[dict]`):
+                The formatted messages. If a `MultiFormatPrompt` is given,
+                each backend receives its own prompt variant.
+            *args (`Any`):
+                The positional arguments for the backends.
+            **kwargs (`Any`):
+                The keyword arguments for the backends.
+        """
+        order = self._rank_backends()
+        tasks: dict[asyncio.Task, int] = {}
+        pending: set[asyncio.Task] = set()
+        n_launched = 0
+        last_error: BaseException | None = None
+
+        def _launch() -> None:
+            nonlocal n_launched
+            index = order[n_launched]
+            n_launched += 1
+            task = self._create_task(
+                self._attempt(index, messages, *args, **kwargs),
+            )
+            tasks[task] = index
+            pending.add(task)
+
+        _launch()
+        winner = None
+        try:
+            while pending:
+                timeout = None
+                if self.hedge and n_launched == 1 and len(self.models) > 1:
+                    timeout = self._get_hedge_delay(order[0])
+
+                done, _ = await asyncio.wait(
+                    pending,
+                    timeout=timeout,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+
+                if not done:
+                    logger.debug(
+                        "Send a hedge request to backend %s.",
+                        self.models[order[n_launched]].model_name,
+                    )
+                    _launch()
+                    continue
+
+                for task in done:
+                    pending.discard(task)
+                    if task.exception() is None:
+                        winner = task
+                        break
+
+                    last_error = task.exception()
+                    logger.warning(
+                        "Backend %s failed: %s",
+                        self.models[tasks[task]].model_name,
+                        str(last_error),
+                    )
+                    if n_launched < len(order):
+                        _launch()
+
+                if winner is not None:
+                    break
+
+        finally:
+            for task in tasks:
+                if task is winner:
+                    continue
+                if not task.done():
+                    task.cancel()
+                elif task.exception() is None:
+                    # Also finished but lost the race
+                    self._discard(task.result())
+
+        if winner is None:
+            raise last_error
+
+        res = winner.result()
+        if isinstance(res, tuple):
+            return self._chain_stream(*res)
+        return res
+
+    def get_stats(self) -> list[dict]:
+        """Get the latency and error statistics of the backends, in the same
+        order as the models."""
+        return [
+            {"model_name": model.model_name, **stats.to_dict()}
+            for model, stats in zip(self.models, self._stats)
+        ]
+
+    def _rank_backends(self) -> list[int]:
+        """Rank the backends by their health and latency quantile. The
+        backends without latency samples keep their configured order after
+        the measured ones."""
+
+        def _key(index: int) -> tuple:
+            stats = self._stats[index]
+            p = stats.quantile(self.hedge_quantile)
+            return (
+                stats.error_rate >= self.error_rate_threshold,
+                math.inf if p is None else p,
+                index,
+            )
+
+        return sorted(range(len(self.models)), key=_key)
+
+    def _get_hedge_delay(self, index: int) -> float:
+        """Get the adaptive hedge delay of the given backend."""
+        stats = self._stats[index]
+        if len(stats.latencies) < self.min_samples:
+            return self.default_hedge_delay
+        return stats.quantile(self.hedge_quantile)
+
+    async def _attempt(
+        self,
+        index: int,
+        messages: list[dict],
+        *args: Any,
+        **kwargs: Any,
+    ) -> ChatResponse | tuple[ChatResponse | None, AsyncGenerator]:
+        """Send the request to one backend. For streaming responses, wait
+        for the first chunk and return it together with the generator."""
+        if isinstance(messages, MultiFormatPrompt):
+            messages = messages.variants[index]
+
+        stats = self._stats[index]
+        start = time.perf_counter()
+        try:
+            res = await self.models[index](messages, *args, **kwargs)
+            if isinstance(res, AsyncGenerator):
+                try:
+                    first = await anext(res)
+                except StopAsyncIteration:
+                    first = None
+                except BaseException:
+                    await res.aclose()
+                    raise
+                res = (first, res)
+        except asyncio.CancelledError:
+            stats.record_cancelled(time.perf_counter() - start)
+            raise
+        except Exception:
+            stats.record_error()
+            raise
+
+        stats.record_success(time.perf_counter() - start)
+        return res
+
+    async def _chain_stream(
+        self,
+        first: ChatResponse | None,
+        res: AsyncGenerator[ChatResponse, None],
+    ) -> AsyncGenerator[ChatResponse, None]:
+        """Yield the first chunk and then the remaining chunks."""
+        try:
+            if first is not None:
+                yield first
+            async for chunk in res:
+                yield chunk
+        finally:
+            await res.aclose()
+
+    def _discard(self, res: Any) -> None:
+        """Close the streaming response that lost the race."""
+        if isinstance(res, tuple):
+            self._create_task(res[1].aclose())
+
+    def _create_task(self, coro: Any) -> asyncio.Task:
+        """Create a task and keep its reference until it finishes, so that
+        it's not garbage collected while running."""
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+"""An in-memory chat cache implementation with LRU eviction."""
+import time
+from collections import OrderedDict
+from typing import Any
+
+from ._cache_base import ChatCacheBase
+from ..types import JSONSerializableObject
+
+
+class InMemoryChatCache(ChatCacheBase):
+    """The chat cache that keeps the recorded responses in memory, and evicts
+    the least recently used ones when the maximum number is exceeded."""
+
+    def __init__(
+        self,
+        ttl: float | None = None,
+        max_entries: int | None = 1024,
+    ) -> None:
+        """Initialize the in-memory chat cache.
+
+        Args:
+            ttl (`float | None`, defaults to `None`):
+                The time-to-live of the cached responses in seconds. If
+                `None`, the cached responses never expire.
+            max_entries (`int | None`, defaults to `1024`):
+                The maximum number of cached responses. If exceeded, the least
+                recently used ones will be removed.
+        """
+        super().__init__(ttl)
+        self.max_entries = max_entries
+        self._records: OrderedDict[
+            str,
+            tuple[float, JSONSerializableObject],
+        ] = OrderedDict()
+
+    async def store(
+        self,
+        key: str,
+        record: JSONSerializableObject,
+        **kwargs: Any,
+    ) -> None:
+        """Store the recorded response with the given key.
+
+        Args:
+            key (`str`):
+                The key of the request, e.g. a hash of the request.
+            record (`JSONSerializableObject`):
+                The recorded response to store.
+        """
+        self._records[key] = (time.time(), record)
+        self._records.move_to_end(key)
+
+        if self.max_entries is not None:
+            while len(self._records) > self.max_entries:
+                self._records.popitem(last=False)
+
+    async def retrieve(self, key: str) -> JSONSerializableObject | None:
+        """Retrieve the recorded response with the given key. If not found
+        or expired, return `None`.
+
+        Args:
+            key (`str`):
+                The key of the request.
+        """
+        if key not in self._records:
+            return None
+
+        created_at, record = self._records[key]
+        if self._is_expired(created_at):
+            self._records.pop(key)
+            return None
+
+        self._records.move_to_end(key)
+        return record
+
+    async def remove(self, key: str) -> None:
+        """Remove the recorded response with the given key.
+
+        Args:
+            key (`str`):
+                The key of the request.
+        """
+        self._records.pop(key, None)
+
+    async def clear(self) -> None:
+        """Clear all cached responses."""
+        self._records.clear()
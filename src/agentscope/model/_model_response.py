@@ -6,6 +6,7 @@ from typing import Literal, Sequence
 
 from anthropic.types import ThinkingBlock
 
+from ._model_stream_stats import StreamStats
 from ._model_usage import ChatUsage
 from .._utils._common import _get_timestamp
 from .._utils._mixin import DictMixin
@@ -33,6 +34,10 @@ class ChatResponse(DictMixin):
     usage: ChatUsage | None = field(default_factory=lambda: None)
     """The usage information of the chat response, if available."""
 
+    stream_stats: StreamStats | None = field(default_factory=lambda: None)
+    """The time-to-first-token, decoding speed and inter-chunk gaps of a
+    streaming response, or `None` for the non-streaming ones."""
+
     metadata: JSONSerializableObject | None = field(
         default_factory=lambda: None,
     )
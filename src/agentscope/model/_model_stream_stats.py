@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+"""The latency statistics of the streaming chat model responses."""
+import bisect
+import math
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from .._utils._mixin import DictMixin
+
+_CHUNK_GAP_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+"""The upper bounds of the inter-chunk gap buckets in seconds."""
+
+
+@dataclass
+class StreamStats(DictMixin):
+    """The latency statistics of a streaming chat model response, which tell
+    whether a slow answer comes from the first-token delay or the decoding
+    speed."""
+
+    time_to_first_token: float | None
+    """The time in seconds from sending the request to receiving the first
+    chunk with content, or `None` if no content is received yet."""
+
+    tokens_per_second: float | None
+    """The output tokens per second after the first token, or `None` if the
+    output tokens are not reported by the API yet."""
+
+    n_chunks: int
+    """The number of the chunks received so far."""
+
+    max_chunk_gap: float
+    """The maximum gap in seconds between two consecutive chunks."""
+
+    chunk_gap_histogram: dict[str, int] = field(default_factory=dict)
+    """The numbers of the gaps between consecutive chunks, keyed by the upper
+    bound of the bucket in seconds (`"+Inf"` for the last one), e.g.
+    `{"0.01": 12, "0.025": 3, ..., "+Inf": 0}`."""
+
+
+class _StreamTimer:
+    """Track the arrival times of the chunks in a streaming response."""
+
+    def __init__(self, start_datetime: datetime) -> None:
+        """Initialize the timer.
+
+        Args:
+            start_datetime (`datetime`):
+                The datetime when the request is sent.
+        """
+        self.start_datetime = start_datetime
+        self._first_token_time: float | None = None
+        self._last_chunk_time: float | None = None
+        self._n_chunks = 0
+        self._max_gap = 0.0
+        self._gap_counts = [0] * (len(_CHUNK_GAP_BUCKETS) + 1)
+
+    def elapsed(self) -> float:
+        """The elapsed time in seconds since the request is sent."""
+        return (datetime.now() - self.start_datetime).total_seconds()
+
+    def tick(self, has_content: bool = True) -> None:
+        """Record the arrival of a chunk.
+
+        Args:
+            has_content (`bool`, defaults to `True`):
+                If the chunk carries content, e.g. text, thinking or tool
+                call deltas, rather than only the usage or the stop reason.
+        """
+        now = self.elapsed()
+        if self._last_chunk_time is not None:
+            gap = now - self._last_chunk_time
+            self._gap_counts[bisect.bisect_left(_CHUNK_GAP_BUCKETS, gap)] += 1
+            self._max_gap = max(self._max_gap, gap)
+        self._last_chunk_time = now
+        self._n_chunks += 1
+
+        if has_content and self._first_token_time is None:
+            self._first_token_time = now
+
+    def stats(self, output_tokens: int | None = None) -> StreamStats:
+        """Take a snapshot of the statistics.
+
+        Args:
+            output_tokens (`int | None`, optional):
+                The number of the output tokens reported by the API, which is
+                used to compute the decoding speed.
+        """
+        tokens_per_second = None
+        if output_tokens and self._first_token_time is not None:
+            decode_time = self._last_chunk_time - self._first_token_time
+            if decode_time > 0:
+                tokens_per_second = output_tokens / decode_time
+
+        histogram = {}
+        for bound, count in zip(
+            [*_CHUNK_GAP_BUCKETS, math.inf],
+            self._gap_counts,
+        ):
+            histogram["+Inf" if math.isinf(bound) else str(bound)] = count
+
+        return StreamStats(
+            time_to_first_token=self._first_token_time,
+            tokens_per_second=tokens_per_second,
+            n_chunks=self._n_chunks,
+            max_chunk_gap=self._max_gap,
+            chunk_gap_histogram=histogram,
+        )
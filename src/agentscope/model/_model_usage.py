@@ -19,5 +19,9 @@ class ChatUsage(DictMixin):
     time: float
     """The time used in seconds."""
 
+    queue_time: float = field(default_factory=lambda: 0.0)
+    """The time in seconds spent waiting for admission before the request
+    was sent, e.g. by a rate limiter."""
+
     type: Literal["chat"] = field(default_factory=lambda: "chat")
     """The type of the usage, must be `chat`."""
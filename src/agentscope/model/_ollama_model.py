@@ -16,6 +16,7 @@ from pydantic import BaseModel
 
 from . import ChatResponse
 from ._model_base import ChatModelBase
+from ._model_stream_stats import _StreamTimer
 from ._model_usage import ChatUsage
 from .._logging import logger
 from .._utils._common import _json_loads_with_repair
@@ -196,10 +197,12 @@ class OllamaChatModel(ChatModelBase):
         acc_thinking_content = ""
         tool_calls = OrderedDict()  # Store tool calls
         metadata = None
+        timer = _StreamTimer(start_datetime)
 
         async for chunk in response:
             # Handle text content
             msg = chunk.message
+            timer.tick(bool(msg.thinking or msg.content or msg.tool_calls))
             acc_thinking_content += msg.thinking or ""
             accumulated_text += msg.content or ""
 
@@ -214,11 +217,10 @@ class OllamaChatModel(ChatModelBase):
                     "input": function.arguments,
                 }
             # Calculate usage statistics
-            current_time = (datetime.now() - start_datetime).total_seconds()
             usage = ChatUsage(
                 input_tokens=getattr(chunk, "prompt_eval_count", 0) or 0,
                 output_tokens=getattr(chunk, "eval_count", 0) or 0,
-                time=current_time,
+                time=timer.elapsed(),
             )
             # Create content blocks
             contents: list = []
@@ -259,6 +261,7 @@ class OllamaChatModel(ChatModelBase):
                     content=contents,
                     usage=usage,
                     metadata=metadata,
+                    stream_stats=timer.stats(usage.output_tokens),
                 )
                 yield res
 
@@ -16,6 +16,7 @@ from pydantic import BaseModel
 
 from . import ChatResponse
 from ._model_base import ChatModelBase
+from ._model_stream_stats import _StreamTimer
 from ._model_usage import ChatUsage
 from .._logging import logger
 from .._utils._common import _json_loads_with_repair
@@ -243,6 +244,7 @@ class OpenAIChatModel(ChatModelBase):
         thinking = ""
         tool_calls = OrderedDict()
         metadata = None
+        timer = _StreamTimer(start_datetime)
 
         async with response as stream:
             async for item in stream:
@@ -253,11 +255,13 @@ class OpenAIChatModel(ChatModelBase):
                 else:
                     chunk = item
 
+                timer.tick(bool(chunk.choices))
+
                 if chunk.usage:
                     usage = ChatUsage(
                         input_tokens=chunk.usage.prompt_tokens,
                         output_tokens=chunk.usage.completion_tokens,
-                        time=(datetime.now() - start_datetime).total_seconds(),
+                        time=timer.elapsed(),
                     )
 
                 if chunk.choices:
@@ -323,9 +327,23 @@ class OpenAIChatModel(ChatModelBase):
                             content=contents,
                             usage=usage,
                             metadata=metadata,
+                            stream_stats=timer.stats(
+                                usage.output_tokens if usage else None,
+                            ),
                         )
                         yield res
 
+        # The usage comes in the last chunk without choices, so yield the
+        # final response again with the usage and the complete statistics
+        if res is not None and usage is not None and res.usage is not usage:
+            res = ChatResponse(
+                content=res.content,
+                usage=usage,
+                metadata=metadata,
+                stream_stats=timer.stats(usage.output_tokens),
+            )
+            yield res
+
     def _parse_openai_completion_response(
         self,
         start_datetime: datetime,
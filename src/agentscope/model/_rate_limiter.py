@@ -0,0 +1,416 @@
+# -*- coding: utf-8 -*-
+"""The rate limiter for chat models, which throttles the requests by
+requests per minute, tokens per minute and the number of in-flight
+requests."""
+import asyncio
+import heapq
+import itertools
+import time
+import weakref
+from dataclasses import dataclass, field
+from typing import Any, AsyncGenerator
+
+from ._model_base import ChatModelBase
+from ._model_response import ChatResponse
+from .._logging import logger
+from ..token import TokenCounterBase
+
+
+class _TokenBucket:
+    """A token bucket that refills continuously at a fixed rate per
+    minute."""
+
+    def __init__(self, per_minute: int) -> None:
+        """Initialize the token bucket.
+
+        Args:
+            per_minute (`int`):
+                The capacity of the bucket, which is also the number of
+                tokens refilled per minute.
+        """
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.level = float(per_minute)
+        self.updated_at = time.monotonic()
+
+    def refill(self) -> None:
+        """Refill the bucket according to the elapsed time."""
+        now = time.monotonic()
+        self.level = min(
+            self.capacity,
+            self.level + (now - self.updated_at) * self.rate,
+        )
+        self.updated_at = now
+
+    def delay(self, amount: float) -> float:
+        """The seconds to wait until the given amount is available. The
+        amount is clamped to the capacity so that large requests can still
+        pass."""
+        amount = min(amount, self.capacity)
+        if self.level >= amount:
+            return 0.0
+        return (amount - self.level) / self.rate
+
+
+@dataclass(order=True)
+class _Waiter:
+    """A queued request waiting for admission."""
+
+    priority: int
+    seq: int
+    tokens: int = field(compare=False)
+    future: asyncio.Future = field(compare=False)
+
+
+class _StreamSlot:
+    """The in-flight slot held by a streaming response, which is released
+    exactly once."""
+
+    def __init__(
+        self,
+        rate_limiter: "ChatRateLimiter",
+        estimated_tokens: int,
+    ) -> None:
+        """Initialize the slot with the charged tokens."""
+        self.rate_limiter = rate_limiter
+        self.estimated_tokens = estimated_tokens
+        self.actual_tokens: int | None = None
+        self.released = False
+
+    def release(self) -> None:
+        """Release the slot if it's not released yet."""
+        if not self.released:
+            self.released = True
+            self.rate_limiter.release(
+                self.estimated_tokens,
+                self.actual_tokens,
+            )
+
+
+class ChatRateLimiter:
+    """A rate limiter that can be shared by multiple chat models in the
+    process, so that the overall throughput stays under the provider quota.
+
+    The queued requests are admitted in the order of their priority (smaller
+    value first), and in the FIFO order within the same priority.
+
+    .. code-block:: python
+        :caption: Example usage
+
+        limiter = ChatRateLimiter(
+            requests_per_minute=500,
+            tokens_per_minute=200_000,
+            max_concurrency=32,
+        )
+        model = RateLimitedChatModel(
+            OpenAIChatModel("gpt-4o", api_key="xxx"),
+            rate_limiter=limiter,
+            token_counter=OpenAITokenCounter("gpt-4o"),
+        )
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: int | None = None,
+        tokens_per_minute: int | None = None,
+        max_concurrency: int | None = None,
+    ) -> None:
+        """Initialize the rate limiter.
+
+        Args:
+            requests_per_minute (`int | None`, optional):
+                The maximum number of requests per minute. If `None`, the
+                requests are not limited.
+            tokens_per_minute (`int | None`, optional):
+                The maximum number of tokens (both input and output) per
+                minute. If `None`, the tokens are not limited.
+            max_concurrency (`int | None`, optional):
+                The maximum number of in-flight requests. If `None`, the
+                concurrency is not limited.
+        """
+        for name, value in [
+            ("requests_per_minute", requests_per_minute),
+            ("tokens_per_minute", tokens_per_minute),
+            ("max_concurrency", max_concurrency),
+        ]:
+            if value is not None and value <= 0:
+                raise ValueError(
+                    f"`{name}` must be a positive integer, got {value}.",
+                )
+
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.max_concurrency = max_concurrency
+
+        self._request_bucket = (
+            _TokenBucket(requests_per_minute) if requests_per_minute else None
+        )
+        self._token_bucket = (
+            _TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        )
+        self._in_flight = 0
+        self._waiters: list[_Waiter] = []
+        self._counter = itertools.count()
+        self._timer: asyncio.TimerHandle | None = None
+
+    @property
+    def in_flight(self) -> int:
+        """The number of in-flight requests."""
+        return self._in_flight
+
+    @property
+    def queue_size(self) -> int:
+        """The number of requests waiting for admission."""
+        return len(self._waiters)
+
+    async def acquire(self, tokens: int = 0, priority: int = 0) -> float:
+        """Wait until the request is admitted.
+
+        Args:
+            tokens (`int`, defaults to `0`):
+                The estimated number of tokens of the request.
+            priority (`int`, defaults to `0`):
+                The priority of the request, smaller value means higher
+                priority.
+
+        Returns:
+            `float`:
+                The waiting time in seconds.
+        """
+        start = time.monotonic()
+        waiter = _Waiter(
+            priority=priority,
+            seq=next(self._counter),
+            tokens=max(tokens, 0),
+            future=asyncio.get_running_loop().create_future(),
+        )
+        heapq.heappush(self._waiters, waiter)
+        self._dispatch()
+
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # Admitted but cancelled before running, give back the slot
+                self.release()
+            elif waiter in self._waiters:
+                self._waiters.remove(waiter)
+                heapq.heapify(self._waiters)
+                self._dispatch()
+            raise
+
+        return time.monotonic() - start
+
+    def release(
+        self,
+        estimated_tokens: int = 0,
+        actual_tokens: int | None = None,
+    ) -> None:
+        """Release the in-flight slot of an admitted request, and correct
+        the token bucket with the actual token usage.
+
+        Args:
+            estimated_tokens (`int`, defaults to `0`):
+                The estimated tokens that were charged in `acquire`.
+            actual_tokens (`int | None`, optional):
+                The actual tokens used by the request. If provided, the
+                difference to the estimation is charged to (or refunded from)
+                the token bucket.
+        """
+        self._in_flight = max(self._in_flight - 1, 0)
+
+        if self._token_bucket is not None and actual_tokens is not None:
+            self._token_bucket.refill()
+            self._token_bucket.level = min(
+                self._token_bucket.capacity,
+                self._token_bucket.level - (actual_tokens - estimated_tokens),
+            )
+
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        """Admit the queued requests as long as the limits allow, otherwise
+        schedule a retry when the buckets are refilled."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        while self._waiters:
+            waiter = self._waiters[0]
+            if waiter.future.done():
+                heapq.heappop(self._waiters)
+                continue
+
+            if (
+                self.max_concurrency is not None
+                and self._in_flight >= self.max_concurrency
+            ):
+                # Wait for a request to be released
+                return
+
+            delay = 0.0
+            for bucket in [self._request_bucket, self._token_bucket]:
+                if bucket is not None:
+                    bucket.refill()
+            if self._request_bucket is not None:
+                delay = max(delay, self._request_bucket.delay(1))
+            if self._token_bucket is not None:
+                delay = max(delay, self._token_bucket.delay(waiter.tokens))
+
+            if delay > 0:
+                self._timer = asyncio.get_running_loop().call_later(
+                    delay,
+                    self._dispatch,
+                )
+                return
+
+            heapq.heappop(self._waiters)
+            if self._request_bucket is not None:
+                self._request_bucket.level -= 1
+            if self._token_bucket is not None:
+                self._token_bucket.level -= min(
+                    waiter.tokens,
+                    self._token_bucket.capacity,
+                )
+            self._in_flight += 1
+            waiter.future.set_result(None)
+
+
+class RateLimitedChatModel(ChatModelBase):
+    """A chat model wrapper that throttles the requests of the wrapped model
+    by a (shared) `ChatRateLimiter`. The waiting time is recorded in the
+    `queue_time` field of the `ChatUsage`."""
+
+    def __init__(
+        self,
+        model: ChatModelBase,
+        rate_limiter: ChatRateLimiter,
+        token_counter: TokenCounterBase | None = None,
+        priority: int = 0,
+    ) -> None:
+        """Initialize the rate limited chat model.
+
+        Args:
+            model (`ChatModelBase`):
+                The chat model to be wrapped.
+            rate_limiter (`ChatRateLimiter`):
+                The rate limiter, which can be shared by multiple models.
+            token_counter (`TokenCounterBase | None`, optional):
+                The token counter used to estimate the input tokens of a
+                request before sending it. If not provided, the tokens are
+                only charged after the request finishes, according to the
+                usage returned by the API.
+            priority (`int`, defaults to `0`):
+                The default priority of the requests, smaller value means
+                higher priority. It can be overridden by passing `priority`
+                when calling the model.
+        """
+        super().__init__(model.model_name, model.stream)
+
+        self.model = model
+        self.rate_limiter = rate_limiter
+        self.token_counter = token_counter
+        self.priority = priority
+
+    async def __call__(
+        self,
+        *args: Any,
+        priority: int | None = None,
+        **kwargs: Any,
+    ) -> ChatResponse | AsyncGenerator[ChatResponse, None]:
+        """Call the wrapped chat model once the request is admitted by the
+        rate limiter.
+
+        Args:
+            *args (`Any`):
+                The positional arguments for the wrapped model.
+            priority (`int | None`, optional):
+                The priority of this request. If not provided, the default
+                priority of this wrapper is used.
+            **kwargs (`Any`):
+                The keyword arguments for the wrapped model.
+        """
+        estimated_tokens = await self._estimate_tokens(*args, **kwargs)
+
+        queue_time = await self.rate_limiter.acquire(
+            estimated_tokens,
+            self.priority if priority is None else priority,
+        )
+
+        try:
+            res = await self.model(*args, **kwargs)
+        except BaseException:
+            self.rate_limiter.release(estimated_tokens)
+            raise
+
+        if isinstance(res, AsyncGenerator):
+            slot = _StreamSlot(self.rate_limiter, estimated_tokens)
+            stream = self._wrap_stream(res, slot, queue_time)
+            # The `finally` clause of a generator never runs if it's dropped
+            # before the first iteration, so release the slot when it's
+            # garbage collected
+            weakref.finalize(stream, slot.release)
+            return stream
+
+        self._record_usage(res, queue_time)
+        self.rate_limiter.release(
+            estimated_tokens,
+            self._get_actual_tokens(res),
+        )
+        return res
+
+    async def _wrap_stream(
+        self,
+        res: AsyncGenerator[ChatResponse, None],
+        slot: _StreamSlot,
+        queue_time: float,
+    ) -> AsyncGenerator[ChatResponse, None]:
+        """Hold the in-flight slot until the streaming response finishes.
+
+        .. note:: The slot of a stream that is stopped early is released
+         when the stream is closed, so the consumers should call `aclose()`
+         on the streams they don't exhaust, rather than relying on the
+         garbage collection.
+        """
+        try:
+            async for chunk in res:
+                self._record_usage(chunk, queue_time)
+                slot.actual_tokens = self._get_actual_tokens(
+                    chunk,
+                    slot.actual_tokens,
+                )
+                yield chunk
+        finally:
+            slot.release()
+
+    async def _estimate_tokens(self, *args: Any, **kwargs: Any) -> int:
+        """Estimate the input tokens of the request by the token counter."""
+        if self.token_counter is None:
+            return 0
+
+        messages = kwargs.get("messages", args[0] if args else [])
+        tools = kwargs.get("tools", args[1] if len(args) > 1 else None)
+        try:
+            return await self.token_counter.count(messages, tools=tools)
+        except Exception as e:
+            logger.warning(
+                "Failed to estimate the tokens for rate limiting: %s",
+                str(e),
+            )
+            return 0
+
+    @staticmethod
+    def _record_usage(res: ChatResponse, queue_time: float) -> None:
+        """Record the queueing time in the usage of the response."""
+        if res.usage is not None:
+            res.usage.queue_time = queue_time
+
+    @staticmethod
+    def _get_actual_tokens(
+        res: ChatResponse,
+        default: int | None = None,
+    ) -> int | None:
+        """Get the total tokens from the usage of the response."""
+        if res.usage is None:
+            return default
+        return res.usage.input_tokens + res.usage.output_tokens
@@ -15,14 +15,25 @@ class SequentialPipeline:
     def __init__(
         self,
         agents: list[AgentBase],
+        streaming: bool = False,
+        max_queue_size: int = 16,
     ) -> None:
         """Initialize a sequential pipeline class
 
         Args:
             agents (`list[AgentBase]`):
                 A list of agents.
+            streaming (`bool`, defaults to `False`):
+                Whether to stream the printed messages of each agent to the
+                `observe_stream` method of the next agent, so that the next
+                agent can prepare before the previous one finishes.
+            max_queue_size (`int`, defaults to `16`):
+                The maximum number of the chunks buffered between two agents
+                in the streaming mode.
         """
         self.agents = agents
+        self.streaming = streaming
+        self.max_queue_size = max_queue_size
 
     async def __call__(
         self,
@@ -37,6 +48,8 @@ class SequentialPipeline:
         return await sequential_pipeline(
             agents=self.agents,
             msg=msg,
+            streaming=self.streaming,
+            max_queue_size=self.max_queue_size,
         )
 
 
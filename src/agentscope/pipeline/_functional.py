@@ -1,21 +1,83 @@
 # -*- coding: utf-8 -*-
 """Functional counterpart for Pipeline"""
 import asyncio
-from copy import deepcopy
 from typing import Any
 from ..agent import AgentBase
 from ..message import Msg
 
 
+def _fork(msg: Msg | list[Msg] | None) -> Msg | list[Msg] | None:
+    """Get modifiable copies of the frozen message(s) in O(1) time."""
+    if isinstance(msg, Msg):
+        return msg.fork()
+    if isinstance(msg, list):
+        return [_.fork() for _ in msg]
+    return msg
+
+
+async def _forward_stream(queue: asyncio.Queue, agent: AgentBase) -> None:
+    """Forward the streamed chunks in the queue to the agent until `None`
+    is received. The queue is drained even if the agent fails, so that the
+    upstream agent is never blocked by a full queue."""
+    error = None
+    while (item := await queue.get()) is not None:
+        if error is None:
+            try:
+                await agent.observe_stream(*item)
+            except Exception as e:
+                error = e
+    if error is not None:
+        raise error
+
+
+async def _reply_streaming(
+    agent: AgentBase,
+    next_agent: AgentBase,
+    msg: Msg | list[Msg] | None,
+    max_queue_size: int,
+) -> Msg | list[Msg] | None:
+    """Call the agent, while streaming its printed messages to the next
+    agent through a bounded queue."""
+    queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue_size)
+    forward_task = asyncio.create_task(_forward_stream(queue, next_agent))
+    agent.set_msg_queue(queue)
+    try:
+        msg = await agent(msg)
+    except BaseException:
+        forward_task.cancel()
+        try:
+            await forward_task
+        except (asyncio.CancelledError, Exception):
+            # The error of the agent is more relevant
+            pass
+        raise
+    finally:
+        agent.set_msg_queue(None)
+
+    await queue.put(None)
+    await forward_task
+    return msg
+
+
 async def sequential_pipeline(
     agents: list[AgentBase],
     msg: Msg | list[Msg] | None = None,
+    streaming: bool = False,
+    max_queue_size: int = 16,
 ) -> Msg | list[Msg] | None:
     """An async syntactic sugar pipeline that executes a sequence of agents
     sequentially. The output of the previous agent will be passed as the
     input to the next agent. The final output will be the output of the
     last agent.
 
+    In the streaming mode, the messages printed by each agent while
+    replying, e.g. the streamed chunks of the reasoning, are passed to the
+    `observe_stream` method of the next agent as soon as they are
+    generated, so that the next agent can prepare for replying before the
+    previous agent finishes. The chunks are passed through a bounded queue,
+    and a slow consumer makes the previous agent wait rather than buffering
+    the chunks without limit.
+
     Example:
         .. code-block:: python
 
@@ -35,12 +97,32 @@ async def sequential_pipeline(
             A list of agents.
         msg (`Msg | list[Msg] | None`, defaults to `None`):
             The initial input that will be passed to the first agent.
+        streaming (`bool`, defaults to `False`):
+            Whether to stream the printed messages of each agent to the
+            `observe_stream` method of the next agent.
+        max_queue_size (`int`, defaults to `16`):
+            The maximum number of the chunks buffered between two agents in
+            the streaming mode.
+
     Returns:
         `Msg | list[Msg] | None`:
             The output of the last agent in the sequence.
     """
-    for agent in agents:
-        msg = await agent(msg)
+    if max_queue_size < 1:
+        raise ValueError(
+            f"max_queue_size must be positive, got {max_queue_size}.",
+        )
+
+    for i, agent in enumerate(agents):
+        if streaming and i + 1 < len(agents):
+            msg = await _reply_streaming(
+                agent,
+                agents[i + 1],
+                msg,
+                max_queue_size,
+            )
+        else:
+            msg = await agent(msg)
     return msg
 
 
@@ -51,10 +133,12 @@ async def fanout_pipeline(
     **kwargs: Any,
 ) -> list[Msg]:
     """A fanout pipeline that distributes the same input to multiple agents.
-    This pipeline sends the same message (or a deep copy of it) to all agents
-    and collects their responses. Agents can be executed either concurrently
-    using asyncio.gather() or sequentially depending on the enable_gather
-    parameter.
+    This pipeline freezes the input message(s) once, and sends a
+    copy-on-write fork of it to each agent, so that the agents can't affect
+    each other while the content isn't copied for each agent. The agents'
+    responses are collected and returned. Agents can be executed either
+    concurrently using asyncio.gather() or sequentially depending on the
+    enable_gather parameter.
 
     Example:
         .. code-block:: python
@@ -93,12 +177,18 @@ async def fanout_pipeline(
         `list[Msg]`:
             A list of response messages from each agent.
     """
+    # Freeze the input once, rather than deep copying it for each agent
+    if isinstance(msg, Msg):
+        msg = msg.freeze()
+    elif isinstance(msg, list):
+        msg = [_.freeze() for _ in msg]
+
     if enable_gather:
         tasks = [
-            asyncio.create_task(agent(deepcopy(msg), **kwargs))
+            asyncio.create_task(agent(_fork(msg), **kwargs))
             for agent in agents
         ]
 
         return await asyncio.gather(*tasks)
     else:
-        return [await agent(deepcopy(msg), **kwargs) for agent in agents]
+        return [await agent(_fork(msg), **kwargs) for agent in agents]
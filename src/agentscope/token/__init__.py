@@ -2,6 +2,7 @@
 """The token module in agentscope"""
 
 from ._token_base import TokenCounterBase
+from ._local_estimator import LocalTokenEstimator
 from ._gemini_token_counter import GeminiTokenCounter
 from ._openai_token_counter import OpenAITokenCounter
 from ._anthropic_token_counter import AnthropicTokenCounter
@@ -9,6 +10,7 @@ from ._huggingface_token_counter import HuggingFaceTokenCounter
 
 __all__ = [
     "TokenCounterBase",
+    "LocalTokenEstimator",
     "GeminiTokenCounter",
     "OpenAITokenCounter",
     "AnthropicTokenCounter",
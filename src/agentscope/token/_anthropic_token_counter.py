@@ -1,24 +1,64 @@
 # -*- coding: utf-8 -*-
 """The Anthropic token counter class."""
-from typing import Any
+from typing import Any, Literal
 
+from ._local_estimator import LocalTokenEstimator
+from ._token_base import TokenCounterBase
 
-class AnthropicTokenCounter:
-    """The Anthropic token counter class."""
 
-    def __init__(self, model_name: str, api_key: str, **kwargs: Any) -> None:
+class AnthropicTokenCounter(TokenCounterBase):
+    """The Anthropic token counter class.
+
+    The token counter supports three modes:
+
+    - `"remote"`: count the tokens by the Anthropic token counting API.
+    - `"local"`: estimate the tokens offline by the local estimator.
+    - `"hybrid"`: estimate the tokens locally in `count`, and count the
+      final prompt remotely in `confirm`, which also calibrates the local
+      estimator. It's used by the truncated formatters, so that the
+      truncation loop doesn't need a network round-trip per round.
+    """
+
+    def __init__(
+        self,
+        model_name: str,
+        api_key: str | None = None,
+        mode: Literal["remote", "local", "hybrid"] = "remote",
+        estimator: LocalTokenEstimator | None = None,
+        **kwargs: Any,
+    ) -> None:
         """Initialize the Anthropic token counter.
 
         Args:
             model_name (`str`):
                 The name of the Anthropic model to use, e.g. "claude-2".
-            api_key (`str`):
-                The API key for Anthropic.
+            api_key (`str | None`, optional):
+                The API key for Anthropic, which is not required in the
+                `"local"` mode.
+            mode (`Literal["remote", "local", "hybrid"]`, defaults to \
+            `"remote"`):
+                The counting mode.
+            estimator (`LocalTokenEstimator | None`, optional):
+                The local token estimator used in the `"local"` and
+                `"hybrid"` modes. Defaults to a chars-per-token model
+                calibrated for the Claude models.
         """
-        import anthropic
+        assert mode in ["remote", "local", "hybrid"]
 
-        self.client = anthropic.AsyncAnthropic(api_key=api_key, **kwargs)
         self.model_name = model_name
+        self.mode = mode
+        self.estimator = estimator or LocalTokenEstimator(
+            ascii_chars_per_token=3.5,
+            non_ascii_chars_per_token=1.0,
+            tokens_per_message=3,
+            tokens_per_media=1600,
+        )
+
+        self.client = None
+        if mode != "local":
+            import anthropic
+
+            self.client = anthropic.AsyncAnthropic(api_key=api_key, **kwargs)
 
     async def count(
         self,
@@ -40,9 +80,73 @@ class AnthropicTokenCounter:
             **kwargs (`Any`):
                 Additional keyword arguments for the token counting API.
         """
+        if self.mode != "remote":
+            return self.estimator.count(messages, tools)
+
+        return await self._count_remote(messages, tools, **kwargs)
+
+    async def confirm(
+        self,
+        messages: list[dict],
+        tools: list[dict] | None = None,
+        **kwargs: Any,
+    ) -> int | None:
+        """Count the final prompt remotely in the `"hybrid"` mode, and
+        calibrate the local estimator with the result.
+
+        Args:
+            messages (`list[dict]`):
+                A list of dictionaries, where `role` and `content` fields are
+                required.
+            tools (`list[dict] | None`, defaults to `None`):
+                The tools JSON schemas that the model can use.
+            **kwargs (`Any`):
+                Additional keyword arguments for the token counting API.
+        """
+        if self.mode != "hybrid":
+            return None
+
+        n_tokens = await self._count_remote(messages, tools, **kwargs)
+        self.estimator.calibrate(
+            self.estimator.count(messages, tools),
+            n_tokens,
+        )
+        return n_tokens
+
+    async def count_many(
+        self,
+        texts: list[str],
+        **kwargs: Any,
+    ) -> list[int]:
+        """Estimate the token numbers of a batch of plain texts locally. Only
+        supported in the `"local"` and `"hybrid"` modes.
+
+        Args:
+            texts (`list[str]`):
+                The texts to be counted.
+
+        Returns:
+            `list[int]`:
+                The token numbers in the same order as the texts.
+        """
+        if self.mode == "remote":
+            raise NotImplementedError(
+                "The Anthropic token counting API doesn't support counting "
+                "plain texts. Use the 'local' or 'hybrid' mode instead.",
+            )
+        return self.estimator.count_many(texts)
+
+    async def _count_remote(
+        self,
+        messages: list[dict],
+        tools: list[dict] | None = None,
+        **kwargs: Any,
+    ) -> int:
+        """Count the tokens by the Anthropic token counting API."""
         system_message = None
-        if messages[0].get("role") == "system":
-            system_message = messages.pop(0)
+        if messages and messages[0].get("role") == "system":
+            system_message = messages[0]
+            messages = messages[1:]
 
         extra_kwargs: dict = {
             "model": self.model_name,
@@ -54,7 +158,7 @@ class AnthropicTokenCounter:
             extra_kwargs["tools"] = tools
 
         if system_message:
-            extra_kwargs["system"] = system_message
+            extra_kwargs["system"] = system_message["content"]
 
         res = await self.client.messages.count_tokens(**extra_kwargs)
 
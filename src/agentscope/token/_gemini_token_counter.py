@@ -1,32 +1,70 @@
 # -*- coding: utf-8 -*-
 """The gemini token counter class in agentscope."""
-from typing import Any
+import asyncio
+from typing import Any, Literal
 
+from agentscope.token._local_estimator import LocalTokenEstimator
 from agentscope.token._token_base import TokenCounterBase
 
 
 class GeminiTokenCounter(TokenCounterBase):
-    """The Gemini token counter class."""
+    """The Gemini token counter class.
 
-    def __init__(self, model_name: str, api_key: str, **kwargs: Any) -> None:
+    The token counter supports three modes:
+
+    - `"remote"`: count the tokens by the Gemini token counting API.
+    - `"local"`: estimate the tokens offline by the local estimator.
+    - `"hybrid"`: estimate the tokens locally in `count`, and count the
+      final prompt remotely in `confirm`, which also calibrates the local
+      estimator.
+    """
+
+    def __init__(
+        self,
+        model_name: str,
+        api_key: str | None = None,
+        mode: Literal["remote", "local", "hybrid"] = "remote",
+        estimator: LocalTokenEstimator | None = None,
+        **kwargs: Any,
+    ) -> None:
         """Initialize the Gemini token counter.
 
         Args:
             model_name (`str`):
                 The name of the Gemini model to use, e.g. "gemini-2.5-flash".
-            api_key (`str`):
-                The API key for Google Gemini.
+            api_key (`str | None`, optional):
+                The API key for Google Gemini, which is not required in the
+                `"local"` mode.
+            mode (`Literal["remote", "local", "hybrid"]`, defaults to \
+            `"remote"`):
+                The counting mode.
+            estimator (`LocalTokenEstimator | None`, optional):
+                The local token estimator used in the `"local"` and
+                `"hybrid"` modes. Defaults to a chars-per-token model
+                calibrated for the Gemini models.
             **kwargs:
                 Additional keyword arguments that will be passed to the
                 Gemini client.
         """
-        from google import genai
+        assert mode in ["remote", "local", "hybrid"]
 
-        self.client = genai.Client(
-            api_key=api_key,
-            **kwargs,
-        )
         self.model_name = model_name
+        self.mode = mode
+        self.estimator = estimator or LocalTokenEstimator(
+            ascii_chars_per_token=4.0,
+            non_ascii_chars_per_token=1.5,
+            tokens_per_message=3,
+            tokens_per_media=258,
+        )
+
+        self.client = None
+        if mode != "local":
+            from google import genai
+
+            self.client = genai.Client(
+                api_key=api_key,
+                **kwargs,
+            )
 
     async def count(
         self,
@@ -35,6 +73,8 @@ class GeminiTokenCounter(TokenCounterBase):
         **config_kwargs: Any,
     ) -> int:
         """Count the number of tokens of gemini models."""
+        if self.mode != "remote":
+            return self.estimator.count(messages, tools)
 
         kwargs = {
             "model": self.model_name,
@@ -48,3 +88,58 @@ class GeminiTokenCounter(TokenCounterBase):
         res = self.client.models.count_tokens(**kwargs)
 
         return res.total_tokens
+
+    async def confirm(
+        self,
+        messages: list[dict],
+        tools: list[dict] | None = None,
+        **config_kwargs: Any,
+    ) -> int | None:
+        """Count the final prompt remotely in the `"hybrid"` mode, and
+        calibrate the local estimator with the result."""
+        if self.mode != "hybrid":
+            return None
+
+        res = await self.client.aio.models.count_tokens(
+            model=self.model_name,
+            contents=messages,
+            config={"tools": tools, **config_kwargs},
+        )
+        self.estimator.calibrate(
+            self.estimator.count(messages, tools),
+            res.total_tokens,
+        )
+        return res.total_tokens
+
+    async def count_many(
+        self,
+        texts: list[str],
+        **kwargs: Any,
+    ) -> list[int]:
+        """Count the token numbers of a batch of plain texts. In the
+        `"remote"` mode, the Gemini API only returns the total number of a
+        request, so the texts are counted by concurrent requests.
+
+        Args:
+            texts (`list[str]`):
+                The texts to be counted.
+
+        Returns:
+            `list[int]`:
+                The token numbers in the same order as the texts.
+        """
+        if self.mode != "remote":
+            return self.estimator.count_many(texts)
+
+        results = await asyncio.gather(
+            *[
+                self.client.aio.models.count_tokens(
+                    model=self.model_name,
+                    contents=text,
+                )
+                for text in texts
+                if text
+            ],
+        )
+        totals = iter(_.total_tokens for _ in results)
+        return [next(totals) if text else 0 for text in texts]
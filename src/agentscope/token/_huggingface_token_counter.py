@@ -1,10 +1,41 @@
 # -*- coding: utf-8 -*-
 """The huggingface token counter class."""
+import json
 import os
+import threading
 from typing import Any
 
 from agentscope.token._token_base import TokenCounterBase
 
+_tokenizers: dict[str, Any] = {}
+_tokenizers_lock = threading.Lock()
+
+
+def _load_tokenizer(
+    pretrained_model_name_or_path: str,
+    use_fast: bool,
+    trust_remote_code: bool,
+    **kwargs: Any,
+) -> Any:
+    """Load the tokenizer from HuggingFace, which is cached across the
+    process so that the counters of the same model share one tokenizer."""
+    key = json.dumps(
+        [pretrained_model_name_or_path, use_fast, trust_remote_code, kwargs],
+        sort_keys=True,
+        default=str,
+    )
+    with _tokenizers_lock:
+        if key not in _tokenizers:
+            from transformers import AutoTokenizer
+
+            _tokenizers[key] = AutoTokenizer.from_pretrained(
+                pretrained_model_name_or_path,
+                use_fast=use_fast,
+                trust_remote_code=trust_remote_code,
+                **kwargs,
+            )
+        return _tokenizers[key]
+
 
 class HuggingFaceTokenCounter(TokenCounterBase):
     """The token counter for Huggingface models."""
@@ -37,9 +68,7 @@ class HuggingFaceTokenCounter(TokenCounterBase):
         if use_mirror:
             os.environ["HF_ENDPOINT"] = "https://hf-mirror.com"
 
-        from transformers import AutoTokenizer
-
-        self.tokenizer = AutoTokenizer.from_pretrained(
+        self.tokenizer = _load_tokenizer(
             pretrained_model_name_or_path,
             use_fast=use_fast,
             trust_remote_code=trust_remote_code,
@@ -81,3 +110,32 @@ class HuggingFaceTokenCounter(TokenCounterBase):
         )[0]
 
         return len(tokenized_msgs)
+
+    async def count_many(
+        self,
+        texts: list[str],
+        **kwargs: Any,
+    ) -> list[int]:
+        """Count the token numbers of a batch of plain texts in one call of
+        the tokenizer, which is parallelized by the fast tokenizers.
+
+        Args:
+            texts (`list[str]`):
+                The texts to be counted.
+            **kwargs (`Any`):
+                The additional keyword arguments that will be passed to the
+                tokenizer.
+
+        Returns:
+            `list[int]`:
+                The token numbers in the same order as the texts.
+        """
+        if not texts:
+            return []
+
+        encoded = self.tokenizer(
+            texts,
+            add_special_tokens=False,
+            **kwargs,
+        )
+        return [len(_) for _ in encoded["input_ids"]]
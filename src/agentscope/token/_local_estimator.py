@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+"""The local token estimator, which estimates the token numbers offline for
+the token counters relying on remote counting APIs."""
+import json
+from typing import Any, Callable
+
+_MEDIA_TYPES = {"image", "audio", "video", "document", "image_url"}
+_MEDIA_KEYS = {"inline_data", "file_data", "image_url", "input_audio"}
+
+
+class LocalTokenEstimator:
+    """Estimate the token numbers of the formatted messages locally, either
+    with a pluggable tokenizer, or with a chars-per-token model that
+    distinguishes ASCII and non-ASCII (e.g. CJK) characters.
+
+    The estimation can be calibrated by the exact counts, e.g. from the
+    remote counting APIs, with an exponential moving average of the ratio
+    between the exact and the estimated counts.
+    """
+
+    def __init__(
+        self,
+        tokenizer: Callable[[str], int] | None = None,
+        ascii_chars_per_token: float = 4.0,
+        non_ascii_chars_per_token: float = 1.0,
+        tokens_per_message: int = 3,
+        tokens_per_media: int = 1000,
+        calibration_rate: float = 0.3,
+    ) -> None:
+        """Initialize the local token estimator.
+
+        Args:
+            tokenizer (`Callable[[str], int] | None`, optional):
+                The function that returns the token number of a text. If
+                provided, the chars-per-token model is not used.
+            ascii_chars_per_token (`float`, defaults to `4.0`):
+                The average number of ASCII characters per token.
+            non_ascii_chars_per_token (`float`, defaults to `1.0`):
+                The average number of non-ASCII characters per token.
+            tokens_per_message (`int`, defaults to `3`):
+                The overhead tokens of each message.
+            tokens_per_media (`int`, defaults to `1000`):
+                The estimated tokens of each image, audio, video or document
+                block.
+            calibration_rate (`float`, defaults to `0.3`):
+                The weight of the latest exact count when calibrating.
+        """
+        if ascii_chars_per_token <= 0 or non_ascii_chars_per_token <= 0:
+            raise ValueError("The chars per token must be positive.")
+
+        self.tokenizer = tokenizer
+        self.ascii_chars_per_token = ascii_chars_per_token
+        self.non_ascii_chars_per_token = non_ascii_chars_per_token
+        self.tokens_per_message = tokens_per_message
+        self.tokens_per_media = tokens_per_media
+        self.calibration_rate = calibration_rate
+
+        self.scale = 1.0
+        """The calibrated scale applied to the estimations."""
+
+    def count_text(self, text: str) -> int:
+        """Estimate the token number of a text, without calibration."""
+        if not text:
+            return 0
+
+        if self.tokenizer is not None:
+            return self.tokenizer(text)
+
+        n_ascii = sum(1 for _ in text if _.isascii())
+        n_non_ascii = len(text) - n_ascii
+        return max(
+            1,
+            round(
+                n_ascii / self.ascii_chars_per_token
+                + n_non_ascii / self.non_ascii_chars_per_token,
+            ),
+        )
+
+    def count(
+        self,
+        messages: list[dict],
+        tools: list[dict] | None = None,
+    ) -> int:
+        """Estimate the token number of the formatted messages and tools.
+
+        Args:
+            messages (`list[dict]`):
+                The formatted messages in the provider's format.
+            tools (`list[dict] | None`, optional):
+                The tools JSON schemas.
+
+        Returns:
+            `int`:
+                The calibrated estimation of the token number.
+        """
+        n_tokens = 0
+        for message in messages:
+            n_tokens += self.tokens_per_message + self._count_value(message)
+
+        if tools:
+            n_tokens += self.count_text(
+                json.dumps(tools, ensure_ascii=False),
+            )
+
+        return round(n_tokens * self.scale)
+
+    def count_many(self, texts: list[str]) -> list[int]:
+        """Estimate the token numbers of a batch of plain texts."""
+        return [round(self.count_text(_) * self.scale) for _ in texts]
+
+    def calibrate(self, estimated: int, exact: int) -> None:
+        """Calibrate the estimator by an exact count.
+
+        Args:
+            estimated (`int`):
+                The calibrated estimation returned by `count`.
+            exact (`int`):
+                The exact token number of the same input.
+        """
+        if estimated <= 0 or exact <= 0:
+            return
+
+        raw = estimated / self.scale
+        self.scale = (
+            1 - self.calibration_rate
+        ) * self.scale + self.calibration_rate * (exact / raw)
+
+    def _count_value(self, value: Any) -> int:
+        """Estimate the token number of a value in the formatted messages
+        recursively, where the media blocks are counted as fixed tokens and
+        their data is skipped."""
+        if isinstance(value, str):
+            return self.count_text(value)
+
+        if isinstance(value, list):
+            return sum(self._count_value(_) for _ in value)
+
+        if isinstance(value, dict):
+            if value.get("type") in _MEDIA_TYPES or _MEDIA_KEYS & set(value):
+                return self.tokens_per_media
+
+            return sum(
+                self._count_value(v)
+                for k, v in value.items()
+                if k not in ("role", "type")
+            )
+
+        return 0
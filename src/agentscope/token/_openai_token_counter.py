@@ -7,8 +7,10 @@ import base64
 import io
 import json
 import math
+from collections import OrderedDict
+from functools import lru_cache
 from http import HTTPStatus
-from typing import Any
+from typing import Any, Callable
 
 import requests
 
@@ -118,60 +120,96 @@ def _get_base_and_tile_tokens(model_name: str) -> tuple[int, int]:
     )
 
 
+@lru_cache(maxsize=None)
+def _get_encoding(model_name: str) -> Any:
+    """Get the tiktoken encoding of the given model, which is cached across
+    the process since loading the encoding is expensive."""
+    import tiktoken
+
+    try:
+        return tiktoken.encoding_for_model(model_name)
+    except KeyError:
+        return tiktoken.get_encoding("o200k_base")
+
+
+def _calculate_tokens_for_tool(
+    model_name: str,
+    tool: dict,
+    encoding: Any,
+) -> int:
+    """Calculate the tokens for a single tool JSON schema, excluding the
+    fixed tokens at the end of the tool list. Refer to
+    `_calculate_tokens_for_tools` for details."""
+    func_init = 10
+    prop_init = 3
+    prop_key = 3
+    enum_init = -3
+    enum_item = 3
+
+    if model_name.startswith("gpt-4o"):
+        func_init = 7
+
+    func_token_count = func_init
+    function = tool["function"]
+    f_name = function["name"]
+    f_desc = function.get("description", "").removesuffix(".")
+    func_token_count += len(encoding.encode(f"{f_name}:{f_desc}"))
+
+    properties = function["parameters"]["properties"]
+
+    if len(properties) > 0:
+        func_token_count += prop_init
+        for key in properties.keys():
+            func_token_count += prop_key
+            p_name = key
+            p_type = properties[key]["type"]
+            p_desc = properties[key].get("description", "").removesuffix(".")
+
+            if "enum" in properties[key].keys():
+                func_token_count += enum_init
+                for item in properties[key]["enum"]:
+                    func_token_count += enum_item
+                    func_token_count += len(encoding.encode(item))
+
+            func_token_count += len(
+                encoding.encode(f"{p_name}:{p_type}:{p_desc}"),
+            )
+
+    return func_token_count
+
+
 def _calculate_tokens_for_tools(
     model_name: str,
     tools: list[dict],
     encoding: Any,
+    count_tool: Callable[[dict], int] | None = None,
 ) -> int:
     """Calculate the tokens for the given tools JSON schema, which follows the
     OpenAI cookbook
     https://github.com/openai/openai-cookbook/blob/6dfb7920b59a45291f7df4ea41338d1faf9ef1e8/examples/How_to_count_tokens_with_tiktoken.ipynb
+
+    Args:
+        model_name (`str`):
+            The name of the model.
+        tools (`list[dict]`):
+            The tools JSON schemas.
+        encoding (`Any`):
+            The encoding object.
+        count_tool (`Callable[[dict], int] | None`, optional):
+            The function to count the tokens of a single tool, e.g. a
+            memoized one. Defaults to `_calculate_tokens_for_tool`.
     """
     if not tools:
         return 0
 
-    func_init = 10
-    prop_init = 3
-    prop_key = 3
-    enum_init = -3
-    enum_item = 3
     func_end = 12
 
-    if model_name.startswith("gpt-4o"):
-        func_init = 7
+    if count_tool is None:
 
-    func_token_count = 0
-    for f in tools:
-        func_token_count += func_init
-        function = f["function"]
-        f_name = function["name"]
-        f_desc = function.get("description", "").removesuffix(".")
-        func_token_count += len(encoding.encode(f"{f_name}:{f_desc}"))
-
-        properties = function["parameters"]["properties"]
-
-        if len(properties) > 0:
-            func_token_count += prop_init
-            for key in properties.keys():
-                func_token_count += prop_key
-                p_name = key
-                p_type = properties[key]["type"]
-                p_desc = (
-                    properties[key].get("description", "").removesuffix(".")
-                )
+        def count_tool(tool: dict) -> int:
+            return _calculate_tokens_for_tool(model_name, tool, encoding)
 
-                if "enum" in properties[key].keys():
-                    func_token_count += enum_init
-                    for item in properties[key]["enum"]:
-                        func_token_count += enum_item
-                        func_token_count += len(encoding.encode(item))
-
-                func_token_count += len(
-                    encoding.encode(f"{p_name}:{p_type}:{p_desc}"),
-                )
-    func_token_count += func_end
-
-    return func_token_count
+    return sum(count_tool(_) for _ in tools) + func_end
 
 
 def _count_content_tokens_for_openai_vision_model(
@@ -294,17 +332,102 @@ def _count_content_tokens_for_openai_vision_model(
     return num_tokens
 
 
+def _count_tokens_for_message(
+    model_name: str,
+    message: dict[str, Any],
+    encoding: Any,
+) -> int:
+    """Count the tokens of a single message, excluding the fixed tokens per
+    message.
+
+    Args:
+        model_name (`str`):
+            The name of the model.
+        message (`dict[str, Any]`):
+            The message dictionary.
+        encoding (`Any`):
+            The encoding object.
+    """
+    tokens_per_name = 1
+
+    num_tokens = 0
+    for key, value in message.items():
+        # Considering vision models
+        if key == "content" and isinstance(value, list):
+            num_tokens += _count_content_tokens_for_openai_vision_model(
+                model_name,
+                value,
+                encoding,
+            )
+
+        elif isinstance(value, str):
+            num_tokens += len(encoding.encode(value))
+
+        elif value is None:
+            continue
+
+        elif key == "tool_calls":
+            # TODO: This is only a temporary solution, since OpenAI
+            # hasn't provided an official guide for counting tokens
+            # with tool results.
+            num_tokens += len(
+                encoding.encode(
+                    json.dumps(value, ensure_ascii=False),
+                ),
+            )
+
+        else:
+            raise TypeError(
+                f"Invalid type {type(value)} in the {key} field: {value}",
+            )
+
+        if key == "name":
+            num_tokens += tokens_per_name
+
+    return num_tokens
+
+
+_MEMO_KEY_MAX_STR_LEN = 256
+"""The strings longer than this, e.g. the inline base64 data, are keyed by
+their length and hash in the memoization, rather than their content."""
+
+
+def _get_memo_key(obj: Any) -> Any:
+    """Get a hashable key of the JSON object for the memoization, without
+    serializing or keeping the long strings."""
+    if isinstance(obj, dict):
+        return tuple((k, _get_memo_key(v)) for k, v in sorted(obj.items()))
+    if isinstance(obj, (list, tuple)):
+        return tuple(_get_memo_key(_) for _ in obj)
+    if isinstance(obj, str) and len(obj) > _MEMO_KEY_MAX_STR_LEN:
+        return len(obj), hash(obj)
+    if obj is None or isinstance(obj, (str, int, float)):
+        # Distinguish `True` from `1`
+        return type(obj).__name__, obj
+    return str(obj)
+
+
 class OpenAITokenCounter(TokenCounterBase):
-    """The OpenAI token counting class."""
+    """The OpenAI token counting class.
+
+    The token numbers of the messages and tools are memoized by their
+    content, so that counting a growing conversation, or the same tools
+    list repeatedly, only encodes the new content.
+    """
 
-    def __init__(self, model_name: str) -> None:
+    def __init__(self, model_name: str, cache_size: int = 4096) -> None:
         """Initialize the OpenAI token counter.
 
         Args:
             model_name (`str`):
                 The name of the OpenAI model to use for token counting.
+            cache_size (`int`, defaults to `4096`):
+                The maximum number of memoized token numbers of messages and
+                tools. Set it to `0` to disable the memoization.
         """
         self.model_name = model_name
+        self.cache_size = cache_size
+        self._cache: OrderedDict[tuple, int] = OrderedDict()
 
     async def count(
         self,
@@ -324,61 +447,76 @@ class OpenAITokenCounter(TokenCounterBase):
                 required.
             tools (`list[dict]`, defaults to `None`):
         """
-        import tiktoken
-
-        try:
-            encoding = tiktoken.encoding_for_model(self.model_name)
-        except KeyError:
-            encoding = tiktoken.get_encoding("o200k_base")
+        encoding = _get_encoding(self.model_name)
 
         tokens_per_message = 3
-        tokens_per_name = 1
 
         # every reply is primed with <|start|>assistant<|message|>
         num_tokens = 3
         for message in messages:
             num_tokens += tokens_per_message
-            for key, value in message.items():
-                # Considering vision models
-                if key == "content" and isinstance(value, list):
-                    num_tokens += (
-                        _count_content_tokens_for_openai_vision_model(
-                            self.model_name,
-                            value,
-                            encoding,
-                        )
-                    )
-
-                elif isinstance(value, str):
-                    num_tokens += len(encoding.encode(value))
-
-                elif value is None:
-                    continue
-
-                elif key == "tool_calls":
-                    # TODO: This is only a temporary solution, since OpenAI
-                    # hasn't provided an official guide for counting tokens
-                    # with tool results.
-                    num_tokens += len(
-                        encoding.encode(
-                            json.dumps(value, ensure_ascii=False),
-                        ),
-                    )
-
-                else:
-                    raise TypeError(
-                        f"Invalid type {type(value)} in the {key} field: "
-                        f"{value}",
-                    )
-
-                if key == "name":
-                    num_tokens += tokens_per_name
+            num_tokens += self._memoize(
+                "message",
+                message,
+                lambda _: _count_tokens_for_message(
+                    self.model_name,
+                    _,
+                    encoding,
+                ),
+            )
 
         if tools:
             num_tokens += _calculate_tokens_for_tools(
                 self.model_name,
                 tools,
                 encoding,
+                count_tool=lambda tool: self._memoize(
+                    "tool",
+                    tool,
+                    lambda _: _calculate_tokens_for_tool(
+                        self.model_name,
+                        _,
+                        encoding,
+                    ),
+                ),
             )
 
         return num_tokens
+
+    async def count_many(self, texts: list[str], **kwargs: Any) -> list[int]:
+        """Count the token numbers of a batch of plain texts in one call,
+        with tiktoken's batch encoding.
+
+        Args:
+            texts (`list[str]`):
+                The texts to be counted.
+
+        Returns:
+            `list[int]`:
+                The token numbers in the same order as the texts.
+        """
+        encoding = _get_encoding(self.model_name)
+        return [len(_) for _ in encoding.encode_batch(texts)]
+
+    def _memoize(
+        self,
+        kind: str,
+        obj: dict,
+        func: Callable[[dict], int],
+    ) -> int:
+        """Count the tokens of the object with the given function, memoized
+        by the content of the object."""
+        if self.cache_size <= 0:
+            return func(obj)
+
+        key = (kind, _get_memo_key(obj))
+
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+
+        num_tokens = func(obj)
+        self._cache[key] = num_tokens
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return num_tokens
@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
+# pylint: disable=unused-argument
 """The token base class in agentscope."""
+import asyncio
 from abc import abstractmethod
 from typing import Any
 
@@ -14,3 +16,48 @@ class TokenCounterBase:
         **kwargs: Any,
     ) -> int:
         """Count the number of tokens by the given model and messages."""
+
+    async def confirm(
+        self,
+        messages: list[dict],
+        **kwargs: Any,
+    ) -> int | None:
+        """Confirm the final token number with an exact count, if `count`
+        only returns an estimation, e.g. in the hybrid mode of the token
+        counters with remote counting APIs. Return `None` if `count` is
+        already exact.
+
+        Args:
+            messages (`list[dict]`):
+                The formatted messages.
+        """
+        return None
+
+    async def count_many(
+        self,
+        texts: list[str],
+        **kwargs: Any,
+    ) -> list[int]:
+        """Count the token numbers of a batch of plain texts.
+
+        .. note:: The default implementation counts each text as a user
+         message concurrently, so the numbers include the per-message
+         overhead of the counter. The subclasses override it to count the
+         texts in one call without the overhead.
+
+        Args:
+            texts (`list[str]`):
+                The texts to be counted.
+
+        Returns:
+            `list[int]`:
+                The token numbers in the same order as the texts.
+        """
+        return list(
+            await asyncio.gather(
+                *[
+                    self.count([{"role": "user", "content": _}], **kwargs)
+                    for _ in texts
+                ],
+            ),
+        )
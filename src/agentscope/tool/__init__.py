@@ -21,12 +21,23 @@ from ._multi_modality import (
     openai_create_image_variation,
     openai_image_to_text,
     openai_audio_to_text,
+    dashscope_text_to_image_async,
+    dashscope_text_to_audio_async,
+    dashscope_image_to_text_async,
+    openai_text_to_image_async,
+    openai_text_to_audio_async,
+    openai_edit_image_async,
+    openai_create_image_variation_async,
+    openai_image_to_text_async,
+    openai_audio_to_text_async,
 )
 from ._toolkit import Toolkit
+from ._output_policy import ToolOutputPolicy
 
 __all__ = [
     "Toolkit",
     "ToolResponse",
+    "ToolOutputPolicy",
     "execute_python_code",
     "execute_shell_command",
     "view_text_file",
@@ -41,4 +52,13 @@ __all__ = [
     "openai_create_image_variation",
     "openai_image_to_text",
     "openai_audio_to_text",
+    "dashscope_text_to_image_async",
+    "dashscope_text_to_audio_async",
+    "dashscope_image_to_text_async",
+    "openai_text_to_image_async",
+    "openai_text_to_audio_async",
+    "openai_edit_image_async",
+    "openai_create_image_variation_async",
+    "openai_image_to_text_async",
+    "openai_audio_to_text_async",
 ]
@@ -13,6 +13,19 @@ from ._openai_tools import (
     openai_image_to_text,
     openai_audio_to_text,
 )
+from ._dashscope_async_tools import (
+    dashscope_image_to_text_async,
+    dashscope_text_to_audio_async,
+    dashscope_text_to_image_async,
+)
+from ._openai_async_tools import (
+    openai_text_to_image_async,
+    openai_edit_image_async,
+    openai_text_to_audio_async,
+    openai_create_image_variation_async,
+    openai_image_to_text_async,
+    openai_audio_to_text_async,
+)
 
 __all__ = [
     "dashscope_image_to_text",
@@ -24,4 +37,13 @@ __all__ = [
     "openai_create_image_variation",
     "openai_image_to_text",
     "openai_audio_to_text",
+    "dashscope_image_to_text_async",
+    "dashscope_text_to_audio_async",
+    "dashscope_text_to_image_async",
+    "openai_text_to_image_async",
+    "openai_text_to_audio_async",
+    "openai_edit_image_async",
+    "openai_create_image_variation_async",
+    "openai_image_to_text_async",
+    "openai_audio_to_text_async",
 ]
@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+"""The shared async HTTP utilities of the multi-modal tools, where the
+clients are pooled per event loop, so that the connections are reused across
+the tool calls."""
+import asyncio
+import base64
+import os
+import uuid
+import weakref
+from typing import Any
+
+import httpx
+
+from ..._logging import logger
+from ...message import Base64Source, URLSource
+
+_http_clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+"""The pooled HTTP clients, keyed by the event loop."""
+
+_openai_clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+"""The OpenAI async clients, keyed by the event loop and the API key."""
+
+_MAX_CONCURRENT_DOWNLOADS = 8
+"""The maximum number of the concurrent downloads in a tool call."""
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Get the pooled HTTP client of the running event loop."""
+    loop = asyncio.get_running_loop()
+    client = _http_clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            timeout=httpx.Timeout(60.0, connect=10.0),
+            limits=httpx.Limits(
+                max_connections=64,
+                max_keepalive_connections=16,
+            ),
+            follow_redirects=True,
+        )
+        _http_clients[loop] = client
+    return client
+
+
+def _get_openai_client(api_key: str) -> Any:
+    """Get the OpenAI async client of the running event loop for the given
+    API key, which sends the requests with the pooled HTTP client."""
+    import openai
+
+    loop = asyncio.get_running_loop()
+    clients = _openai_clients.setdefault(loop, {})
+    client = clients.get(api_key)
+    if client is None:
+        client = openai.AsyncOpenAI(
+            api_key=api_key,
+            http_client=_get_http_client(),
+        )
+        clients[api_key] = client
+    return client
+
+
+async def _download_bytes(url: str, max_retries: int = 3) -> bytes:
+    """Download the content of the given web URL.
+
+    Args:
+        url (`str`):
+            The web URL.
+        max_retries (`int`, defaults to `3`):
+            The maximum number of retries.
+    """
+    client = _get_http_client()
+    for attempt in range(max_retries):
+        try:
+            response = await client.get(url)
+            response.raise_for_status()
+            return response.content
+
+        except httpx.HTTPError as e:
+            if attempt == max_retries - 1:
+                raise
+            logger.info(
+                "Failed to fetch bytes from URL %s. Error %s. Retrying...",
+                url,
+                str(e),
+            )
+            await asyncio.sleep(2**attempt)
+
+    raise RuntimeError(f"Failed to fetch bytes from URL {url}.")
+
+
+async def _read_bytes(url: str) -> bytes:
+    """Read the bytes from a web URL or a local file path, without blocking
+    the event loop."""
+    if url.startswith(("http://", "https://")):
+        return await _download_bytes(url)
+
+    if not os.path.exists(url):
+        raise FileNotFoundError(f"File not found: {url}")
+
+    def _read() -> bytes:
+        with open(url, "rb") as f:
+            return f.read()
+
+    return await asyncio.to_thread(_read)
+
+
+async def _stream_to_file(url: str, path: str) -> None:
+    """Stream the content of the given web URL to a local file chunk by
+    chunk, so that the media is never fully held in memory."""
+    async with _get_http_client().stream("GET", url) as response:
+        response.raise_for_status()
+        with open(path, "wb") as f:
+            async for chunk in response.aiter_bytes():
+                f.write(chunk)
+
+
+async def _write_bytes(data: bytes, path: str) -> None:
+    """Write the bytes to a local file in a thread."""
+
+    def _write() -> None:
+        with open(path, "wb") as f:
+            f.write(data)
+
+    await asyncio.to_thread(_write)
+
+
+def _get_media_path(save_dir: str, extension: str) -> str:
+    """Get a new file path in the save directory."""
+    os.makedirs(save_dir, exist_ok=True)
+    return os.path.abspath(
+        os.path.join(save_dir, f"{uuid.uuid4().hex}.{extension}"),
+    )
+
+
+async def _to_media_source(
+    url: str | None = None,
+    data: str | None = None,
+    media_type: str = "image/png",
+    save_dir: str | None = None,
+    use_base64: bool = False,
+) -> URLSource | Base64Source:
+    """Convert a generated media from a web URL or base64 data into a
+    source, which refers to the local file if `save_dir` is given.
+
+    Args:
+        url (`str | None`, optional):
+            The web URL of the media.
+        data (`str | None`, optional):
+            The base64 data of the media.
+        media_type (`str`, defaults to `"image/png"`):
+            The media type of the base64 data.
+        save_dir (`str | None`, optional):
+            The directory to save the media. If given, the media is streamed
+            to a local file, and referred by its path.
+        use_base64 (`bool`, defaults to `False`):
+            Whether to download the web URL as base64 data, if `save_dir` is
+            not given.
+    """
+    if url is not None:
+        extension = url.split("?", maxsplit=1)[0].rsplit(".", maxsplit=1)
+        extension = extension[-1].lower() if len(extension) > 1 else "png"
+        if save_dir is not None:
+            path = _get_media_path(save_dir, extension)
+            await _stream_to_file(url, path)
+            return URLSource(type="url", url=path)
+
+        if use_base64:
+            content = await _download_bytes(url)
+            return Base64Source(
+                type="base64",
+                media_type=f"image/{extension}",
+                data=base64.b64encode(content).decode("ascii"),
+            )
+
+        return URLSource(type="url", url=url)
+
+    if save_dir is not None:
+        path = _get_media_path(save_dir, media_type.split("/")[-1])
+        await _write_bytes(base64.b64decode(data), path)
+        return URLSource(type="url", url=path)
+
+    return Base64Source(type="base64", media_type=media_type, data=data)
+
+
+async def _gather_bounded(*coroutines: Any) -> list:
+    """Run the coroutines concurrently with a bounded concurrency, and
+    return the results in order."""
+    semaphore = asyncio.Semaphore(_MAX_CONCURRENT_DOWNLOADS)
+
+    async def _run(coroutine: Any) -> Any:
+        async with semaphore:
+            return await coroutine
+
+    return await asyncio.gather(*[_run(_) for _ in coroutines])
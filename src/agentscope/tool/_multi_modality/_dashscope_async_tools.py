@@ -0,0 +1,309 @@
+# -*- coding: utf-8 -*-
+"""The async variants of the DashScope multi-modal tools, which don't block
+the event loop. Please refer to the
+`official documentation <https://dashscope.aliyun.com/>`_ for more details.
+"""
+import asyncio
+import base64
+import os
+from typing import Literal, Sequence
+
+from ._async_utils import (
+    _gather_bounded,
+    _get_media_path,
+    _to_media_source,
+    _write_bytes,
+)
+from .._response import ToolResponse
+from ...message import (
+    AudioBlock,
+    Base64Source,
+    ImageBlock,
+    TextBlock,
+    URLSource,
+)
+
+
+async def dashscope_text_to_image_async(
+    prompt: str,
+    api_key: str,
+    n: int = 1,
+    size: Literal["1024*1024", "720*1280", "1280*720"] = "1024*1024",
+    model: str = "wanx-v1",
+    use_base64: bool = False,
+    save_dir: str | None = None,
+    poll_interval: float = 1.0,
+) -> ToolResponse:
+    """Generate image(s) based on the given prompt, and return image url(s)
+    or base64 data.
+
+    The image synthesis task is submitted and polled asynchronously, so that
+    the event loop isn't blocked while the images are being generated.
+
+    Args:
+        prompt (`str`):
+            The text prompt to generate image.
+        api_key (`str`):
+            The api key for the dashscope api.
+        n (`int`, defaults to `1`):
+            The number of images to generate.
+        size (`Literal["1024*1024", "720*1280", "1280*720"]`, defaults to \
+         `"1024*1024"`):
+            Size of the image.
+        model (`str`, defaults to '"wanx-v1"'):
+            The model to use, such as "wanx-v1", "qwen-image",
+            "wan2.2-t2i-flash", etc.
+        use_base64 (`bool`, defaults to 'False'):
+            Whether to use base64 data for images, which are downloaded
+            concurrently.
+        save_dir (`str | None`, optional):
+            The directory to save the generated images. If given, the images
+            are streamed to local files and returned by their paths.
+        poll_interval (`float`, defaults to `1.0`):
+            The interval in seconds to poll the status of the task.
+
+    Returns:
+        `ToolResponse`:
+            A ToolResponse containing the generated images or error
+            information if the operation failed.
+    """
+    try:
+        import dashscope
+
+        task = await asyncio.to_thread(
+            dashscope.ImageSynthesis.async_call,
+            model=model,
+            prompt=prompt,
+            api_key=api_key,
+            n=n,
+            size=size,
+        )
+        while True:
+            response = await asyncio.to_thread(
+                dashscope.ImageSynthesis.fetch,
+                task,
+                api_key=api_key,
+            )
+            status = response.output["task_status"]
+            if status == "SUCCEEDED":
+                break
+            if status in ["FAILED", "CANCELED", "UNKNOWN"]:
+                return ToolResponse(
+                    [
+                        TextBlock(
+                            type="text",
+                            text=f"Failed to generate images: the task is "
+                            f"{status}, {response.message}",
+                        ),
+                    ],
+                )
+            await asyncio.sleep(poll_interval)
+
+        urls = [_["url"] for _ in response.output["results"] if "url" in _]
+        if not urls:
+            return ToolResponse(
+                [
+                    TextBlock(
+                        type="text",
+                        text="Error: Failed to generate images",
+                    ),
+                ],
+            )
+
+        sources = await _gather_bounded(
+            *[
+                _to_media_source(
+                    url=url,
+                    save_dir=save_dir,
+                    use_base64=use_base64,
+                )
+                for url in urls
+            ],
+        )
+        return ToolResponse(
+            content=[ImageBlock(type="image", source=_) for _ in sources],
+        )
+
+    except Exception as e:
+        return ToolResponse(
+            [
+                TextBlock(
+                    type="text",
+                    text=f"Failed to generate images: {str(e)}",
+                ),
+            ],
+        )
+
+
+async def dashscope_image_to_text_async(
+    image_urls: str | Sequence[str],
+    api_key: str,
+    prompt: str = "Describe the image",
+    model: str = "qwen-vl-plus",
+) -> ToolResponse:
+    """Generate text based on the given images.
+
+    Args:
+        image_urls (`str | Sequence[str]`):
+            The url of single or multiple images.
+        api_key (`str`):
+            The api key for the dashscope api.
+        prompt (`str`, defaults to 'Describe the image' ):
+            The text prompt.
+        model (`str`, defaults to 'qwen-vl-plus'):
+            The model to use in DashScope MultiModal API.
+
+    Returns:
+        `ToolResponse`:
+            A ToolResponse containing the generated text or error information
+            if the operation failed.
+    """
+    if isinstance(image_urls, str):
+        image_urls = [image_urls]
+
+    # Check if the local url is valid
+    contents = []
+    for url in image_urls:
+        if os.path.exists(url):
+            if not os.path.isfile(url):
+                return ToolResponse(
+                    [
+                        TextBlock(
+                            type="text",
+                            text=f'Error: The input image url "{url}" is '
+                            f"not a file.",
+                        ),
+                    ],
+                )
+            url = os.path.abspath(url)
+        # Maybe a web url or an invalid url, we leave it to the API to handle
+        contents.append({"image": url})
+
+    contents.append({"text": prompt})
+
+    messages = [
+        {
+            "role": "system",
+            "content": [{"text": "You are a helpful assistant."}],
+        },
+        {
+            "role": "user",
+            "content": contents,
+        },
+    ]
+    try:
+        import dashscope
+
+        response = await dashscope.AioMultiModalConversation.call(
+            model=model,
+            messages=messages,
+            api_key=api_key,
+        )
+        content = response.output["choices"][0]["message"]["content"]
+        if isinstance(content, list):
+            content = content[0]["text"]
+        if content is None:
+            return ToolResponse(
+                [
+                    TextBlock(
+                        type="text",
+                        text="Error: Failed to generate text",
+                    ),
+                ],
+            )
+
+        return ToolResponse(
+            [
+                TextBlock(
+                    type="text",
+                    text=content,
+                ),
+            ],
+        )
+    except Exception as e:
+        return ToolResponse(
+            [
+                TextBlock(
+                    type="text",
+                    text=f"Failed to generate text: {str(e)}",
+                ),
+            ],
+        )
+
+
+async def dashscope_text_to_audio_async(
+    text: str,
+    api_key: str,
+    model: str = "sambert-zhichu-v1",
+    sample_rate: int = 48000,
+    save_dir: str | None = None,
+) -> ToolResponse:
+    """Convert the given text to audio.
+
+    The synthesis runs in a thread, since the DashScope SDK only provides a
+    synchronous API for it.
+
+    Args:
+        text (`str`):
+            The text to be converted into audio.
+        api_key (`str`):
+            The api key for the dashscope API.
+        model (`str`, defaults to 'sambert-zhichu-v1'):
+            The model to use. Full model list can be found in the
+            `official document
+            <https://help.aliyun.com/zh/model-studio/sambert-python-sdk>`_.
+        sample_rate (`int`, defaults to 48000):
+            Sample rate of the audio.
+        save_dir (`str | None`, optional):
+            The directory to save the audio. If given, the audio is written
+            to a local file and returned by its path.
+
+    Returns:
+        `ToolResponse`:
+            A ToolResponse containing the generated audio or error
+            information if the operation failed.
+    """
+    try:
+        import dashscope
+
+        res = await asyncio.to_thread(
+            dashscope.audio.tts.SpeechSynthesizer.call,
+            model=model,
+            text=text,
+            sample_rate=sample_rate,
+            format="wav",
+            api_key=api_key,
+        )
+        audio_data = res.get_audio_data()
+        if audio_data is None:
+            return ToolResponse(
+                [
+                    TextBlock(
+                        type="text",
+                        text="Error: Failed to generate audio",
+                    ),
+                ],
+            )
+
+        if save_dir is not None:
+            path = _get_media_path(save_dir, "wav")
+            await _write_bytes(audio_data, path)
+            source = URLSource(type="url", url=path)
+        else:
+            source = Base64Source(
+                type="base64",
+                media_type="audio/wav",
+                data=base64.b64encode(audio_data).decode("utf-8"),
+            )
+
+        return ToolResponse([AudioBlock(type="audio", source=source)])
+
+    except Exception as e:
+        return ToolResponse(
+            [
+                TextBlock(
+                    type="text",
+                    text=f"Failed to generate audio: {str(e)}",
+                ),
+            ],
+        )
@@ -0,0 +1,544 @@
+# -*- coding: utf-8 -*-
+"""The async variants of the OpenAI multi-modal tools, which don't block the
+event loop, reuse the pooled HTTP connections, download multiple images
+concurrently and stream the generated media to disk. Refer the official
+`OpenAI API documentation <https://platform.openai.com/docs/overview>`_ for
+more details.
+"""
+import asyncio
+import base64
+import urllib.parse
+from io import BytesIO
+from pathlib import Path
+from typing import Any, Literal
+
+from ._async_utils import (
+    _gather_bounded,
+    _get_media_path,
+    _get_openai_client,
+    _read_bytes,
+    _to_media_source,
+)
+from .._response import ToolResponse
+from ...formatter._openai_formatter import _to_openai_image_url
+from ...message import (
+    AudioBlock,
+    Base64Source,
+    ImageBlock,
+    TextBlock,
+    URLSource,
+)
+
+
+async def _to_image_blocks(
+    data: list[Any],
+    response_format: Literal["url", "b64_json"],
+    save_dir: str | None,
+) -> list[ImageBlock]:
+    """Convert the image data in the OpenAI response into image blocks, where
+    the images are saved concurrently if `save_dir` is given."""
+    sources = await _gather_bounded(
+        *[
+            _to_media_source(url=_.url, save_dir=save_dir)
+            if response_format == "url"
+            else _to_media_source(data=_.b64_json, save_dir=save_dir)
+            for _ in data
+        ],
+    )
+    return [ImageBlock(type="image", source=_) for _ in sources]
+
+
+async def _prepare_image(url_or_path: str) -> BytesIO:
+    """Load the image from a web URL or a local path and convert it into an
+    RGBA PNG image, where the conversion runs in a thread."""
+    content = await _read_bytes(url_or_path)
+
+    def _convert() -> BytesIO:
+        from PIL import Image
+
+        img = Image.open(BytesIO(content))
+        if img.mode != "RGBA":
+            img = img.convert("RGBA")
+        img_buffer = BytesIO()
+        img.save(img_buffer, format="PNG")
+        img_buffer.seek(0)
+        img_buffer.name = "image.png"
+        return img_buffer
+
+    return await asyncio.to_thread(_convert)
+
+
+async def openai_text_to_image_async(
+    prompt: str,
+    api_key: str,
+    n: int = 1,
+    model: Literal["dall-e-2", "dall-e-3", "gpt-image-1"] = "dall-e-2",
+    size: Literal[
+        "256x256",
+        "512x512",
+        "1024x1024",
+        "1792x1024",
+        "1024x1792",
+    ] = "256x256",
+    quality: Literal[
+        "auto",
+        "standard",
+        "hd",
+        "high",
+        "medium",
+        "low",
+    ] = "auto",
+    style: Literal["vivid", "natural"] = "vivid",
+    response_format: Literal["url", "b64_json"] = "url",
+    save_dir: str | None = None,
+) -> ToolResponse:
+    """
+    Generate image(s) based on the given prompt, and return image URL(s) or
+    base64 data.
+
+    Args:
+        prompt (`str`):
+            The text prompt to generate images.
+        api_key (`str`):
+            The API key for the OpenAI API.
+        n (`int`, defaults to `1`):
+            The number of images to generate.
+        model (`Literal["dall-e-2", "dall-e-3", "gpt-image-1"]`, defaults \
+        to `"dall-e-2"`):
+            The model to use for image generation.
+        size (`Literal["256x256", "512x512", "1024x1024", "1792x1024", \
+        "1024x1792"]`, defaults to `"256x256"`):
+            The size of the generated images.
+        quality (`Literal["auto", "standard", "hd", "high", "medium", \
+        "low"]`,  defaults to `"auto"`):
+            The quality of the image that will be generated.
+        style (`Literal["vivid", "natural"]`, defaults to `"vivid"`):
+            The style of the generated images, only supported for dall-e-3.
+        response_format (`Literal["url", "b64_json"]`, defaults to `"url"`):
+            The format in which generated images with dall-e-2 and dall-e-3
+            are returned. gpt-image-1 always returns base64-encoded images.
+        save_dir (`str | None`, optional):
+            The directory to save the generated images. If given, the images
+            are streamed to local files and returned by their paths.
+
+    Returns:
+        `ToolResponse`:
+            A ToolResponse containing the generated images or error
+            information if the operation failed.
+    """
+    kwargs = {
+        "model": model,
+        "prompt": prompt,
+        "n": n,
+        "size": size,
+    }
+    if model == "dall-e-3":
+        kwargs["style"] = style
+    if model != "dall-e-2":
+        kwargs["quality"] = quality
+    if model != "gpt-image-1":
+        kwargs["response_format"] = response_format
+    if model == "gpt-image-1":
+        response_format = "b64_json"
+
+    try:
+        client = _get_openai_client(api_key)
+        response = await client.images.generate(**kwargs)
+        return ToolResponse(
+            content=await _to_image_blocks(
+                response.data,
+                response_format,
+                save_dir,
+            ),
+        )
+    except Exception as e:
+        return ToolResponse(
+            [
+                TextBlock(
+                    type="text",
+                    text=f"Failed to generate image: {str(e)}",
+                ),
+            ],
+        )
+
+
+async def openai_edit_image_async(
+    image_url: str,
+    prompt: str,
+    api_key: str,
+    model: Literal["dall-e-2", "gpt-image-1"] = "dall-e-2",
+    mask_url: str | None = None,
+    n: int = 1,
+    size: Literal[
+        "256x256",
+        "512x512",
+        "1024x1024",
+    ] = "256x256",
+    response_format: Literal["url", "b64_json"] = "url",
+    save_dir: str | None = None,
+) -> ToolResponse:
+    """
+    Edit an image based on the provided mask and prompt, and return the edited
+    image URL(s) or base64 data.
+
+    Args:
+        image_url (`str`):
+            The file path or URL to the image that needs editing.
+        prompt (`str`):
+            The text prompt describing the edits to be made to the image.
+        api_key (`str`):
+            The API key for the OpenAI API.
+        model (`Literal["dall-e-2", "gpt-image-1"]`, defaults to `"dall-e-2"`):
+            The model to use for image generation.
+        mask_url (`str | None`, defaults to `None`):
+            The file path or URL to the mask image that specifies the regions
+            to be edited.
+        n (`int`, defaults to `1`):
+            The number of edited images to generate.
+        size (`Literal["256x256", "512x512", "1024x1024"]`, defaults to \
+        `"256x256"`):
+            The size of the edited images.
+        response_format (`Literal["url", "b64_json"]`, defaults to `"url"`):
+            The format in which generated images are returned. gpt-image-1
+            always returns base64-encoded images.
+        save_dir (`str | None`, optional):
+            The directory to save the edited images. If given, the images
+            are streamed to local files and returned by their paths.
+
+    Returns:
+        `ToolResponse`:
+            A ToolResponse containing the edited images or error information
+            if the operation failed.
+    """
+    try:
+        client = _get_openai_client(api_key)
+
+        # Load the image and the mask concurrently
+        images = await asyncio.gather(
+            _prepare_image(image_url),
+            *([_prepare_image(mask_url)] if mask_url else []),
+        )
+
+        kwargs = {
+            "model": model,
+            "image": images[0],
+            "prompt": prompt,
+            "n": n,
+            "size": size,
+        }
+        if mask_url:
+            kwargs["mask"] = images[1]
+
+        if model == "dall-e-2":
+            kwargs["response_format"] = response_format
+        else:
+            response_format = "b64_json"
+
+        response = await client.images.edit(**kwargs)
+        return ToolResponse(
+            content=await _to_image_blocks(
+                response.data,
+                response_format,
+                save_dir,
+            ),
+        )
+    except Exception as e:
+        return ToolResponse(
+            [
+                TextBlock(
+                    type="text",
+                    text=f"Failed to generate image: {str(e)}",
+                ),
+            ],
+        )
+
+
+async def openai_create_image_variation_async(
+    image_url: str,
+    api_key: str,
+    n: int = 1,
+    model: Literal["dall-e-2"] = "dall-e-2",
+    size: Literal[
+        "256x256",
+        "512x512",
+        "1024x1024",
+    ] = "256x256",
+    response_format: Literal["url", "b64_json"] = "url",
+    save_dir: str | None = None,
+) -> ToolResponse:
+    """
+    Create variations of an image and return the image URL(s) or base64 data.
+
+    Args:
+        image_url (`str`):
+            The file path or URL to the image from which variations will be
+            generated.
+        api_key (`str`):
+            The API key for the OpenAI API.
+        n (`int`, defaults to `1`):
+            The number of image variations to generate.
+        model (` Literal["dall-e-2"]`, default to `dall-e-2`):
+            The model to use for image variation.
+        size (`Literal["256x256", "512x512", "1024x1024"]`, defaults to \
+        `"256x256"`):
+            The size of the generated image variations.
+        response_format (`Literal["url", "b64_json"]`, defaults to `"url"`):
+            The format in which generated images are returned.
+        save_dir (`str | None`, optional):
+            The directory to save the generated images. If given, the images
+            are streamed to local files and returned by their paths.
+
+    Returns:
+        `ToolResponse`:
+            A ToolResponse containing the generated images or error
+            information if the operation failed.
+    """
+    try:
+        client = _get_openai_client(api_key)
+        image = BytesIO(await _read_bytes(image_url))
+        image.name = Path(urllib.parse.urlparse(image_url).path).name
+        response = await client.images.create_variation(
+            model=model,
+            image=image,
+            n=n,
+            size=size,
+            response_format=response_format,
+        )
+        return ToolResponse(
+            content=await _to_image_blocks(
+                response.data,
+                response_format,
+                save_dir,
+            ),
+        )
+    except Exception as e:
+        return ToolResponse(
+            [
+                TextBlock(
+                    type="text",
+                    text=f"Failed to generate image: {str(e)}",
+                ),
+            ],
+        )
+
+
+async def openai_image_to_text_async(
+    image_urls: str | list[str],
+    api_key: str,
+    prompt: str = "Describe the image",
+    model: str = "gpt-4o",
+) -> ToolResponse:
+    """
+    Generate descriptive text for given image(s) using a specified model, and
+    return the generated text.
+
+    Args:
+        image_urls (`str | list[str]`):
+            The URL or list of URLs pointing to the images that need to be
+            described.
+        api_key (`str`):
+            The API key for the OpenAI API.
+        prompt (`str`, defaults to `"Describe the image"`):
+            The prompt that instructs the model on how to describe
+            the image(s).
+        model (`str`, defaults to `"gpt-4o"`):
+            The model to use for generating the text descriptions.
+
+    Returns:
+        `ToolResponse`:
+            A ToolResponse containing the generated text or error information
+            if the operation failed.
+    """
+    if isinstance(image_urls, str):
+        image_urls = [image_urls]
+
+    try:
+        # The local images are read and encoded concurrently in threads
+        openai_urls = await _gather_bounded(
+            *[asyncio.to_thread(_to_openai_image_url, _) for _ in image_urls],
+        )
+        content: list = [
+            {"type": "image_url", "image_url": {"url": url}}
+            for url in openai_urls
+        ]
+        content.append({"type": "text", "text": prompt})
+
+        client = _get_openai_client(api_key)
+        response = await client.chat.completions.create(
+            messages=[{"role": "user", "content": content}],
+            model=model,
+        )
+        return ToolResponse(
+            [
+                TextBlock(
+                    type="text",
+                    text=response.choices[0].message.content,
+                ),
+            ],
+        )
+    except Exception as e:
+        return ToolResponse(
+            [
+                TextBlock(
+                    type="text",
+                    text=f"Failed to generate text: {str(e)}",
+                ),
+            ],
+        )
+
+
+async def openai_text_to_audio_async(
+    text: str,
+    api_key: str,
+    model: Literal["tts-1", "tts-1-hd", "gpt-4o-mini-tts"] = "tts-1",
+    voice: Literal[
+        "alloy",
+        "ash",
+        "ballad",
+        "coral",
+        "echo",
+        "fable",
+        "nova",
+        "onyx",
+        "sage",
+        "shimmer",
+    ] = "alloy",
+    speed: float = 1.0,
+    res_format: Literal[
+        "mp3",
+        "opus",
+        "aac",
+        "flac",
+        "wav",
+        "pcm",
+    ] = "mp3",
+    save_dir: str | None = None,
+) -> ToolResponse:
+    """
+    Convert text to an audio file using a specified model and voice.
+
+    Args:
+        text (`str`):
+            The text to convert to audio.
+        api_key (`str`):
+            The API key for the OpenAI API.
+        model (`Literal["tts-1", "tts-1-hd", "gpt-4o-mini-tts"]`, defaults \
+        to `"tts-1"`):
+            The model to use for text-to-speech conversion.
+        voice (`Literal["alloy", "ash", "ballad", "coral", "echo", "fable", \
+        "nova", "onyx", "sage", "shimmer"]`, defaults to `"alloy"`):
+            The voice to use for the audio output.
+        speed (`float`, defaults to `1.0`):
+            The speed of the audio playback. A value of 1.0 is normal speed.
+        res_format (`Literal["mp3", "opus", "aac", "flac", "wav", "pcm"]`, \
+        defaults to `"mp3"`):
+            The format of the audio file.
+        save_dir (`str | None`, optional):
+            The directory to save the audio. If given, the audio is streamed
+            to a local file as it's generated, and returned by its path.
+
+    Returns:
+        `ToolResponse`:
+            A ToolResponse containing the generated audio or error
+            information if the operation failed.
+    """
+    kwargs = {
+        "model": model,
+        "voice": voice,
+        "speed": speed,
+        "input": text,
+        "response_format": res_format,
+    }
+    try:
+        client = _get_openai_client(api_key)
+        if save_dir is not None:
+            path = _get_media_path(save_dir, res_format)
+            async with client.audio.speech.with_streaming_response.create(
+                **kwargs,
+            ) as response:
+                with open(path, "wb") as f:
+                    async for chunk in response.iter_bytes():
+                        f.write(chunk)
+            source = URLSource(type="url", url=path)
+
+        else:
+            response = await client.audio.speech.create(**kwargs)
+            source = Base64Source(
+                type="base64",
+                media_type=f"audio/{res_format}",
+                data=base64.b64encode(response.content).decode("utf-8"),
+            )
+
+        return ToolResponse([AudioBlock(type="audio", source=source)])
+
+    except Exception as e:
+        return ToolResponse(
+            [
+                TextBlock(
+                    type="text",
+                    text=f"Error: Failed to generate audio. {str(e)}",
+                ),
+            ],
+        )
+
+
+async def openai_audio_to_text_async(
+    audio_file_url: str,
+    api_key: str,
+    language: str = "en",
+    temperature: float = 0.2,
+) -> ToolResponse:
+    """
+    Convert an audio file to text using OpenAI's transcription service.
+
+    Args:
+        audio_file_url (`str`):
+            The file path or URL to the audio file that needs to be
+            transcribed.
+        api_key (`str`):
+            The API key for the OpenAI API.
+        language (`str`, defaults to `"en"`):
+            The language of the input audio in
+            `ISO-639-1 format \
+            <https://en.wikipedia.org/wiki/List_of_ISO_639-1_codes>`_
+            (e.g., "en", "zh", "fr"). Improves accuracy and latency.
+        temperature (`float`, defaults to `0.2`):
+            The temperature for the transcription, which affects the
+            randomness of the output.
+
+    Returns:
+        `ToolResponse`:
+            A ToolResponse containing the transcribed text or error
+            information if the operation failed.
+    """
+    try:
+        audio_buffer = BytesIO(await _read_bytes(audio_file_url))
+        audio_buffer.name = (
+            Path(urllib.parse.urlparse(audio_file_url).path).name
+            or "audio.mp3"
+        )
+
+        client = _get_openai_client(api_key)
+        transcription = await client.audio.transcriptions.create(
+            model="whisper-1",
+            file=audio_buffer,
+            language=language,
+            temperature=temperature,
+        )
+        return ToolResponse(
+            [
+                TextBlock(
+                    type="text",
+                    text=transcription.text,
+                ),
+            ],
+        )
+    except Exception as e:
+        return ToolResponse(
+            [
+                TextBlock(
+                    type="text",
+                    text=f"Error: Failed to transcribe audio: {str(e)}",
+                ),
+            ],
+        )
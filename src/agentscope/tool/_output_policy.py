@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+"""The output policy of tool functions, which limits the size of the tool
+results kept in the agent memory."""
+from dataclasses import dataclass
+
+from ..message import BlobStore, TextBlock
+
+
+@dataclass
+class ToolOutputPolicy:
+    """The output policy of a tool function. If the text output of a tool
+    call exceeds the maximum inline size, only its head and tail are kept in
+    the tool result, and the full text is spilled to a blob store, so that
+    the agent can page through it on demand instead of carrying it in every
+    later prompt."""
+
+    max_inline_chars: int = 20000
+    """The maximum number of characters of the text output kept inline."""
+
+    head_chars: int = 8000
+    """The number of characters kept from the head of a truncated output."""
+
+    tail_chars: int = 4000
+    """The number of characters kept from the tail of a truncated output."""
+
+    spill: bool = True
+    """Whether to spill the full text output to the blob store. If `False`,
+    the omitted part is dropped."""
+
+    spill_media: bool = True
+    """Whether to move the base64 data of the image, audio and video outputs
+    to the blob store, so that the tool result only carries the blob
+    references, which are resolved by the formatters when building the
+    requests."""
+
+    def __post_init__(self) -> None:
+        """Validate the policy."""
+        if self.head_chars + self.tail_chars > self.max_inline_chars:
+            raise ValueError(
+                "The sum of head_chars and tail_chars should not exceed "
+                "max_inline_chars.",
+            )
+
+    def apply(
+        self,
+        content: list[dict],
+        blob_store: BlobStore | None = None,
+    ) -> list[dict]:
+        """Apply the policy to the output blocks of a tool result.
+
+        Args:
+            content (`list[dict]`):
+                The output blocks of the tool result.
+            blob_store (`BlobStore | None`, optional):
+                The blob store to spill the full text output.
+
+        Returns:
+            `list[dict]`:
+                The output blocks, where the text blocks are merged and
+                truncated if the text exceeds the maximum inline size, and
+                the base64 media are replaced by the blob references if
+                `spill_media` is enabled.
+        """
+        if self.spill_media and blob_store is not None:
+            content = [
+                (
+                    {
+                        **_,
+                        "source": blob_store.put_source(
+                            _["source"]["data"],
+                            _["source"]["media_type"],
+                        ),
+                    }
+                    if _.get("type") in ["image", "audio", "video"]
+                    and _.get("source", {}).get("type") == "base64"
+                    else _
+                )
+                for _ in content
+            ]
+
+        text_blocks = [_ for _ in content if _.get("type") == "text"]
+        text = "\n".join(_["text"] for _ in text_blocks)
+        if len(text) <= self.max_inline_chars:
+            return content
+
+        n_omitted = len(text) - self.head_chars - self.tail_chars
+        if self.spill and blob_store is not None:
+            blob_id = blob_store.put(text)
+            note = (
+                f"[... {n_omitted} characters omitted. The full output "
+                f"({len(text)} characters) is stored in blob {blob_id}, call "
+                f'view_tool_output(blob_id="{blob_id}", '
+                f"offset={self.head_chars}) to read the omitted part ...]"
+            )
+        else:
+            note = f"[... {n_omitted} characters omitted ...]"
+
+        truncated = TextBlock(
+            type="text",
+            text=(
+                text[: self.head_chars]
+                + f"\n\n{note}\n\n"
+                + (text[-self.tail_chars :] if self.tail_chars > 0 else "")
+            ),
+        )
+
+        # Replace the text blocks with the truncated one at the position of
+        # the first text block
+        index = content.index(text_blocks[0])
+        others = [_ for _ in content if _.get("type") != "text"]
+        return [*others[:index], truncated, *others[index:]]
@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
+# pylint: disable=too-many-lines
 """The toolkit class for tool calls in agentscope."""
 
 import asyncio
@@ -35,6 +36,7 @@ from .._utils._common import _remove_title_field
 from ..mcp import (
     MCPToolFunction,
     MCPClientBase,
+    MCPToolCache,
     StatefulClientBase,
 )
 from ..message import (
@@ -100,6 +102,11 @@ class Toolkit(StateModule):
         self.tools: dict[str, RegisteredToolFunction] = {}
         self.groups: dict[str, ToolGroup] = {}
 
+        # The cached JSON schemas and the toolkit fingerprint they are built
+        # from, see `get_json_schemas`
+        self._json_schemas: list[dict] | None = None
+        self._json_schemas_fingerprint: tuple | None = None
+
     def create_tool_group(
         self,
         group_name: str,
@@ -399,10 +406,23 @@ class Toolkit(StateModule):
                     ...
                 ]
 
+        .. note:: The JSON schemas are cached and only rebuilt when the tool
+         functions, the tool groups, their activation status or the extended
+         models change. The same list object is returned until then, so it
+         can be used as a memoization key, and **must not be modified in
+         place**.
+
         Returns:
             `list[dict]`:
                 A list of function JSON schemas.
         """
+        fingerprint = self._get_json_schemas_fingerprint()
+        if (
+            self._json_schemas is not None
+            and fingerprint == self._json_schemas_fingerprint
+        ):
+            return self._json_schemas
+
         # If meta tool is set here, update its extended model here
         if "reset_equipped_tools" in self.tools:
             fields = {}
@@ -422,11 +442,34 @@ class Toolkit(StateModule):
                 extended_model,
             )
 
-        return [
+        self._json_schemas = [
             tool.extended_json_schema
             for tool in self.tools.values()
             if tool.group == "basic" or self.groups[tool.group].active
         ]
+        # Computed after updating the extended model of the meta tool
+        self._json_schemas_fingerprint = self._get_json_schemas_fingerprint()
+        return self._json_schemas
+
+    def _get_json_schemas_fingerprint(self) -> tuple:
+        """Get a cheap fingerprint of the toolkit states that the JSON
+        schemas depend on, so that the cached schemas are invalidated even if
+        the `tools` and `groups` attributes are modified directly.
+
+        .. note:: The tuples are compared by identity first, so comparing
+         the fingerprints of an unchanged toolkit doesn't compare the tool
+         functions field by field.
+        """
+        return (
+            tuple(
+                (name, group.active, group.description)
+                for name, group in self.groups.items()
+            ),
+            tuple(
+                (tool, tool.group, tool.extended_model)
+                for tool in self.tools.values()
+            ),
+        )
 
     def set_extended_model(
         self,
@@ -523,6 +566,7 @@ class Toolkit(StateModule):
                             f"function named {tool_call['name']}",
                         ),
                     ],
+                    metadata={"success": False},
                 ),
                 None,
             )
@@ -577,6 +621,7 @@ class Toolkit(StateModule):
                         text=f"Error: {e}",
                     ),
                 ],
+                metadata={"success": False},
             )
 
         # Handle different return type
@@ -613,6 +658,7 @@ class Toolkit(StateModule):
             ToolResponse | None,
         ]
         | None = None,
+        tool_cache: MCPToolCache | None = None,
     ) -> None:
         """Register tool functions from an MCP client.
 
@@ -639,15 +685,78 @@ class Toolkit(StateModule):
                 result will be returned as is. If it returns a
                 `ToolResponse`, the returned block will be used as the
                 final tool result.
+            tool_cache (`MCPToolCache | None`, optional):
+                The disk cache of the tool schemas. If provided, the tools
+                are loaded from the cache when the server version matches.
         """
-        if (
-            isinstance(mcp_client, StatefulClientBase)
-            and not mcp_client.is_connected
-        ):
-            raise RuntimeError(
-                "The MCP client is not connected to the server. Use the "
-                "`connect()` method first.",
-            )
+        await self.register_mcp_clients(
+            [mcp_client],
+            group_name=group_name,
+            enable_funcs=enable_funcs,
+            disable_funcs=disable_funcs,
+            preset_kwargs_mapping=preset_kwargs_mapping,
+            postprocess_func=postprocess_func,
+            tool_cache=tool_cache,
+        )
+
+    async def register_mcp_clients(
+        self,
+        mcp_clients: list[MCPClientBase],
+        group_name: str = "basic",
+        enable_funcs: list[str] | None = None,
+        disable_funcs: list[str] | None = None,
+        preset_kwargs_mapping: dict[str, dict[str, Any]] | None = None,
+        postprocess_func: Callable[
+            [
+                ToolUseBlock,
+                ToolResponse,
+            ],
+            ToolResponse | None,
+        ]
+        | None = None,
+        tool_cache: MCPToolCache | None = None,
+    ) -> None:
+        """Register tool functions from multiple MCP clients. The tools of
+        all the MCP servers are discovered concurrently, and the listed tool
+        metadata is reused to create the tool functions. If the discovery
+        fails on any server, no tool function will be registered.
+
+        Args:
+            mcp_clients (`list[MCPClientBase]`):
+                The MCP client instances to connect to the MCP servers.
+            group_name (`str`, defaults to `"basic"`):
+                The group name that the tool functions will be added to.
+            enable_funcs (`list[str] | None`, optional):
+                The functions to be added into the toolkit. If `None`, all
+                tool functions within the MCP servers will be added.
+            disable_funcs (`list[str] | None`, optional):
+                The functions that will be filtered out. If `None`, no
+                tool functions will be filtered out.
+            preset_kwargs_mapping: (`Optional[dict[str, dict[str, Any]]]`, \
+            defaults to `None`):
+                The preset keyword arguments mapping, whose keys are the tool
+                function names and values are the preset keyword arguments.
+            postprocess_func (`Callable[[ToolUseBlock, ToolResponse], \
+            ToolResponse | None] | None`, optional):
+                A post-processing function that will be called after the tool
+                function is executed, taking the tool call block and tool
+                response as arguments. If it returns `None`, the tool
+                result will be returned as is. If it returns a
+                `ToolResponse`, the returned block will be used as the
+                final tool result.
+            tool_cache (`MCPToolCache | None`, optional):
+                The disk cache of the tool schemas. If provided, the tools
+                are loaded from the cache when the server version matches.
+        """
+        for mcp_client in mcp_clients:
+            if (
+                isinstance(mcp_client, StatefulClientBase)
+                and not mcp_client.is_connected
+            ):
+                raise RuntimeError(
+                    f"The MCP client {mcp_client.name} is not connected to "
+                    "the server. Use the `connect()` method first.",
+                )
 
         # Check arguments for enable_funcs and disabled_funcs
         if enable_funcs is not None and disable_funcs is not None:
@@ -681,44 +790,55 @@ class Toolkit(StateModule):
                 f"but got {type(preset_kwargs_mapping)}.",
             )
 
-        tool_names = []
-        for mcp_tool in await mcp_client.list_tools():
-            # Skip the functions that are not in the enable_funcs if
-            # enable_funcs is not None
-            if enable_funcs is not None and mcp_tool.name not in enable_funcs:
-                continue
+        async def _discover(
+            mcp_client: MCPClientBase,
+        ) -> list[Callable]:
+            """List the tools of the MCP client and create the functions."""
+            if tool_cache is None:
+                mcp_tools = await mcp_client.list_tools()
+            else:
+                mcp_tools = await tool_cache.list_tools(mcp_client)
+
+            mcp_tools = [
+                _
+                for _ in mcp_tools
+                if (enable_funcs is None or _.name in enable_funcs)
+                and (disable_funcs is None or _.name not in disable_funcs)
+            ]
+            return await mcp_client.get_callable_functions(
+                mcp_tools,
+                wrap_tool_result=True,
+            )
 
-            # Skip the disabled functions
-            if disable_funcs is not None and mcp_tool.name in disable_funcs:
-                continue
+        all_func_objs = await asyncio.gather(
+            *[_discover(_) for _ in mcp_clients],
+        )
 
-            tool_names.append(mcp_tool.name)
+        for mcp_client, func_objs in zip(mcp_clients, all_func_objs):
+            for func_obj in func_objs:
+                # Prepare preset kwargs
+                preset_kwargs = None
+                if preset_kwargs_mapping is not None:
+                    preset_kwargs = preset_kwargs_mapping.get(
+                        func_obj.name,
+                        {},
+                    )
 
-            # Obtain callable function object
-            func_obj = await mcp_client.get_callable_function(
-                func_name=mcp_tool.name,
-                wrap_tool_result=True,
-            )
+                # TODO: handle mcp_server_name
+                self.register_tool_function(
+                    tool_func=func_obj,
+                    group_name=group_name,
+                    preset_kwargs=preset_kwargs,
+                    postprocess_func=postprocess_func,
+                )
 
-            # Prepare preset kwargs
-            preset_kwargs = None
-            if preset_kwargs_mapping is not None:
-                preset_kwargs = preset_kwargs_mapping.get(mcp_tool.name, {})
-
-            # TODO: handle mcp_server_name
-            self.register_tool_function(
-                tool_func=func_obj,
-                group_name=group_name,
-                preset_kwargs=preset_kwargs,
-                postprocess_func=postprocess_func,
+            logger.info(
+                "Registered %d tool functions from MCP %s: %s.",
+                len(func_objs),
+                mcp_client.name,
+                ", ".join(_.name for _ in func_objs),
             )
 
-        logger.info(
-            "Registered %d tool functions from MCP: %s.",
-            len(tool_names),
-            ", ".join(tool_names),
-        )
-
     def state_dict(self) -> dict[str, Any]:
         """Get the state dictionary of the toolkit.
 
@@ -2,13 +2,15 @@
 """Attributes processor for span attributes."""
 import datetime
 import enum
+import hashlib
 import inspect
 import json
-from dataclasses import is_dataclass
+from dataclasses import fields, is_dataclass
 from typing import Any
 
 from pydantic import BaseModel
 
+from .. import _config
 from ..message import Msg
 
 
@@ -36,12 +38,20 @@ def _to_serializable(
     elif isinstance(obj, dict):
         res = {str(key): _to_serializable(val) for (key, val) in obj.items()}
 
-    elif isinstance(obj, (Msg, BaseModel)) or is_dataclass(obj):
-        res = repr(obj)
+    elif isinstance(obj, Msg):
+        res = _to_serializable(obj.to_dict())
 
-    elif inspect.isclass(obj) and issubclass(obj, BaseModel):
+    elif inspect.isclass(obj):
         res = repr(obj)
 
+    elif isinstance(obj, BaseModel):
+        res = _to_serializable(obj.model_dump())
+
+    elif is_dataclass(obj):
+        res = {
+            _.name: _to_serializable(getattr(obj, _.name)) for _ in fields(obj)
+        }
+
     elif isinstance(obj, (datetime.date, datetime.datetime, datetime.time)):
         res = obj.isoformat()
 
@@ -57,9 +67,47 @@ def _to_serializable(
     return res
 
 
+def _cap_bytes(text: str, max_bytes: int | None) -> str:
+    """Truncate the text to the given number of UTF-8 bytes, including the
+    appended original size and SHA-256 hash of the full text, so that the
+    identical payloads can still be correlated across spans.
+
+    Args:
+        text (`str`):
+            The text to be capped.
+        max_bytes (`int | None`):
+            The maximum number of bytes. If `None`, the text is returned as
+            it is.
+
+    Returns:
+        `str`:
+            The capped text.
+    """
+    # A character takes at most 4 bytes in UTF-8
+    if max_bytes is None or len(text) * 4 <= max_bytes:
+        return text
+
+    encoded = text.encode("utf-8")
+    if len(encoded) <= max_bytes:
+        return text
+
+    digest = hashlib.sha256(encoded).hexdigest()
+    suffix = f"...[truncated, {len(encoded)} bytes, sha256:{digest}]"
+    # Reserve the bytes of the (ASCII) suffix, which is cut itself only if
+    # the limit is too small to hold it
+    head = encoded[: max(max_bytes - len(suffix), 0)].decode(
+        "utf-8",
+        errors="ignore",
+    )
+    return f"{head}{suffix}"[:max_bytes]
+
+
 def _serialize_to_str(value: Any) -> str:
     """Get input attributes
 
+    .. note:: The serialized string is capped by
+     `_config.trace_max_attribute_bytes`.
+
     Args:
         value (`Any`):
             The input value
@@ -69,10 +117,15 @@ def _serialize_to_str(value: Any) -> str:
             JSON serialized string of the input value
     """
     try:
-        return json.dumps(value, ensure_ascii=False)
-
-    except TypeError:
-        return json.dumps(
-            _to_serializable(value),
+        # The non-serializable objects are converted on demand in a single
+        # pass, instead of re-walking the whole value after a failure
+        text = json.dumps(
+            value,
             ensure_ascii=False,
+            default=_to_serializable,
         )
+
+    except (TypeError, ValueError):
+        text = json.dumps(str(value), ensure_ascii=False)
+
+    return _cap_bytes(text, _config.trace_max_attribute_bytes)
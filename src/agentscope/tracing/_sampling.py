@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+"""The trace sampler in agentscope."""
+from typing import Sequence
+
+from opentelemetry.context import Context
+from opentelemetry.sdk.trace.sampling import (
+    Decision,
+    ParentBased,
+    Sampler,
+    SamplingResult,
+    TraceIdRatioBased,
+)
+from opentelemetry.trace import Link, SpanKind, TraceState, get_current_span
+from opentelemetry.util.types import Attributes
+
+from ._types import SpanAttributes
+
+
+class TraceSampler(Sampler):
+    """The sampler of agentscope, which samples the traces by a ratio at the
+    root span (head-based), and lets the child spans follow the decision of
+    their parents. The spans marked by the tail-based sampling are always
+    recorded, even if their traces are not sampled at the head."""
+
+    def __init__(self, sample_rate: float = 1.0) -> None:
+        """Initialize the trace sampler.
+
+        Args:
+            sample_rate (`float`, defaults to `1.0`):
+                The ratio of the traces sampled at the root span, ranging
+                from 0 to 1.
+        """
+        if not 0 <= sample_rate <= 1:
+            raise ValueError(
+                f"The sample rate should be in [0, 1], got {sample_rate}.",
+            )
+        self.sample_rate = sample_rate
+        self._head_sampler = ParentBased(TraceIdRatioBased(sample_rate))
+
+    def should_sample(
+        self,
+        parent_context: Context | None,
+        trace_id: int,
+        name: str,
+        kind: SpanKind | None = None,
+        attributes: Attributes = None,
+        links: Sequence[Link] | None = None,
+        trace_state: TraceState | None = None,
+    ) -> SamplingResult:
+        """Record the tail-sampled spans, and delegate the others to the
+        parent-based ratio sampler."""
+        if attributes and attributes.get(SpanAttributes.TAIL_SAMPLED):
+            return SamplingResult(
+                Decision.RECORD_AND_SAMPLE,
+                attributes,
+                get_current_span(parent_context)
+                .get_span_context()
+                .trace_state,
+            )
+
+        return self._head_sampler.should_sample(
+            parent_context,
+            trace_id,
+            name,
+            kind,
+            attributes,
+            links,
+            trace_state,
+        )
+
+    def get_description(self) -> str:
+        """The description of the sampler."""
+        return f"AgentScopeTraceSampler{{{self.sample_rate}}}"
@@ -3,12 +3,37 @@
 from agentscope import _config
 
 
-def setup_tracing(endpoint: str) -> None:
+def setup_tracing(
+    endpoint: str,
+    sample_rate: float = 1.0,
+    sample_errors: bool = True,
+    slow_threshold: float | None = None,
+    max_attribute_bytes: int | None = 32 * 1024,
+) -> None:
     """Set up the AgentScope tracing by configuring the endpoint URL.
 
+    The traces are sampled at the root span by `sample_rate` (head-based),
+    and the inputs and outputs of the unsampled spans are never serialized.
+    The spans that raise errors or run slower than `slow_threshold` are still
+    recorded when they finish (tail-based), even if their traces are not
+    sampled.
+
     Args:
         endpoint (`str`):
             The endpoint URL for the tracing exporter.
+        sample_rate (`float`, defaults to `1.0`):
+            The ratio of the traces sampled at the root span, ranging from 0
+            to 1.
+        sample_errors (`bool`, defaults to `True`):
+            Whether to record the unsampled spans that raise errors.
+        slow_threshold (`float | None`, optional):
+            The duration in seconds, beyond which the unsampled spans are
+            recorded. If not provided, the slow spans are not tail-sampled.
+        max_attribute_bytes (`int | None`, defaults to `32 * 1024`):
+            The maximum number of UTF-8 bytes of the serialized input and
+            output attributes. The longer ones are truncated, with their
+            original size and SHA-256 hash appended. If `None`, the
+            attributes are not truncated.
     """
     # Lazy import
     from opentelemetry.sdk.trace import TracerProvider
@@ -18,10 +43,15 @@ def setup_tracing(endpoint: str) -> None:
     )
     from opentelemetry import trace
 
-    tracer_provider = TracerProvider()
+    from ._sampling import TraceSampler
+
+    tracer_provider = TracerProvider(sampler=TraceSampler(sample_rate))
     exporter = OTLPSpanExporter(endpoint=endpoint)
     span_processor = BatchSpanProcessor(exporter)
     tracer_provider.add_span_processor(span_processor)
     trace.set_tracer_provider(tracer_provider)
 
+    _config.trace_sample_errors = sample_errors
+    _config.trace_slow_threshold = slow_threshold
+    _config.trace_max_attribute_bytes = max_attribute_bytes
     _config.trace_enabled = True
@@ -2,7 +2,8 @@
 """The tracing decorators for agent, formatter, toolkit, chat and embedding
 models."""
 import inspect
-from functools import wraps
+import time
+from functools import partial, wraps
 from typing import (
     Generator,
     AsyncGenerator,
@@ -13,12 +14,16 @@ from typing import (
     TYPE_CHECKING,
 )
 
-import aioitertools
-
 from ._attributes import _serialize_to_str
 from .. import _config
 from ..embedding._embedding_base import EmbeddingModelBase
 from ..model._model_base import ChatModelBase
+from ..metrics._builtin import (
+    _check_metrics_enabled,
+    _record_chat,
+    _record_embedding,
+    _record_tool_call,
+)
 from .._logging import logger
 from ._types import SpanKind, SpanAttributes
 
@@ -60,81 +65,253 @@ def _check_tracing_enabled() -> bool:
     return _config.trace_enabled
 
 
-def _trace_sync_generator_wrapper(
-    res: Generator[T, None, None],
-    span: Span,
-) -> Generator[T, None, None]:
-    """Trace the sync generator output with OpenTelemetry."""
+class _TracedCall:
+    """A traced call, which evaluates the span attributes lazily. Entering
+    it starts the span and sets it as the current span, so that the nested
+    calls are traced as its children. If the tracing is disabled, only the
+    `on_finish` callback is called to record the metrics.
+
+    The input and output attributes are serialized only if the span is
+    sampled at the head, or if the call is kept by the tail-based sampling,
+    i.e. it raises an error or exceeds the slow threshold. In the latter
+    case, the span is recorded retrospectively with the original start time
+    when the call finishes.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        get_attributes: Callable[[], dict[str, Any]],
+        on_finish: Callable[[Any, BaseException | None, float], None]
+        | None = None,
+    ) -> None:
+        """Initialize the traced call.
+
+        Args:
+            name (`str`):
+                The name of the span.
+            get_attributes (`Callable[[], dict[str, Any]]`):
+                A function that returns the span attributes, which is called
+                only when the span is recorded.
+            on_finish (`Callable[[Any, BaseException | None, float], None] \
+            | None`, optional):
+                The callback to record the metrics when the call finishes,
+                which takes the output, the error and the elapsed time in
+                seconds.
+        """
+        self.name = name
+        self.get_attributes = get_attributes
+        self.on_finish = on_finish
+        self.span: Span | None = None
+        self._parent_context = None
+        self._start_time = 0
+        self._span_context_manager = None
+
+    def __enter__(self) -> "_TracedCall":
+        """Start the span and set it as the current span."""
+        import opentelemetry
+
+        self._start_time = time.time_ns()
+        if not _check_tracing_enabled():
+            self.span = opentelemetry.trace.INVALID_SPAN
+            return self
+
+        tracer = opentelemetry.trace.get_tracer(__name__)
+
+        self._parent_context = opentelemetry.context.get_current()
+        self.span = tracer.start_span(self.name, start_time=self._start_time)
+        if self.span.is_recording():
+            self.span.set_attributes(self.get_attributes())
+
+        # The span is ended by the `finish` method, which may be called
+        # after exiting, e.g. when the generator output is exhausted
+        self._span_context_manager = opentelemetry.trace.use_span(
+            self.span,
+            end_on_exit=False,
+            record_exception=False,
+            set_status_on_exception=False,
+        )
+        self._span_context_manager.__enter__()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Restore the current span."""
+        if self._span_context_manager is not None:
+            self._span_context_manager.__exit__(*args)
+
+    @property
+    def needs_output(self) -> bool:
+        """If the output is needed when the call finishes, otherwise the
+        generator outputs don't need to be wrapped."""
+        if self.on_finish is not None and _check_metrics_enabled():
+            return True
+        return self.span.is_recording() or (
+            _check_tracing_enabled()
+            and (
+                _config.trace_sample_errors
+                or _config.trace_slow_threshold is not None
+            )
+        )
+
+    def finish(
+        self,
+        output: Any = None,
+        error: BaseException | None = None,
+    ) -> None:
+        """Finish the call with the output or the error.
+
+        Args:
+            output (`Any`, optional):
+                The output of the call.
+            error (`BaseException | None`, optional):
+                The error raised by the call.
+        """
+        elapsed = (time.time_ns() - self._start_time) / 1e9
+        if self.on_finish is not None and _check_metrics_enabled():
+            try:
+                self.on_finish(output, error, elapsed)
+            except Exception as e:
+                logger.warning("Failed to record the metrics: %s", str(e))
+
+        if self.span.is_recording():
+            self._record(self.span, output, error)
+            self.span.end()
+            return
+
+        self.span.end()
 
-    import opentelemetry
+        # Tail-based sampling
+        if not _check_tracing_enabled() or not (
+            error is not None
+            and _config.trace_sample_errors
+            or _config.trace_slow_threshold is not None
+            and elapsed >= _config.trace_slow_threshold
+        ):
+            return
 
-    has_error = False
+        import opentelemetry
+
+        tracer = opentelemetry.trace.get_tracer(__name__)
+        span = tracer.start_span(
+            self.name,
+            context=self._parent_context,
+            attributes={
+                **self.get_attributes(),
+                SpanAttributes.TAIL_SAMPLED: True,
+            },
+            start_time=self._start_time,
+        )
+        self._record(span, output, error)
+        span.end()
+
+    @staticmethod
+    def _record(
+        span: Span,
+        output: Any,
+        error: BaseException | None,
+    ) -> None:
+        """Record the output or the error in the span."""
+        import opentelemetry
+
+        if error is not None:
+            span.set_status(opentelemetry.trace.StatusCode.ERROR, str(error))
+            span.record_exception(error)
+        else:
+            span.set_attributes(
+                {
+                    SpanAttributes.OUTPUT: _serialize_to_str(output),
+                    **_get_stream_attributes(output),
+                },
+            )
+            span.set_status(opentelemetry.trace.StatusCode.OK)
+
+
+def _get_stream_attributes(output: Any) -> dict[str, float]:
+    """Get the latency attributes of a streaming chat response, so that they
+    can be queried without parsing the output."""
+    stats = getattr(output, "stream_stats", None)
+    if stats is None:
+        return {}
 
+    attributes = {SpanAttributes.LLM_MAX_CHUNK_GAP: stats.max_chunk_gap}
+    if stats.time_to_first_token is not None:
+        attributes[
+            SpanAttributes.LLM_TIME_TO_FIRST_TOKEN
+        ] = stats.time_to_first_token
+    if stats.tokens_per_second is not None:
+        attributes[
+            SpanAttributes.LLM_TOKENS_PER_SECOND
+        ] = stats.tokens_per_second
+    return attributes
+
+
+def _trace_sync_generator_wrapper(
+    res: Generator[T, None, None],
+    call: _TracedCall,
+) -> Generator[T, None, None]:
+    """Trace the sync generator output with OpenTelemetry. Only the last
+    chunk is retained as the output."""
+    error = None
+    last_chunk = None
     try:
-        last_chunk = None
         for chunk in res:
             last_chunk = chunk
             yield chunk
+
     except Exception as e:
-        has_error = True
-        span.set_status(opentelemetry.trace.StatusCode.ERROR, str(e))
-        span.record_exception(e)
+        error = e
         raise e from None
 
     finally:
-        if not has_error:
-            # Set the last chunk as output
-            span.set_attributes(
-                {
-                    SpanAttributes.OUTPUT: _serialize_to_str(last_chunk),
-                },
-            )
-            span.set_status(opentelemetry.trace.StatusCode.OK)
-        span.end()
+        call.finish(output=last_chunk, error=error)
 
 
 async def _trace_async_generator_wrapper(
     res: AsyncGenerator[T, None],
-    span: Span,
+    call: _TracedCall,
 ) -> AsyncGenerator[T, None]:
-    """Trace the async generator output with OpenTelemetry.
+    """Trace the async generator output with OpenTelemetry. Only the last
+    chunk is retained as the output.
 
     Args:
         res (`AsyncGenerator[T, None]`):
             The generator or async generator to be traced.
-        span (`Span`):
-            The OpenTelemetry span to be used for tracing.
+        call (`_TracedCall`):
+            The traced call that the generator belongs to.
 
     Yields:
         `T`:
             The output of the async generator.
     """
-    import opentelemetry
-
-    has_error = False
-
+    error = None
+    last_chunk = None
     try:
-        last_chunk = None
-        async for chunk in aioitertools.iter(res):
+        async for chunk in res:
             last_chunk = chunk
             yield chunk
 
     except Exception as e:
-        has_error = True
-        span.set_status(opentelemetry.trace.StatusCode.ERROR, str(e))
-        span.record_exception(e)
+        error = e
         raise e from None
 
     finally:
-        if not has_error:
-            # Set the last chunk as output
-            span.set_attributes(
-                {
-                    SpanAttributes.OUTPUT: _serialize_to_str(last_chunk),
-                },
-            )
-            span.set_status(opentelemetry.trace.StatusCode.OK)
-        span.end()
+        call.finish(output=last_chunk, error=error)
+
+
+def _wrap_result(res: Any, call: _TracedCall) -> Any:
+    """Finish the traced call with a non-generator result, or wrap the
+    generator result to finish the call when it's exhausted."""
+    if isinstance(res, (AsyncGenerator, Generator)):
+        if not call.needs_output:
+            # Nothing to record, so avoid the per-chunk overhead
+            call.span.end()
+            return res
+        if isinstance(res, AsyncGenerator):
+            return _trace_async_generator_wrapper(res, call)
+        return _trace_sync_generator_wrapper(res, call)
+
+    call.finish(output=res)
+    return res
 
 
 def trace(
@@ -167,6 +344,23 @@ def trace(
                 A wrapper function that traces the function call and handles
                 input/output and exceptions.
         """
+
+        def _get_attributes(args: tuple, kwargs: dict) -> dict[str, Any]:
+            """Get the span attributes of the function call."""
+            return {
+                SpanAttributes.SPAN_KIND: SpanKind.COMMON,
+                SpanAttributes.PROJECT_RUN_ID: _serialize_to_str(
+                    _config.run_id,
+                ),
+                SpanAttributes.INPUT: _serialize_to_str(
+                    {
+                        "args": args,
+                        "kwargs": kwargs,
+                    },
+                ),
+                SpanAttributes.META: _serialize_to_str({}),
+            }
+
         # Async function
         if inspect.iscoroutinefunction(func):
 
@@ -179,53 +373,17 @@ def trace(
                 if not _check_tracing_enabled():
                     return await func(*args, **kwargs)
 
-                import opentelemetry
-
-                tracer = opentelemetry.trace.get_tracer(__name__)
-
-                attributes = {
-                    SpanAttributes.SPAN_KIND: SpanKind.COMMON,
-                    SpanAttributes.PROJECT_RUN_ID: _serialize_to_str(
-                        _config.run_id,
-                    ),
-                    SpanAttributes.INPUT: _serialize_to_str(
-                        {
-                            "args": args,
-                            "kwargs": kwargs,
-                        },
-                    ),
-                    SpanAttributes.META: _serialize_to_str({}),
-                }
-
-                with tracer.start_as_current_span(
-                    name=name,
-                    attributes=attributes,
-                    end_on_exit=False,
-                ) as span:
+                call = _TracedCall(
+                    name,
+                    lambda: _get_attributes(args, kwargs),
+                )
+                with call:
                     try:
                         res = await func(*args, **kwargs)
-
-                        # If generator or async generator
-                        if isinstance(res, AsyncGenerator):
-                            return _trace_async_generator_wrapper(res, span)
-                        if isinstance(res, Generator):
-                            return _trace_sync_generator_wrapper(res, span)
-
-                        # non-generator result
-                        span.set_attributes(
-                            {SpanAttributes.OUTPUT: _serialize_to_str(res)},
-                        )
-                        span.set_status(opentelemetry.trace.StatusCode.OK)
-                        span.end()
-                        return res
+                        return _wrap_result(res, call)
 
                     except Exception as e:
-                        span.set_status(
-                            opentelemetry.trace.StatusCode.ERROR,
-                            str(e),
-                        )
-                        span.record_exception(e)
-                        span.end()
+                        call.finish(error=e)
                         raise e from None
 
             return wrapper
@@ -240,53 +398,14 @@ def trace(
             if not _check_tracing_enabled():
                 return func(*args, **kwargs)
 
-            import opentelemetry
-
-            tracer = opentelemetry.trace.get_tracer(__name__)
-
-            attributes = {
-                SpanAttributes.SPAN_KIND: SpanKind.COMMON,
-                SpanAttributes.PROJECT_RUN_ID: _serialize_to_str(
-                    _config.run_id,
-                ),
-                SpanAttributes.INPUT: _serialize_to_str(
-                    {
-                        "args": args,
-                        "kwargs": kwargs,
-                    },
-                ),
-                SpanAttributes.META: _serialize_to_str({}),
-            }
-
-            with tracer.start_as_current_span(
-                name=name,
-                attributes=attributes,
-                end_on_exit=False,
-            ) as span:
+            call = _TracedCall(name, lambda: _get_attributes(args, kwargs))
+            with call:
                 try:
                     res = func(*args, **kwargs)
-
-                    # If generator or async generator
-                    if isinstance(res, AsyncGenerator):
-                        return _trace_async_generator_wrapper(res, span)
-                    if isinstance(res, Generator):
-                        return _trace_sync_generator_wrapper(res, span)
-
-                    # non-generator result
-                    span.set_attributes(
-                        {SpanAttributes.OUTPUT: _serialize_to_str(res)},
-                    )
-                    span.set_status(opentelemetry.trace.StatusCode.OK)
-                    span.end()
-                    return res
+                    return _wrap_result(res, call)
 
                 except Exception as e:
-                    span.set_status(
-                        opentelemetry.trace.StatusCode.ERROR,
-                        str(e),
-                    )
-                    span.record_exception(e)
-                    span.end()
+                    call.finish(error=e)
                     raise e from None
 
         return sync_wrapper
@@ -309,48 +428,40 @@ def trace_toolkit(
     ) -> AsyncGenerator[ToolResponse, None]:
         """The wrapper function for tracing the toolkit call_tool_function
         method."""
-        if not _check_tracing_enabled():
+        if not _check_tracing_enabled() and not _check_metrics_enabled():
             return await func(self, tool_call=tool_call)
 
-        import opentelemetry
-
-        tracer = opentelemetry.trace.get_tracer(__name__)
-
         # Prepare the attributes for the span
-        attributes = {
-            SpanAttributes.SPAN_KIND: _serialize_to_str(SpanKind.TOOL),
-            SpanAttributes.PROJECT_RUN_ID: _serialize_to_str(_config.run_id),
-            SpanAttributes.INPUT: _serialize_to_str(
-                {
-                    "tool_call": tool_call,
-                },
-            ),
-            SpanAttributes.META: _serialize_to_str(
-                {
-                    **tool_call,
-                },
-            ),
-        }
-
-        with tracer.start_as_current_span(
+        call = _TracedCall(
             f"{func.__name__}",
-            attributes=attributes,
-            end_on_exit=False,
-        ) as span:
+            lambda: {
+                SpanAttributes.SPAN_KIND: _serialize_to_str(SpanKind.TOOL),
+                SpanAttributes.PROJECT_RUN_ID: _serialize_to_str(
+                    _config.run_id,
+                ),
+                SpanAttributes.INPUT: _serialize_to_str(
+                    {
+                        "tool_call": tool_call,
+                    },
+                ),
+                SpanAttributes.META: _serialize_to_str(
+                    {
+                        **tool_call,
+                    },
+                ),
+            },
+            partial(_record_tool_call, tool_call["name"]),
+        )
+        with call:
             try:
                 # Call the toolkit function
                 res = await func(self, tool_call=tool_call)
 
                 # The result must be an AsyncGenerator of ToolResponse objects
-                return _trace_async_generator_wrapper(res, span)
+                return _wrap_result(res, call)
 
             except Exception as e:
-                span.set_status(
-                    opentelemetry.trace.StatusCode.ERROR,
-                    str(e),
-                )
-                span.record_exception(e)
-                span.end()
+                call.finish(error=e)
                 raise e from None
 
     return wrapper
@@ -392,53 +503,37 @@ def trace_reply(
             )
             return await func(self, *args, **kwargs)
 
-        import opentelemetry
-
-        tracer = opentelemetry.trace.get_tracer(__name__)
-
         # Prepare the attributes for the span
-        agent_name = self.name if hasattr(self, "name") else None
-        attributes = {
-            SpanAttributes.SPAN_KIND: _serialize_to_str(SpanKind.AGENT),
-            SpanAttributes.PROJECT_RUN_ID: _serialize_to_str(_config.run_id),
-            SpanAttributes.INPUT: _serialize_to_str(
-                {
-                    "args": args,
-                    "kwargs": kwargs,
-                },
-            ),
-            SpanAttributes.META: _serialize_to_str(
-                {
-                    "id": self.id,
-                    "name": agent_name,
-                },
-            ),
-        }
-
-        with tracer.start_as_current_span(
+        call = _TracedCall(
             f"{self.__class__.__name__}.{func.__name__}",
-            attributes=attributes,
-            end_on_exit=False,
-        ) as span:
+            lambda: {
+                SpanAttributes.SPAN_KIND: _serialize_to_str(SpanKind.AGENT),
+                SpanAttributes.PROJECT_RUN_ID: _serialize_to_str(
+                    _config.run_id,
+                ),
+                SpanAttributes.INPUT: _serialize_to_str(
+                    {
+                        "args": args,
+                        "kwargs": kwargs,
+                    },
+                ),
+                SpanAttributes.META: _serialize_to_str(
+                    {
+                        "id": self.id,
+                        "name": getattr(self, "name", None),
+                    },
+                ),
+            },
+        )
+        with call:
             try:
                 # Call the agent reply function
                 res = await func(self, *args, **kwargs)
-
-                # Set the output attribute
-                span.set_attributes(
-                    {SpanAttributes.OUTPUT: _serialize_to_str(res)},
-                )
-                span.set_status(opentelemetry.trace.StatusCode.OK)
-                span.end()
+                call.finish(output=res)
                 return res
 
             except Exception as e:
-                span.set_status(
-                    opentelemetry.trace.StatusCode.ERROR,
-                    str(e),
-                )
-                span.record_exception(e)
-                span.end()
+                call.finish(error=e)
                 raise e from None
 
     return wrapper
@@ -456,7 +551,7 @@ def trace_embedding(
         **kwargs: Any,
     ) -> EmbeddingResponse:
         """The wrapper function for tracing the embedding call."""
-        if not _check_tracing_enabled():
+        if not _check_tracing_enabled() and not _check_metrics_enabled():
             return await func(self, *args, **kwargs)
 
         if not isinstance(self, EmbeddingModelBase):
@@ -468,51 +563,39 @@ def trace_embedding(
             )
             return await func(self, *args, **kwargs)
 
-        import opentelemetry
-
-        tracer = opentelemetry.trace.get_tracer(__name__)
-
         # Prepare the attributes for the span
-        attributes = {
-            SpanAttributes.SPAN_KIND: _serialize_to_str(SpanKind.EMBEDDING),
-            SpanAttributes.PROJECT_RUN_ID: _serialize_to_str(_config.run_id),
-            SpanAttributes.INPUT: _serialize_to_str(
-                {
-                    "args": args,
-                    "kwargs": kwargs,
-                },
-            ),
-            SpanAttributes.META: _serialize_to_str(
-                {
-                    "model_name": self.model_name,
-                },
-            ),
-        }
-
-        with tracer.start_as_current_span(
+        call = _TracedCall(
             f"{self.__class__.__name__}.{func.__name__}",
-            attributes=attributes,
-            end_on_exit=False,
-        ) as span:
+            lambda: {
+                SpanAttributes.SPAN_KIND: _serialize_to_str(
+                    SpanKind.EMBEDDING,
+                ),
+                SpanAttributes.PROJECT_RUN_ID: _serialize_to_str(
+                    _config.run_id,
+                ),
+                SpanAttributes.INPUT: _serialize_to_str(
+                    {
+                        "args": args,
+                        "kwargs": kwargs,
+                    },
+                ),
+                SpanAttributes.META: _serialize_to_str(
+                    {
+                        "model_name": self.model_name,
+                    },
+                ),
+            },
+            partial(_record_embedding, self.model_name),
+        )
+        with call:
             try:
                 # Call the embedding function
                 res = await func(self, *args, **kwargs)
-
-                # Set the output attribute
-                span.set_attributes(
-                    {SpanAttributes.OUTPUT: _serialize_to_str(res)},
-                )
-                span.set_status(opentelemetry.trace.StatusCode.OK)
-                span.end()
+                call.finish(output=res)
                 return res
 
             except Exception as e:
-                span.set_status(
-                    opentelemetry.trace.StatusCode.ERROR,
-                    str(e),
-                )
-                span.record_exception(e)
-                span.end()
+                call.finish(error=e)
                 raise e from None
 
     return wrapper
@@ -554,47 +637,34 @@ def trace_format(
             )
             return await func(self, *args, **kwargs)
 
-        import opentelemetry
-
-        tracer = opentelemetry.trace.get_tracer(__name__)
-
         # Prepare the attributes for the span
-        attributes = {
-            SpanAttributes.SPAN_KIND: _serialize_to_str(SpanKind.FORMATTER),
-            SpanAttributes.PROJECT_RUN_ID: _serialize_to_str(_config.run_id),
-            SpanAttributes.INPUT: _serialize_to_str(
-                {
-                    "args": args,
-                    "kwargs": kwargs,
-                },
-            ),
-            SpanAttributes.META: _serialize_to_str({}),
-        }
-
-        with tracer.start_as_current_span(
+        call = _TracedCall(
             f"{self.__class__.__name__}.{func.__name__}",
-            attributes=attributes,
-            end_on_exit=False,
-        ) as span:
+            lambda: {
+                SpanAttributes.SPAN_KIND: _serialize_to_str(
+                    SpanKind.FORMATTER,
+                ),
+                SpanAttributes.PROJECT_RUN_ID: _serialize_to_str(
+                    _config.run_id,
+                ),
+                SpanAttributes.INPUT: _serialize_to_str(
+                    {
+                        "args": args,
+                        "kwargs": kwargs,
+                    },
+                ),
+                SpanAttributes.META: _serialize_to_str({}),
+            },
+        )
+        with call:
             try:
                 # Call the formatter function
                 res = await func(self, *args, **kwargs)
-
-                # Set the output attribute
-                span.set_attributes(
-                    {SpanAttributes.OUTPUT: _serialize_to_str(res)},
-                )
-                span.set_status(opentelemetry.trace.StatusCode.OK)
-                span.end()
+                call.finish(output=res)
                 return res
 
             except Exception as e:
-                span.set_status(
-                    opentelemetry.trace.StatusCode.ERROR,
-                    str(e),
-                )
-                span.record_exception(e)
-                span.end()
+                call.finish(error=e)
                 raise e from None
 
     return wrapper
@@ -634,7 +704,7 @@ def trace_llm(
         **kwargs: Any,
     ) -> ChatResponse | AsyncGenerator[ChatResponse, None]:
         """The wrapper function for tracing the LLM call."""
-        if not _check_tracing_enabled():
+        if not _check_tracing_enabled() and not _check_metrics_enabled():
             return await func(self, *args, **kwargs)
 
         if not isinstance(self, ChatModelBase):
@@ -646,57 +716,39 @@ def trace_llm(
             )
             return await func(self, *args, **kwargs)
 
-        import opentelemetry
-
-        tracer = opentelemetry.trace.get_tracer(__name__)
-
         # Prepare the attributes for the span
-        attributes = {
-            SpanAttributes.SPAN_KIND: _serialize_to_str(SpanKind.LLM),
-            SpanAttributes.PROJECT_RUN_ID: _serialize_to_str(_config.run_id),
-            SpanAttributes.INPUT: _serialize_to_str(
-                {
-                    "args": args,
-                    "kwargs": kwargs,
-                },
-            ),
-            SpanAttributes.META: _serialize_to_str(
-                {
-                    "model_name": self.model_name,
-                    "stream": self.stream,
-                },
-            ),
-        }
+        call = _TracedCall(
+            f"{self.__class__.__name__}.__call__",
+            lambda: {
+                SpanAttributes.SPAN_KIND: _serialize_to_str(SpanKind.LLM),
+                SpanAttributes.PROJECT_RUN_ID: _serialize_to_str(
+                    _config.run_id,
+                ),
+                SpanAttributes.INPUT: _serialize_to_str(
+                    {
+                        "args": args,
+                        "kwargs": kwargs,
+                    },
+                ),
+                SpanAttributes.META: _serialize_to_str(
+                    {
+                        "model_name": self.model_name,
+                        "stream": self.stream,
+                    },
+                ),
+            },
+            partial(_record_chat, self.model_name),
+        )
 
         # Begin the llm call span
-        with tracer.start_as_current_span(
-            f"{self.__class__.__name__}.__call__",
-            attributes=attributes,
-            end_on_exit=False,
-        ) as span:
+        with call:
             try:
                 # Must be an async calling
                 res = await func(self, *args, **kwargs)
-
-                # If the result is a AsyncGenerator
-                if isinstance(res, AsyncGenerator):
-                    return _trace_async_generator_wrapper(res, span)
-
-                # non-generator result
-                span.set_attributes(
-                    {SpanAttributes.OUTPUT: _serialize_to_str(res)},
-                )
-                span.set_status(opentelemetry.trace.StatusCode.OK)
-                span.end()
-                return res
+                return _wrap_result(res, call)
 
             except Exception as e:
-                span.set_status(
-                    opentelemetry.trace.StatusCode.ERROR,
-                    str(e),
-                )
-                span.record_exception(e)
-                span.end()
+                call.finish(error=e)
                 raise e from None
 
     return async_wrapper
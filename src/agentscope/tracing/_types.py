@@ -26,3 +26,7 @@ class SpanAttributes:
     INPUT = "input"
     META = "metadata"
     PROJECT_RUN_ID = "project.run_id"
+    TAIL_SAMPLED = "sampling.tail"
+    LLM_TIME_TO_FIRST_TOKEN = "llm.time_to_first_token"
+    LLM_TOKENS_PER_SECOND = "llm.tokens_per_second"
+    LLM_MAX_CHUNK_GAP = "llm.max_chunk_gap"
@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+"""The embedding batching tests in agentscope."""
+import asyncio
+import time
+from typing import Any
+from unittest.async_case import IsolatedAsyncioTestCase
+from unittest.mock import AsyncMock, Mock, patch
+
+from agentscope.embedding import (
+    DashScopeTextEmbedding,
+    EmbeddingModelBase,
+    EmbeddingResponse,
+    EmbeddingUsage,
+    OllamaTextEmbedding,
+)
+
+_sleep = asyncio.sleep
+
+
+class MockEmbedding(EmbeddingModelBase):
+    """The mock embedding model recording the batches."""
+
+    max_batch_size = 3
+
+    max_batch_tokens = 6
+
+    def __init__(self) -> None:
+        """Initialize the mock embedding model."""
+        super().__init__("mock")
+        self.batches: list[list[str]] = []
+
+    async def __call__(self, text: list[str], **kwargs: Any) -> Any:
+        """Embed the texts by their lengths."""
+
+        async def embed_batch(batch: list[str]) -> tuple:
+            self.batches.append(batch)
+            return [[float(len(_))] for _ in batch], None
+
+        embeddings, tokens = await self._embed_in_batches(text, embed_batch)
+        return EmbeddingResponse(
+            embeddings=embeddings,
+            usage=EmbeddingUsage(time=0, tokens=tokens),
+        )
+
+
+class EmbeddingBatchTest(IsolatedAsyncioTestCase):
+    """The embedding batching tests in agentscope."""
+
+    async def test_split_batches(self) -> None:
+        """Test splitting the texts by the batch size and token limits."""
+        model = MockEmbedding()
+        text = ["a", "b", "c", "d", "eeeeeeee", "ff", "gg"]
+        response = await model(text)
+        self.assertListEqual(
+            model.batches,
+            [["a", "b", "c"], ["d"], ["eeeeeeee"], ["ff", "gg"]],
+        )
+        self.assertListEqual(
+            response.embeddings,
+            [[float(len(_))] for _ in text],
+        )
+        self.assertIsNone(response.usage.tokens)
+
+        model.batches.clear()
+        response = await model([])
+        self.assertListEqual(model.batches, [])
+        self.assertListEqual(response.embeddings, [])
+
+    async def test_dashscope_batches(self) -> None:
+        """Test the DashScope embedding splits the texts into batches and
+        merges the results in order."""
+        n_running, max_running = 0, 0
+
+        def mock_call(**kwargs: Any) -> Mock:
+            nonlocal n_running, max_running
+            n_running += 1
+            max_running = max(max_running, n_running)
+            time.sleep(0.05)
+            n_running -= 1
+            return Mock(
+                status_code=200,
+                output={
+                    "embeddings": [
+                        {"embedding": [float(_)]} for _ in kwargs["input"]
+                    ],
+                },
+                usage={"total_tokens": len(kwargs["input"])},
+            )
+
+        model = DashScopeTextEmbedding(
+            api_key="test_key",
+            model_name="text-embedding-v4",
+            max_concurrency=2,
+        )
+        text = [str(_) for _ in range(35)]
+        with patch(
+            "dashscope.embeddings.TextEmbedding.call",
+            side_effect=mock_call,
+        ) as mock:
+            response = await model(text)
+
+        self.assertEqual(mock.call_count, 4)
+        self.assertListEqual(
+            [len(_.kwargs["input"]) for _ in mock.call_args_list],
+            [10, 10, 10, 5],
+        )
+        self.assertListEqual(
+            response.embeddings,
+            [[float(_)] for _ in range(35)],
+        )
+        self.assertEqual(response.usage.tokens, 35)
+        self.assertLessEqual(max_running, 2)
+
+    async def test_ollama_bounded_concurrency(self) -> None:
+        """Test the Ollama embedding bounds the concurrent requests and
+        retries the failed ones."""
+        n_running, max_running, n_failed = 0, 0, 0
+
+        async def mock_embeddings(_model: str, prompt: str) -> Mock:
+            nonlocal n_running, max_running, n_failed
+            n_running += 1
+            max_running = max(max_running, n_running)
+            await _sleep(0.01)
+            n_running -= 1
+            if prompt == "3" and n_failed == 0:
+                n_failed += 1
+                raise ConnectionError("Connection reset")
+            return Mock(embedding=[float(prompt)])
+
+        model = OllamaTextEmbedding(model_name="test", max_concurrency=3)
+        model.client = Mock(embeddings=AsyncMock(side_effect=mock_embeddings))
+        with patch(
+            "agentscope.embedding._embedding_base.asyncio.sleep",
+            AsyncMock(),
+        ):
+            response = await model([str(_) for _ in range(10)])
+
+        self.assertListEqual(
+            response.embeddings,
+            [[float(_)] for _ in range(10)],
+        )
+        self.assertEqual(model.client.embeddings.call_count, 11)
+        self.assertLessEqual(max_running, 3)
+
+    async def test_retries_exhausted(self) -> None:
+        """Test the error is raised after the retries are exhausted."""
+        model = OllamaTextEmbedding(model_name="test", max_retries=2)
+        model.client = Mock(
+            embeddings=AsyncMock(side_effect=ConnectionError("Timeout")),
+        )
+        with patch(
+            "agentscope.embedding._embedding_base.asyncio.sleep",
+            AsyncMock(),
+        ):
+            with self.assertRaises(ConnectionError):
+                await model(["a"])
+        self.assertEqual(model.client.embeddings.call_count, 2)
@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for loading the ACE benchmark from a local data dir."""
+import json
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch
+
+from agentscope.evaluate import ACEBenchmark
+
+
+class ACEBenchmarkTest(TestCase):
+    """Test cases for loading, caching and filtering the ACE benchmark."""
+
+    def setUp(self) -> None:
+        """Create a tiny synthetic data dir."""
+        self.data_dir = tempfile.mkdtemp()
+        for filename in ACEBenchmark.data_files:
+            category = filename.split(".", maxsplit=1)[0].removeprefix("data_")
+            self._write_data(filename, [f"{category}_0", f"{category}_1"])
+
+    def _write_data(self, filename: str, ids: list[str]) -> None:
+        """Write a data file and its ground truth with the given ids."""
+        subdir = os.path.join(self.data_dir, "data_zh")
+        gt_subdir = os.path.join(subdir, ACEBenchmark.ground_truth_dir)
+        os.makedirs(gt_subdir, exist_ok=True)
+
+        with open(os.path.join(subdir, filename), "w", encoding="utf-8") as f:
+            for task_id in ids:
+                data = {
+                    "id": task_id,
+                    "question": f"Question {task_id}",
+                    "initial_config": {},
+                    "function": [
+                        {
+                            "name": "send_message",
+                            "parameters": {"type": "dict"},
+                        },
+                    ],
+                }
+                f.write(json.dumps(data) + "\n")
+
+        with open(
+            os.path.join(gt_subdir, filename),
+            "w",
+            encoding="utf-8",
+        ) as f:
+            for task_id in ids:
+                gt = {"id": task_id, "ground_truth": [], "mile_stone": []}
+                f.write(json.dumps(gt) + "\n")
+
+    def _list_caches(self) -> list[str]:
+        """List the compiled cache files."""
+        return sorted(
+            os.listdir(os.path.join(self.data_dir, ACEBenchmark.cache_dir)),
+        )
+
+    def test_cache(self) -> None:
+        """Test the compiled cache is used, and invalidated after the data
+        file is changed."""
+        benchmark = ACEBenchmark(self.data_dir)
+        self.assertEqual(len(benchmark), 4)
+        self.assertEqual(
+            benchmark.dataset[0]["function"][0]["parameters"]["type"],
+            "object",
+        )
+        caches = self._list_caches()
+        self.assertEqual(len(caches), len(ACEBenchmark.data_files))
+
+        # The cache hit doesn't parse the files again
+        with patch("json5.loads", side_effect=AssertionError("Parsed")):
+            cached = ACEBenchmark(self.data_dir)
+        self.assertListEqual(cached.dataset, benchmark.dataset)
+
+        # The changed file is parsed again, and its outdated cache removed
+        self._write_data("data_agent_multi_step.json", ["new_0"])
+        changed = ACEBenchmark(self.data_dir)
+        self.assertListEqual(
+            [_["id"] for _ in changed.dataset],
+            ["new_0", "agent_multi_turn_0", "agent_multi_turn_1"],
+        )
+        new_caches = self._list_caches()
+        self.assertEqual(len(new_caches), len(ACEBenchmark.data_files))
+        self.assertEqual(len(set(caches) & set(new_caches)), 1)
+
+        # The cache can be disabled
+        with patch("json5.loads", side_effect=AssertionError("Parsed")):
+            with self.assertRaises(AssertionError):
+                ACEBenchmark(self.data_dir, use_cache=False)
+
+    def test_filter(self) -> None:
+        """Test loading and filtering the tasks by the categories."""
+        benchmark = ACEBenchmark(
+            self.data_dir,
+            categories=["agent_multi_turn"],
+        )
+        self.assertListEqual(
+            [_["id"] for _ in benchmark.dataset],
+            ["agent_multi_turn_0", "agent_multi_turn_1"],
+        )
+
+        benchmark = ACEBenchmark(self.data_dir)
+        filtered = benchmark.filter(categories=["agent_multi_step"])
+        self.assertListEqual(
+            [_["id"] for _ in filtered.dataset],
+            ["agent_multi_step_0", "agent_multi_step_1"],
+        )
+        self.assertEqual(len(benchmark), 4)
+        self.assertEqual(len(benchmark.filter(languages=["zh"])), 4)
+        self.assertEqual(len(benchmark.filter(languages=["en"])), 0)
+
+        with self.assertRaisesRegex(ValueError, "Unknown categories"):
+            ACEBenchmark(self.data_dir, categories=["unknown"])
+
+    def tearDown(self) -> None:
+        """Remove the data dir."""
+        shutil.rmtree(self.data_dir, ignore_errors=True)
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for the multiprocess evaluator."""
+import os
+import shutil
+import tempfile
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable
+from unittest.async_case import IsolatedAsyncioTestCase
+
+from evaluate_utils import ListBenchmark
+
+from agentscope.evaluate import (
+    FileEvaluatorStorage,
+    ProcessPoolEvaluator,
+    SolutionOutput,
+    Task,
+)
+
+
+class MainProcessStorage(FileEvaluatorStorage):
+    """A file storage that can only be written by the main process."""
+
+    def __init__(self, save_dir: str) -> None:
+        """Record the process that creates the storage."""
+        super().__init__(save_dir)
+        self.pid = os.getpid()
+
+    def save_solution_result(self, *args: Any, **kwargs: Any) -> None:
+        """Save the solution result in the main process only."""
+        assert os.getpid() == self.pid, "Written by a worker process"
+        super().save_solution_result(*args, **kwargs)
+
+    def save_evaluation_result(self, *args: Any, **kwargs: Any) -> None:
+        """Save the evaluation result in the main process only."""
+        assert os.getpid() == self.pid, "Written by a worker process"
+        super().save_evaluation_result(*args, **kwargs)
+
+
+async def echo_solution(
+    task: Task, _pre_print_hook: Callable
+) -> SolutionOutput:
+    """Echo the task input, and fail on the input "fail"."""
+    if task.input == "fail":
+        raise ValueError("Failed on purpose")
+    return SolutionOutput(
+        success=True,
+        output=task.input,
+        trajectory=[],
+        meta={"ground_truth": task.ground_truth},
+    )
+
+
+def resume_solution(task: Task, _pre_print_hook: Callable) -> SolutionOutput:
+    """Echo the task input, and fail on the finished tasks."""
+    if task.input != "fail":
+        raise ValueError(f"The finished task {task.id} is run again")
+    return SolutionOutput(
+        success=True,
+        output=task.input,
+        trajectory=[],
+        meta={"ground_truth": task.ground_truth},
+    )
+
+
+def crash_solution(_task: Task, _pre_print_hook: Callable) -> SolutionOutput:
+    """Exit the worker process abruptly."""
+    os._exit(1)
+
+
+class ProcessPoolEvaluatorTest(IsolatedAsyncioTestCase):
+    """Test cases for the multiprocess evaluator."""
+
+    async def asyncSetUp(self) -> None:
+        """Create the temporary storage directory."""
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def _get_evaluator(self, inputs: list[str]) -> ProcessPoolEvaluator:
+        """Create an evaluator with two workers over the inputs."""
+        return ProcessPoolEvaluator(
+            name="test",
+            benchmark=ListBenchmark(inputs),
+            n_repeat=1,
+            storage=MainProcessStorage(self.tmp_dir),
+            n_workers=2,
+            n_tasks_per_worker=2,
+        )
+
+    async def test_run_and_resume(self) -> None:
+        """Test the results are saved by the main process, the failures are
+        aggregated, and only the unfinished tasks are run on resume."""
+        evaluator = self._get_evaluator(["a", "b", "fail", "c", "d"])
+        with self.assertRaisesRegex(RuntimeError, r"1/5 tasks failed"):
+            await evaluator.run(echo_solution)
+
+        storage = evaluator.storage
+        for task in evaluator.benchmark:
+            self.assertEqual(
+                storage.solution_result_exists(task.id, "0"),
+                task.input != "fail",
+            )
+        self.assertEqual(
+            storage.get_evaluation_result("3", "0", "equal").result,
+            1.0,
+        )
+
+        # Resume with the failed task only
+        evaluator = self._get_evaluator(["a", "b", "fail", "c", "d"])
+        await evaluator.run(resume_solution)
+        self.assertTrue(storage.solution_result_exists("2", "0"))
+        self.assertTrue(storage.aggregation_result_exists())
+
+    async def test_worker_crash(self) -> None:
+        """Test the evaluation raises instead of waiting forever when the
+        worker processes exit abruptly."""
+        evaluator = self._get_evaluator(["a", "b"])
+        with self.assertRaises(BrokenProcessPool):
+            await evaluator.run(crash_solution)
+
+    async def asyncTearDown(self) -> None:
+        """Remove the temporary storage directory."""
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
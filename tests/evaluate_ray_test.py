@@ -0,0 +1,202 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for the actor pool mode of the ray evaluator, with a mocked
+ray module."""
+import asyncio
+import shutil
+import tempfile
+from concurrent.futures import Future
+from typing import Any, Callable
+from unittest.async_case import IsolatedAsyncioTestCase
+from unittest.mock import patch
+
+from evaluate_utils import ListBenchmark
+
+from agentscope.evaluate import (
+    FileEvaluatorStorage,
+    RayEvaluator,
+    SolutionOutput,
+    Task,
+)
+
+
+class MockObjectRef:
+    """A mock ray object reference."""
+
+    def __init__(self, future: Future) -> None:
+        """Initialize the reference with a future."""
+        self._future = future
+
+    def future(self) -> Future:
+        """Get the future of the result."""
+        return self._future
+
+
+class MockActor:
+    """A mock ray actor, which runs the methods on the running event loop
+    and records the number of its running tasks."""
+
+    def __init__(self, instance: Any) -> None:
+        """Initialize the mock actor with the actor instance."""
+        self.instance = instance
+        self.n_running = 0
+        self.max_running = 0
+        self.n_tasks = 0
+        self.tasks: set[asyncio.Task] = set()
+
+    @property
+    def run_task(self) -> "MockActor":
+        """Return the actor itself as the remote method."""
+        return self
+
+    def remote(self, *args: Any) -> MockObjectRef:
+        """Call `run_task` of the actor instance asynchronously."""
+        future: Future = Future()
+
+        async def run() -> None:
+            """Run the task and set the future."""
+            self.n_running += 1
+            self.n_tasks += 1
+            self.max_running = max(self.max_running, self.n_running)
+            try:
+                future.set_result(await self.instance.run_task(*args))
+            except Exception as e:
+                future.set_exception(e)
+            finally:
+                self.n_running -= 1
+
+        task = asyncio.create_task(run())
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+        return MockObjectRef(future)
+
+
+class MockActorClass:
+    """A mock ray actor class."""
+
+    def __init__(self, ray: "MockRay", actor_cls: type) -> None:
+        """Initialize the mock actor class."""
+        self.ray = ray
+        self.actor_cls = actor_cls
+
+    def options(self, max_concurrency: int) -> "MockActorClass":
+        """Record the maximum concurrency of the actors."""
+        self.ray.max_concurrency = max_concurrency
+        return self
+
+    def remote(self, *args: Any) -> MockActor:
+        """Create a mock actor."""
+        actor = MockActor(self.actor_cls(*args))
+        self.ray.actors.append(actor)
+        return actor
+
+
+class MockRay:
+    """A mock ray module for the actor pool."""
+
+    def __init__(self) -> None:
+        """Initialize the mock ray module."""
+        self.actors: list[MockActor] = []
+        self.killed: list[MockActor] = []
+        self.max_concurrency: int | None = None
+
+    def remote(self, actor_cls: type) -> MockActorClass:
+        """Wrap the actor class."""
+        return MockActorClass(self, actor_cls)
+
+    @staticmethod
+    def put(obj: Any) -> Any:
+        """Return the object itself as the reference."""
+        return obj
+
+    def kill(self, actor: MockActor) -> None:
+        """Record the killed actor."""
+        self.killed.append(actor)
+
+
+async def echo_solution(
+    task: Task, _pre_print_hook: Callable
+) -> SolutionOutput:
+    """Echo the task input after a delay, and fail on the input "fail"."""
+    await asyncio.sleep(0.01 * (int(task.id) % 3))
+    if task.input == "fail":
+        raise ValueError("Failed on purpose")
+    return SolutionOutput(
+        success=True,
+        output=task.input,
+        trajectory=[],
+        meta={"ground_truth": task.ground_truth},
+    )
+
+
+class RayEvaluatorActorPoolTest(IsolatedAsyncioTestCase):
+    """Test cases for the actor pool mode of the ray evaluator."""
+
+    async def asyncSetUp(self) -> None:
+        """Create the temporary storage directory and the mock ray."""
+        self.tmp_dir = tempfile.mkdtemp()
+        self.ray = MockRay()
+
+    def _get_evaluator(self, inputs: list[str]) -> RayEvaluator:
+        """Create an actor pool evaluator with two actors."""
+        return RayEvaluator(
+            name="test",
+            benchmark=ListBenchmark(inputs),
+            n_repeat=1,
+            storage=FileEvaluatorStorage(self.tmp_dir),
+            n_workers=2,
+            use_actor_pool=True,
+            n_tasks_per_actor=2,
+        )
+
+    async def test_slot_refill(self) -> None:
+        """Test the actors take the next task once a slot is free, and are
+        killed after the evaluation."""
+        evaluator = self._get_evaluator([str(_) for _ in range(9)])
+        with patch(
+            "agentscope.evaluate._evaluator._ray_evaluator.ray",
+            self.ray,
+        ):
+            await evaluator.run(echo_solution)
+
+        self.assertEqual(self.ray.max_concurrency, 2)
+        self.assertEqual(len(self.ray.actors), 2)
+        self.assertEqual(sum(_.n_tasks for _ in self.ray.actors), 9)
+        for actor in self.ray.actors:
+            # More tasks than the slots are run, but never at the same time
+            self.assertGreater(actor.n_tasks, 2)
+            self.assertEqual(actor.max_running, 2)
+        self.assertListEqual(self.ray.killed, self.ray.actors)
+
+        for task in evaluator.benchmark:
+            self.assertEqual(
+                evaluator.storage.get_evaluation_result(
+                    task.id,
+                    "0",
+                    "equal",
+                ).result,
+                1.0,
+            )
+        self.assertTrue(evaluator.storage.aggregation_result_exists())
+
+    async def test_failure_aggregation(self) -> None:
+        """Test the failures are aggregated after all the tasks finish, and
+        the actors are still killed."""
+        evaluator = self._get_evaluator(["a", "fail", "b", "fail", "c"])
+        with patch(
+            "agentscope.evaluate._evaluator._ray_evaluator.ray",
+            self.ray,
+        ):
+            with self.assertRaisesRegex(RuntimeError, r"2/5 tasks failed"):
+                await evaluator.run(echo_solution)
+
+        self.assertEqual(sum(_.n_tasks for _ in self.ray.actors), 5)
+        self.assertListEqual(self.ray.killed, self.ray.actors)
+        for task in evaluator.benchmark:
+            self.assertEqual(
+                evaluator.storage.solution_result_exists(task.id, "0"),
+                task.input != "fail",
+            )
+
+    async def asyncTearDown(self) -> None:
+        """Remove the temporary storage directory."""
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
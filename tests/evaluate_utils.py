@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+"""The shared benchmark and metric for the evaluator unit tests."""
+from typing import Generator
+
+from agentscope.evaluate import (
+    BenchmarkBase,
+    MetricBase,
+    MetricResult,
+    MetricType,
+    SolutionOutput,
+    Task,
+)
+
+
+class EqualMetric(MetricBase):
+    """A metric that checks if the output equals the ground truth."""
+
+    def __init__(self) -> None:
+        """Initialize the metric."""
+        super().__init__("equal", MetricType.NUMERICAL)
+
+    def __call__(self, solution: SolutionOutput) -> MetricResult:
+        """Compare the output with the ground truth."""
+        return MetricResult(
+            name=self.name,
+            result=float(solution.output == solution.meta["ground_truth"]),
+        )
+
+
+class ListBenchmark(BenchmarkBase):
+    """A benchmark over a list of inputs."""
+
+    def __init__(self, inputs: list[str]) -> None:
+        """Initialize the benchmark."""
+        super().__init__("list", "A benchmark over a list of inputs.")
+        self.tasks = [
+            Task(
+                id=str(i),
+                input=_,
+                ground_truth=_,
+                metrics=[EqualMetric()],
+            )
+            for i, _ in enumerate(inputs)
+        ]
+
+    def __iter__(self) -> Generator[Task, None, None]:
+        """Iterate over the tasks."""
+        yield from self.tasks
+
+    def __len__(self) -> int:
+        """Get the number of the tasks."""
+        return len(self.tasks)
+
+    def __getitem__(self, index: int) -> Task:
+        """Get the task by index."""
+        return self.tasks[index]
@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+"""The unittests of formatting the blob sources."""
+import base64
+import copy
+import shutil
+import tempfile
+from unittest.async_case import IsolatedAsyncioTestCase
+
+from agentscope.formatter import (
+    AnthropicChatFormatter,
+    AnthropicMultiAgentFormatter,
+    DashScopeChatFormatter,
+    DashScopeMultiAgentFormatter,
+    GeminiChatFormatter,
+    GeminiMultiAgentFormatter,
+    OllamaChatFormatter,
+    OllamaMultiAgentFormatter,
+    OpenAIChatFormatter,
+    OpenAIMultiAgentFormatter,
+)
+from agentscope.message import (
+    AudioBlock,
+    Base64Source,
+    BlobStore,
+    ImageBlock,
+    Msg,
+    TextBlock,
+)
+from agentscope.tool import ToolOutputPolicy
+
+
+class TestBlobSource(IsolatedAsyncioTestCase):
+    """The unittests of formatting the blob sources."""
+
+    async def asyncSetUp(self) -> None:
+        """Set up the blob store and the messages."""
+        self.root_dir = tempfile.mkdtemp()
+        self.blob_store = BlobStore(self.root_dir)
+        self.image_data = base64.b64encode(b"\x89PNG fake image").decode()
+        self.audio_data = base64.b64encode(b"RIFF fake audio").decode()
+
+    async def asyncTearDown(self) -> None:
+        """Remove the blob store."""
+        shutil.rmtree(self.root_dir, ignore_errors=True)
+
+    def _get_msgs(self, use_blob: bool, with_audio: bool) -> list[Msg]:
+        """Get the messages with the base64 or blob sources."""
+
+        def get_source(data: str, media_type: str) -> dict:
+            if use_blob:
+                return self.blob_store.put_source(data, media_type)
+            return Base64Source(
+                type="base64",
+                media_type=media_type,
+                data=data,
+            )
+
+        content = [
+            TextBlock(type="text", text="What's in the image?"),
+            ImageBlock(
+                type="image",
+                source=get_source(self.image_data, "image/png"),
+            ),
+        ]
+        if with_audio:
+            content.append(
+                AudioBlock(
+                    type="audio",
+                    source=get_source(self.audio_data, "audio/wav"),
+                ),
+            )
+        return [
+            Msg("system", "You're a helpful assistant.", "system"),
+            Msg("user", content, "user"),
+        ]
+
+    def test_blob_store(self) -> None:
+        """Test storing and resolving the blob sources."""
+        source = self.blob_store.put_source(self.image_data, "image/png")
+        self.assertEqual(source["type"], "blob")
+        # The same data is stored once
+        self.assertEqual(
+            self.blob_store.put_source(
+                base64.b64decode(self.image_data),
+                "image/png",
+            ),
+            source,
+        )
+        self.assertDictEqual(
+            BlobStore.resolve_source(source),
+            Base64Source(
+                type="base64",
+                media_type="image/png",
+                data=self.image_data,
+            ),
+        )
+
+        # The message only carries the reference
+        msg = Msg("user", [ImageBlock(type="image", source=source)], "user")
+        self.assertNotIn(self.image_data, str(msg.to_dict()))
+        self.assertEqual(copy.deepcopy(msg).content, msg.content)
+
+    async def test_formatters(self) -> None:
+        """Test the formatters resolve the blob sources into the same
+        requests as the base64 sources."""
+        for formatter, with_audio in [
+            (OpenAIChatFormatter(), True),
+            (OpenAIMultiAgentFormatter(), False),
+            (AnthropicChatFormatter(), False),
+            (AnthropicMultiAgentFormatter(), False),
+            (DashScopeChatFormatter(), True),
+            (DashScopeMultiAgentFormatter(), True),
+            (GeminiChatFormatter(), True),
+            (GeminiMultiAgentFormatter(), True),
+            (OllamaChatFormatter(), False),
+            (OllamaMultiAgentFormatter(), False),
+        ]:
+            blob_msgs = self._get_msgs(True, with_audio)
+            res = await formatter.format(blob_msgs)
+            self.assertListEqual(
+                res,
+                await formatter.format(self._get_msgs(False, with_audio)),
+                formatter.__class__.__name__,
+            )
+            self.assertIn(self.image_data, str(res))
+            # The messages are not changed
+            self.assertEqual(
+                blob_msgs[1].content[1]["source"]["type"],
+                "blob",
+            )
+
+    def test_tool_output_policy(self) -> None:
+        """Test the tool output policy moves the base64 media to the blob
+        store."""
+        output = ToolOutputPolicy().apply(
+            [
+                TextBlock(type="text", text="Generated an image"),
+                ImageBlock(
+                    type="image",
+                    source=Base64Source(
+                        type="base64",
+                        media_type="image/png",
+                        data=self.image_data,
+                    ),
+                ),
+            ],
+            self.blob_store,
+        )
+        self.assertEqual(output[0]["text"], "Generated an image")
+        self.assertDictEqual(
+            output[1]["source"],
+            self.blob_store.put_source(self.image_data, "image/png"),
+        )
@@ -4,7 +4,9 @@ import asyncio
 from multiprocessing import Process
 from unittest.async_case import IsolatedAsyncioTestCase
 
+import anyio
 import mcp.types
+from mcp import ClientSession
 from mcp.server import FastMCP
 
 from agentscope.mcp import HttpStatelessClient, HttpStatefulClient
@@ -87,6 +89,53 @@ class StreamableHttpMCPClientTest(IsolatedAsyncioTestCase):
             ),
         )
 
+        # Test stateless client with pooled sessions
+        client = HttpStatelessClient(
+            name="test_streamable_http_stateless_client",
+            transport="streamable_http",
+            url=f"http://127.0.0.1:{self.port}/mcp",
+            pool_sessions=True,
+            max_pool_size=2,
+        )
+
+        func_3 = await client.get_callable_function(
+            "tool_1",
+            wrap_tool_result=False,
+        )
+        self.assertEqual(client.session_pool.size, 1)
+
+        results = await asyncio.gather(
+            *[func_3(arg1=str(i), arg2=[i]) for i in range(4)],
+        )
+        self.assertListEqual(
+            [_.content[0].text for _ in results],
+            [f"arg1: {i}, arg2: [{i}]" for i in range(4)],
+        )
+        self.assertEqual(client.session_pool.size, 2)
+
+        # The broken session is replaced transparently
+        n_attempts = 0
+
+        async def call_with_broken_session(
+            session: ClientSession,
+        ) -> mcp.types.CallToolResult:
+            """Fail as a broken session on the first attempt."""
+            nonlocal n_attempts
+            n_attempts += 1
+            if n_attempts == 1:
+                raise anyio.ClosedResourceError()
+            return await session.call_tool(
+                "tool_1", {"arg1": "5", "arg2": [5]}
+            )
+
+        res_5 = await client.session_pool.run(call_with_broken_session)
+        self.assertEqual(res_5.content[0].text, "arg1: 5, arg2: [5]")
+        self.assertEqual(n_attempts, 2)
+        self.assertEqual(client.session_pool.size, 2)
+
+        await client.close()
+        self.assertEqual(client.session_pool.size, 0)
+
         # Test stateful client connection
         client = HttpStatefulClient(
             name="test_streamable_http_stateless_client",
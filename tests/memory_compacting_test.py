@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for the compacting memory."""
+import asyncio
+from typing import Any
+from unittest.async_case import IsolatedAsyncioTestCase
+
+from agentscope.formatter import FormatterBase
+from agentscope.memory import CompactingMemory
+from agentscope.message import Msg, TextBlock, ToolResultBlock, ToolUseBlock
+from agentscope.model import ChatModelBase, ChatResponse
+from agentscope.token import TokenCounterBase
+
+
+class MockChatModel(ChatModelBase):
+    """A mock chat model that returns a fixed summary."""
+
+    def __init__(self) -> None:
+        """Initialize the mock model."""
+        super().__init__("mock", False)
+        self.prompts = []
+
+    async def __call__(
+        self,
+        messages: list[dict],
+        **kwargs: Any,
+    ) -> ChatResponse:
+        """Return the summary after a delay."""
+        self.prompts.append(messages)
+        await asyncio.sleep(0.05)
+        return ChatResponse(content=[TextBlock(type="text", text="summary")])
+
+
+class MockFormatter(FormatterBase):
+    """A mock formatter that keeps the message ids."""
+
+    async def format(self, msgs: list[Msg], **kwargs: Any) -> list[dict]:
+        """Format each message into a dictionary with its word number."""
+        return [
+            {"id": _.id, "words": str(_.content).count("word")} for _ in msgs
+        ]
+
+
+class MockTokenCounter(TokenCounterBase):
+    """A mock token counter that counts the words."""
+
+    def __init__(self) -> None:
+        """Initialize the mock token counter."""
+        self.n_counted = []
+
+    async def count(self, messages: list[dict], **kwargs: Any) -> int:
+        """Count the words and record the message number."""
+        self.n_counted.append(len(messages))
+        return sum(_["words"] for _ in messages)
+
+
+class CompactingMemoryTest(IsolatedAsyncioTestCase):
+    """Test cases for the compacting memory."""
+
+    async def asyncSetUp(self) -> None:
+        """Set up the messages with ten words each."""
+        text = " ".join(["word"] * 10)
+        self.msgs = [Msg("user", text, "user")]
+        for i in range(5):
+            self.msgs.append(
+                Msg(
+                    "assistant",
+                    [
+                        ToolUseBlock(
+                            type="tool_use",
+                            id=str(i),
+                            name="tool",
+                            input={},
+                        ),
+                    ],
+                    "assistant",
+                ),
+            )
+            self.msgs.append(
+                Msg(
+                    "system",
+                    [
+                        ToolResultBlock(
+                            type="tool_result",
+                            id=str(i),
+                            name="tool",
+                            output=text,
+                        ),
+                    ],
+                    "system",
+                ),
+            )
+
+    async def test_background_compaction(self) -> None:
+        """Test the compaction runs in the background and keeps the tool
+        call and result pairs."""
+        model = MockChatModel()
+        memory = CompactingMemory(
+            model=model,
+            formatter=MockFormatter(),
+            token_counter=MockTokenCounter(),
+            high_water_mark=50,
+            low_water_mark=25,
+            keep_recent=2,
+        )
+
+        for msg in self.msgs:
+            await memory.add(msg)
+        self.assertEqual(await memory.size(), 11)
+
+        # New messages added during the compaction are kept
+        new_msg = Msg("user", "new", "user")
+        await memory.add(new_msg)
+        await memory.wait_compaction()
+
+        msgs = await memory.get_memory()
+        self.assertEqual(msgs[0].name, "memory_summary")
+        self.assertIn("summary", msgs[0].get_text_content())
+        # The remaining tool calls are paired with their results
+        self.assertListEqual(
+            [_.id for _ in msgs[1:]],
+            [_.id for _ in self.msgs[-4:]] + [new_msg.id],
+        )
+        self.assertEqual(len(model.prompts), 1)
+        self.assertListEqual(
+            [_["id"] for _ in model.prompts[0][:-1]],
+            [_.id for _ in self.msgs[:-4]],
+        )
+
+    async def test_foreground_compaction(self) -> None:
+        """Test the compaction waits in the foreground mode."""
+        memory = CompactingMemory(
+            model=MockChatModel(),
+            formatter=MockFormatter(),
+            token_counter=MockTokenCounter(),
+            high_water_mark=25,
+            keep_recent=1,
+            background=False,
+        )
+        await memory.add(self.msgs[:5])
+
+        msgs = await memory.get_memory()
+        self.assertEqual(msgs[0].name, "memory_summary")
+        self.assertListEqual(
+            [_.id for _ in msgs[1:]],
+            [self.msgs[3].id, self.msgs[4].id],
+        )
+
+        # The state dictionary is the one of the wrapped memory
+        self.assertEqual(memory.state_dict(), memory.memory.state_dict())
+
+    async def test_incremental_counting(self) -> None:
+        """Test each message is counted once, and the whole memory is only
+        counted near the high water mark."""
+        token_counter = MockTokenCounter()
+        memory = CompactingMemory(
+            model=MockChatModel(),
+            formatter=MockFormatter(),
+            token_counter=token_counter,
+            high_water_mark=50,
+            keep_recent=2,
+            background=False,
+        )
+
+        # 30 tokens in 6 messages, below 80% of the high water mark
+        for msg in self.msgs[:6]:
+            await memory.add(msg)
+        self.assertListEqual(token_counter.n_counted, [1] * 6)
+
+        # 40 tokens in 8 messages, the whole memory is counted exactly
+        await memory.add(self.msgs[6:8])
+        self.assertListEqual(token_counter.n_counted, [1] * 8 + [8])
+        self.assertEqual(await memory.size(), 8)
@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for the local long-term memory."""
+import gc
+import os
+import shutil
+import tempfile
+from typing import Any
+from unittest.async_case import IsolatedAsyncioTestCase
+
+import numpy as np
+
+from agentscope.embedding import (
+    EmbeddingModelBase,
+    EmbeddingResponse,
+    EmbeddingUsage,
+)
+from agentscope.memory import LocalLongTermMemory
+from agentscope.message import Msg
+
+_VOCABULARY = ["apple", "banana", "car", "dog", "weather", "Alice", "Bob"]
+
+
+class MockEmbeddingModel(EmbeddingModelBase):
+    """A mock embedding model that counts the words in the vocabulary, or
+    uses the given vectors for the texts like `vec-<i>`."""
+
+    def __init__(self, vectors: np.ndarray | None = None) -> None:
+        """Initialize the mock embedding model."""
+        super().__init__("mock")
+        self.vectors = vectors
+        self.calls: list[list[str]] = []
+
+    async def __call__(self, text: list[str], **kwargs: Any) -> Any:
+        """Embed the texts."""
+        self.calls.append(text)
+        if self.vectors is not None:
+            embeddings = [
+                self.vectors[int(_.rsplit("-", 1)[-1])].tolist() for _ in text
+            ]
+        else:
+            embeddings = [
+                [_.count(word) for word in _VOCABULARY] for _ in text
+            ]
+        return EmbeddingResponse(
+            embeddings=embeddings,
+            usage=EmbeddingUsage(time=0),
+        )
+
+
+class LocalLongTermMemoryTest(IsolatedAsyncioTestCase):
+    """Test cases for the local long-term memory."""
+
+    async def asyncSetUp(self) -> None:
+        """Set up the storage directory."""
+        self.storage_dir = tempfile.mkdtemp()
+        self.model = MockEmbeddingModel()
+
+    async def asyncTearDown(self) -> None:
+        """Remove the storage directory."""
+        shutil.rmtree(self.storage_dir, ignore_errors=True)
+
+    async def test_record_and_retrieve(self) -> None:
+        """Test recording and retrieving the memories filtered by the
+        metadata."""
+        alice = LocalLongTermMemory(
+            self.model,
+            self.storage_dir,
+            agent_name="Friday",
+            user_name="Alice",
+        )
+        bob = LocalLongTermMemory(
+            self.model,
+            self.storage_dir,
+            agent_name="Friday",
+            user_name="Bob",
+        )
+
+        await alice.record(
+            [
+                Msg("Alice", "I like apple", "user"),
+                None,
+                Msg("Alice", "My dog is sick", "user"),
+            ],
+        )
+        # The messages are embedded in a single batch
+        self.assertListEqual(
+            self.model.calls,
+            [["Alice: I like apple", "Alice: My dog is sick"]],
+        )
+        await bob.record_to_memory("", ["Bob likes banana and apple"])
+
+        res = await alice.retrieve(Msg("user", "apple", "user"), limit=5)
+        self.assertListEqual(
+            res.split("\n"),
+            ["Alice: I like apple", "Alice: My dog is sick"],
+        )
+
+        res = await bob.retrieve_from_memory(["apple", "banana"])
+        self.assertEqual(res.content[0]["text"], "Bob likes banana and apple")
+
+        # Recording the same content again updates it in place
+        await bob.record_to_memory("", ["Bob likes banana and apple"])
+        res = await bob.retrieve_from_memory(["car"], limit=10)
+        self.assertEqual(res.content[0]["text"], "Bob likes banana and apple")
+
+    async def test_shared_message(self) -> None:
+        """Test the agents sharing the store record the same broadcast
+        message separately."""
+        agents = [
+            LocalLongTermMemory(self.model, self.storage_dir, agent_name=_)
+            for _ in ["A", "B"]
+        ]
+        msg = Msg("Alice", "I like apple", "user")
+        for agent in agents:
+            await agent.record([msg])
+
+        for agent in agents:
+            self.assertEqual(
+                await agent.retrieve(Msg("user", "apple", "user")),
+                "Alice: I like apple",
+            )
+
+    async def test_persistence(self) -> None:
+        """Test the memories are loaded from the storage directory."""
+        memory = LocalLongTermMemory(
+            self.model,
+            self.storage_dir,
+            run_name="run-1",
+        )
+        msg = Msg("user", "The weather is good", "user")
+        await memory.record([msg])
+        # Update the message in place
+        msg.content = "The weather is bad, take a car"
+        await memory.record([msg, Msg("user", "apple", "user")])
+        del memory
+        gc.collect()
+
+        memory = LocalLongTermMemory(
+            self.model,
+            self.storage_dir,
+            run_name="run-1",
+        )
+        res = await memory.retrieve(Msg("user", "car", "user"), limit=5)
+        self.assertListEqual(
+            res.split("\n"),
+            ["user: The weather is bad, take a car", "user: apple"],
+        )
+
+        memory = LocalLongTermMemory(
+            self.model,
+            self.storage_dir,
+            run_name="run-2",
+        )
+        self.assertEqual(await memory.retrieve(msg), "")
+
+    async def test_ivf_index(self) -> None:
+        """Test the IVF index finds the nearest neighbours."""
+        rng = np.random.default_rng(0)
+        centers = rng.normal(size=(16, 32))
+        vectors = np.concatenate(
+            [center + 0.1 * rng.normal(size=(100, 32)) for center in centers],
+        )
+        model = MockEmbeddingModel(vectors)
+        memory = LocalLongTermMemory(
+            model,
+            self.storage_dir,
+            agent_name="Friday",
+            index_type="ivf",
+            ivf_min_size=1000,
+        )
+        for start in range(0, len(vectors), 400):
+            await memory.upsert(
+                [f"vec-{_}" for _ in range(start, start + 400)],
+            )
+        self.assertTrue(
+            os.path.exists(os.path.join(self.storage_dir, "ivf.npz")),
+        )
+
+        queries = [f"vec-{_}" for _ in range(0, len(vectors), 50)]
+        results = await memory.search(queries, limit=1)
+        self.assertListEqual([_[0] for _ in results], queries)
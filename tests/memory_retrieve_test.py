@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for the semantic retrieval of the in-memory memory."""
+from typing import Any
+from unittest.async_case import IsolatedAsyncioTestCase
+
+from agentscope.embedding import (
+    EmbeddingModelBase,
+    EmbeddingResponse,
+    EmbeddingUsage,
+)
+from agentscope.memory import InMemoryMemory
+from agentscope.message import Msg, ToolUseBlock
+
+_VOCABULARY = ["apple", "banana", "car", "dog", "weather"]
+
+
+class MockEmbeddingModel(EmbeddingModelBase):
+    """A mock embedding model that counts the words in the vocabulary."""
+
+    def __init__(self) -> None:
+        """Initialize the mock embedding model."""
+        super().__init__("mock")
+        self.calls: list[list[str]] = []
+        self.fail = False
+
+    async def __call__(self, text: list[str], **kwargs: Any) -> Any:
+        """Embed the texts by the word counts."""
+        self.calls.append(text)
+        if self.fail:
+            raise ConnectionError("The embedding API is unavailable")
+        return EmbeddingResponse(
+            embeddings=[[_.count(word) for word in _VOCABULARY] for _ in text],
+            usage=EmbeddingUsage(time=0),
+        )
+
+
+class InMemoryMemoryRetrieveTest(IsolatedAsyncioTestCase):
+    """Test cases for the semantic retrieval of the in-memory memory."""
+
+    async def asyncSetUp(self) -> None:
+        """Set up the memory with the messages about different topics."""
+        self.model = MockEmbeddingModel()
+        self.memory = InMemoryMemory(embedding_model=self.model)
+        self.msgs = [
+            Msg("user", "I like apple and banana", "user"),
+            Msg("user", "My dog is chasing a car", "user"),
+            Msg("user", "The weather is good", "user"),
+            Msg("user", "An apple a day", "user"),
+            Msg(
+                "assistant",
+                [
+                    ToolUseBlock(
+                        type="tool_use",
+                        id="1",
+                        name="search",
+                        input={"query": "apple"},
+                    ),
+                ],
+                "assistant",
+            ),
+        ]
+
+    async def test_retrieve(self) -> None:
+        """Test retrieving the most similar messages."""
+        await self.memory.add(self.msgs[:2])
+        await self.memory.add(self.msgs[2:])
+        # The messages are embedded incrementally when added
+        self.assertListEqual(
+            self.model.calls,
+            [
+                ["I like apple and banana", "My dog is chasing a car"],
+                ["The weather is good", "An apple a day"],
+            ],
+        )
+
+        res = await self.memory.retrieve("apple", limit=2)
+        self.assertListEqual(
+            [_.id for _ in res],
+            [self.msgs[3].id, self.msgs[0].id],
+        )
+
+        # The message without text content is never retrieved
+        res = await self.memory.retrieve(Msg("user", "dog", "user"), limit=10)
+        self.assertListEqual(
+            [_.id for _ in res[:1]],
+            [self.msgs[1].id],
+        )
+        self.assertEqual(len(res), 4)
+
+    async def test_recency_weight(self) -> None:
+        """Test the recent messages are preferred with the recency
+        weight."""
+        old = Msg("user", "apple banana", "user")
+        new = Msg("user", "apple car", "user")
+        await self.memory.add([old] + self.msgs[1:3] + [new])
+
+        res = await self.memory.retrieve("apple banana", limit=1)
+        self.assertEqual(res[0].id, old.id)
+
+        res = await self.memory.retrieve(
+            "apple banana",
+            limit=1,
+            recency_weight=0.5,
+            recency_half_life=1,
+        )
+        self.assertEqual(res[0].id, new.id)
+
+    async def test_delete_and_load(self) -> None:
+        """Test the index stays aligned after deleting and loading without
+        embedding the known messages again."""
+        await self.memory.add(self.msgs)
+        await self.memory.delete([0, 3])
+        n_calls = len(self.model.calls)
+
+        # Only the query is embedded
+        res = await self.memory.retrieve("apple weather", limit=1)
+        self.assertEqual(res[0].id, self.msgs[2].id)
+        self.assertEqual(len(self.model.calls), n_calls + 1)
+
+        state = self.memory.state_dict()
+        await self.memory.clear()
+        self.memory.load_state_dict(state)
+        await self.memory.add(Msg("user", "apple pie", "user"))
+        res = await self.memory.retrieve("car", limit=1)
+        self.assertEqual(res[0].id, self.msgs[1].id)
+
+    async def test_growth(self) -> None:
+        """Test the matrix grows when many messages are added."""
+        for i in range(200):
+            await self.memory.add(
+                Msg("user", "weather" if i == 7 else "dog", "user"),
+            )
+        res = await self.memory.retrieve("weather", limit=3)
+        self.assertEqual(res[0].content, "weather")
+        self.assertEqual(len(res), 3)
+
+    async def test_embedding_failure(self) -> None:
+        """Test the embedding failure doesn't fail adding the messages, and
+        the messages are embedded again when retrieving."""
+        self.model.fail = True
+        await self.memory.add(self.msgs[:2])
+        self.assertEqual(await self.memory.size(), 2)
+
+        # The error is raised by retrieve
+        with self.assertRaises(ConnectionError):
+            await self.memory.retrieve("apple")
+
+        self.model.fail = False
+        res = await self.memory.retrieve("apple", limit=1)
+        self.assertListEqual([_.id for _ in res], [self.msgs[0].id])
+        self.assertListEqual(
+            self.model.calls[-2],
+            ["I like apple and banana", "My dog is chasing a car"],
+        )
+
+    async def test_without_embedding_model(self) -> None:
+        """Test the retrieve method requires an embedding model."""
+        memory = InMemoryMemory()
+        await memory.add(self.msgs)
+        with self.assertRaises(NotImplementedError):
+            await memory.retrieve("apple")
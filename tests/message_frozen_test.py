@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for the frozen messages."""
+import copy
+import json
+import pickle
+from typing import Any
+from unittest.async_case import IsolatedAsyncioTestCase
+
+from agentscope.agent import AgentBase
+from agentscope.message import Msg, TextBlock
+from agentscope.pipeline import fanout_pipeline
+
+
+class RecordAgent(AgentBase):
+    """An agent that records the received message, and modifies it if
+    required."""
+
+    def __init__(self, modify: bool) -> None:
+        """Initialize the agent."""
+        super().__init__()
+        self.name = "Record"
+        self.modify = modify
+        self.received: Msg | None = None
+
+    async def reply(self, x: Msg) -> Msg:
+        """Record and modify the message."""
+        self.received = x
+        if self.modify:
+            x.content.append(TextBlock(type="text", text=self.id))
+            x.metadata["modified"] = True
+        return x
+
+    async def observe(self, msg: Msg | list[Msg] | None) -> None:
+        """Observe function"""
+
+    async def handle_interrupt(
+        self,
+        *args: Any,
+        **kwargs: Any,
+    ) -> Msg:
+        """Handle interrupt"""
+
+
+class MyMsg(Msg):
+    """A subclass of the message."""
+
+    def get_name(self) -> str:
+        """Get the name of the message."""
+        return self.name
+
+
+class FrozenMsgTest(IsolatedAsyncioTestCase):
+    """Test cases for the frozen messages."""
+
+    async def asyncSetUp(self) -> None:
+        """Set up the message."""
+        self.msg = Msg(
+            "user",
+            [TextBlock(type="text", text="Hello")],
+            "user",
+            metadata={"tags": ["a"]},
+        )
+
+    def test_freeze(self) -> None:
+        """Test the frozen message is read-only and doesn't affect the
+        original message."""
+        # The ordinary messages carry no copy-on-write state
+        self.assertNotIn("_shared_fields", vars(self.msg))
+
+        frozen = self.msg.freeze()
+        self.assertTrue(frozen.is_frozen)
+        self.assertFalse(self.msg.is_frozen)
+        self.assertIs(frozen.freeze(), frozen)
+        self.assertEqual(frozen.id, self.msg.id)
+
+        with self.assertRaises(AttributeError):
+            frozen.content = "Hi"
+        with self.assertRaises(TypeError):
+            frozen.content.append(TextBlock(type="text", text="Hi"))
+        with self.assertRaises(TypeError):
+            frozen.get_content_blocks("text")[0]["text"] = "Hi"
+        with self.assertRaises(TypeError):
+            frozen.metadata["tags"].append("b")
+
+        # The original message is still modifiable
+        self.msg.get_content_blocks("text")[0]["text"] = "Hi"
+        self.assertEqual(frozen.get_text_content(), "Hello")
+
+        # The frozen message is serialized as usual
+        self.assertEqual(
+            json.loads(json.dumps(frozen.to_dict()))["content"],
+            [{"type": "text", "text": "Hello"}],
+        )
+        unpickled = pickle.loads(pickle.dumps(frozen.content))
+        unpickled.append("b")
+        self.assertEqual(type(unpickled), list)
+
+    def test_fork(self) -> None:
+        """Test the forks share the content until being modified."""
+        frozen = self.msg.freeze()
+        fork1, fork2 = frozen.fork(), copy.deepcopy(frozen)
+        self.assertFalse(fork1.is_frozen)
+
+        # Reading doesn't copy the content
+        self.assertIs(fork1.get_content_blocks(), frozen.get_content_blocks())
+        self.assertIs(fork1.to_dict()["metadata"], frozen.metadata)
+
+        fork1.content.append(TextBlock(type="text", text="world"))
+        fork1.metadata["tags"].append("b")
+        self.assertEqual(fork1.get_text_content(), "Helloworld")
+        self.assertEqual(fork1.metadata, {"tags": ["a", "b"]})
+        self.assertEqual(fork2.get_text_content(), "Hello")
+        self.assertEqual(fork2.metadata, {"tags": ["a"]})
+        self.assertEqual(frozen.metadata, {"tags": ["a"]})
+
+        # Deep copying a fork keeps the unmodified fields shared
+        fork3 = copy.deepcopy(fork2)
+        self.assertIs(fork3.get_content_blocks(), frozen.get_content_blocks())
+        fork3.content = "Hi"
+        self.assertEqual(fork2.get_text_content(), "Hello")
+
+    def test_subclass(self) -> None:
+        """Test the subclasses of the message are kept by freezing, forking,
+        copying and pickling."""
+        msg = MyMsg("user", "Hello", "user")
+        frozen = msg.freeze()
+        self.assertIsInstance(frozen, MyMsg)
+        self.assertTrue(frozen.is_frozen)
+        with self.assertRaises(AttributeError):
+            frozen.name = "assistant"
+
+        unpickled = pickle.loads(pickle.dumps(frozen))
+        self.assertIsInstance(unpickled, MyMsg)
+        self.assertTrue(unpickled.is_frozen)
+
+        for copied in [
+            copy.deepcopy(msg),
+            frozen.fork(),
+            copy.deepcopy(frozen),
+        ]:
+            self.assertIs(type(copied), MyMsg)
+            self.assertFalse(copied.is_frozen)
+            self.assertEqual(copied.get_name(), "user")
+            self.assertEqual(copied.id, msg.id)
+
+    async def test_fanout_pipeline(self) -> None:
+        """Test the fanout pipeline shares the content between the agents,
+        while the agents can modify their inputs independently."""
+        readers = [RecordAgent(modify=False) for _ in range(3)]
+        writer = RecordAgent(modify=True)
+
+        res = await fanout_pipeline(readers + [writer], self.msg)
+        blocks = readers[0].received.get_content_blocks()
+        for reader in readers[1:]:
+            self.assertIs(reader.received.get_content_blocks(), blocks)
+        self.assertEqual(res[0].get_text_content(), "Hello")
+        self.assertEqual(
+            res[-1].get_text_content(),
+            "Hello" + writer.id,
+        )
+        self.assertEqual(res[-1].metadata["modified"], True)
+
+        # The input message is unchanged and still modifiable
+        self.assertFalse(self.msg.is_frozen)
+        self.assertEqual(self.msg.metadata, {"tags": ["a"]})
+        self.msg.metadata["modified"] = False
@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+"""Unittests for the metrics in AgentScope."""
+import math
+from typing import Any
+from unittest import IsolatedAsyncioTestCase
+
+from agentscope import _config
+from agentscope.agent import AgentBase
+from agentscope.message import Msg, TextBlock, ToolUseBlock
+from agentscope.metrics import MetricsRegistry, get_registry, setup_metrics
+from agentscope.model import ChatModelBase, ChatResponse
+from agentscope.model._model_usage import ChatUsage
+from agentscope.tool import Toolkit, ToolResponse
+from agentscope.tracing import trace_llm
+
+
+class MyModel(ChatModelBase):
+    """Test model class."""
+
+    def __init__(self) -> None:
+        """Initialize the test model."""
+        super().__init__("metrics_model", stream=False)
+
+    @trace_llm
+    async def __call__(self, *args: Any, **kwargs: Any) -> ChatResponse:
+        """Return a fixed response with usage."""
+        return ChatResponse(
+            content=[TextBlock(type="text", text="Hi")],
+            usage=ChatUsage(input_tokens=10, output_tokens=3, time=0.1),
+        )
+
+
+class MyAgent(AgentBase):
+    """Test agent class."""
+
+    def __init__(self) -> None:
+        """Initialize the test agent."""
+        super().__init__()
+        self.name = "metrics_agent"
+
+    async def reply(self, msg: Msg) -> Msg:
+        """Echo the input message."""
+        return msg
+
+    async def observe(self, msg: Msg) -> None:
+        """Do nothing."""
+
+    async def handle_interrupt(self, *args: Any, **kwargs: Any) -> Msg:
+        """Do nothing."""
+
+
+def good_tool() -> ToolResponse:
+    """A tool that succeeds."""
+    return ToolResponse(content=[TextBlock(type="text", text="ok")])
+
+
+def bad_tool() -> ToolResponse:
+    """A tool that fails."""
+    raise RuntimeError("boom")
+
+
+class MetricsTest(IsolatedAsyncioTestCase):
+    """Test cases for the metrics."""
+
+    async def asyncSetUp(self) -> None:
+        """Set up the environment."""
+        setup_metrics()
+        get_registry().clear()
+
+    async def test_registry(self) -> None:
+        """Test the metric types and the Prometheus text format."""
+        registry = MetricsRegistry()
+
+        counter = registry.counter("requests_total", "Requests.", ["route"])
+        counter.inc(route="/a")
+        counter.inc(2, route="/a")
+        self.assertEqual(counter.get(route="/a"), 3)
+        self.assertIs(
+            registry.counter("requests_total", "Requests.", ["route"]),
+            counter,
+        )
+        with self.assertRaises(ValueError):
+            registry.gauge("requests_total", "Requests.", ["route"])
+        with self.assertRaises(ValueError):
+            counter.inc(other="x")
+
+        gauge = registry.gauge("queue_size", "Queue size.")
+        gauge.set(5)
+        gauge.dec(2)
+        self.assertEqual(gauge.get(), 3)
+
+        histogram = registry.histogram(
+            "latency_seconds",
+            "Latency.",
+            buckets=[1, 2, 4],
+        )
+        self.assertTrue(math.isnan(histogram.quantile(0.5)))
+        for value in [0.5, 1.5, 1.5, 3]:
+            histogram.observe(value)
+        stats = histogram.get()
+        self.assertEqual(stats["count"], 4)
+        self.assertEqual(stats["sum"], 6.5)
+        self.assertListEqual(
+            stats["buckets"],
+            [(1, 1), (2, 3), (4, 4), (math.inf, 4)],
+        )
+        self.assertAlmostEqual(histogram.quantile(0.5), 1.5)
+
+        self.assertEqual(
+            registry.to_prometheus(),
+            "# HELP requests_total Requests.\n"
+            "# TYPE requests_total counter\n"
+            'requests_total{route="/a"} 3\n'
+            "# HELP queue_size Queue size.\n"
+            "# TYPE queue_size gauge\n"
+            "queue_size 3\n"
+            "# HELP latency_seconds Latency.\n"
+            "# TYPE latency_seconds histogram\n"
+            'latency_seconds_bucket{le="1"} 1\n'
+            'latency_seconds_bucket{le="2"} 3\n'
+            'latency_seconds_bucket{le="4"} 4\n'
+            'latency_seconds_bucket{le="+Inf"} 4\n'
+            "latency_seconds_sum 6.5\n"
+            "latency_seconds_count 4\n",
+        )
+
+    async def test_builtin_metrics(self) -> None:
+        """Test the built-in metrics are recorded automatically."""
+        registry = get_registry()
+
+        model = MyModel()
+        await model([])
+        self.assertEqual(
+            registry.get("agentscope_model_calls_total").get(
+                model="metrics_model",
+                status="ok",
+            ),
+            1,
+        )
+        tokens = registry.get("agentscope_model_tokens_total")
+        self.assertEqual(tokens.get(model="metrics_model", type="input"), 10)
+        self.assertEqual(tokens.get(model="metrics_model", type="output"), 3)
+
+        toolkit = Toolkit()
+        toolkit.register_tool_function(good_tool)
+        toolkit.register_tool_function(bad_tool)
+        for name in ["good_tool", "bad_tool"]:
+            res = await toolkit.call_tool_function(
+                ToolUseBlock(type="tool_use", id="1", name=name, input={}),
+            )
+            async for _ in res:
+                pass
+        calls = registry.get("agentscope_tool_calls_total")
+        self.assertEqual(calls.get(tool="good_tool", status="ok"), 1)
+        self.assertEqual(calls.get(tool="bad_tool", status="error"), 1)
+
+        agent = MyAgent()
+        await agent(Msg("user", "Hi", "user"))
+        self.assertEqual(
+            registry.get("agentscope_agent_replies_total").get(
+                agent="metrics_agent",
+                status="ok",
+            ),
+            1,
+        )
+        self.assertEqual(
+            registry.get("agentscope_agent_reply_seconds").get(
+                agent="metrics_agent",
+            )["count"],
+            1,
+        )
+
+    async def test_metrics_disabled(self) -> None:
+        """Test nothing is recorded when the metrics are disabled, which is
+        the default."""
+        _config.metrics_enabled = False
+        await MyModel()([])
+        self.assertIsNone(get_registry().get("agentscope_model_calls_total"))
+
+    async def asyncTearDown(self) -> None:
+        """Reset the environment."""
+        _config.metrics_enabled = False
+        get_registry().clear()
@@ -326,6 +326,21 @@ class TestAnthropicChatModel(IsolatedAsyncioTestCase):
             ]
             self.assertEqual(final_response.content, expected_content)
 
+            # The final output tokens arrive after the last content block,
+            # so the final response is yielded again with the same content
+            self.assertEqual(len(responses), 3)
+            self.assertEqual(responses[-2].content, final_response.content)
+            self.assertEqual(final_response.usage.output_tokens, 5)
+
+            stats = final_response.stream_stats
+            self.assertEqual(stats.n_chunks, 4)
+            self.assertIsNotNone(stats.time_to_first_token)
+            self.assertLessEqual(
+                stats.time_to_first_token,
+                final_response.usage.time,
+            )
+            self.assertEqual(sum(stats.chunk_gap_histogram.values()), 3)
+
     async def test_generate_kwargs_integration(self) -> None:
         """Test integration of generate_kwargs."""
         with patch("anthropic.AsyncAnthropic") as mock_client_class:
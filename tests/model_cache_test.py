@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for the chat response caches."""
+import asyncio
+import os
+import shutil
+from typing import Any, AsyncGenerator
+from unittest.async_case import IsolatedAsyncioTestCase
+
+from agentscope.message import TextBlock
+from agentscope.model import (
+    CachedChatModel,
+    ChatModelBase,
+    ChatResponse,
+    FileChatCache,
+    InMemoryChatCache,
+)
+from agentscope.model._model_usage import ChatUsage
+
+
+class MockChatModel(ChatModelBase):
+    """A mock chat model that counts the calls."""
+
+    def __init__(self, stream: bool) -> None:
+        """Initialize the mock model."""
+        super().__init__("mock", stream)
+        self.generate_kwargs = {"temperature": 0.0}
+        self.cnt = 0
+
+    async def __call__(
+        self,
+        messages: list[dict],
+        **kwargs: Any,
+    ) -> ChatResponse | AsyncGenerator[ChatResponse, None]:
+        """Return a response depending on the number of calls."""
+        self.cnt += 1
+        if self.stream:
+            return self._stream()
+        return self._response(f"response {self.cnt}")
+
+    async def _stream(self) -> AsyncGenerator[ChatResponse, None]:
+        """Yield accumulated chunks."""
+        text = ""
+        for word in ["Hello", " world"]:
+            await asyncio.sleep(0.05)
+            text += word
+            yield self._response(text)
+
+    @staticmethod
+    def _response(text: str) -> ChatResponse:
+        """Create a response with usage."""
+        return ChatResponse(
+            content=[TextBlock(type="text", text=text)],
+            usage=ChatUsage(input_tokens=10, output_tokens=5, time=0.1),
+        )
+
+
+class ChatCacheTest(IsolatedAsyncioTestCase):
+    """Test cases for the chat response caches."""
+
+    async def asyncSetUp(self) -> None:
+        """Set up the cache directory."""
+        self.cache_dir = "./.cache_chat_test"
+
+    async def test_non_streaming_replay(self) -> None:
+        """Test the cached response is replayed for the same request."""
+        model = MockChatModel(stream=False)
+        cached = CachedChatModel(model, InMemoryChatCache())
+        messages = [{"role": "user", "content": "Hi"}]
+
+        res1 = await cached(messages)
+        res2 = await cached(messages)
+        self.assertEqual(model.cnt, 1)
+        self.assertEqual(res1.content, res2.content)
+        self.assertEqual(res2.usage.input_tokens, 10)
+
+        # Different generation arguments lead to a different key
+        await cached(messages, temperature=0.5)
+        self.assertEqual(model.cnt, 2)
+
+    async def test_streaming_replay(self) -> None:
+        """Test the streaming response is recorded and replayed."""
+        model = MockChatModel(stream=True)
+        cached = CachedChatModel(
+            model,
+            FileChatCache(self.cache_dir),
+            replay_speed=2.0,
+        )
+        messages = [{"role": "user", "content": "Hi"}]
+
+        chunks1 = [_.content async for _ in await cached(messages)]
+
+        start = asyncio.get_running_loop().time()
+        chunks2 = [_.content async for _ in await cached(messages)]
+        elapsed = asyncio.get_running_loop().time() - start
+
+        self.assertEqual(model.cnt, 1)
+        self.assertEqual(chunks1, chunks2)
+        self.assertEqual(
+            chunks2[-1],
+            [TextBlock(type="text", text="Hello world")],
+        )
+        # Replayed at twice the original speed
+        self.assertGreater(elapsed, 0.04)
+        self.assertLess(elapsed, 0.09)
+
+    async def test_in_memory_eviction(self) -> None:
+        """Test the TTL and size eviction of the in-memory cache."""
+        cache = InMemoryChatCache(max_entries=2)
+        for key in ["a", "b", "c"]:
+            await cache.store(key, key)
+        self.assertIsNone(await cache.retrieve("a"))
+        self.assertEqual(await cache.retrieve("c"), "c")
+
+        cache = InMemoryChatCache(ttl=0.05)
+        await cache.store("a", "a")
+        self.assertEqual(await cache.retrieve("a"), "a")
+        await asyncio.sleep(0.1)
+        self.assertIsNone(await cache.retrieve("a"))
+
+    async def test_file_eviction(self) -> None:
+        """Test the size eviction of the file cache."""
+        cache = FileChatCache(self.cache_dir, max_file_number=2)
+        for key in ["a", "b", "c"]:
+            await cache.store(key, {"value": key})
+            await asyncio.sleep(0.01)
+        self.assertEqual(len(os.listdir(self.cache_dir)), 2)
+        self.assertIsNone(await cache.retrieve("a"))
+        self.assertEqual(await cache.retrieve("c"), {"value": "c"})
+
+        await cache.clear()
+        self.assertEqual(os.listdir(self.cache_dir), [])
+
+    async def asyncTearDown(self) -> None:
+        """Clean up the cache directory."""
+        if os.path.exists(self.cache_dir):
+            shutil.rmtree(self.cache_dir)
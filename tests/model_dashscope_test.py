@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 """Unit tests for DashScope API model class."""
-from typing import Any, AsyncGenerator
+import threading
+from typing import Any, AsyncGenerator, Generator
 from unittest.async_case import IsolatedAsyncioTestCase
 from unittest.mock import Mock, patch
 from http import HTTPStatus
@@ -326,6 +327,104 @@ class TestDashScopeChatModel(IsolatedAsyncioTestCase):
             ]
             self.assertEqual(final_response.content, expected_content)
 
+            stats = final_response.stream_stats
+            self.assertEqual(stats.n_chunks, 2)
+            self.assertIsNotNone(stats.time_to_first_token)
+            self.assertLessEqual(
+                stats.time_to_first_token,
+                final_response.usage.time,
+            )
+            self.assertEqual(sum(stats.chunk_gap_histogram.values()), 1)
+
+    async def test_multimodal_call_not_blocking_event_loop(self) -> None:
+        """Test the multimodal conversation API is called in a worker
+        thread."""
+        model = DashScopeChatModel(
+            model_name="qwen-vl-max",
+            api_key="test_key",
+            stream=False,
+        )
+        messages = [{"role": "user", "content": [{"text": "Hello"}]}]
+
+        main_thread = threading.get_ident()
+        call_threads = []
+
+        def _mock_call(**_kwargs: Any) -> Mock:
+            call_threads.append(threading.get_ident())
+            return self._create_mock_response("Hi!")
+
+        with patch(
+            "dashscope.MultiModalConversation.call",
+            side_effect=_mock_call,
+        ) as mock_call:
+            result = await model(messages)
+            self.assertEqual(mock_call.call_args[1]["model"], "qwen-vl-max")
+            self.assertEqual(
+                result.content,
+                [TextBlock(type="text", text="Hi!")],
+            )
+            self.assertNotEqual(call_threads, [main_thread])
+
+    async def test_multimodal_streaming_response_processing(self) -> None:
+        """Test the streaming multimodal conversation API is iterated in a
+        worker thread and bridged back to the event loop."""
+        model = DashScopeChatModel(
+            model_name="qwen-vl-max",
+            api_key="test_key",
+            stream=True,
+        )
+        messages = [{"role": "user", "content": [{"text": "Hello"}]}]
+
+        main_thread = threading.get_ident()
+        iter_threads = []
+        chunks = [
+            self._create_mock_chunk(content=[{"text": "Hello"}]),
+            self._create_mock_chunk(content=[{"text": " there!"}]),
+        ]
+
+        def _mock_call(**_kwargs: Any) -> Generator:
+            for chunk in chunks:
+                iter_threads.append(threading.get_ident())
+                yield chunk
+
+        with patch(
+            "dashscope.MultiModalConversation.call",
+            side_effect=_mock_call,
+        ):
+            result = await model(messages)
+            responses = [_ async for _ in result]
+
+        self.assertEqual(len(responses), 2)
+        self.assertEqual(
+            responses[-1].content,
+            [TextBlock(type="text", text="Hello there!")],
+        )
+        self.assertEqual(len(iter_threads), 2)
+        self.assertNotIn(main_thread, iter_threads)
+
+    async def test_multimodal_streaming_error(self) -> None:
+        """Test the errors raised in the worker thread are propagated to the
+        consumer."""
+        model = DashScopeChatModel(
+            model_name="qwen-vl-max",
+            api_key="test_key",
+            stream=True,
+        )
+        messages = [{"role": "user", "content": [{"text": "Hello"}]}]
+
+        def _mock_call(**_kwargs: Any) -> Generator:
+            yield self._create_mock_chunk(content=[{"text": "Hello"}])
+            raise ConnectionError("Connection lost")
+
+        with patch(
+            "dashscope.MultiModalConversation.call",
+            side_effect=_mock_call,
+        ):
+            result = await model(messages)
+            with self.assertRaises(ConnectionError):
+                async for _ in result:
+                    pass
+
     def test_tools_schema_validation_through_api(self) -> None:
         """Test tools schema validation through API call."""
         model = DashScopeChatModel(
@@ -423,7 +522,7 @@ class TestDashScopeChatModel(IsolatedAsyncioTestCase):
 
     def _create_mock_chunk(
         self,
-        content: str = "",
+        content: str | list = "",
         reasoning_content: str = "",
         tool_calls: list = None,
     ) -> Mock:
@@ -328,6 +328,15 @@ class TestGeminiChatModel(IsolatedAsyncioTestCase):
             ]
             self.assertEqual(final_response.content, expected_content)
 
+            stats = final_response.stream_stats
+            self.assertEqual(stats.n_chunks, 2)
+            self.assertIsNotNone(stats.time_to_first_token)
+            self.assertLessEqual(
+                stats.time_to_first_token,
+                final_response.usage.time,
+            )
+            self.assertEqual(sum(stats.chunk_gap_histogram.values()), 1)
+
     async def test_generate_kwargs_integration(self) -> None:
         """Test integration of generate_kwargs."""
         with patch("google.genai.Client") as mock_client_class:
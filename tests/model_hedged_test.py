@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for the hedged chat model."""
+import asyncio
+from typing import Any, AsyncGenerator
+from unittest.async_case import IsolatedAsyncioTestCase
+
+from agentscope.formatter import FormatterBase, HedgedFormatter
+from agentscope.message import Msg, TextBlock
+from agentscope.model import ChatModelBase, ChatResponse, HedgedChatModel
+
+
+class MockChatModel(ChatModelBase):
+    """A mock chat model with configurable latency and failure."""
+
+    def __init__(
+        self,
+        name: str,
+        delay: float,
+        fail: bool = False,
+        stream: bool = False,
+    ) -> None:
+        """Initialize the mock model."""
+        super().__init__(name, stream)
+        self.delay = delay
+        self.fail = fail
+        self.received = []
+        self.cancelled = False
+
+    async def __call__(
+        self,
+        messages: list[dict],
+        **kwargs: Any,
+    ) -> ChatResponse | AsyncGenerator[ChatResponse, None]:
+        """Return the model name after a delay."""
+        self.received.append(messages)
+        if self.stream:
+            return self._stream()
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        if self.fail:
+            raise RuntimeError(f"{self.model_name} failed")
+        return self._response()
+
+    async def _stream(self) -> AsyncGenerator[ChatResponse, None]:
+        """Yield two chunks, the first one after the delay."""
+        try:
+            await asyncio.sleep(self.delay)
+            yield self._response()
+            yield self._response()
+        except (asyncio.CancelledError, GeneratorExit):
+            self.cancelled = True
+            raise
+
+    def _response(self) -> ChatResponse:
+        """Create a response with the model name."""
+        return ChatResponse(
+            content=[TextBlock(type="text", text=self.model_name)],
+        )
+
+
+class MockFormatter(FormatterBase):
+    """A mock formatter that tags the messages."""
+
+    def __init__(self, tag: str) -> None:
+        """Initialize the mock formatter."""
+        self.tag = tag
+
+    async def format(self, msgs: list[Msg], **kwargs: Any) -> list[dict]:
+        """Format the messages with the tag."""
+        return [{"role": _.role, "content": self.tag} for _ in msgs]
+
+
+class HedgedChatModelTest(IsolatedAsyncioTestCase):
+    """Test cases for the hedged chat model."""
+
+    async def test_hedge_request(self) -> None:
+        """Test the hedge request wins when the primary is slow."""
+        slow = MockChatModel("slow", delay=1.0)
+        fast = MockChatModel("fast", delay=0.01)
+        model = HedgedChatModel([slow, fast], default_hedge_delay=0.05)
+
+        res = await model([{"role": "user", "content": "Hi"}])
+        self.assertEqual(res.content[0]["text"], "fast")
+        await asyncio.sleep(0)
+        self.assertTrue(slow.cancelled)
+
+        # The elapsed time of the cancelled request is a latency sample
+        stats = model.get_stats()
+        self.assertEqual(stats[0]["n_cancelled"], 1)
+        self.assertGreaterEqual(stats[0]["p50"], 0.05)
+        self.assertEqual(stats[1]["n_requests"], 1)
+
+        # The fast backend is preferred once it has latency samples
+        res = await model([{"role": "user", "content": "Hi"}])
+        self.assertEqual(res.content[0]["text"], "fast")
+        self.assertEqual(len(slow.received), 1)
+
+    async def test_no_hedge_when_fast(self) -> None:
+        """Test no hedge request is sent if the primary is fast enough."""
+        primary = MockChatModel("primary", delay=0.01)
+        secondary = MockChatModel("secondary", delay=0.01)
+        model = HedgedChatModel([primary, secondary], default_hedge_delay=1)
+
+        res = await model([{"role": "user", "content": "Hi"}])
+        self.assertEqual(res.content[0]["text"], "primary")
+        self.assertEqual(secondary.received, [])
+
+    async def test_failover(self) -> None:
+        """Test the request fails over to the next backend on errors."""
+        broken = MockChatModel("broken", delay=0.01, fail=True)
+        backup = MockChatModel("backup", delay=0.01)
+        model = HedgedChatModel([broken, backup], hedge=False)
+
+        res = await model([{"role": "user", "content": "Hi"}])
+        self.assertEqual(res.content[0]["text"], "backup")
+        self.assertEqual(model.get_stats()[0]["n_errors"], 1)
+
+        # All backends fail
+        model = HedgedChatModel([broken], hedge=False)
+        with self.assertRaises(RuntimeError):
+            await model([{"role": "user", "content": "Hi"}])
+
+    async def test_streaming_hedge(self) -> None:
+        """Test the hedging of streaming backends by the first chunk."""
+        slow = MockChatModel("slow", delay=1.0, stream=True)
+        fast = MockChatModel("fast", delay=0.01, stream=True)
+        model = HedgedChatModel([slow, fast], default_hedge_delay=0.05)
+
+        res = await model([{"role": "user", "content": "Hi"}])
+        chunks = [_.content[0]["text"] async for _ in res]
+        self.assertEqual(chunks, ["fast", "fast"])
+        await asyncio.sleep(0)
+        self.assertTrue(slow.cancelled)
+
+    async def test_hedged_formatter(self) -> None:
+        """Test each backend receives the prompt of its formatter."""
+        broken = MockChatModel("broken", delay=0.01, fail=True)
+        backup = MockChatModel("backup", delay=0.01)
+        model = HedgedChatModel([broken, backup])
+        formatter = HedgedFormatter([MockFormatter("a"), MockFormatter("b")])
+
+        prompt = await formatter.format([Msg("user", "Hi", "user")])
+        self.assertEqual(prompt, [{"role": "user", "content": "a"}])
+
+        await model(prompt)
+        self.assertEqual(broken.received, [[{"role": "user", "content": "a"}]])
+        self.assertEqual(backup.received, [[{"role": "user", "content": "b"}]])
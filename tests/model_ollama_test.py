@@ -286,6 +286,15 @@ class TestOllamaChatModel(IsolatedAsyncioTestCase):
             expected_content = [TextBlock(type="text", text="Hello there!")]
             self.assertEqual(final_response.content, expected_content)
 
+            stats = final_response.stream_stats
+            self.assertEqual(stats.n_chunks, 2)
+            self.assertIsNotNone(stats.time_to_first_token)
+            self.assertLessEqual(
+                stats.time_to_first_token,
+                final_response.usage.time,
+            )
+            self.assertEqual(sum(stats.chunk_gap_histogram.values()), 1)
+
     async def test_options_integration(self) -> None:
         """Test integration of options parameter."""
         with patch("ollama.AsyncClient") as mock_client_class:
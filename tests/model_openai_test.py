@@ -249,6 +249,61 @@ class TestOpenAIChatModel(IsolatedAsyncioTestCase):
             expected_content = [TextBlock(type="text", text="Hello there!")]
             self.assertEqual(final_response.content, expected_content)
 
+            stats = final_response.stream_stats
+            self.assertEqual(stats.n_chunks, 2)
+            self.assertIsNotNone(stats.time_to_first_token)
+            self.assertLessEqual(
+                stats.time_to_first_token,
+                final_response.usage.time,
+            )
+            self.assertEqual(sum(stats.chunk_gap_histogram.values()), 1)
+            self.assertIn("+Inf", stats.chunk_gap_histogram)
+
+    async def test_streaming_usage_chunk(self) -> None:
+        """Test the final response is yielded again when the usage comes in
+        the last chunk without choices."""
+        with patch("openai.AsyncClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client_class.return_value = mock_client
+
+            model = OpenAIChatModel(
+                model_name="gpt-4",
+                api_key="test_key",
+                stream=True,
+            )
+            model.client = mock_client
+
+            mock_client.chat.completions.create = AsyncMock(
+                return_value=self._create_stream_mock(
+                    [
+                        {"content": "Hello", "with_usage": False},
+                        {"content": " there!", "with_usage": False},
+                        {"usage_only": True},
+                    ],
+                ),
+            )
+            result = await model([{"role": "user", "content": "Hello"}])
+            responses = [_ async for _ in result]
+
+            self.assertEqual(len(responses), 3)
+            final_response = responses[-1]
+            self.assertEqual(responses[-2].content, final_response.content)
+            self.assertEqual(
+                final_response.content,
+                [TextBlock(type="text", text="Hello there!")],
+            )
+            self.assertIsNone(responses[-2].usage)
+            self.assertEqual(final_response.usage.output_tokens, 10)
+
+            stats = final_response.stream_stats
+            self.assertEqual(stats.n_chunks, 3)
+            self.assertIsNotNone(stats.time_to_first_token)
+            self.assertLessEqual(
+                stats.time_to_first_token,
+                final_response.usage.time,
+            )
+            self.assertEqual(sum(stats.chunk_gap_histogram.values()), 2)
+
     # Auxiliary methods - ensure all Mock objects have complete attributes
     def _create_mock_response(
         self,
@@ -372,10 +427,15 @@ class TestOpenAIChatModel(IsolatedAsyncioTestCase):
                 choice.delta = delta
 
                 chunk = Mock()
-                chunk.choices = [choice]
-                chunk.usage = Mock()
-                chunk.usage.prompt_tokens = 5
-                chunk.usage.completion_tokens = 10
+                # The usage-only chunk comes without choices
+                chunk.choices = (
+                    [] if chunk_data.get("usage_only") else [choice]
+                )
+                chunk.usage = None
+                if chunk_data.get("with_usage", True):
+                    chunk.usage = Mock()
+                    chunk.usage.prompt_tokens = 5
+                    chunk.usage.completion_tokens = 10
                 return chunk
 
         return MockStream(chunks_data)
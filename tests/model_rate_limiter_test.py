@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for the chat rate limiter."""
+import asyncio
+import gc
+from typing import Any, AsyncGenerator
+from unittest.async_case import IsolatedAsyncioTestCase
+
+from agentscope.message import TextBlock
+from agentscope.model import (
+    ChatModelBase,
+    ChatResponse,
+    ChatRateLimiter,
+    RateLimitedChatModel,
+)
+from agentscope.model._model_usage import ChatUsage
+from agentscope.token import TokenCounterBase
+
+
+class MockChatModel(ChatModelBase):
+    """A mock chat model that records the number of concurrent calls."""
+
+    def __init__(self, stream: bool = False, delay: float = 0.05) -> None:
+        """Initialize the mock model."""
+        super().__init__("mock", stream)
+        self.delay = delay
+        self.running = 0
+        self.max_running = 0
+        self.calls = []
+
+    async def __call__(
+        self,
+        messages: list[dict],
+        **kwargs: Any,
+    ) -> ChatResponse | AsyncGenerator[ChatResponse, None]:
+        """Return a fixed response after a delay."""
+        self.calls.append(messages[0]["content"])
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        if self.stream:
+            return self._stream()
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.running -= 1
+        return self._response()
+
+    async def _stream(self) -> AsyncGenerator[ChatResponse, None]:
+        """Yield two chunks."""
+        try:
+            for _ in range(2):
+                await asyncio.sleep(self.delay)
+                yield self._response()
+        finally:
+            self.running -= 1
+
+    @staticmethod
+    def _response() -> ChatResponse:
+        """Create a response with usage."""
+        return ChatResponse(
+            content=[TextBlock(type="text", text="ok")],
+            usage=ChatUsage(input_tokens=10, output_tokens=5, time=0.1),
+        )
+
+
+class MockTokenCounter(TokenCounterBase):
+    """A mock token counter returning a fixed number."""
+
+    async def count(self, messages: list[dict], **kwargs: Any) -> int:
+        """Return a fixed number."""
+        return 100
+
+
+class RateLimiterTest(IsolatedAsyncioTestCase):
+    """Test cases for the chat rate limiter."""
+
+    async def test_max_concurrency(self) -> None:
+        """Test the number of in-flight requests is bounded."""
+        model = MockChatModel()
+        limited = RateLimitedChatModel(
+            model,
+            ChatRateLimiter(max_concurrency=2),
+        )
+        res = await asyncio.gather(
+            *[
+                limited([{"role": "user", "content": str(i)}])
+                for i in range(6)
+            ],
+        )
+        self.assertEqual(len(res), 6)
+        self.assertEqual(model.max_running, 2)
+        self.assertEqual(limited.rate_limiter.in_flight, 0)
+        self.assertGreater(res[-1].usage.queue_time, 0)
+
+    async def test_streaming_holds_slot(self) -> None:
+        """Test the slot is held until the streaming response finishes."""
+        model = MockChatModel(stream=True)
+        limited = RateLimitedChatModel(
+            model,
+            ChatRateLimiter(max_concurrency=1),
+        )
+
+        async def _consume(i: int) -> list:
+            res = await limited([{"role": "user", "content": str(i)}])
+            return [_ async for _ in res]
+
+        chunks = await asyncio.gather(*[_consume(i) for i in range(3)])
+        self.assertEqual([len(_) for _ in chunks], [2, 2, 2])
+        self.assertEqual(model.max_running, 1)
+        self.assertEqual(limited.rate_limiter.in_flight, 0)
+
+    async def test_dropped_stream(self) -> None:
+        """Test the slot is released when the streaming response is closed
+        early or dropped without being iterated."""
+        model = MockChatModel(stream=True, delay=0)
+        limiter = ChatRateLimiter(max_concurrency=1)
+        limited = RateLimitedChatModel(model, limiter)
+
+        res = await limited([{"role": "user", "content": "closed"}])
+        await anext(res)
+        self.assertEqual(limiter.in_flight, 1)
+        await res.aclose()
+        self.assertEqual(limiter.in_flight, 0)
+
+        res = await limited([{"role": "user", "content": "dropped"}])
+        self.assertEqual(limiter.in_flight, 1)
+        del res
+        gc.collect()
+        self.assertEqual(limiter.in_flight, 0)
+
+        # The next request is admitted immediately
+        res = await asyncio.wait_for(
+            limited([{"role": "user", "content": "next"}]),
+            timeout=1,
+        )
+        self.assertEqual(len([_ async for _ in res]), 2)
+        self.assertEqual(limiter.in_flight, 0)
+
+    async def test_priority(self) -> None:
+        """Test the queued requests are admitted by priority."""
+        model = MockChatModel(delay=0.01)
+        limiter = ChatRateLimiter(max_concurrency=1)
+        limited = RateLimitedChatModel(model, limiter)
+
+        # Occupy the only slot
+        await limiter.acquire()
+        tasks = [
+            asyncio.create_task(
+                limited(
+                    [{"role": "user", "content": f"p{priority}"}],
+                    priority=priority,
+                ),
+            )
+            for priority in [3, 1, 2]
+        ]
+        await asyncio.sleep(0.01)
+        self.assertEqual(limiter.queue_size, 3)
+        limiter.release()
+        await asyncio.gather(*tasks)
+        self.assertEqual(model.calls, ["p1", "p2", "p3"])
+
+    async def test_tokens_per_minute(self) -> None:
+        """Test the requests wait for the token bucket to refill."""
+        limiter = ChatRateLimiter(tokens_per_minute=60000)
+        limited = RateLimitedChatModel(
+            MockChatModel(delay=0),
+            limiter,
+            token_counter=MockTokenCounter(),
+        )
+        # Drain the bucket, the refill rate is 1000 tokens per second
+        await limiter.acquire(60000)
+        limiter.release()
+
+        res = await limited([{"role": "user", "content": "hi"}])
+        self.assertGreaterEqual(res.usage.queue_time, 0.08)
+
+    async def test_cancelled_waiter(self) -> None:
+        """Test a cancelled waiter is removed from the queue."""
+        limiter = ChatRateLimiter(max_concurrency=1)
+        await limiter.acquire()
+
+        task = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0.01)
+        self.assertEqual(limiter.queue_size, 1)
+        task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+        self.assertEqual(limiter.queue_size, 0)
+
+        limiter.release()
+        self.assertEqual(limiter.in_flight, 0)
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 """Unit tests for pipeline classes and functions"""
+import asyncio
 from typing import Any
 from unittest.async_case import IsolatedAsyncioTestCase
 
@@ -68,6 +69,46 @@ class MultAgent(AgentBase):
         """Handle interrupt"""
 
 
+class StreamAgent(AgentBase):
+    """Stream agent class, which streams its reply in chunks and records the
+    streamed chunks from the upstream agent."""
+
+    def __init__(self, name: str, events: list[str], delay: float) -> None:
+        """Initialize the agent"""
+        super().__init__()
+        self.name = name
+        self.events = events
+        self.delay = delay
+        self.disable_console_output()
+
+    async def reply(self, x: Msg | None) -> Msg:
+        """Reply function"""
+        self.events.append(f"{self.name} reply {x.get_text_content()}")
+        msg = Msg(self.name, "", "assistant")
+        for i in range(3):
+            msg.content += str(i)
+            await self.print(msg, i == 2)
+            self.events.append(f"{self.name} print {msg.content}")
+            if self.delay < 0:
+                raise ValueError(f"{self.name} failed")
+        return msg
+
+    async def observe_stream(self, msg: Msg, last: bool) -> None:
+        """Observe the streamed chunk slowly"""
+        await asyncio.sleep(self.delay)
+        self.events.append(f"{self.name} observe {msg.content} {last}")
+
+    async def observe(self, msg: Msg | list[Msg] | None) -> None:
+        """Observe function"""
+
+    async def handle_interrupt(
+        self,
+        *args: Any,
+        **kwargs: Any,
+    ) -> Msg:
+        """Handle interrupt"""
+
+
 class PipelineTest(IsolatedAsyncioTestCase):
     """Test cases for Pipelines"""
 
@@ -186,6 +227,63 @@ class PipelineTest(IsolatedAsyncioTestCase):
         res = await pipeline(None)
         self.assertIsNone(res)
 
+    async def test_streaming_sequential_pipeline(self) -> None:
+        """Test the streamed chunks are passed to the next agent before the
+        previous agent finishes, with backpressure by the bounded queue"""
+
+        events: list[str] = []
+        agent1 = StreamAgent("A", events, 0)
+        agent2 = StreamAgent("B", events, 0.01)
+        agent3 = StreamAgent("C", events, 0)
+
+        res = await sequential_pipeline(
+            [agent1, agent2, agent3],
+            Msg("user", "x", "user"),
+            streaming=True,
+            max_queue_size=1,
+        )
+        self.assertEqual(res.content, "012")
+        self.assertListEqual(
+            events[: events.index("B reply 012")],
+            [
+                "A reply x",
+                # The first chunk is taken by the slow consumer at once, and
+                # the next one waits in the queue, which blocks the printing
+                "A print 0",
+                "A print 01",
+                "B observe 0 False",
+                "A print 012",
+                "B observe 01 False",
+                "B observe 012 True",
+            ],
+        )
+        # All the chunks of B are observed by C before C replies
+        self.assertLess(
+            events.index("C observe 012 True"),
+            events.index("C reply 012"),
+        )
+        self.assertLess(
+            events.index("C observe 0 False"),
+            events.index("B print 012"),
+        )
+
+        # The consumer is cancelled when the upstream agent fails
+        agent2.delay = 10
+        with self.assertRaises(ValueError):
+            await sequential_pipeline(
+                [StreamAgent("D", events, -1), agent2],
+                Msg("user", "x", "user"),
+                streaming=True,
+            )
+        self.assertSetEqual(asyncio.all_tasks(), {asyncio.current_task()})
+
+        # The class-based pipeline without streaming
+        events.clear()
+        pipeline = SequentialPipeline([agent1, agent2])
+        res = await pipeline(Msg("user", "x", "user"))
+        self.assertEqual(res.content, "012")
+        self.assertNotIn("B observe 012 True", events)
+
     # ==================== Fanout Pipeline Tests ====================
 
     async def test_functional_fanout_pipeline_concurrent(self) -> None:
@@ -1,14 +1,16 @@
 # -*- coding: utf-8 -*-
 """The ReAct agent unittests."""
+import tempfile
 from typing import Any
 from unittest import IsolatedAsyncioTestCase
 
 from agentscope.agent import ReActAgent
 from agentscope.formatter import DashScopeChatFormatter
-from agentscope.memory import InMemoryMemory
-from agentscope.message import TextBlock, ToolUseBlock, Msg
+from agentscope.memory import InMemoryMemory, LongTermMemoryBase
+from agentscope.message import TextBlock, ToolUseBlock, Msg, BlobStore
 from agentscope.model import ChatModelBase, ChatResponse
-from agentscope.tool import Toolkit
+from agentscope.pipeline import sequential_pipeline
+from agentscope.tool import Toolkit, ToolResponse, ToolOutputPolicy
 
 
 class MyModel(ChatModelBase):
@@ -30,6 +32,36 @@ class MyModel(ChatModelBase):
         )
 
 
+class ToolCallModel(ChatModelBase):
+    """Test model class that calls a tool once and then answers."""
+
+    def __init__(self, tool_name: str) -> None:
+        """Initialize the test model."""
+        super().__init__("test_model", stream=False)
+        self.tool_name = tool_name
+        self.n_calls = 0
+
+    async def __call__(
+        self,
+        _messages: list[dict],
+        **kwargs: Any,
+    ) -> ChatResponse:
+        """Mock model call."""
+        self.n_calls += 1
+        if self.n_calls == 1:
+            return ChatResponse(
+                content=[
+                    ToolUseBlock(
+                        type="tool_use",
+                        id="1",
+                        name=self.tool_name,
+                        input={},
+                    ),
+                ],
+            )
+        return ChatResponse(content=[TextBlock(type="text", text="done")])
+
+
 async def pre_reasoning_hook(self: ReActAgent, _kwargs: Any) -> None:
     """Mock pre-reasoning hook."""
     if hasattr(self, "cnt_pre_reasoning"):
@@ -70,6 +102,39 @@ async def post_acting_hook(
         self.cnt_post_acting = 1
 
 
+def large_output_tool() -> ToolResponse:
+    """A mock tool function that returns a large output."""
+    return ToolResponse(
+        content=[TextBlock(type="text", text="a" * 500 + "b" * 500)],
+    )
+
+
+class MyLongTermMemory(LongTermMemoryBase):
+    """Test long-term memory class."""
+
+    def __init__(self) -> None:
+        """Initialize the test long-term memory."""
+        super().__init__()
+        self.queries: list[tuple[str | None, bool]] = []
+
+    async def record(self, msgs: list[Msg | None], **kwargs: Any) -> None:
+        """Mock record."""
+
+    async def retrieve(
+        self, msg: Msg | list[Msg] | None, **kwargs: Any
+    ) -> str:
+        """Mock retrieve, which records the query and whether it's a
+        streamed chunk."""
+        self.queries.append((msg.get_text_content(), msg.is_frozen))
+        return "Friday likes 123"
+
+    async def record_to_memory(self, *args: Any, **kwargs: Any) -> Any:
+        """Mock record_to_memory."""
+
+    async def retrieve_from_memory(self, *args: Any, **kwargs: Any) -> Any:
+        """Mock retrieve_from_memory."""
+
+
 class ReActAgentTest(IsolatedAsyncioTestCase):
     """Test class for ReActAgent."""
 
@@ -153,3 +218,78 @@ class ReActAgentTest(IsolatedAsyncioTestCase):
             getattr(agent, "cnt_post_acting"),
             2,
         )
+
+    async def test_streaming_retrieval(self) -> None:
+        """Test the long-term memory retrieval starts early in the streaming
+        pipeline, and is reused by the reply."""
+        long_term_memory = MyLongTermMemory()
+        agents = [
+            ReActAgent(
+                name=name,
+                sys_prompt="You are a helpful assistant.",
+                model=MyModel(),
+                formatter=DashScopeChatFormatter(),
+                long_term_memory=long_term_memory if name == "Bob" else None,
+                long_term_memory_mode="static_control",
+            )
+            for name in ["Alice", "Bob"]
+        ]
+        for agent in agents:
+            agent.disable_console_output()
+
+        res = await sequential_pipeline(agents, streaming=True)
+        self.assertEqual(res.get_text_content(), "123")
+        # Retrieved once by the streamed text reply of Alice
+        self.assertListEqual(long_term_memory.queries, [("123", True)])
+        msgs = await agents[1].memory.get_memory()
+        self.assertIn("Friday likes 123", msgs[1].get_text_content())
+
+        long_term_memory.queries.clear()
+        await sequential_pipeline(agents)
+        self.assertListEqual(long_term_memory.queries, [("123", False)])
+
+    async def test_tool_output_policy(self) -> None:
+        """Test the large tool output is truncated in the memory and can be
+        paged through from the blob store."""
+        toolkit = Toolkit()
+        toolkit.register_tool_function(large_output_tool)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            agent = ReActAgent(
+                name="Friday",
+                sys_prompt="You are a helpful assistant named Friday.",
+                model=ToolCallModel("large_output_tool"),
+                formatter=DashScopeChatFormatter(),
+                toolkit=toolkit,
+                tool_output_policy={
+                    "large_output_tool": ToolOutputPolicy(
+                        max_inline_chars=300,
+                        head_chars=100,
+                        tail_chars=50,
+                    ),
+                },
+                blob_store=BlobStore(tmp_dir),
+            )
+            self.assertIn("view_tool_output", toolkit.tools)
+
+            await agent()
+            msgs = await agent.memory.get_memory()
+            output = msgs[1].content[0]["output"]
+            self.assertEqual(len(output), 1)
+            self.assertTrue(output[0]["text"].startswith("a" * 100 + "\n"))
+            self.assertTrue(output[0]["text"].endswith("\n" + "b" * 50))
+            self.assertIn("850 characters omitted", output[0]["text"])
+
+            blob_id = agent.blob_store.put("a" * 500 + "b" * 500)
+            self.assertIn(blob_id, output[0]["text"])
+
+            # Page through the full output
+            res = agent.view_tool_output(blob_id, offset=450, length=100)
+            text = res.content[0]["text"]
+            self.assertIn("a" * 50 + "b" * 50, text)
+            self.assertIn("450 characters remaining", text)
+            self.assertIn("offset=550", text)
+
+            # The page is capped by the maximum inline size
+            res = agent.view_tool_output(blob_id, offset=0, length=10000)
+            self.assertIn("700 characters remaining", res.content[0]["text"])
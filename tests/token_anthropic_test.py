@@ -2,8 +2,11 @@
 """The unittests for huggingface token counter."""
 import os
 from unittest.async_case import IsolatedAsyncioTestCase
+from unittest.mock import AsyncMock, MagicMock
 
-from agentscope.token import AnthropicTokenCounter
+from agentscope.formatter import AnthropicChatFormatter
+from agentscope.message import Msg
+from agentscope.token import AnthropicTokenCounter, LocalTokenEstimator
 
 
 class AnthropicTokenCounterTest(IsolatedAsyncioTestCase):
@@ -106,3 +109,69 @@ class AnthropicTokenCounterTest(IsolatedAsyncioTestCase):
 
             res = await counter.count(self.messages)
             self.assertEqual(res, 49)
+
+    async def test_local_mode(self) -> None:
+        """Test the offline estimation in the local mode."""
+        counter = AnthropicTokenCounter(
+            model_name="claude-sonnet-4-20250514",
+            mode="local",
+        )
+        self.assertIsNone(counter.client)
+
+        # The image block is counted as fixed tokens
+        n_tokens = await counter.count(self.messages)
+        self.assertGreater(n_tokens, 1600)
+        self.assertLess(n_tokens, 1700)
+        self.assertIsNone(await counter.confirm(self.messages))
+
+        # The non-ASCII characters take more tokens
+        self.assertListEqual(
+            await counter.count_many(["abcdefg", "你好世界", ""]),
+            [2, 4, 0],
+        )
+
+        # The pluggable tokenizer
+        counter = AnthropicTokenCounter(
+            model_name="claude-sonnet-4-20250514",
+            mode="local",
+            estimator=LocalTokenEstimator(tokenizer=lambda _: len(_.split())),
+        )
+        self.assertListEqual(await counter.count_many(["a b c"]), [3])
+
+    async def test_hybrid_mode(self) -> None:
+        """Test the remote confirmation in the hybrid mode."""
+        counter = AnthropicTokenCounter(
+            model_name="claude-sonnet-4-20250514",
+            api_key="xxx",
+            mode="hybrid",
+            estimator=LocalTokenEstimator(tokenizer=lambda _: len(_.split())),
+        )
+
+        # The exact count is twice the uncalibrated estimation
+        exact = LocalTokenEstimator(tokenizer=lambda _: 2 * len(_.split()))
+        counter.client = MagicMock()
+        counter.client.messages.count_tokens = AsyncMock(
+            side_effect=lambda **kwargs: MagicMock(
+                input_tokens=exact.count(
+                    [{"role": "system", "content": kwargs["system"]}]
+                    + kwargs["messages"],
+                ),
+            ),
+        )
+
+        formatter = AnthropicChatFormatter(
+            token_counter=counter, max_tokens=30
+        )
+        msgs = [
+            Msg("system", "You're a helpful assistant.", "system"),
+            Msg("user", "What is the capital of France?", "user"),
+            Msg("assistant", "Paris.", "assistant"),
+            Msg("user", "And Japan?", "user"),
+        ]
+        res = await formatter.format(msgs)
+
+        # The estimations fit, but the confirmed counts don't, so the
+        # messages are truncated further
+        self.assertEqual(len(res), 3)
+        self.assertEqual(counter.client.messages.count_tokens.await_count, 2)
+        self.assertGreater(counter.estimator.scale, 1.0)
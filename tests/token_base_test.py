@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+"""The unittests for the token counter base class."""
+from typing import Any
+from unittest.async_case import IsolatedAsyncioTestCase
+
+from agentscope.token import TokenCounterBase
+
+
+class WordCounter(TokenCounterBase):
+    """A token counter that counts the words and one token per message."""
+
+    async def count(self, messages: list[dict], **kwargs: Any) -> int:
+        """Count the words in the messages."""
+        return sum(len(_["content"].split()) + 1 for _ in messages)
+
+
+class TokenCounterBaseTest(IsolatedAsyncioTestCase):
+    """The unittests for the token counter base class."""
+
+    async def test_count_many(self) -> None:
+        """Test the default batch counting counts each text as a message."""
+        counter = WordCounter()
+        self.assertListEqual(
+            await counter.count_many(["Hello world!", "", "a b c"]),
+            [3, 1, 4],
+        )
+        self.assertListEqual(await counter.count_many([]), [])
+        self.assertIsNone(await counter.confirm([]))
@@ -158,3 +158,30 @@ class OpenAITokenCounterTest(IsolatedAsyncioTestCase):
 
         n_tokens = await counter.count(self.messages, self.tools)
         self.assertEqual(n_tokens, 1841)
+
+    async def test_memoization_and_batch(self) -> None:
+        """Test the memoized counting and the batch counting."""
+        counter = OpenAITokenCounter(model_name="gpt-4o")
+        uncached = OpenAITokenCounter(model_name="gpt-4o", cache_size=0)
+
+        messages = self.messages[-3:]
+        n_tokens = await counter.count(messages, self.tools)
+        self.assertEqual(
+            n_tokens,
+            await uncached.count(messages, self.tools),
+        )
+        self.assertEqual(
+            await counter.count(messages, self.tools),
+            n_tokens,
+        )
+
+        # The long strings of the same length are memoized separately
+        for text in ["a " * 300, "b" * 600]:
+            long_messages = [{"role": "user", "content": text}]
+            self.assertEqual(
+                await counter.count(long_messages),
+                await uncached.count(long_messages),
+            )
+
+        texts = ["Hello world!", "", "The capital of Japan is Tokyo."]
+        self.assertListEqual(await counter.count_many(texts), [3, 0, 7])
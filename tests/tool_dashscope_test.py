@@ -1,8 +1,9 @@
 # -*- coding: utf-8 -*-
 """Unit tests for DashScope tools"""
 
+import asyncio
 import base64
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import AsyncMock, Mock, patch, MagicMock
 
 from agentscope.message import ImageBlock, TextBlock, AudioBlock
 from agentscope.tool import ToolResponse
@@ -10,6 +11,8 @@ from agentscope.tool import (
     dashscope_text_to_image,
     dashscope_image_to_text,
     dashscope_text_to_audio,
+    dashscope_text_to_image_async,
+    dashscope_image_to_text_async,
 )
 
 
@@ -397,3 +400,78 @@ class TestDashScopeTextToAudio:
                 text="Failed to generate audio: TTS API Error",
             ),
         ]
+
+
+class TestDashScopeAsyncTools:
+    """Test cases for the async variants of the DashScope tools"""
+
+    def test_text_to_image_async_polling(self) -> None:
+        """Test the image synthesis task is polled until it succeeds"""
+        mock_dashscope = MagicMock()
+        pending, succeeded = Mock(), Mock()
+        pending.output = {"task_status": "RUNNING"}
+        succeeded.output = {
+            "task_status": "SUCCEEDED",
+            "results": [{"url": "https://example.com/image1.jpg"}],
+        }
+        mock_dashscope.ImageSynthesis.fetch.side_effect = [pending, succeeded]
+
+        with patch.dict("sys.modules", {"dashscope": mock_dashscope}):
+            result = asyncio.run(
+                dashscope_text_to_image_async(
+                    prompt="A beautiful landscape",
+                    api_key="test_key",
+                    poll_interval=0,
+                ),
+            )
+
+        assert mock_dashscope.ImageSynthesis.fetch.call_count == 2
+        assert result.content == [
+            ImageBlock(
+                type="image",
+                source={
+                    "type": "url",
+                    "url": "https://example.com/image1.jpg",
+                },
+            ),
+        ]
+
+    def test_text_to_image_async_failed(self) -> None:
+        """Test the failed image synthesis task"""
+        mock_dashscope = MagicMock()
+        failed = Mock(message="bad prompt")
+        failed.output = {"task_status": "FAILED"}
+        mock_dashscope.ImageSynthesis.fetch.return_value = failed
+
+        with patch.dict("sys.modules", {"dashscope": mock_dashscope}):
+            result = asyncio.run(
+                dashscope_text_to_image_async(
+                    prompt="A beautiful landscape",
+                    api_key="test_key",
+                ),
+            )
+
+        assert "FAILED" in result.content[0]["text"]
+
+    def test_image_to_text_async(self) -> None:
+        """Test generating text from images with the async API"""
+        mock_dashscope = MagicMock()
+        mock_response = Mock()
+        mock_response.output = {
+            "choices": [
+                {"message": {"content": [{"text": "A cat"}]}},
+            ],
+        }
+        mock_dashscope.AioMultiModalConversation.call = AsyncMock(
+            return_value=mock_response,
+        )
+
+        with patch.dict("sys.modules", {"dashscope": mock_dashscope}):
+            result = asyncio.run(
+                dashscope_image_to_text_async(
+                    "https://example.com/cat.jpg",
+                    api_key="test_key",
+                ),
+            )
+
+        assert result.content == [TextBlock(type="text", text="A cat")]
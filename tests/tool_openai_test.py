@@ -1,9 +1,11 @@
 # -*- coding: utf-8 -*-
 """Unit tests for OpenAI tools"""
 
+import asyncio
 import base64
 from io import BytesIO
-from unittest.mock import Mock, patch, mock_open, MagicMock
+from typing import Any
+from unittest.mock import AsyncMock, Mock, patch, mock_open, MagicMock
 
 from agentscope.message import ImageBlock, TextBlock, AudioBlock
 from agentscope.tool import ToolResponse
@@ -14,6 +16,8 @@ from agentscope.tool import (
     openai_image_to_text,
     openai_text_to_audio,
     openai_audio_to_text,
+    openai_text_to_image_async,
+    openai_audio_to_text_async,
 )
 
 
@@ -687,3 +691,94 @@ class TestOpenAIAudioToText:
                 text="Error: Failed to transcribe audio: Transcription Error",
             ),
         ]
+
+
+class TestOpenAIAsyncTools:
+    """Test cases for the async variants of the OpenAI tools"""
+
+    def test_text_to_image_async_save_dir(self, tmp_path: Any) -> None:
+        """Test the generated base64 images are saved to local files"""
+        mock_openai = MagicMock()
+        mock_client = Mock()
+        mock_openai.AsyncOpenAI.return_value = mock_client
+        mock_response = Mock()
+        mock_response.data = [
+            Mock(b64_json=base64.b64encode(b"image1").decode("utf-8")),
+            Mock(b64_json=base64.b64encode(b"image2").decode("utf-8")),
+        ]
+        mock_client.images.generate = AsyncMock(return_value=mock_response)
+
+        with patch.dict("sys.modules", {"openai": mock_openai}):
+            result = asyncio.run(
+                openai_text_to_image_async(
+                    prompt="A beautiful landscape",
+                    api_key="test_key",
+                    n=2,
+                    response_format="b64_json",
+                    save_dir=str(tmp_path),
+                ),
+            )
+
+        assert len(result.content) == 2
+        for block, expected in zip(result.content, [b"image1", b"image2"]):
+            assert block["source"]["type"] == "url"
+            with open(block["source"]["url"], "rb") as f:
+                assert f.read() == expected
+
+    def test_text_to_image_async_url_mode(self) -> None:
+        """Test the image URLs are returned directly"""
+        mock_openai = MagicMock()
+        mock_client = Mock()
+        mock_openai.AsyncOpenAI.return_value = mock_client
+        mock_response = Mock()
+        mock_response.data = [Mock(url="https://example.com/image1.jpg")]
+        mock_client.images.generate = AsyncMock(return_value=mock_response)
+
+        with patch.dict("sys.modules", {"openai": mock_openai}):
+            result = asyncio.run(
+                openai_text_to_image_async(
+                    prompt="A beautiful landscape",
+                    api_key="test_key",
+                ),
+            )
+
+        assert result.content == [
+            ImageBlock(
+                type="image",
+                source={
+                    "type": "url",
+                    "url": "https://example.com/image1.jpg",
+                },
+            ),
+        ]
+
+    def test_audio_to_text_async_local_file(self, tmp_path: Any) -> None:
+        """Test transcribing a local audio file"""
+        audio_path = tmp_path / "audio.mp3"
+        audio_path.write_bytes(b"fake_audio")
+
+        mock_openai = MagicMock()
+        mock_client = Mock()
+        mock_openai.AsyncOpenAI.return_value = mock_client
+        mock_client.audio.transcriptions.create = AsyncMock(
+            return_value=Mock(text="Hello"),
+        )
+
+        with patch.dict("sys.modules", {"openai": mock_openai}):
+            result = asyncio.run(
+                openai_audio_to_text_async(str(audio_path), "test_key"),
+            )
+
+        assert result.content == [TextBlock(type="text", text="Hello")]
+        audio_file = mock_client.audio.transcriptions.create.call_args[1][
+            "file"
+        ]
+        assert audio_file.getvalue() == b"fake_audio"
+        assert audio_file.name == "audio.mp3"
+
+    def test_audio_to_text_async_file_not_found(self) -> None:
+        """Test the error of a missing audio file"""
+        result = asyncio.run(
+            openai_audio_to_text_async("/not/exists.mp3", "test_key"),
+        )
+        assert "File not found" in result.content[0]["text"]
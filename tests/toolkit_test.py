@@ -1,14 +1,17 @@
 # -*- coding: utf-8 -*-
 """Test toolkit module in agentscope."""
 import asyncio
+import tempfile
 import time
 from copy import deepcopy
 from functools import partial
 from typing import Union, Optional, Any, AsyncGenerator, Generator, Tuple
 from unittest import IsolatedAsyncioTestCase
 
+import mcp.types
 from pydantic import BaseModel, Field
 
+from agentscope.mcp import MCPClientBase, MCPToolCache, MCPToolFunction
 from agentscope.message import ToolUseBlock, TextBlock
 from agentscope.tool import ToolResponse, Toolkit
 
@@ -111,6 +114,66 @@ class StructuredModel(BaseModel):
     arg3: int = Field(description="Test argument 3.")
 
 
+class MockMCPClient(MCPClientBase):
+    """A mock MCP client with slow tool discovery."""
+
+    def __init__(self, name: str, version: str = "1.0") -> None:
+        """Initialize the mock MCP client."""
+        super().__init__(name)
+        self.server_id = f"mock:{name}"
+        self.server_info = mcp.types.Implementation(
+            name=name,
+            version=version,
+        )
+        self.n_list_tools = 0
+
+    async def list_tools(self) -> list[mcp.types.Tool]:
+        """List the tools after a delay."""
+        self.n_list_tools += 1
+        await asyncio.sleep(0.2)
+        return [
+            mcp.types.Tool(
+                name=f"{self.name}_{i}",
+                description="A mock MCP tool.",
+                inputSchema={"type": "object", "properties": {}},
+            )
+            for i in range(2)
+        ]
+
+    async def get_callable_function(
+        self,
+        func_name: str,
+        wrap_tool_result: bool = True,
+    ) -> MCPToolFunction:
+        """Create the tool function by its name."""
+        return MCPToolFunction(
+            self.name,
+            mcp.types.Tool(
+                name=func_name,
+                description="A mock MCP tool.",
+                inputSchema={"type": "object", "properties": {}},
+            ),
+            wrap_tool_result,
+            client_gen=lambda: None,
+        )
+
+    async def get_callable_functions(
+        self,
+        tools: list[mcp.types.Tool],
+        wrap_tool_result: bool = True,
+    ) -> list[MCPToolFunction]:
+        """Create the tool functions from the listed tools."""
+        return [
+            MCPToolFunction(
+                self.name,
+                _,
+                wrap_tool_result,
+                client_gen=lambda: None,
+            )
+            for _ in tools
+        ]
+
+
 class ToolkitTest(IsolatedAsyncioTestCase):
     """Unittest for the toolkit module."""
 
@@ -846,6 +909,85 @@ class ToolkitTest(IsolatedAsyncioTestCase):
                 "</notes>",
             )
 
+    async def test_json_schemas_cache(self) -> None:
+        """Test the JSON schemas are cached until the toolkit changes."""
+        self.toolkit.register_tool_function(
+            self.toolkit.reset_equipped_tools,
+        )
+        self.toolkit.create_tool_group("group", "A tool group.")
+        self.toolkit.register_tool_function(sync_func, group_name="group")
+
+        schemas = self.toolkit.get_json_schemas()
+        extended_model = self.toolkit.tools[
+            "reset_equipped_tools"
+        ].extended_model
+        self.assertIs(self.toolkit.get_json_schemas(), schemas)
+        self.assertIs(
+            self.toolkit.tools["reset_equipped_tools"].extended_model,
+            extended_model,
+        )
+        self.assertEqual(len(schemas), 1)
+
+        # Activate the group
+        self.toolkit.update_tool_groups(["group"], active=True)
+        schemas = self.toolkit.get_json_schemas()
+        self.assertEqual(
+            [_["function"]["name"] for _ in schemas],
+            ["reset_equipped_tools", "sync_func"],
+        )
+
+        # Set the extended model
+        self.toolkit.set_extended_model("sync_func", StructuredModel)
+        self.assertIn(
+            "arg3",
+            self.toolkit.get_json_schemas()[1]["function"]["parameters"][
+                "properties"
+            ],
+        )
+
+        # Modify the attributes directly
+        self.toolkit.groups["group"].active = False
+        self.assertEqual(len(self.toolkit.get_json_schemas()), 1)
+        self.toolkit.tools.pop("reset_equipped_tools")
+        self.assertEqual(self.toolkit.get_json_schemas(), [])
+
+    async def test_register_mcp_clients(self) -> None:
+        """Test the concurrent discovery and the tool schema cache of the
+        MCP clients."""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            clients = [MockMCPClient(f"server{i}") for i in range(3)]
+
+            start = time.perf_counter()
+            await self.toolkit.register_mcp_clients(
+                clients,
+                disable_funcs=["server0_1"],
+                tool_cache=MCPToolCache(cache_dir),
+            )
+            self.assertLess(time.perf_counter() - start, 0.5)
+            self.assertEqual(
+                list(self.toolkit.tools.keys()),
+                [
+                    "server0_0",
+                    "server1_0",
+                    "server1_1",
+                    "server2_0",
+                    "server2_1",
+                ],
+            )
+
+            # Warm start from the cache, and list the upgraded server again
+            clients = [
+                MockMCPClient("server0"),
+                MockMCPClient("server1", version="2.0"),
+            ]
+            toolkit = Toolkit()
+            await toolkit.register_mcp_clients(
+                clients,
+                tool_cache=MCPToolCache(cache_dir),
+            )
+            self.assertEqual([_.n_list_tools for _ in clients], [0, 1])
+            self.assertEqual(len(toolkit.tools), 4)
+
     async def asyncTearDown(self) -> None:
         """Clean up after each test."""
         self.toolkit = None
@@ -6,6 +6,13 @@ from typing import (
     Any,
 )
 from unittest import IsolatedAsyncioTestCase
+from unittest.mock import patch
+
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+    InMemorySpanExporter,
+)
 
 from agentscope import _config
 from agentscope.agent import AgentBase
@@ -25,6 +32,7 @@ from agentscope.tracing import (
     trace_format,
     trace_embedding,
 )
+from agentscope.tracing._sampling import TraceSampler
 
 
 class TracingTest(IsolatedAsyncioTestCase):
@@ -376,6 +384,94 @@ class TracingTest(IsolatedAsyncioTestCase):
         with self.assertRaises(ValueError):
             await model(True)
 
+    async def test_sampling(self) -> None:
+        """Test the head-based and tail-based sampling, the lazy
+        serialization and the attribute caps."""
+
+        class Payload:
+            """A payload that counts its serialization."""
+
+            n_serialized = 0
+
+            def __str__(self) -> str:
+                Payload.n_serialized += 1
+                return "payload" * 100
+
+        @trace(name="inner")
+        async def inner(payload: Payload) -> str:
+            """Test inner function"""
+            return str(payload)
+
+        @trace(name="outer")
+        async def outer(payload: Payload, raise_error: bool) -> str:
+            """Test outer function"""
+            res = await inner(payload)
+            if raise_error:
+                raise ValueError("Simulated error")
+            return res
+
+        def run_with_sampler(sample_rate: float) -> tuple:
+            """Create an in-memory exporter and a patcher of the tracer."""
+            exporter = InMemorySpanExporter()
+            provider = TracerProvider(sampler=TraceSampler(sample_rate))
+            provider.add_span_processor(SimpleSpanProcessor(exporter))
+            return exporter, patch(
+                "opentelemetry.trace.get_tracer",
+                provider.get_tracer,
+            )
+
+        try:
+            _config.trace_max_attribute_bytes = 200
+
+            # Sampled at the head
+            exporter, patcher = run_with_sampler(1.0)
+            with patcher:
+                await outer(Payload(), False)
+            spans = exporter.get_finished_spans()
+            self.assertListEqual([_.name for _ in spans], ["inner", "outer"])
+            self.assertEqual(spans[0].parent.span_id, spans[1].context.span_id)
+            self.assertIn("sha256:", spans[1].attributes["output"])
+            self.assertEqual(
+                len(spans[1].attributes["output"].encode("utf-8")),
+                200,
+            )
+
+            # Not sampled, and the inputs are never serialized
+            _config.trace_sample_errors = False
+            Payload.n_serialized = 0
+            exporter, patcher = run_with_sampler(0.0)
+            with patcher:
+                await outer(Payload(), False)
+                with self.assertRaises(ValueError):
+                    await outer(Payload(), True)
+            self.assertEqual(len(exporter.get_finished_spans()), 0)
+            # Only called by the inner function itself
+            self.assertEqual(Payload.n_serialized, 2)
+
+            # The errors are kept by the tail-based sampling
+            _config.trace_sample_errors = True
+            exporter, patcher = run_with_sampler(0.0)
+            with patcher:
+                await outer(Payload(), False)
+                with self.assertRaises(ValueError):
+                    await outer(Payload(), True)
+            spans = exporter.get_finished_spans()
+            self.assertListEqual([_.name for _ in spans], ["outer"])
+            self.assertTrue(spans[0].attributes["sampling.tail"])
+            self.assertIn("input", spans[0].attributes)
+
+            # The slow calls are kept by the tail-based sampling
+            _config.trace_slow_threshold = 0.0
+            exporter, patcher = run_with_sampler(0.0)
+            with patcher:
+                await outer(Payload(), False)
+            self.assertEqual(len(exporter.get_finished_spans()), 2)
+
+        finally:
+            _config.trace_max_attribute_bytes = 32 * 1024
+            _config.trace_sample_errors = True
+            _config.trace_slow_threshold = None
+
     async def asyncTearDown(self) -> None:
         """Tear down the environment"""
         _config.trace_enabled = True